@@ -39,7 +39,8 @@ from src.apps.catalogs.services.medical_organizations_catalog_service import (
     MedicalOrganizationsCatalogService,
 )
 from src.apps.patients.services.patients_service import PatientService
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -57,6 +58,7 @@ class AssetsJournalContainer(containers.DeclarativeContainer):
     # Зависимости из основного контейнера
     logger = providers.Dependency(instance_of=LoggerService)
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
 
     # Зависимости от других модулей
     patients_service = providers.Dependency(instance_of=PatientService)
@@ -66,11 +68,16 @@ class AssetsJournalContainer(containers.DeclarativeContainer):
 
     # Фабрика сессий
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Асинхронная сессия БД
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # Unit of Work
     unit_of_work = providers.Factory(
@@ -33,6 +33,7 @@ from src.shared.dependencies.check_user_permissions import check_user_permission
 from src.shared.schemas.pagination_schemas import (
     PaginationMetaDataSchema,
     PaginationParams,
+    build_pagination_metadata,
 )
 from src.apps.assets_journal.domain.enums import (
     AssetDeliveryStatusEnum,
@@ -119,19 +120,8 @@ async def get_emergency_assets(
     )
 
     # Вычисляем метаданные пагинации
-    page: int = pagination_params.page or 1
-    limit: int = pagination_params.limit or 30
-    total_pages = math.ceil(total_count / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
-
-    pagination_metadata = PaginationMetaDataSchema(
-        current_page=page,
-        per_page=limit,
-        total_items=total_count,
-        total_pages=total_pages,
-        has_next=has_next,
-        has_prev=has_prev,
+    pagination_metadata = build_pagination_metadata(
+        pagination_params, total_count, assets
     )
 
     return MultipleEmergencyAssetsResponseSchema(
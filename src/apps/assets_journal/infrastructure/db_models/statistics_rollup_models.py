@@ -0,0 +1,25 @@
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.shared.infrastructure.base import Base
+
+
+class JournalStatisticsRollup(Base):
+    """
+    Предагрегированная статистика журналов: количество записей журнала за день
+    по организации (прикрепление пациента) и показателю.
+
+    Показатели - метки колонок 'JournalStatistics' журнала: 'total', флаги
+    ('confirmed', ...), разрезы ('status:completed', ...) и суммируемые агрегаты.
+    Поддерживается при записи в журналы (см. 'statistics_rollup.py').
+    """
+    __tablename__ = "journal_statistics_rollups"
+
+    journal: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # 0 - пациент не прикреплен к организации
+    organization_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    metric: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
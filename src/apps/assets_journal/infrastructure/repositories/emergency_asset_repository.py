@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, case, Integer
+from sqlalchemy import func, or_, select, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -18,9 +18,31 @@ from src.apps.assets_journal.mappers.emergency_asset_mappers import (
     map_emergency_asset_db_to_domain,
     map_emergency_asset_domain_to_db,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+EMERGENCY_STATISTICS = JournalStatistics(
+    EmergencyAsset,
+    flags={
+        "confirmed": EmergencyAsset.has_confirm == True,
+        "refused": EmergencyAsset.has_refusal == True,
+        "with_files": EmergencyAsset.has_files == True,
+    },
+    breakdowns={
+        "outcome": Breakdown(EmergencyAsset.outcome, EmergencyOutcomeEnum),
+    },
+)
+EMERGENCY_ROLLUP = JournalRollup(
+    "emergency",
+    EMERGENCY_STATISTICS,
+    day=EmergencyAsset.reg_date,
+    date_filters=("date_from", "date_to"),
+)
 
 
 class EmergencyAssetRepositoryImpl(BaseRepository, EmergencyAssetRepositoryInterface):
@@ -64,6 +86,7 @@ class EmergencyAssetRepositoryImpl(BaseRepository, EmergencyAssetRepositoryInter
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[EmergencyAssetDomain]:
         query = (
             select(EmergencyAsset)
@@ -75,6 +98,20 @@ class EmergencyAssetRepositoryImpl(BaseRepository, EmergencyAssetRepositoryInter
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(EmergencyAsset.reg_date, EmergencyAsset.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_emergency_asset_db_to_domain(asset) for asset in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(EmergencyAsset.reg_date.desc())
 
@@ -161,65 +198,28 @@ class EmergencyAssetRepositoryImpl(BaseRepository, EmergencyAssetRepositoryInter
         await self._async_db_session.flush()
 
     async def get_statistics(self, filters: Dict[str, any]) -> EmergencyAssetStatisticsSchema:
-        base_query = select(EmergencyAsset)
-        base_query = self._apply_filters(base_query, filters)
-
-        # Общее количество
-        total_query = select(func.count(EmergencyAsset.id))
-        total_query = self._apply_filters(total_query, filters)
-        total_result = await self._async_db_session.execute(total_query)
-        total_assets = total_result.scalar_one()
-
-        # Подтвержденные
-        confirmed_query = select(func.count(EmergencyAsset.id)).where(
-            EmergencyAsset.has_confirm == True
-        )
-        confirmed_query = self._apply_filters(confirmed_query, filters)
-        confirmed_result = await self._async_db_session.execute(confirmed_query)
-        confirmed_assets = confirmed_result.scalar_one()
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await EMERGENCY_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(EMERGENCY_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(EMERGENCY_STATISTICS, query)
+        outcomes = statistics.breakdowns["outcome"]
 
-        # Отказанные
-        refused_query = select(func.count(EmergencyAsset.id)).where(
-            EmergencyAsset.has_refusal == True
-        )
-        refused_query = self._apply_filters(refused_query, filters)
-        refused_result = await self._async_db_session.execute(refused_query)
-        refused_assets = refused_result.scalar_one()
-
-        # Ожидающие
-        pending_assets = total_assets - confirmed_assets - refused_assets
-
-        # С файлами
-        files_query = select(func.count(EmergencyAsset.id)).where(
-            EmergencyAsset.has_files == True
-        )
-        files_query = self._apply_filters(files_query, filters)
-        files_result = await self._async_db_session.execute(files_query)
-        assets_with_files = files_result.scalar_one()
-
-        # Статистика по исходам
-        outcome_stats_query = select(
-            func.count(case((EmergencyAsset.outcome == EmergencyOutcomeEnum.HOSPITALIZED, 1))).label('hospitalized'),
-            func.count(case((EmergencyAsset.outcome == EmergencyOutcomeEnum.TREATED_AT_HOME, 1))).label('treated_at_home'),
-            func.count(case((EmergencyAsset.outcome == EmergencyOutcomeEnum.REFUSED_TREATMENT, 1))).label('refused_treatment'),
-            func.count(case((EmergencyAsset.outcome == EmergencyOutcomeEnum.DEATH, 1))).label('death'),
-            func.count(case((EmergencyAsset.outcome == EmergencyOutcomeEnum.TRANSFERRED, 1))).label('transferred'),
-        )
-        outcome_stats_query = self._apply_filters(outcome_stats_query, filters)
-        outcome_result = await self._async_db_session.execute(outcome_stats_query)
-        outcome_stats = outcome_result.first()
+        confirmed_assets = statistics.counts["confirmed"]
+        refused_assets = statistics.counts["refused"]
 
         return EmergencyAssetStatisticsSchema(
-            total_assets=total_assets,
+            total_assets=statistics.total,
             confirmed_assets=confirmed_assets,
             refused_assets=refused_assets,
-            pending_assets=pending_assets,
-            assets_with_files=assets_with_files,
-            hospitalized_count=outcome_stats.hospitalized or 0,
-            treated_at_home_count=outcome_stats.treated_at_home or 0,
-            refused_treatment_count=outcome_stats.refused_treatment or 0,
-            death_count=outcome_stats.death or 0,
-            transferred_count=outcome_stats.transferred or 0,
+            pending_assets=statistics.total - confirmed_assets - refused_assets,
+            assets_with_files=statistics.counts["with_files"],
+            hospitalized_count=outcomes[EmergencyOutcomeEnum.HOSPITALIZED],
+            treated_at_home_count=outcomes[EmergencyOutcomeEnum.TREATED_AT_HOME],
+            refused_treatment_count=outcomes[EmergencyOutcomeEnum.REFUSED_TREATMENT],
+            death_count=outcomes[EmergencyOutcomeEnum.DEATH],
+            transferred_count=outcomes[EmergencyOutcomeEnum.TRANSFERRED],
         )
 
     async def bulk_create(self, assets: List[EmergencyAssetDomain]) -> List[EmergencyAssetDomain]:
@@ -6,7 +6,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.apps.assets_journal.domain.models.home_call import HomeCallDomain, HomeCallListItemDomain
-from src.apps.assets_journal.domain.enums import HomeCallStatusEnum
+from src.apps.assets_journal.domain.enums import (
+    HomeCallCategoryEnum,
+    HomeCallSourceEnum,
+    HomeCallStatusEnum,
+    HomeCallTypeEnum,
+)
+from src.apps.assets_journal.infrastructure.api.schemas.responses.home_call_schemas import (
+    HomeCallStatisticsSchema,
+)
 from src.apps.assets_journal.infrastructure.db_models.home_call_models import HomeCall
 from src.apps.assets_journal.interfaces.home_call_repository_interfaces import (
     HomeCallRepositoryInterface,
@@ -16,9 +24,29 @@ from src.apps.assets_journal.mappers.home_call_mappers import (
     map_home_call_domain_to_db,
     map_home_call_db_to_list_item,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+HOME_CALL_STATISTICS = JournalStatistics(
+    HomeCall,
+    breakdowns={
+        "status": Breakdown(HomeCall.status, HomeCallStatusEnum),
+        "category": Breakdown(HomeCall.category, HomeCallCategoryEnum),
+        "source": Breakdown(HomeCall.source, HomeCallSourceEnum),
+        "call_type": Breakdown(HomeCall.call_type, HomeCallTypeEnum),
+    },
+)
+HOME_CALL_ROLLUP = JournalRollup(
+    "home_call",
+    HOME_CALL_STATISTICS,
+    day=HomeCall.registration_date,
+    date_filters=("registration_date_from", "registration_date_to"),
+)
 
 
 class HomeCallRepositoryImpl(BaseRepository, HomeCallRepositoryInterface):
@@ -62,6 +90,7 @@ class HomeCallRepositoryImpl(BaseRepository, HomeCallRepositoryInterface):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[HomeCallListItemDomain]:
         query = (
             select(HomeCall)
@@ -73,6 +102,20 @@ class HomeCallRepositoryImpl(BaseRepository, HomeCallRepositoryInterface):
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(HomeCall.registration_date, HomeCall.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_home_call_db_to_list_item(home_call) for home_call in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(HomeCall.registration_date.desc())
 
@@ -94,6 +137,35 @@ class HomeCallRepositoryImpl(BaseRepository, HomeCallRepositoryInterface):
         result = await self._async_db_session.execute(query)
         return result.scalar_one()
 
+    async def get_statistics(self, filters: Dict[str, any]) -> HomeCallStatisticsSchema:
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await HOME_CALL_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(HOME_CALL_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(HOME_CALL_STATISTICS, query)
+        statuses = statistics.breakdowns["status"]
+        categories = statistics.breakdowns["category"]
+        sources = statistics.breakdowns["source"]
+        call_types = statistics.breakdowns["call_type"]
+
+        return HomeCallStatisticsSchema(
+            total_calls=statistics.total,
+            registered_calls=statuses[HomeCallStatusEnum.REGISTERED],
+            in_progress_calls=statuses[HomeCallStatusEnum.IN_PROGRESS],
+            completed_calls=statuses[HomeCallStatusEnum.COMPLETED],
+            cancelled_calls=statuses[HomeCallStatusEnum.CANCELLED],
+            emergency_calls=categories[HomeCallCategoryEnum.EMERGENCY],
+            urgent_calls=categories[HomeCallCategoryEnum.URGENT],
+            planned_calls=categories[HomeCallCategoryEnum.PLANNED],
+            patient_calls=sources[HomeCallSourceEnum.CALL_PATIENT],
+            egov_calls=sources[HomeCallSourceEnum.EGOV],
+            other_source_calls=sources[HomeCallSourceEnum.APPLICATION],
+            therapeutic_calls=call_types[HomeCallTypeEnum.THERAPEUTIC],
+            pediatric_calls=call_types[HomeCallTypeEnum.PEDIATRIC],
+            specialist_calls=call_types[HomeCallTypeEnum.SPECIALIST],
+        )
+
     async def create(self, home_call: HomeCallDomain) -> HomeCallDomain:
         # Генерируем номер вызова если не указан
         if not home_call.call_number:
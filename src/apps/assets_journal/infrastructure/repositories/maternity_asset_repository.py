@@ -16,6 +16,7 @@ from src.apps.assets_journal.mappers.maternity_asset_mappers import (
 )
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
 
 
@@ -60,6 +61,7 @@ class MaternityAssetRepositoryImpl(BaseRepository, MaternityAssetRepositoryInter
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[MaternityAssetDomain]:
         query = (
             select(MaternityAsset)
@@ -71,6 +73,20 @@ class MaternityAssetRepositoryImpl(BaseRepository, MaternityAssetRepositoryInter
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(MaternityAsset.reg_date, MaternityAsset.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_maternity_asset_db_to_domain(asset) for asset in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(MaternityAsset.reg_date.desc())
 
@@ -2,7 +2,7 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
-from sqlalchemy import func, or_, select, case, Integer
+from sqlalchemy import func, or_, select, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -19,9 +19,38 @@ from src.apps.assets_journal.mappers.newborn_asset_mappers import (
     map_newborn_asset_db_to_domain,
     map_newborn_asset_domain_to_db,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+NEWBORN_STATISTICS = JournalStatistics(
+    NewbornAsset,
+    flags={
+        "confirmed": NewbornAsset.has_confirm == True,
+        "refused": NewbornAsset.has_refusal == True,
+        "with_files": NewbornAsset.has_files == True,
+    },
+    breakdowns={
+        "condition": Breakdown(
+            func.json_extract_path_text(NewbornAsset.newborn_data, 'condition'),
+            (condition.value for condition in NewbornConditionEnum),
+        ),
+        "delivery_type": Breakdown(
+            func.json_extract_path_text(NewbornAsset.mother_data, 'delivery_type'),
+            (delivery_type.value for delivery_type in DeliveryTypeEnum),
+        ),
+    },
+)
+NEWBORN_ROLLUP = JournalRollup(
+    "newborn",
+    NEWBORN_STATISTICS,
+    day=NewbornAsset.reg_date,
+    date_filters=("date_from", "date_to"),
+)
 
 
 class NewbornAssetRepositoryImpl(BaseRepository, NewbornAssetRepositoryInterface):
@@ -65,6 +94,7 @@ class NewbornAssetRepositoryImpl(BaseRepository, NewbornAssetRepositoryInterface
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[NewbornAssetDomain]:
         query = (
             select(NewbornAsset)
@@ -76,6 +106,20 @@ class NewbornAssetRepositoryImpl(BaseRepository, NewbornAssetRepositoryInterface
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(NewbornAsset.reg_date, NewbornAsset.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_newborn_asset_db_to_domain(asset) for asset in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(NewbornAsset.reg_date.desc())
 
@@ -186,98 +230,33 @@ class NewbornAssetRepositoryImpl(BaseRepository, NewbornAssetRepositoryInterface
         await self._async_db_session.flush()
 
     async def get_statistics(self, filters: Dict[str, any]) -> NewbornAssetStatisticsSchema:
-        base_query = select(NewbornAsset)
-        base_query = self._apply_filters(base_query, filters)
-
-        # Общее количество
-        total_query = select(func.count(NewbornAsset.id))
-        total_query = self._apply_filters(total_query, filters)
-        total_result = await self._async_db_session.execute(total_query)
-        total_assets = total_result.scalar_one()
-
-        # Подтвержденные
-        confirmed_query = select(func.count(NewbornAsset.id)).where(
-            NewbornAsset.has_confirm == True
-        )
-        confirmed_query = self._apply_filters(confirmed_query, filters)
-        confirmed_result = await self._async_db_session.execute(confirmed_query)
-        confirmed_assets = confirmed_result.scalar_one()
-
-        # Отказанные
-        refused_query = select(func.count(NewbornAsset.id)).where(
-            NewbornAsset.has_refusal == True
-        )
-        refused_query = self._apply_filters(refused_query, filters)
-        refused_result = await self._async_db_session.execute(refused_query)
-        refused_assets = refused_result.scalar_one()
-
-        # Ожидающие
-        pending_assets = total_assets - confirmed_assets - refused_assets
-
-        # С файлами
-        files_query = select(func.count(NewbornAsset.id)).where(
-            NewbornAsset.has_files == True
-        )
-        files_query = self._apply_filters(files_query, filters)
-        files_result = await self._async_db_session.execute(files_query)
-        assets_with_files = files_result.scalar_one()
-
-        # Статистика по состоянию новорожденных
-        condition_stats_query = select(
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.newborn_data, 'condition') == NewbornConditionEnum.EXCELLENT.value, 1
-            ))).label('excellent'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.newborn_data, 'condition') == NewbornConditionEnum.GOOD.value, 1
-            ))).label('good'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.newborn_data, 'condition') == NewbornConditionEnum.SATISFACTORY.value, 1
-            ))).label('satisfactory'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.newborn_data, 'condition') == NewbornConditionEnum.SEVERE.value, 1
-            ))).label('severe'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.newborn_data, 'condition') == NewbornConditionEnum.CRITICAL.value, 1
-            ))).label('critical'),
-        )
-        condition_stats_query = self._apply_filters(condition_stats_query, filters)
-        condition_result = await self._async_db_session.execute(condition_stats_query)
-        condition_stats = condition_result.first()
-
-        # Статистика по типу родов
-        delivery_stats_query = select(
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.mother_data, 'delivery_type') == DeliveryTypeEnum.NATURAL.value, 1
-            ))).label('natural'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.mother_data, 'delivery_type') == DeliveryTypeEnum.CESAREAN.value, 1
-            ))).label('cesarean'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.mother_data, 'delivery_type') == DeliveryTypeEnum.FORCEPS.value, 1
-            ))).label('forceps'),
-            func.count(case((
-                func.json_extract_path_text(NewbornAsset.mother_data, 'delivery_type') == DeliveryTypeEnum.VACUUM.value, 1
-            ))).label('vacuum'),
-        )
-        delivery_stats_query = self._apply_filters(delivery_stats_query, filters)
-        delivery_result = await self._async_db_session.execute(delivery_stats_query)
-        delivery_stats = delivery_result.first()
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await NEWBORN_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(NEWBORN_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(NEWBORN_STATISTICS, query)
+        conditions = statistics.breakdowns["condition"]
+        delivery_types = statistics.breakdowns["delivery_type"]
+
+        confirmed_assets = statistics.counts["confirmed"]
+        refused_assets = statistics.counts["refused"]
 
         return NewbornAssetStatisticsSchema(
-            total_assets=total_assets,
+            total_assets=statistics.total,
             confirmed_assets=confirmed_assets,
             refused_assets=refused_assets,
-            pending_assets=pending_assets,
-            assets_with_files=assets_with_files,
-            excellent_condition_count=condition_stats.excellent or 0,
-            good_condition_count=condition_stats.good or 0,
-            satisfactory_condition_count=condition_stats.satisfactory or 0,
-            severe_condition_count=condition_stats.severe or 0,
-            critical_condition_count=condition_stats.critical or 0,
-            natural_delivery_count=delivery_stats.natural or 0,
-            cesarean_delivery_count=delivery_stats.cesarean or 0,
-            forceps_delivery_count=delivery_stats.forceps or 0,
-            vacuum_delivery_count=delivery_stats.vacuum or 0,
+            pending_assets=statistics.total - confirmed_assets - refused_assets,
+            assets_with_files=statistics.counts["with_files"],
+            excellent_condition_count=conditions[NewbornConditionEnum.EXCELLENT.value],
+            good_condition_count=conditions[NewbornConditionEnum.GOOD.value],
+            satisfactory_condition_count=conditions[NewbornConditionEnum.SATISFACTORY.value],
+            severe_condition_count=conditions[NewbornConditionEnum.SEVERE.value],
+            critical_condition_count=conditions[NewbornConditionEnum.CRITICAL.value],
+            natural_delivery_count=delivery_types[DeliveryTypeEnum.NATURAL.value],
+            cesarean_delivery_count=delivery_types[DeliveryTypeEnum.CESAREAN.value],
+            forceps_delivery_count=delivery_types[DeliveryTypeEnum.FORCEPS.value],
+            vacuum_delivery_count=delivery_types[DeliveryTypeEnum.VACUUM.value],
         )
 
     async def bulk_create(self, assets: List[NewbornAssetDomain]) -> List[NewbornAssetDomain]:
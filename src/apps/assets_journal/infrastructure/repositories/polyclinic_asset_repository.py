@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, case, Integer
+from sqlalchemy import func, or_, select, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -22,9 +22,33 @@ from src.apps.assets_journal.mappers.polyclinic_asset_mappers import (
     map_polyclinic_asset_db_to_domain,
     map_polyclinic_asset_domain_to_db,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+POLYCLINIC_STATISTICS = JournalStatistics(
+    PolyclinicAsset,
+    flags={
+        "confirmed": PolyclinicAsset.has_confirm == True,
+        "refused": PolyclinicAsset.has_refusal == True,
+        "with_files": PolyclinicAsset.has_files == True,
+    },
+    breakdowns={
+        "visit_type": Breakdown(PolyclinicAsset.visit_type, PolyclinicVisitTypeEnum),
+        "service": Breakdown(PolyclinicAsset.service, PolyclinicServiceTypeEnum),
+        "outcome": Breakdown(PolyclinicAsset.visit_outcome, PolyclinicOutcomeEnum),
+    },
+)
+POLYCLINIC_ROLLUP = JournalRollup(
+    "polyclinic",
+    POLYCLINIC_STATISTICS,
+    day=PolyclinicAsset.reg_date,
+    date_filters=("date_from", "date_to"),
+)
 
 
 class PolyclinicAssetRepositoryImpl(BaseRepository, PolyclinicAssetRepositoryInterface):
@@ -68,6 +92,7 @@ class PolyclinicAssetRepositoryImpl(BaseRepository, PolyclinicAssetRepositoryInt
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[PolyclinicAssetDomain]:
         query = (
             select(PolyclinicAsset)
@@ -79,6 +104,20 @@ class PolyclinicAssetRepositoryImpl(BaseRepository, PolyclinicAssetRepositoryInt
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(PolyclinicAsset.reg_date, PolyclinicAsset.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_polyclinic_asset_db_to_domain(asset) for asset in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(PolyclinicAsset.reg_date.desc())
 
@@ -164,95 +203,38 @@ class PolyclinicAssetRepositoryImpl(BaseRepository, PolyclinicAssetRepositoryInt
         await self._async_db_session.flush()
 
     async def get_statistics(self, filters: Dict[str, any]) -> PolyclinicAssetStatisticsSchema:
-        base_query = select(PolyclinicAsset)
-        base_query = self._apply_filters(base_query, filters)
-
-        # Общее количество
-        total_query = select(func.count(PolyclinicAsset.id))
-        total_query = self._apply_filters(total_query, filters)
-        total_result = await self._async_db_session.execute(total_query)
-        total_assets = total_result.scalar_one()
-
-        # Подтвержденные
-        confirmed_query = select(func.count(PolyclinicAsset.id)).where(
-            PolyclinicAsset.has_confirm == True
-        )
-        confirmed_query = self._apply_filters(confirmed_query, filters)
-        confirmed_result = await self._async_db_session.execute(confirmed_query)
-        confirmed_assets = confirmed_result.scalar_one()
-
-        # Отказанные
-        refused_query = select(func.count(PolyclinicAsset.id)).where(
-            PolyclinicAsset.has_refusal == True
-        )
-        refused_query = self._apply_filters(refused_query, filters)
-        refused_result = await self._async_db_session.execute(refused_query)
-        refused_assets = refused_result.scalar_one()
-
-        # Ожидающие
-        pending_assets = total_assets - confirmed_assets - refused_assets
-
-        # С файлами
-        files_query = select(func.count(PolyclinicAsset.id)).where(
-            PolyclinicAsset.has_files == True
-        )
-        files_query = self._apply_filters(files_query, filters)
-        files_result = await self._async_db_session.execute(files_query)
-        assets_with_files = files_result.scalar_one()
-
-        # Статистика по типу посещения
-        visit_type_stats_query = select(
-            func.count(case((PolyclinicAsset.visit_type == PolyclinicVisitTypeEnum.FIRST_VISIT, 1))).label('first_visit'),
-            func.count(case((PolyclinicAsset.visit_type == PolyclinicVisitTypeEnum.REPEAT_VISIT, 1))).label('repeat_visit'),
-        )
-        visit_type_stats_query = self._apply_filters(visit_type_stats_query, filters)
-        visit_type_result = await self._async_db_session.execute(visit_type_stats_query)
-        visit_type_stats = visit_type_result.first()
-
-        # Статистика по типу услуги
-        service_type_stats_query = select(
-            func.count(case((PolyclinicAsset.service == PolyclinicServiceTypeEnum.CONSULTATION, 1))).label('consultation'),
-            func.count(case((PolyclinicAsset.service == PolyclinicServiceTypeEnum.PROCEDURE, 1))).label('procedure'),
-            func.count(case((PolyclinicAsset.service == PolyclinicServiceTypeEnum.DIAGNOSTIC, 1))).label('diagnostic'),
-            func.count(case((PolyclinicAsset.service == PolyclinicServiceTypeEnum.VACCINATION, 1))).label('vaccination'),
-            func.count(case((PolyclinicAsset.service == PolyclinicServiceTypeEnum.LABORATORY, 1))).label('laboratory'),
-        )
-        service_type_stats_query = self._apply_filters(service_type_stats_query, filters)
-        service_type_result = await self._async_db_session.execute(service_type_stats_query)
-        service_type_stats = service_type_result.first()
-
-        # Статистика по исходу посещения
-        outcome_stats_query = select(
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.RECOVERED, 1))).label('recovered'),
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.IMPROVED, 1))).label('improved'),
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.WITHOUT_CHANGES, 1))).label('without_changes'),
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.WORSENED, 1))).label('worsened'),
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.REFERRED, 1))).label('referred'),
-            func.count(case((PolyclinicAsset.visit_outcome == PolyclinicOutcomeEnum.HOSPITALIZED, 1))).label('hospitalized'),
-        )
-        outcome_stats_query = self._apply_filters(outcome_stats_query, filters)
-        outcome_result = await self._async_db_session.execute(outcome_stats_query)
-        outcome_stats = outcome_result.first()
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await POLYCLINIC_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(POLYCLINIC_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(POLYCLINIC_STATISTICS, query)
+        visit_types = statistics.breakdowns["visit_type"]
+        services = statistics.breakdowns["service"]
+        outcomes = statistics.breakdowns["outcome"]
+
+        confirmed_assets = statistics.counts["confirmed"]
+        refused_assets = statistics.counts["refused"]
 
         return PolyclinicAssetStatisticsSchema(
-            total_assets=total_assets,
+            total_assets=statistics.total,
             confirmed_assets=confirmed_assets,
             refused_assets=refused_assets,
-            pending_assets=pending_assets,
-            assets_with_files=assets_with_files,
-            first_visit_count=visit_type_stats.first_visit or 0,
-            repeat_visit_count=visit_type_stats.repeat_visit or 0,
-            consultation_count=service_type_stats.consultation or 0,
-            procedure_count=service_type_stats.procedure or 0,
-            diagnostic_count=service_type_stats.diagnostic or 0,
-            vaccination_count=service_type_stats.vaccination or 0,
-            laboratory_count=service_type_stats.laboratory or 0,
-            recovered_count=outcome_stats.recovered or 0,
-            improved_count=outcome_stats.improved or 0,
-            without_changes_count=outcome_stats.without_changes or 0,
-            worsened_count=outcome_stats.worsened or 0,
-            referred_count=outcome_stats.referred or 0,
-            hospitalized_count=outcome_stats.hospitalized or 0,
+            pending_assets=statistics.total - confirmed_assets - refused_assets,
+            assets_with_files=statistics.counts["with_files"],
+            first_visit_count=visit_types[PolyclinicVisitTypeEnum.FIRST_VISIT],
+            repeat_visit_count=visit_types[PolyclinicVisitTypeEnum.REPEAT_VISIT],
+            consultation_count=services[PolyclinicServiceTypeEnum.CONSULTATION],
+            procedure_count=services[PolyclinicServiceTypeEnum.PROCEDURE],
+            diagnostic_count=services[PolyclinicServiceTypeEnum.DIAGNOSTIC],
+            vaccination_count=services[PolyclinicServiceTypeEnum.VACCINATION],
+            laboratory_count=services[PolyclinicServiceTypeEnum.LABORATORY],
+            recovered_count=outcomes[PolyclinicOutcomeEnum.RECOVERED],
+            improved_count=outcomes[PolyclinicOutcomeEnum.IMPROVED],
+            without_changes_count=outcomes[PolyclinicOutcomeEnum.WITHOUT_CHANGES],
+            worsened_count=outcomes[PolyclinicOutcomeEnum.WORSENED],
+            referred_count=outcomes[PolyclinicOutcomeEnum.REFERRED],
+            hospitalized_count=outcomes[PolyclinicOutcomeEnum.HOSPITALIZED],
         )
 
     async def bulk_create(self, assets: List[PolyclinicAssetDomain]) -> List[PolyclinicAssetDomain]:
@@ -6,7 +6,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from src.apps.assets_journal.domain.models.sick_leave import SickLeaveDomain, SickLeaveListItemDomain
-from src.apps.assets_journal.domain.enums import SickLeaveStatusEnum
+from src.apps.assets_journal.domain.enums import SickLeaveReasonEnum, SickLeaveStatusEnum
+from src.apps.assets_journal.infrastructure.api.schemas.responses.sick_leave_schemas import (
+    SickLeaveStatisticsSchema,
+)
 from src.apps.assets_journal.infrastructure.db_models.sick_leave_models import SickLeave
 from src.apps.assets_journal.interfaces.sick_leave_repository_interfaces import (
     SickLeaveRepositoryInterface,
@@ -16,9 +19,33 @@ from src.apps.assets_journal.mappers.sick_leave_mappers import (
     map_sick_leave_domain_to_db,
     map_sick_leave_db_to_list_item,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+SICK_LEAVE_STATISTICS = JournalStatistics(
+    SickLeave,
+    breakdowns={
+        "status": Breakdown(SickLeave.status, SickLeaveStatusEnum),
+        "reason": Breakdown(SickLeave.sick_leave_reason, SickLeaveReasonEnum),
+    },
+    aggregates={
+        # Разность дат в PostgreSQL - количество дней; открытые листы (без даты окончания) не учитываются.
+        # Средняя длительность считается из суммы и количества, чтобы их можно было суммировать по дням
+        "duration_days_sum": func.sum(SickLeave.disability_end_date - SickLeave.disability_start_date),
+        "with_end_date": func.count(SickLeave.disability_end_date),
+    },
+)
+SICK_LEAVE_ROLLUP = JournalRollup(
+    "sick_leave",
+    SICK_LEAVE_STATISTICS,
+    day=SickLeave.receive_date,
+    date_filters=("receive_date_from", "receive_date_to"),
+)
 
 
 class SickLeaveRepositoryImpl(BaseRepository, SickLeaveRepositoryInterface):
@@ -68,6 +95,7 @@ class SickLeaveRepositoryImpl(BaseRepository, SickLeaveRepositoryInterface):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[SickLeaveListItemDomain]:
         query = (
             select(SickLeave)
@@ -79,6 +107,20 @@ class SickLeaveRepositoryImpl(BaseRepository, SickLeaveRepositoryInterface):
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(SickLeave.created_at, SickLeave.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_sick_leave_db_to_list_item(sick_leave) for sick_leave in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате создания (сначала новые)
         query = query.order_by(SickLeave.created_at.desc())
 
@@ -101,6 +143,36 @@ class SickLeaveRepositoryImpl(BaseRepository, SickLeaveRepositoryInterface):
         result = await self._async_db_session.execute(query)
         return result.scalar_one()
 
+    async def get_statistics(self, filters: Dict[str, any]) -> SickLeaveStatisticsSchema:
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await SICK_LEAVE_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(SICK_LEAVE_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(SICK_LEAVE_STATISTICS, query)
+        statuses = statistics.breakdowns["status"]
+        reasons = statistics.breakdowns["reason"]
+        with_end_date = statistics.aggregates["with_end_date"] or 0
+        duration_days_sum = statistics.aggregates["duration_days_sum"] or 0
+
+        return SickLeaveStatisticsSchema(
+            total_sick_leaves=statistics.total,
+            open_sick_leaves=statuses[SickLeaveStatusEnum.OPEN],
+            closed_sick_leaves=statuses[SickLeaveStatusEnum.CLOSED],
+            cancelled_sick_leaves=statuses[SickLeaveStatusEnum.CANCELLED],
+            extended_sick_leaves=statuses[SickLeaveStatusEnum.EXTENSION],
+            acute_illness_count=reasons[SickLeaveReasonEnum.ACUTE_ILLNESS],
+            chronic_illness_count=reasons[SickLeaveReasonEnum.CHRONIC_ILLNESS],
+            work_injury_count=reasons[SickLeaveReasonEnum.WORK_INJURY],
+            domestic_injury_count=reasons[SickLeaveReasonEnum.DOMESTIC_INJURY],
+            pregnancy_complications_count=reasons[SickLeaveReasonEnum.PREGNANCY_COMPLICATIONS],
+            child_care_count=reasons[SickLeaveReasonEnum.CHILD_CARE],
+            family_member_care_count=reasons[SickLeaveReasonEnum.FAMILY_MEMBER_CARE],
+            average_duration_days=(
+                round(duration_days_sum / with_end_date, 1) if with_end_date else None
+            ),
+        )
+
     async def create(self, sick_leave: SickLeaveDomain) -> SickLeaveDomain:
         db_sick_leave = map_sick_leave_domain_to_db(sick_leave)
 
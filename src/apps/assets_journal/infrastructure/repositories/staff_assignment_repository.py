@@ -2,11 +2,19 @@ from datetime import date
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select, and_
+from sqlalchemy import distinct, func, or_, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.assets_journal.domain.models.staff_assignment import StaffAssignmentDomain, StaffAssignmentListItemDomain
-from src.apps.assets_journal.domain.enums import StaffAssignmentStatusEnum
+from src.apps.assets_journal.domain.enums import (
+    AreaTypeEnum,
+    MedicalDepartmentEnum,
+    MedicalSpecializationEnum,
+    StaffAssignmentStatusEnum,
+)
+from src.apps.assets_journal.infrastructure.api.schemas.responses.staff_assignment_schemas import (
+    StaffAssignmentStatisticsSchema,
+)
 from src.apps.assets_journal.infrastructure.db_models.staff_assignment import StaffAssignment
 from src.apps.assets_journal.interfaces.staff_assignment_repository_interface import (
     StaffAssignmentRepositoryInterface,
@@ -17,7 +25,28 @@ from src.apps.assets_journal.mappers.staff_assignment_mappers import (
     map_staff_assignment_db_to_list_item,
 )
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+STAFF_ASSIGNMENT_STATISTICS = JournalStatistics(
+    StaffAssignment,
+    breakdowns={
+        "status": Breakdown(StaffAssignment.status, StaffAssignmentStatusEnum),
+        "specialization": Breakdown(StaffAssignment.specialization, MedicalSpecializationEnum),
+        "department": Breakdown(StaffAssignment.department, MedicalDepartmentEnum),
+    },
+    aggregates={
+        "areas": func.count(distinct(StaffAssignment.area_number)),
+        **{
+            f"{area_type.value}_areas": func.count(distinct(StaffAssignment.area_number)).filter(
+                StaffAssignment.area_type == area_type
+            )
+            for area_type in AreaTypeEnum
+        },
+    },
+)
 
 
 class StaffAssignmentRepositoryImpl(BaseRepository, StaffAssignmentRepositoryInterface):
@@ -40,12 +69,27 @@ class StaffAssignmentRepositoryImpl(BaseRepository, StaffAssignmentRepositoryInt
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[StaffAssignmentListItemDomain]:
         query = select(StaffAssignment)
 
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(StaffAssignment.start_date, StaffAssignment.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_staff_assignment_db_to_list_item(assignment) for assignment in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате начала (сначала новые)
         query = query.order_by(StaffAssignment.start_date.desc())
 
@@ -67,6 +111,51 @@ class StaffAssignmentRepositoryImpl(BaseRepository, StaffAssignmentRepositoryInt
         result = await self._async_db_session.execute(query)
         return result.scalar_one()
 
+    async def get_statistics(self, filters: Dict[str, any]) -> StaffAssignmentStatisticsSchema:
+        # Все разрезы считаются одним проходом по отфильтрованным записям
+        query = self._apply_filters(STAFF_ASSIGNMENT_STATISTICS.select(), filters)
+        statistics = await self._get_statistics(STAFF_ASSIGNMENT_STATISTICS, query)
+        statuses = statistics.breakdowns["status"]
+        specializations = statistics.breakdowns["specialization"]
+        departments = statistics.breakdowns["department"]
+        areas = statistics.aggregates
+
+        therapists = specializations[MedicalSpecializationEnum.THERAPIST]
+        pediatricians = specializations[MedicalSpecializationEnum.PEDIATRICIAN]
+        surgeons = specializations[MedicalSpecializationEnum.SURGEON]
+        cardiologists = specializations[MedicalSpecializationEnum.CARDIOLOGIST]
+        neurologists = specializations[MedicalSpecializationEnum.NEUROLOGIST]
+
+        therapeutic_department = departments[MedicalDepartmentEnum.THERAPEUTIC]
+        pediatric_department = departments[MedicalDepartmentEnum.PEDIATRIC]
+        surgical_department = departments[MedicalDepartmentEnum.SURGICAL]
+
+        return StaffAssignmentStatisticsSchema(
+            total_assignments=statistics.total,
+            active_assignments=statuses[StaffAssignmentStatusEnum.ACTIVE],
+            inactive_assignments=statuses[StaffAssignmentStatusEnum.INACTIVE],
+            suspended_assignments=statuses[StaffAssignmentStatusEnum.SUSPENDED],
+            completed_assignments=statuses[StaffAssignmentStatusEnum.COMPLETED],
+            therapists_count=therapists,
+            pediatricians_count=pediatricians,
+            surgeons_count=surgeons,
+            cardiologists_count=cardiologists,
+            neurologists_count=neurologists,
+            other_specialists_count=(
+                statistics.total - therapists - pediatricians - surgeons - cardiologists - neurologists
+            ),
+            therapeutic_department_count=therapeutic_department,
+            pediatric_department_count=pediatric_department,
+            surgical_department_count=surgical_department,
+            other_departments_count=(
+                statistics.total - therapeutic_department - pediatric_department - surgical_department
+            ),
+            total_areas_covered=areas["areas"] or 0,
+            therapeutic_areas_count=areas["therapeutic_areas"] or 0,
+            pediatric_areas_count=areas["pediatric_areas"] or 0,
+            general_practice_areas_count=areas["general_practice_areas"] or 0,
+        )
+
     async def create(self, assignment: StaffAssignmentDomain) -> StaffAssignmentDomain:
         db_assignment = map_staff_assignment_domain_to_db(assignment)
 
@@ -17,9 +17,28 @@ from src.apps.assets_journal.mappers.stationary_asset_mappers import (
     map_stationary_asset_db_to_domain,
     map_stationary_asset_domain_to_db,
 )
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import JournalRollup
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.statistics import JournalStatistics
+
+
+STATIONARY_STATISTICS = JournalStatistics(
+    StationaryAsset,
+    flags={
+        "confirmed": StationaryAsset.has_confirm == True,
+        "refused": StationaryAsset.has_refusal == True,
+        "with_files": StationaryAsset.has_files == True,
+    },
+)
+STATIONARY_ROLLUP = JournalRollup(
+    "stationary",
+    STATIONARY_STATISTICS,
+    day=StationaryAsset.reg_date,
+    date_filters=("date_from", "date_to"),
+)
 
 
 class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInterface):
@@ -63,6 +82,7 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[StationaryAssetDomain]:
         query = (
             select(StationaryAsset)
@@ -74,6 +94,20 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
         # Применяем фильтры
         query = self._apply_filters(query, filters)
 
+        # Курсорная (keyset) пагинация, если передан курсор
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query,
+                sort_key=(StationaryAsset.reg_date, StationaryAsset.id),
+                limit=limit,
+                cursor=cursor,
+                descending=True,
+            )
+            return KeysetPage(
+                [map_stationary_asset_db_to_domain(asset) for asset in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         # Сортировка по дате регистрации (сначала новые)
         query = query.order_by(StationaryAsset.reg_date.desc())
 
@@ -145,48 +179,22 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
         await self._async_db_session.flush()
 
     async def get_statistics(self, filters: Dict[str, any]) -> StationaryAssetStatisticsSchema:
-        base_query = select(StationaryAsset)
-        base_query = self._apply_filters(base_query, filters)
-
-        # Общее количество
-        total_query = select(func.count(StationaryAsset.id))
-        total_query = self._apply_filters(total_query, filters)
-        total_result = await self._async_db_session.execute(total_query)
-        total_assets = total_result.scalar_one()
-
-        # Подтвержденные
-        confirmed_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_confirm == True
-        )
-        confirmed_query = self._apply_filters(confirmed_query, filters)
-        confirmed_result = await self._async_db_session.execute(confirmed_query)
-        confirmed_assets = confirmed_result.scalar_one()
-
-        # Отказанные
-        refused_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_refusal == True
-        )
-        refused_query = self._apply_filters(refused_query, filters)
-        refused_result = await self._async_db_session.execute(refused_query)
-        refused_assets = refused_result.scalar_one()
-
-        # Ожидающие
-        pending_assets = total_assets - confirmed_assets - refused_assets
+        # Дашборды (только организация и период) читают предагрегированные данные,
+        # остальные запросы считают все показатели одним проходом по журналу
+        statistics = await STATIONARY_ROLLUP.read(self._async_db_session, filters)
+        if statistics is None:
+            query = self._apply_filters(STATIONARY_STATISTICS.select(), filters)
+            statistics = await self._get_statistics(STATIONARY_STATISTICS, query)
 
-        # С файлами
-        files_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_files == True
-        )
-        files_query = self._apply_filters(files_query, filters)
-        files_result = await self._async_db_session.execute(files_query)
-        assets_with_files = files_result.scalar_one()
+        confirmed_assets = statistics.counts["confirmed"]
+        refused_assets = statistics.counts["refused"]
 
         return StationaryAssetStatisticsSchema(
-            total_assets=total_assets,
+            total_assets=statistics.total,
             confirmed_assets=confirmed_assets,
             refused_assets=refused_assets,
-            pending_assets=pending_assets,
-            assets_with_files=assets_with_files,
+            pending_assets=statistics.total - confirmed_assets - refused_assets,
+            assets_with_files=statistics.counts["with_files"],
         )
 
     async def bulk_create(self, assets: List[StationaryAssetDomain]) -> List[StationaryAssetDomain]:
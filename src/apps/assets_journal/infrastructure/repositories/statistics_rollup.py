@@ -0,0 +1,283 @@
+import datetime
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import Date, Integer, cast, delete, event, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.apps.assets_journal.infrastructure.db_models.statistics_rollup_models import (
+    JournalStatisticsRollup,
+)
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.core.settings import project_settings
+from src.shared.infrastructure.statistics import JournalStatistics, StatisticsResult
+
+# Метки ключа агрегации (не совпадают с колонками журналов, иначе GROUP BY возьмет колонку)
+ORGANIZATION_LABEL = "rollup_organization_id"
+DAY_LABEL = "rollup_day"
+
+INSERT_CHUNK_SIZE = 1000
+
+# Граница периода не совпадает с границей дня
+_PARTIAL_DAY = object()
+
+# Модель журнала -> описание его предагрегированной статистики
+_rollups: Dict[type, "JournalRollup"] = {}
+
+
+def _whole_day(value: Any, end_of_day: bool) -> Any:
+    """
+    День границы периода, если она покрывает целые дни: начало периода - полночь,
+    конец - 23:59:59 и позже. Дни считаются в UTC. Иначе '_PARTIAL_DAY'.
+    """
+    if value is None or type(value) is datetime.date:
+        return value
+    if not isinstance(value, datetime.datetime):
+        return _PARTIAL_DAY
+
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    if end_of_day and value.time() < datetime.time(23, 59, 59):
+        return _PARTIAL_DAY
+    if not end_of_day and value.time() != datetime.time.min:
+        return _PARTIAL_DAY
+
+    return value.date()
+
+
+def rollup_rows(
+    journal: str, contributions: Iterable[Mapping[str, Any]], sign: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Строки таблицы агрегатов из строк 'JournalRollup.contributions_query'
+    (по одной на организацию и день). Нулевые показатели пропускаются.
+    """
+    rows = []
+    for contribution in contributions:
+        for metric, value in contribution.items():
+            if metric in (ORGANIZATION_LABEL, DAY_LABEL) or not value:
+                continue
+            rows.append(
+                {
+                    "journal": journal,
+                    "organization_id": contribution[ORGANIZATION_LABEL],
+                    "day": contribution[DAY_LABEL],
+                    "metric": metric,
+                    "value": sign * value,
+                }
+            )
+    return rows
+
+
+def _upsert_statement():
+    statement = insert(JournalStatisticsRollup)
+    return statement.on_conflict_do_update(
+        index_elements=[
+            JournalStatisticsRollup.journal,
+            JournalStatisticsRollup.organization_id,
+            JournalStatisticsRollup.day,
+            JournalStatisticsRollup.metric,
+        ],
+        set_={"value": JournalStatisticsRollup.value + statement.excluded.value},
+    )
+
+
+class JournalRollup:
+    """
+    Предагрегированная статистика журнала по организациям и дням.
+
+    Показатели 'statistics' журнала хранятся в 'journal_statistics_rollups' по
+    организации прикрепления пациента и дню 'day' (UTC). Таблица обновляется в
+    транзакции записи: перед flush вклад изменяемых и удаляемых записей вычитается,
+    после flush вклад новых и измененных записей прибавляется (UPSERT с приращением,
+    поэтому параллельные транзакции не теряют изменения). Журналы фильтруются по
+    текущему прикреплению пациента, поэтому при его изменении (и удалении пациента)
+    также переносится вклад всех записей пациента.
+
+    Статистика читается из агрегатов, если заданы только организация и период
+    ('date_filters') из целых дней; иначе 'read' возвращает None и статистика
+    считается по самому журналу.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        statistics: JournalStatistics,
+        day: Any,
+        date_filters: Tuple[str, str],
+    ):
+        self.name = name
+        self._statistics = statistics
+        self._model = statistics.model
+        self._day = cast(func.timezone("UTC", day), Date)
+        self._date_from_filter, self._date_to_filter = date_filters
+        _rollups[self._model] = self
+
+    def contributions_query(self) -> Select:
+        """Показатели журнала по организациям и дням."""
+        organization = func.coalesce(
+            SQLAlchemyPatient.attachment_data["attached_clinic_id"].cast(Integer), 0
+        ).label(ORGANIZATION_LABEL)
+        day = self._day.label(DAY_LABEL)
+
+        return (
+            self._statistics.select()
+            .add_columns(organization, day)
+            .outerjoin(SQLAlchemyPatient, SQLAlchemyPatient.id == self._model.patient_id)
+            .group_by(organization, day)
+        )
+
+    def patients_record_ids(self, connection: Connection, patient_ids: List[Any]) -> List[Any]:
+        """ID записей журнала пациентов 'patient_ids'."""
+        result = connection.execute(
+            select(self._model.id).where(self._model.patient_id.in_(patient_ids))
+        )
+        return list(result.scalars().all())
+
+    def apply_changes(self, connection: Connection, ids: Iterable[Any], sign: int) -> None:
+        """Прибавить (sign=1) или вычесть (sign=-1) вклад записей журнала с 'ids'."""
+        result = connection.execute(
+            self.contributions_query().where(self._model.id.in_(list(ids)))
+        )
+        rows = rollup_rows(self.name, result.mappings().all(), sign)
+        if rows:
+            connection.execute(_upsert_statement(), rows)
+
+    def _day_range(
+        self, filters: Dict[str, Any]
+    ) -> Optional[Tuple[Optional[datetime.date], Optional[datetime.date]]]:
+        if set(filters) - {"organization_id", self._date_from_filter, self._date_to_filter}:
+            return None
+
+        first_day = _whole_day(filters.get(self._date_from_filter), end_of_day=False)
+        last_day = _whole_day(filters.get(self._date_to_filter), end_of_day=True)
+        if first_day is _PARTIAL_DAY or last_day is _PARTIAL_DAY:
+            return None
+
+        return first_day, last_day
+
+    async def read(
+        self, session: AsyncSession, filters: Dict[str, Any]
+    ) -> Optional[StatisticsResult]:
+        """Статистика из агрегатов или None, если фильтры ими не покрываются."""
+        if not project_settings.JOURNAL_STATISTICS_ROLLUPS_READ_ENABLED:
+            return None
+
+        day_range = self._day_range(filters)
+        if day_range is None:
+            return None
+
+        first_day, last_day = day_range
+        query = (
+            select(JournalStatisticsRollup.metric, func.sum(JournalStatisticsRollup.value))
+            .where(JournalStatisticsRollup.journal == self.name)
+            .group_by(JournalStatisticsRollup.metric)
+        )
+        if filters.get("organization_id"):
+            query = query.where(JournalStatisticsRollup.organization_id == filters["organization_id"])
+        if first_day is not None:
+            query = query.where(JournalStatisticsRollup.day >= first_day)
+        if last_day is not None:
+            query = query.where(JournalStatisticsRollup.day <= last_day)
+
+        result = await session.execute(query)
+        return self._statistics.read({metric: int(value) for metric, value in result.all()})
+
+    async def rebuild(self, session: AsyncSession) -> int:
+        """Пересчитать агрегаты журнала по всем его записям. Возвращает количество строк."""
+        await session.execute(
+            delete(JournalStatisticsRollup).where(JournalStatisticsRollup.journal == self.name)
+        )
+        result = await session.execute(self.contributions_query())
+        rows = rollup_rows(self.name, result.mappings().all())
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            await session.execute(insert(JournalStatisticsRollup), rows[start:start + INSERT_CHUNK_SIZE])
+
+        return len(rows)
+
+
+def registered_rollups() -> List[JournalRollup]:
+    return list(_rollups.values())
+
+
+async def rebuild_rollups(session: AsyncSession) -> Dict[str, int]:
+    """
+    Пересчитать агрегаты всех журналов в транзакции сессии.
+    Таблица агрегатов блокируется от записи до конца транзакции, чтобы изменения
+    журналов во время пересчета не потерялись и не учлись дважды.
+    """
+    await session.execute(
+        text(f"LOCK TABLE {JournalStatisticsRollup.__tablename__} IN SHARE ROW EXCLUSIVE MODE")
+    )
+    return {rollup.name: await rollup.rebuild(session) for rollup in registered_rollups()}
+
+
+def _attached_clinic_id(attachment_data: Optional[Dict[str, Any]]) -> Any:
+    return (attachment_data or {}).get("attached_clinic_id")
+
+
+def _rekeyed_patient_ids(session: Session) -> List[Any]:
+    """Пациенты, чьи записи журналов переходят в другую организацию или удаляются."""
+    patient_ids = [
+        instance.id for instance in session.deleted if isinstance(instance, SQLAlchemyPatient)
+    ]
+    for instance in session.dirty:
+        if not isinstance(instance, SQLAlchemyPatient):
+            continue
+        history = inspect(instance).attrs.attachment_data.history
+        if not history.has_changes():
+            continue
+        # Если старое значение не загружено, считаем, что прикрепление изменилось
+        new = history.added[0] if history.added else None
+        if history.deleted and _attached_clinic_id(history.deleted[0]) == _attached_clinic_id(new):
+            continue
+        patient_ids.append(instance.id)
+    return patient_ids
+
+
+def _ids_by_rollup(session: Session, instances: Iterable[Any]) -> Dict[JournalRollup, Set[Any]]:
+    ids_by_rollup: Dict[JournalRollup, Set[Any]] = defaultdict(set)
+    for instance in instances:
+        rollup = _rollups.get(type(instance))
+        if rollup is not None and instance.id is not None:
+            ids_by_rollup[rollup].add(instance.id)
+
+    patient_ids = _rekeyed_patient_ids(session)
+    if patient_ids:
+        connection = session.connection()
+        for rollup in registered_rollups():
+            ids_by_rollup[rollup].update(rollup.patients_record_ids(connection, patient_ids))
+
+    return {rollup: ids for rollup, ids in ids_by_rollup.items() if ids}
+
+
+@event.listens_for(Session, "before_flush")
+def _subtract_changed_rows(session: Session, flush_context: Any, instances: Any) -> None:
+    if not project_settings.JOURNAL_STATISTICS_ROLLUPS_MAINTAINED:
+        return
+
+    # Вклад записей по их состоянию в БД до изменения
+    changed = [instance for instance in session.dirty if session.is_modified(instance)]
+    ids_by_rollup = _ids_by_rollup(session, [*changed, *session.deleted])
+    if ids_by_rollup:
+        connection = session.connection()
+        for rollup, ids in ids_by_rollup.items():
+            rollup.apply_changes(connection, ids, sign=-1)
+
+
+@event.listens_for(Session, "after_flush")
+def _add_changed_rows(session: Session, flush_context: Any) -> None:
+    if not project_settings.JOURNAL_STATISTICS_ROLLUPS_MAINTAINED:
+        return
+
+    # 'new', 'dirty' и история атрибутов после flush еще отражают записанные изменения
+    changed = [instance for instance in session.dirty if session.is_modified(instance)]
+    ids_by_rollup = _ids_by_rollup(session, [*session.new, *changed])
+    if ids_by_rollup:
+        connection = session.connection()
+        for rollup, ids in ids_by_rollup.items():
+            rollup.apply_changes(connection, ids, sign=1)
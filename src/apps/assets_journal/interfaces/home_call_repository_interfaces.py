@@ -3,6 +3,9 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from src.apps.assets_journal.domain.models.home_call import HomeCallDomain, HomeCallListItemDomain
+from src.apps.assets_journal.infrastructure.api.schemas.responses.home_call_schemas import (
+    HomeCallStatisticsSchema,
+)
 
 
 class HomeCallRepositoryInterface(ABC):
@@ -34,6 +37,7 @@ class HomeCallRepositoryInterface(ABC):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[HomeCallListItemDomain]:
         """
         Получить список вызовов на дом с фильтрацией и пагинацией
@@ -41,6 +45,8 @@ class HomeCallRepositoryInterface(ABC):
         :param filters: Словарь фильтров
         :param page: Номер страницы
         :param limit: Количество записей на странице
+        :param cursor: Курсор keyset-пагинации (если передан, 'page' игнорируется
+            и возвращается 'KeysetPage' с 'next_cursor')
         :return: Список доменных моделей вызовов на дом
         """
         pass
@@ -55,6 +61,16 @@ class HomeCallRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_statistics(self, filters: Dict[str, any]) -> HomeCallStatisticsSchema:
+        """
+        Получить статистику вызовов на дом одним запросом
+
+        :param filters: Словарь фильтров
+        :return: Статистика вызовов на дом
+        """
+        pass
+
     @abstractmethod
     async def create(self, home_call: HomeCallDomain) -> HomeCallDomain:
         """
@@ -34,6 +34,7 @@ class MaternityAssetRepositoryInterface(ABC):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[MaternityAssetListItemDomain]:
         """
         Получить список активов с фильтрацией и пагинацией
@@ -41,6 +42,8 @@ class MaternityAssetRepositoryInterface(ABC):
         :param filters: Словарь фильтров
         :param page: Номер страницы
         :param limit: Количество записей на странице
+        :param cursor: Курсор keyset-пагинации (если передан, 'page' игнорируется
+            и возвращается 'KeysetPage' с 'next_cursor')
         :return: Список доменных моделей активов
         """
         pass
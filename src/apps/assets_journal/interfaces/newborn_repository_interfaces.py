@@ -37,6 +37,7 @@ class NewbornAssetRepositoryInterface(ABC):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[NewbornAssetListItemDomain]:
         """
         Получить список активов с фильтрацией и пагинацией
@@ -44,6 +45,8 @@ class NewbornAssetRepositoryInterface(ABC):
         :param filters: Словарь фильтров
         :param page: Номер страницы
         :param limit: Количество записей на странице
+        :param cursor: Курсор keyset-пагинации (если передан, 'page' игнорируется
+            и возвращается 'KeysetPage' с 'next_cursor')
         :return: Список доменных моделей активов
         """
         pass
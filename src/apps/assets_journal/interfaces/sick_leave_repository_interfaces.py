@@ -3,6 +3,9 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from src.apps.assets_journal.domain.models.sick_leave import SickLeaveDomain, SickLeaveListItemDomain
+from src.apps.assets_journal.infrastructure.api.schemas.responses.sick_leave_schemas import (
+    SickLeaveStatisticsSchema,
+)
 
 
 class SickLeaveRepositoryInterface(ABC):
@@ -24,6 +27,7 @@ class SickLeaveRepositoryInterface(ABC):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[SickLeaveListItemDomain]:
         """
         Получить список больничных листов с фильтрацией и пагинацией
@@ -31,6 +35,8 @@ class SickLeaveRepositoryInterface(ABC):
         :param filters: Словарь фильтров
         :param page: Номер страницы
         :param limit: Количество записей на странице
+        :param cursor: Курсор keyset-пагинации (если передан, 'page' игнорируется
+            и возвращается 'KeysetPage' с 'next_cursor')
         :return: Список доменных моделей больничных листов
         """
         pass
@@ -45,6 +51,16 @@ class SickLeaveRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_statistics(self, filters: Dict[str, any]) -> SickLeaveStatisticsSchema:
+        """
+        Получить статистику больничных листов одним запросом
+
+        :param filters: Словарь фильтров
+        :return: Статистика больничных листов
+        """
+        pass
+
     @abstractmethod
     async def create(self, sick_leave: SickLeaveDomain) -> SickLeaveDomain:
         """
@@ -3,6 +3,9 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from src.apps.assets_journal.domain.models.staff_assignment import StaffAssignmentDomain, StaffAssignmentListItemDomain
+from src.apps.assets_journal.infrastructure.api.schemas.responses.staff_assignment_schemas import (
+    StaffAssignmentStatisticsSchema,
+)
 
 
 class StaffAssignmentRepositoryInterface(ABC):
@@ -24,6 +27,7 @@ class StaffAssignmentRepositoryInterface(ABC):
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
+            cursor: Optional[str] = None,
     ) -> List[StaffAssignmentListItemDomain]:
         """
         Получить список назначений медперсонала с фильтрацией и пагинацией
@@ -31,6 +35,8 @@ class StaffAssignmentRepositoryInterface(ABC):
         :param filters: Словарь фильтров
         :param page: Номер страницы
         :param limit: Количество записей на странице
+        :param cursor: Курсор keyset-пагинации (если передан, 'page' игнорируется
+            и возвращается 'KeysetPage' с 'next_cursor')
         :return: Список доменных моделей назначений медперсонала
         """
         pass
@@ -45,6 +51,16 @@ class StaffAssignmentRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_statistics(self, filters: Dict[str, any]) -> StaffAssignmentStatisticsSchema:
+        """
+        Получить статистику назначений медперсонала одним запросом
+
+        :param filters: Словарь фильтров
+        :return: Статистика назначений медперсонала
+        """
+        pass
+
     @abstractmethod
     async def create(self, assignment: StaffAssignmentDomain) -> StaffAssignmentDomain:
         """
@@ -2,7 +2,7 @@ from datetime import datetime, time, date
 from typing import List, Tuple, Optional
 from uuid import UUID, uuid4
 
-from src.apps.assets_journal.domain.enums import HomeCallStatusEnum, HomeCallCategoryEnum
+from src.apps.assets_journal.domain.enums import HomeCallStatusEnum
 from src.apps.assets_journal.domain.models.home_call import HomeCallDomain, HomeCallListItemDomain
 from src.apps.assets_journal.infrastructure.api.schemas.requests.home_call_schemas import (
     HomeCallFilterParams,
@@ -23,7 +23,7 @@ from src.apps.assets_journal.interfaces.uow_interface import (
 from src.apps.assets_journal.mappers.home_call_mappers import map_create_schema_to_domain
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError, ValidationError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -58,7 +58,10 @@ class HomeCallService:
         if not home_call:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Вызов на дом с ID: %(ID)s не найден.") % {"ID": home_call_id}
+                detail=format_message(
+                    "Вызов на дом с ID: %(ID)s не найден.",
+                    ID=home_call_id,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -78,7 +81,10 @@ class HomeCallService:
         if not home_call:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Вызов на дом с номером: %(NUMBER)s не найден.") % {"NUMBER": call_number}
+                detail=format_message(
+                    "Вызов на дом с номером: %(NUMBER)s не найден.",
+                    NUMBER=call_number,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -104,6 +110,7 @@ class HomeCallService:
             filters=filters,
             page=pagination_params.page or 1,
             limit=pagination_params.limit or 30,
+            cursor=pagination_params.cursor,
         )
 
         # Загружаем данные организаций для каждого вызова на дом
@@ -221,7 +228,10 @@ class HomeCallService:
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Пациент с ИИН %(IIN)s не найден.") % {"IIN": create_schema.patient_iin}
+                detail=format_message(
+                    "Пациент с ИИН %(IIN)s не найден.",
+                    IIN=create_schema.patient_iin,
+                )
             )
 
         # Валидация данных
@@ -259,7 +269,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(created_home_call)
 
-        self._logger.info(f"Создан вызов на дом {created_home_call.call_number} для пациента {patient.iin}")
+        self._logger.info("Создан вызов на дом %s для пациента %s", created_home_call.call_number, patient.iin)
         return created_home_call
 
     async def create_home_call_by_patient_id(
@@ -312,7 +322,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(created_home_call)
 
-        self._logger.info(f"Создан вызов на дом {created_home_call.call_number} для пациента {patient_id}")
+        self._logger.info("Создан вызов на дом %s для пациента %s", created_home_call.call_number, patient_id)
         return created_home_call
 
     async def update_home_call(
@@ -355,7 +365,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(updated_home_call)
 
-        self._logger.info(f"Обновлен вызов на дом {home_call.call_number}")
+        self._logger.info("Обновлен вызов на дом %s", home_call.call_number)
         return updated_home_call
 
     async def complete_home_call(
@@ -395,7 +405,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(updated_home_call)
 
-        self._logger.info(f"Завершен вызов на дом {home_call.call_number}")
+        self._logger.info("Завершен вызов на дом %s", home_call.call_number)
         return updated_home_call
 
     async def start_processing_home_call(self, home_call_id: UUID) -> HomeCallDomain:
@@ -419,7 +429,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(updated_home_call)
 
-        self._logger.info(f"Вызов на дом {home_call.call_number} взят в работу")
+        self._logger.info("Вызов на дом %s взят в работу", home_call.call_number)
         return updated_home_call
 
     async def cancel_home_call(
@@ -451,7 +461,7 @@ class HomeCallService:
         # Загружаем данные организации
         await self._load_organization_data(updated_home_call)
 
-        self._logger.info(f"Отменен вызов на дом {home_call.call_number}. Причина: {reason or 'Не указана'}")
+        self._logger.info("Отменен вызов на дом %s. Причина: %s", home_call.call_number, reason or 'Не указана')
         return updated_home_call
 
     async def delete_home_call(self, home_call_id: UUID) -> None:
@@ -471,7 +481,7 @@ class HomeCallService:
             await self._uow.home_call_repository.delete(home_call_id)
             await self._uow.commit()
 
-        self._logger.info(f"Удален вызов на дом {home_call.call_number}")
+        self._logger.info("Удален вызов на дом %s", home_call.call_number)
 
     async def get_statistics(
             self,
@@ -484,42 +494,7 @@ class HomeCallService:
         :return: Статистика вызовов на дом
         """
         filters = filter_params.to_dict(exclude_none=True)
-        total_count = await self._home_call_repository.get_total_count(filters)
-
-        # Получаем статистику по статусам
-        status_stats = {}
-        for status in HomeCallStatusEnum:
-            status_filters = filters.copy()
-            status_filters['status'] = status
-            count = await self._home_call_repository.get_total_count(status_filters)
-            status_stats[status.value] = count
-
-        # Получаем статистику по категориям
-        category_stats = {}
-        for category in HomeCallCategoryEnum:
-            category_filters = filters.copy()
-            category_filters['category'] = category
-            count = await self._home_call_repository.get_total_count(category_filters)
-            category_stats[category.value] = count
-
-        return HomeCallStatisticsSchema(
-            total_calls=total_count,
-            registered_calls=status_stats.get('registered', 0),
-            in_progress_calls=status_stats.get('in_progress', 0),
-            completed_calls=status_stats.get('completed', 0),
-            cancelled_calls=status_stats.get('cancelled', 0),
-            emergency_calls=category_stats.get('emergency', 0),
-            urgent_calls=category_stats.get('urgent', 0),
-            planned_calls=category_stats.get('planned', 0),
-            patient_calls=0,
-            relatives_calls=0,
-            egov_calls=0,
-            call_center_calls=0,
-            other_source_calls=0,
-            therapeutic_calls=0,
-            pediatric_calls=0,
-            specialist_calls=0,
-        )
+        return await self._home_call_repository.get_statistics(filters)
 
     async def _validate_home_call_data(self, schema) -> None:
         """
@@ -591,18 +566,18 @@ class HomeCallService:
                 organization_ids.add(home_call.organization_id)
 
         # Загружаем все организации одним запросом
-        organizations_data = {}
-        for org_id in organization_ids:
-            try:
-                organization = await self._medical_organizations_catalog_service.get_by_id(org_id)
-                organizations_data[org_id] = {
-                    'id': organization.id,
-                    'name': organization.name,
-                    'code': organization.organization_code,
-                    'address': organization.address,
-                }
-            except NoInstanceFoundError:
-                self._logger.warning(f"Организация с ID {org_id} не найдена")
+        organizations = await self._medical_organizations_catalog_service.get_by_ids(organization_ids)
+        organizations_data = {
+            org_id: {
+                'id': organization.id,
+                'name': organization.name,
+                'code': organization.organization_code,
+                'address': organization.address,
+            }
+            for org_id, organization in organizations.items()
+        }
+        for org_id in organization_ids - organizations.keys():
+            self._logger.warning(f"Организация с ID {org_id} не найдена")
 
         # Устанавливаем данные организаций для вызовов на дом
         for home_call in home_calls:
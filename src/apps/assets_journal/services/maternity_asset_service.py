@@ -25,7 +25,7 @@ from src.apps.assets_journal.mappers.maternity_asset_mappers import (
 )
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -60,7 +60,10 @@ class MaternityAssetService:
         if not asset:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Актив роддома с ID: %(ID)s не найден.") % {"ID": asset_id}
+                detail=format_message(
+                    "Актив роддома с ID: %(ID)s не найден.",
+                    ID=asset_id,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -86,6 +89,7 @@ class MaternityAssetService:
             filters=filters,
             page=pagination_params.page,
             limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
         # Загружаем данные организаций для каждого актива
@@ -164,7 +168,10 @@ class MaternityAssetService:
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Пациент с ИИН %(IIN)s не найден.") % {"IIN": create_schema.patient_iin}
+                detail=format_message(
+                    "Пациент с ИИН %(IIN)s не найден.",
+                    IIN=create_schema.patient_iin,
+                )
             )
 
         # Проверяем, что актив с таким BG ID еще не существует
@@ -174,7 +181,10 @@ class MaternityAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Mapping
@@ -186,7 +196,7 @@ class MaternityAssetService:
         # Загружаем данные организации
         await self._load_organization_data(created_asset)
 
-        self._logger.info(f"Создан новый актив роддома {created_asset.id} для пациента {patient.iin}")
+        self._logger.info("Создан новый актив роддома %s для пациента %s", created_asset.id, patient.iin)
 
         return created_asset
 
@@ -209,7 +219,10 @@ class MaternityAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Преобразуем диагнозы
@@ -245,7 +258,7 @@ class MaternityAssetService:
         # Загружаем данные организации
         await self._load_organization_data(created_asset)
 
-        self._logger.info(f"Создан новый актив роддома {created_asset.id} по ID пациента {patient_id}")
+        self._logger.info("Создан новый актив роддома %s по ID пациента %s", created_asset.id, patient_id)
 
         return created_asset
 
@@ -319,7 +332,7 @@ class MaternityAssetService:
         # Загружаем данные организации
         await self._load_organization_data(updated_asset)
 
-        self._logger.info(f"Обновлен актив роддома {asset_id}")
+        self._logger.info("Обновлен актив роддома %s", asset_id)
 
         return updated_asset
 
@@ -337,7 +350,7 @@ class MaternityAssetService:
         if asset.is_confirmed:
             raise ValueError(_("Нельзя удалить подтвержденный актив."))
 
-        self._logger.info(f"Удаление актива роддома {asset_id}")
+        self._logger.info("Удаление актива роддома %s", asset_id)
 
         async with self._uow:
             await self._uow.maternity_asset_repository.delete(asset_id)
@@ -367,7 +380,7 @@ class MaternityAssetService:
         # Загружаем данные организации
         await self._load_organization_data(updated_asset)
 
-        self._logger.info(f"Актив роддома {asset_id} подтвержден")
+        self._logger.info("Актив роддома %s подтвержден", asset_id)
 
         return updated_asset
 
@@ -387,7 +400,7 @@ class MaternityAssetService:
             with open(file_path, 'r', encoding='utf-8') as f:
                 bg_data = json.load(f)
 
-            self._logger.info(f"Начинаем загрузку активов роддома из файла: {file_path}")
+            self._logger.info("Начинаем загрузку активов роддома из файла: %s", file_path)
 
             # Преобразуем данные BG в доменные модели
             assets_to_create = []
@@ -424,7 +437,7 @@ class MaternityAssetService:
                     error_count += 1
 
             if not assets_to_create:
-                self._logger.info(f"Нет новых активов для создания. Пропущено: {skipped_count}, ошибок: {error_count}")
+                self._logger.info("Нет новых активов для создания. Пропущено: %s, ошибок: %s", skipped_count, error_count)
                 return []
 
             # Массовое создание активов
@@ -435,8 +448,11 @@ class MaternityAssetService:
             await self._load_organization_data_for_assets(created_assets)
 
             self._logger.info(
-                f"Успешно загружено {len(created_assets)} активов роддома из файла BG. "
-                f"Пропущено: {skipped_count}, ошибок: {error_count}"
+                "Успешно загружено %s активов роддома из файла BG. "
+                "Пропущено: %s, ошибок: %s",
+                len(created_assets),
+                skipped_count,
+                error_count,
             )
             return created_assets
 
@@ -448,7 +464,10 @@ class MaternityAssetService:
             raise ValueError(_("Ошибка в формате файла данных BG"))
         except Exception as e:
             self._logger.error(f"Ошибка при загрузке данных из файла BG: {str(e)}")
-            raise ValueError(_("Ошибка при загрузке данных из файла BG: %(error)s") % {"error": str(e)})
+            raise ValueError(format_message(
+                "Ошибка при загрузке данных из файла BG: %(error)s",
+                error=str(e),
+            ))
 
     async def _load_organization_data(self, asset: MaternityAssetDomain) -> None:
         """
@@ -487,19 +506,19 @@ class MaternityAssetService:
         if not organization_ids:
             return
 
-        # Загружаем все организации
-        organizations_data = {}
-        for org_id in organization_ids:
-            try:
-                organization = await self._medical_organizations_catalog_service.get_by_id(org_id)
-                organizations_data[org_id] = {
-                    'id': organization.id,
-                    'name': organization.name,
-                    'code': organization.organization_code,
-                    'address': organization.address,
-                }
-            except NoInstanceFoundError:
-                self._logger.warning(f"Организация с ID {org_id} не найдена")
+        # Загружаем все организации одним запросом
+        organizations = await self._medical_organizations_catalog_service.get_by_ids(organization_ids)
+        organizations_data = {
+            org_id: {
+                'id': organization.id,
+                'name': organization.name,
+                'code': organization.organization_code,
+                'address': organization.address,
+            }
+            for org_id, organization in organizations.items()
+        }
+        for org_id in organization_ids - organizations.keys():
+            self._logger.warning(f"Организация с ID {org_id} не найдена")
 
         # Устанавливаем данные организаций для активов
         for asset in assets:
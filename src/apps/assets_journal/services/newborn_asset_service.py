@@ -31,7 +31,7 @@ from src.apps.assets_journal.mappers.newborn_asset_mappers import (
 )
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -66,7 +66,10 @@ class NewbornAssetService:
         if not asset:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Актив новорожденного с ID: %(ID)s не найден.") % {"ID": asset_id}
+                detail=format_message(
+                    "Актив новорожденного с ID: %(ID)s не найден.",
+                    ID=asset_id,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -92,6 +95,7 @@ class NewbornAssetService:
             filters=filters,
             page=pagination_params.page,
             limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
         # Загружаем данные организаций для каждого актива
@@ -188,7 +192,10 @@ class NewbornAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Mapping
@@ -221,7 +228,10 @@ class NewbornAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Преобразуем данные
@@ -367,13 +377,20 @@ class NewbornAssetService:
         try:
             new_organization = await self._medical_organizations_catalog_service.get_by_id(new_organization_id)
         except NoInstanceFoundError:
-            raise ValueError(_("Организация с ID %(ID)s не найдена.") % {"ID": new_organization_id})
+            raise ValueError(format_message(
+                "Организация с ID %(ID)s не найдена.",
+                ID=new_organization_id,
+            ))
 
         # Логируем передачу
         old_org_name = asset.organization_data.get('name', 'Неизвестно') if asset.organization_data else 'Неизвестно'
         self._logger.info(
-            f"Передача актива новорожденного {asset_id} из организации '{old_org_name}' "
-            f"в организацию '{new_organization.name}'. Причина: {transfer_reason or 'Не указана'}"
+            "Передача актива новорожденного %s из организации '%s' "
+            "в организацию '%s'. Причина: %s",
+            asset_id,
+            old_org_name,
+            new_organization.name,
+            transfer_reason or 'Не указана',
         )
 
         # Обновляем attachment_data пациента если требуется
@@ -514,7 +531,7 @@ class NewbornAssetService:
             # Загружаем данные организаций для созданных активов
             await self._load_organization_data_for_assets(created_assets)
 
-            self._logger.info(f"Успешно загружено {len(created_assets)} активов новорожденных из файла BG")
+            self._logger.info("Успешно загружено %s активов новорожденных из файла BG", len(created_assets))
             return created_assets
 
         except FileNotFoundError:
@@ -559,18 +576,18 @@ class NewbornAssetService:
                 organization_ids.add(asset.organization_id)
 
         # Загружаем все организации одним запросом
-        organizations_data = {}
-        for org_id in organization_ids:
-            try:
-                organization = await self._medical_organizations_catalog_service.get_by_id(org_id)
-                organizations_data[org_id] = {
-                    'id': organization.id,
-                    'name': organization.name,
-                    'code': organization.organization_code,
-                    'address': organization.address,
-                }
-            except NoInstanceFoundError:
-                self._logger.warning(f"Организация с ID {org_id} не найдена")
+        organizations = await self._medical_organizations_catalog_service.get_by_ids(organization_ids)
+        organizations_data = {
+            org_id: {
+                'id': organization.id,
+                'name': organization.name,
+                'code': organization.organization_code,
+                'address': organization.address,
+            }
+            for org_id, organization in organizations.items()
+        }
+        for org_id in organization_ids - organizations.keys():
+            self._logger.warning(f"Организация с ID {org_id} не найдена")
 
         # Устанавливаем данные организаций для активов
         for asset in assets:
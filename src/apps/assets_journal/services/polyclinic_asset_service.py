@@ -29,7 +29,7 @@ from src.apps.assets_journal.mappers.polyclinic_asset_mappers import (
 )
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -69,7 +69,10 @@ class PolyclinicAssetService:
         if not asset:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Актив поликлиники с ID: %(ID)s не найден.") % {"ID": asset_id}
+                detail=format_message(
+                    "Актив поликлиники с ID: %(ID)s не найден.",
+                    ID=asset_id,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -95,6 +98,7 @@ class PolyclinicAssetService:
             filters=filters,
             page=pagination_params.page,
             limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
         # Загружаем данные организаций для каждого актива
@@ -173,7 +177,10 @@ class PolyclinicAssetService:
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Пациент с ИИН %(IIN)s не найден.") % {"IIN": create_schema.patient_iin}
+                detail=format_message(
+                    "Пациент с ИИН %(IIN)s не найден.",
+                    IIN=create_schema.patient_iin,
+                )
             )
 
         # Проверяем, что актив с таким BG ID еще не существует
@@ -183,7 +190,10 @@ class PolyclinicAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Mapping
@@ -195,7 +205,7 @@ class PolyclinicAssetService:
         # Загружаем данные организации
         await self._load_organization_data(created_asset)
 
-        self._logger.info(f"Создан новый актив поликлиники {created_asset.id} для пациента {patient.iin}")
+        self._logger.info("Создан новый актив поликлиники %s для пациента %s", created_asset.id, patient.iin)
 
         return created_asset
 
@@ -218,7 +228,10 @@ class PolyclinicAssetService:
             )
             if existing_asset:
                 raise ValueError(
-                    _("Актив с BG ID %(ID)s уже существует.") % {"ID": create_schema.bg_asset_id}
+                    format_message(
+                        "Актив с BG ID %(ID)s уже существует.",
+                        ID=create_schema.bg_asset_id,
+                    )
                 )
 
         # Преобразуем недельное расписание
@@ -258,7 +271,7 @@ class PolyclinicAssetService:
         # Загружаем данные организации
         await self._load_organization_data(created_asset)
 
-        self._logger.info(f"Создан новый актив поликлиники {created_asset.id} по ID пациента {patient_id}")
+        self._logger.info("Создан новый актив поликлиники %s по ID пациента %s", created_asset.id, patient_id)
 
         return created_asset
 
@@ -326,7 +339,7 @@ class PolyclinicAssetService:
         # Загружаем данные организации
         await self._load_organization_data(updated_asset)
 
-        self._logger.info(f"Обновлен актив поликлиники {asset_id}")
+        self._logger.info("Обновлен актив поликлиники %s", asset_id)
 
         return updated_asset
 
@@ -361,9 +374,12 @@ class PolyclinicAssetService:
         await self._load_organization_data(updated_asset)
 
         self._logger.info(
-            f"Актив поликлиники {asset_id} отклонен. "
-            f"Причина: {reject_schema.rejection_reason}. "
-            f"Отклонен: {reject_schema.rejection_reason_by.value}"
+            "Актив поликлиники %s отклонен. "
+            "Причина: %s. "
+            "Отклонен: %s",
+            asset_id,
+            reject_schema.rejection_reason,
+            reject_schema.rejection_reason_by.value,
         )
 
         return updated_asset
@@ -395,13 +411,20 @@ class PolyclinicAssetService:
         try:
             new_organization = await self._medical_organizations_catalog_service.get_by_id(new_organization_id)
         except NoInstanceFoundError:
-            raise ValueError(_("Организация с ID %(ID)s не найдена.") % {"ID": new_organization_id})
+            raise ValueError(format_message(
+                "Организация с ID %(ID)s не найдена.",
+                ID=new_organization_id,
+            ))
 
         # Логируем передачу
         old_org_name = asset.organization_data.get('name', 'Неизвестно') if asset.organization_data else 'Неизвестно'
         self._logger.info(
-            f"Передача актива поликлиники {asset_id} из организации '{old_org_name}' "
-            f"в организацию '{new_organization.name}'. Причина: {transfer_reason or 'Не указана'}"
+            "Передача актива поликлиники %s из организации '%s' "
+            "в организацию '%s'. Причина: %s",
+            asset_id,
+            old_org_name,
+            new_organization.name,
+            transfer_reason or 'Не указана',
         )
 
         # Обновляем attachment_data пациента если требуется
@@ -461,7 +484,7 @@ class PolyclinicAssetService:
         if asset.is_confirmed:
             raise ValueError(_("Нельзя удалить подтвержденный актив."))
 
-        self._logger.info(f"Удаление актива поликлиники {asset_id}")
+        self._logger.info("Удаление актива поликлиники %s", asset_id)
 
         async with self._uow:
             await self._uow.polyclinic_asset_repository.delete(asset_id)
@@ -504,7 +527,7 @@ class PolyclinicAssetService:
         # Загружаем данные организации
         await self._load_organization_data(updated_asset)
 
-        self._logger.info(f"Актив поликлиники {asset_id} подтвержден")
+        self._logger.info("Актив поликлиники %s подтвержден", asset_id)
 
         return updated_asset
 
@@ -524,7 +547,7 @@ class PolyclinicAssetService:
             with open(file_path, 'r', encoding='utf-8') as f:
                 bg_data = json.load(f)
 
-            self._logger.info(f"Начинаем загрузку активов поликлиники из файла: {file_path}")
+            self._logger.info("Начинаем загрузку активов поликлиники из файла: %s", file_path)
 
             # Преобразуем данные BG в доменные модели
             assets_to_create = []
@@ -561,7 +584,7 @@ class PolyclinicAssetService:
                     error_count += 1
 
             if not assets_to_create:
-                self._logger.info(f"Нет новых активов для создания. Пропущено: {skipped_count}, ошибок: {error_count}")
+                self._logger.info("Нет новых активов для создания. Пропущено: %s, ошибок: %s", skipped_count, error_count)
                 return []
 
             # Массовое создание активов
@@ -572,8 +595,11 @@ class PolyclinicAssetService:
             await self._load_organization_data_for_assets(created_assets)
 
             self._logger.info(
-                f"Успешно загружено {len(created_assets)} активов поликлиники из файла BG. "
-                f"Пропущено: {skipped_count}, ошибок: {error_count}"
+                "Успешно загружено %s активов поликлиники из файла BG. "
+                "Пропущено: %s, ошибок: %s",
+                len(created_assets),
+                skipped_count,
+                error_count,
             )
             return created_assets
 
@@ -585,7 +611,10 @@ class PolyclinicAssetService:
             raise ValueError(_("Ошибка в формате файла данных BG"))
         except Exception as e:
             self._logger.error(f"Ошибка при загрузке данных из файла BG: {str(e)}")
-            raise ValueError(_("Ошибка при загрузке данных из файла BG: %(error)s") % {"error": str(e)})
+            raise ValueError(format_message(
+                "Ошибка при загрузке данных из файла BG: %(error)s",
+                error=str(e),
+            ))
 
     async def _load_organization_data(self, asset: PolyclinicAssetDomain) -> None:
         """
@@ -624,19 +653,19 @@ class PolyclinicAssetService:
         if not organization_ids:
             return
 
-        # Загружаем все организации
-        organizations_data = {}
-        for org_id in organization_ids:
-            try:
-                organization = await self._medical_organizations_catalog_service.get_by_id(org_id)
-                organizations_data[org_id] = {
-                    'id': organization.id,
-                    'name': organization.name,
-                    'code': organization.organization_code,
-                    'address': organization.address,
-                }
-            except NoInstanceFoundError:
-                self._logger.warning(f"Организация с ID {org_id} не найдена")
+        # Загружаем все организации одним запросом
+        organizations = await self._medical_organizations_catalog_service.get_by_ids(organization_ids)
+        organizations_data = {
+            org_id: {
+                'id': organization.id,
+                'name': organization.name,
+                'code': organization.organization_code,
+                'address': organization.address,
+            }
+            for org_id, organization in organizations.items()
+        }
+        for org_id in organization_ids - organizations.keys():
+            self._logger.warning(f"Организация с ID {org_id} не найдена")
 
         # Устанавливаем данные организаций для активов
         for asset in assets:
@@ -26,7 +26,7 @@ from src.apps.assets_journal.interfaces.uow_interface import (
 from src.apps.assets_journal.mappers.sick_leave_mappers import map_create_schema_to_domain
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -61,7 +61,10 @@ class SickLeaveService:
         if not sick_leave:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Больничный лист с ID: %(ID)s не найден.") % {"ID": sick_leave_id}
+                detail=format_message(
+                    "Больничный лист с ID: %(ID)s не найден.",
+                    ID=sick_leave_id,
+                )
             )
 
         # Загружаем данные организации если есть organization_id
@@ -87,6 +90,7 @@ class SickLeaveService:
             filters=filters,
             page=pagination_params.page,
             limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
         # Загружаем данные организаций для каждого больничного листа
@@ -174,7 +178,10 @@ class SickLeaveService:
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Пациент с ИИН %(IIN)s не найден.") % {"IIN": create_schema.patient_iin}
+                detail=format_message(
+                    "Пациент с ИИН %(IIN)s не найден.",
+                    IIN=create_schema.patient_iin,
+                )
             )
 
         # Валидация дат
@@ -190,7 +197,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(created_sick_leave)
 
-        self._logger.info(f"Создан больничный лист {created_sick_leave.id} для пациента {patient.iin}")
+        self._logger.info("Создан больничный лист %s для пациента %s", created_sick_leave.id, patient.iin)
         return created_sick_leave
 
     async def create_sick_leave_by_patient_id(
@@ -237,7 +244,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(created_sick_leave)
 
-        self._logger.info(f"Создан больничный лист {created_sick_leave.id} для пациента {patient_id}")
+        self._logger.info("Создан больничный лист %s для пациента %s", created_sick_leave.id, patient_id)
         return created_sick_leave
 
     async def update_sick_leave(
@@ -274,7 +281,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(updated_sick_leave)
 
-        self._logger.info(f"Обновлен больничный лист {sick_leave_id}")
+        self._logger.info("Обновлен больничный лист %s", sick_leave_id)
         return updated_sick_leave
 
     async def close_sick_leave(
@@ -305,7 +312,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(updated_sick_leave)
 
-        self._logger.info(f"Закрыт больничный лист {sick_leave_id}")
+        self._logger.info("Закрыт больничный лист %s", sick_leave_id)
         return updated_sick_leave
 
     async def extend_sick_leave(
@@ -339,7 +346,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(updated_sick_leave)
 
-        self._logger.info(f"Продлен больничный лист {sick_leave_id} до {extend_schema.new_end_date}")
+        self._logger.info("Продлен больничный лист %s до %s", sick_leave_id, extend_schema.new_end_date)
         return updated_sick_leave
 
     async def cancel_sick_leave(
@@ -367,7 +374,7 @@ class SickLeaveService:
         # Загружаем данные организации
         await self._load_organization_data(updated_sick_leave)
 
-        self._logger.info(f"Отменен больничный лист {sick_leave_id}. Причина: {reason or 'Не указана'}")
+        self._logger.info("Отменен больничный лист %s. Причина: %s", sick_leave_id, reason or 'Не указана')
         return updated_sick_leave
 
     async def delete_sick_leave(self, sick_leave_id: UUID) -> None:
@@ -382,7 +389,7 @@ class SickLeaveService:
         async with self._uow:
             await self._uow.sick_leave_repository.delete(sick_leave_id)
 
-        self._logger.info(f"Удален больничный лист {sick_leave_id}")
+        self._logger.info("Удален больничный лист %s", sick_leave_id)
 
     async def get_extensions(self, parent_sick_leave_id: UUID) -> List[SickLeaveDomain]:
         """
@@ -420,13 +427,20 @@ class SickLeaveService:
         try:
             new_organization = await self._medical_organizations_catalog_service.get_by_id(new_organization_id)
         except NoInstanceFoundError:
-            raise ValueError(_("Организация с ID %(ID)s не найдена.") % {"ID": new_organization_id})
+            raise ValueError(format_message(
+                "Организация с ID %(ID)s не найдена.",
+                ID=new_organization_id,
+            ))
 
         # Логируем передачу
         old_org_name = sick_leave.organization_data.get('name', 'Неизвестно') if sick_leave.organization_data else 'Неизвестно'
         self._logger.info(
-            f"Передача больничного листа {sick_leave_id} из организации '{old_org_name}' "
-            f"в организацию '{new_organization.name}'. Причина: {transfer_reason or 'Не указана'}"
+            "Передача больничного листа %s из организации '%s' "
+            "в организацию '%s'. Причина: %s",
+            sick_leave_id,
+            old_org_name,
+            new_organization.name,
+            transfer_reason or 'Не указана',
         )
 
         # Обновляем attachment_data пациента если требуется
@@ -469,26 +483,8 @@ class SickLeaveService:
         :param filter_params: Параметры фильтрации
         :return: Статистика больничных листов
         """
-        # Эта функция требует дополнительной реализации в репозитории
-        # Пока возвращаем базовую статистику
         filters = filter_params.to_dict(exclude_none=True)
-        total_count = await self._sick_leave_repository.get_total_count(filters)
-
-        # Можно добавить более детальную статистику позже
-        return SickLeaveStatisticsSchema(
-            total_sick_leaves=total_count,
-            open_sick_leaves=0,
-            closed_sick_leaves=0,
-            cancelled_sick_leaves=0,
-            extended_sick_leaves=0,
-            acute_illness_count=0,
-            chronic_illness_count=0,
-            work_injury_count=0,
-            domestic_injury_count=0,
-            pregnancy_complications_count=0,
-            child_care_count=0,
-            family_member_care_count=0,
-        )
+        return await self._sick_leave_repository.get_statistics(filters)
 
     async def _load_organization_data(self, sick_leave: SickLeaveDomain) -> None:
         """
@@ -522,18 +518,18 @@ class SickLeaveService:
                 organization_ids.add(sick_leave.organization_id)
 
         # Загружаем все организации одним запросом
-        organizations_data = {}
-        for org_id in organization_ids:
-            try:
-                organization = await self._medical_organizations_catalog_service.get_by_id(org_id)
-                organizations_data[org_id] = {
-                    'id': organization.id,
-                    'name': organization.name,
-                    'code': organization.organization_code,
-                    'address': organization.address,
-                }
-            except NoInstanceFoundError:
-                self._logger.warning(f"Организация с ID {org_id} не найдена")
+        organizations = await self._medical_organizations_catalog_service.get_by_ids(organization_ids)
+        organizations_data = {
+            org_id: {
+                'id': organization.id,
+                'name': organization.name,
+                'code': organization.organization_code,
+                'address': organization.address,
+            }
+            for org_id, organization in organizations.items()
+        }
+        for org_id in organization_ids - organizations.keys():
+            self._logger.warning(f"Организация с ID {org_id} не найдена")
 
         # Устанавливаем данные организаций для больничных листов
         for sick_leave in sick_leaves:
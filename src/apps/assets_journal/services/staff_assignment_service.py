@@ -21,7 +21,7 @@ from src.apps.assets_journal.interfaces.uow_interface import (
     AssetsJournalUnitOfWorkInterface,
 )
 from src.apps.assets_journal.mappers.staff_assignment_mappers import map_create_schema_to_domain
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError, ValidationError
 from src.shared.schemas.pagination_schemas import PaginationParams
@@ -52,7 +52,10 @@ class StaffAssignmentService:
         if not assignment:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Назначение медперсонала с ID: %(ID)s не найдено.") % {"ID": assignment_id}
+                detail=format_message(
+                    "Назначение медперсонала с ID: %(ID)s не найдено.",
+                    ID=assignment_id,
+                )
             )
 
         return assignment
@@ -75,6 +78,7 @@ class StaffAssignmentService:
             filters=filters,
             page=pagination_params.page or 1,
             limit=pagination_params.limit or 30,
+            cursor=pagination_params.cursor,
         )
 
         total_count = await self._staff_assignment_repository.get_total_count(filters)
@@ -194,8 +198,11 @@ class StaffAssignmentService:
 
         if has_conflict:
             raise ValidationError(
-                _("Специалист %(specialist)s уже назначен на участок %(area)s в указанный период.") %
-                {"specialist": create_schema.specialist_name, "area": create_schema.area_number}
+                format_message(
+                    "Специалист %(specialist)s уже назначен на участок %(area)s в указанный период.",
+                    specialist=create_schema.specialist_name,
+                    area=create_schema.area_number,
+                )
             )
 
         # Создаем доменную модель
@@ -220,8 +227,11 @@ class StaffAssignmentService:
             await self._uow.commit()
 
         self._logger.info(
-            f"Создано назначение медперсонала: {create_schema.specialist_name} "
-            f"на участок {create_schema.area_number} с {create_schema.start_date}"
+            "Создано назначение медперсонала: %s "
+            "на участок %s с %s",
+            create_schema.specialist_name,
+            create_schema.area_number,
+            create_schema.start_date,
         )
         return created_assignment
 
@@ -266,8 +276,11 @@ class StaffAssignmentService:
 
             if has_conflict:
                 raise ValidationError(
-                    _("Специалист %(specialist)s уже назначен на участок %(area)s в указанный период.") %
-                    {"specialist": assignment.specialist_name, "area": assignment.area_number}
+                    format_message(
+                        "Специалист %(specialist)s уже назначен на участок %(area)s в указанный период.",
+                        specialist=assignment.specialist_name,
+                        area=assignment.area_number,
+                    )
                 )
 
         assignment.updated_at = datetime.utcnow()
@@ -276,7 +289,7 @@ class StaffAssignmentService:
             updated_assignment = await self._uow.staff_assignment_repository.update(assignment)
             await self._uow.commit()
 
-        self._logger.info(f"Обновлено назначение медперсонала {assignment_id}")
+        self._logger.info("Обновлено назначение медперсонала %s", assignment_id)
         return updated_assignment
 
     async def complete_staff_assignment(
@@ -306,7 +319,7 @@ class StaffAssignmentService:
             updated_assignment = await self._uow.staff_assignment_repository.update(assignment)
             await self._uow.commit()
 
-        self._logger.info(f"Завершено назначение медперсонала {assignment_id}")
+        self._logger.info("Завершено назначение медперсонала %s", assignment_id)
         return updated_assignment
 
     async def extend_staff_assignment(
@@ -340,8 +353,10 @@ class StaffAssignmentService:
 
         if has_conflict:
             raise ValidationError(
-                _("Нельзя продлить назначение до %(date)s из-за конфликта с другими назначениями.") %
-                {"date": extend_schema.new_end_date}
+                format_message(
+                    "Нельзя продлить назначение до %(date)s из-за конфликта с другими назначениями.",
+                    date=extend_schema.new_end_date,
+                )
             )
 
         assignment.extend_assignment(extend_schema.new_end_date, extend_schema.reason)
@@ -350,7 +365,7 @@ class StaffAssignmentService:
             updated_assignment = await self._uow.staff_assignment_repository.update(assignment)
             await self._uow.commit()
 
-        self._logger.info(f"Продлено назначение медперсонала {assignment_id} до {extend_schema.new_end_date}")
+        self._logger.info("Продлено назначение медперсонала %s до %s", assignment_id, extend_schema.new_end_date)
         return updated_assignment
 
     async def suspend_staff_assignment(
@@ -376,7 +391,7 @@ class StaffAssignmentService:
             updated_assignment = await self._uow.staff_assignment_repository.update(assignment)
             await self._uow.commit()
 
-        self._logger.info(f"Приостановлено назначение медперсонала {assignment_id}. Причина: {reason or 'Не указана'}")
+        self._logger.info("Приостановлено назначение медперсонала %s. Причина: %s", assignment_id, reason or 'Не указана')
         return updated_assignment
 
     async def activate_staff_assignment(self, assignment_id: UUID) -> StaffAssignmentDomain:
@@ -397,7 +412,7 @@ class StaffAssignmentService:
             updated_assignment = await self._uow.staff_assignment_repository.update(assignment)
             await self._uow.commit()
 
-        self._logger.info(f"Активировано назначение медперсонала {assignment_id}")
+        self._logger.info("Активировано назначение медперсонала %s", assignment_id)
         return updated_assignment
 
     async def delete_staff_assignment(self, assignment_id: UUID) -> None:
@@ -417,7 +432,7 @@ class StaffAssignmentService:
             await self._uow.staff_assignment_repository.delete(assignment_id)
             await self._uow.commit()
 
-        self._logger.info(f"Удалено назначение медперсонала {assignment_id}")
+        self._logger.info("Удалено назначение медперсонала %s", assignment_id)
 
     async def get_statistics(
             self,
@@ -430,37 +445,7 @@ class StaffAssignmentService:
         :return: Статистика назначений медперсонала
         """
         filters = filter_params.to_dict(exclude_none=True)
-        total_count = await self._staff_assignment_repository.get_total_count(filters)
-
-        # Получаем статистику по статусам
-        status_stats = {}
-        for status in StaffAssignmentStatusEnum:
-            status_filters = filters.copy()
-            status_filters['status'] = status
-            count = await self._staff_assignment_repository.get_total_count(status_filters)
-            status_stats[status.value] = count
-
-        return StaffAssignmentStatisticsSchema(
-            total_assignments=total_count,
-            active_assignments=status_stats.get('active', 0),
-            inactive_assignments=status_stats.get('inactive', 0),
-            suspended_assignments=status_stats.get('suspended', 0),
-            completed_assignments=status_stats.get('completed', 0),
-            therapists_count=0,
-            pediatricians_count=0,
-            surgeons_count=0,
-            cardiologists_count=0,
-            neurologists_count=0,
-            other_specialists_count=0,
-            therapeutic_department_count=0,
-            pediatric_department_count=0,
-            surgical_department_count=0,
-            other_departments_count=0,
-            total_areas_covered=0,
-            therapeutic_areas_count=0,
-            pediatric_areas_count=0,
-            general_practice_areas_count=0,
-        )
+        return await self._staff_assignment_repository.get_statistics(filters)
 
     async def _validate_assignment_data(self, schema, is_update: bool = False) -> None:
         """
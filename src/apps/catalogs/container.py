@@ -30,6 +30,14 @@ from src.apps.catalogs.infrastructure.repositories.nationalities_catalog_reposit
 from src.apps.catalogs.infrastructure.repositories.patient_context_attributes_repository import (
     SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl,
 )
+from src.apps.catalogs.services.catalog_cache import (
+    CITIZENSHIP_CATALOG,
+    DIAGNOSES_CATALOG,
+    FINANCING_SOURCES_CATALOG,
+    MEDICAL_ORGANIZATIONS_CATALOG,
+    NATIONALITIES_CATALOG,
+    PATIENT_CONTEXT_ATTRIBUTES_CATALOG,
+)
 from src.apps.catalogs.services.citizenship_catalog_service import (
     CitizenshipCatalogService,
 )
@@ -59,7 +67,8 @@ from src.apps.catalogs.services.patients_and_diagnoses_service import (
 )
 from src.apps.patients.services.patients_service import PatientService
 from src.apps.users.services.user_service import UserService
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -74,16 +83,22 @@ class CatalogsContainer(containers.DeclarativeContainer):
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
     patients_service: providers.Dependency[PatientService] = providers.Dependency()
     user_service: providers.Dependency[UserService] = providers.Dependency()
 
     # Session factory
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Async session
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # Repositories
     citizenship_catalog_repository = providers.Factory(
@@ -200,3 +215,15 @@ class CatalogsContainer(containers.DeclarativeContainer):
         identity_documents_repository=identity_documents_repository,
         patients_service=patients_service,
     )
+
+    # Reference catalogs preloaded into the process-wide 'catalog_cache' on startup
+    catalog_cache_loaders = providers.Dict(
+        {
+            CITIZENSHIP_CATALOG: citizenship_catalog_repository.provided.get_all,
+            NATIONALITIES_CATALOG: nationalities_catalog_repository.provided.get_all,
+            FINANCING_SOURCES_CATALOG: financing_sources_catalog_repository.provided.get_all,
+            PATIENT_CONTEXT_ATTRIBUTES_CATALOG: patient_context_attributes_repository.provided.get_all,
+            MEDICAL_ORGANIZATIONS_CATALOG: medical_organizations_catalog_repository.provided.get_all,
+            DIAGNOSES_CATALOG: diagnoses_catalog_repository.provided.get_all,
+        }
+    )
@@ -43,8 +43,10 @@ async def _handle_create_event(
         create_schema = map_event_payload_to_schema(schema_data, AddNationalitySchema)
         await service.add_nationality(create_schema)
         logger.debug(
-            f"Successfully handled '{schema_data.action}' type event for model: 'cat_nationalities'. "
-            f"New record with ID: {create_schema.id} has been CREATED."
+            "Successfully handled '%s' type event for model: 'cat_nationalities'. "
+            "New record with ID: %s has been CREATED.",
+            schema_data.action,
+            create_schema.id,
         )
     except Exception as err:
         logger.critical(
@@ -70,8 +72,10 @@ async def _handle_update_event(
         )
         await service.update_nationality(update_schema.id, update_schema)
         logger.debug(
-            f"Successfully handled '{schema_data.action}' type event for model: 'cat_nationalities'. "
-            f"Record with ID: {update_schema.id} has been UPDATED."
+            "Successfully handled '%s' type event for model: 'cat_nationalities'. "
+            "Record with ID: %s has been UPDATED.",
+            schema_data.action,
+            update_schema.id,
         )
     except Exception as err:
         logger.critical(
@@ -97,8 +101,10 @@ async def _handle_delete_event(
         )
         await service.delete_by_id(delete_schema.id)
         logger.debug(
-            f"Successfully handled '{schema_data.action}' type event for model: 'cat_nationalities'. "
-            f"Record with ID: {delete_schema.id} has been DELETED."
+            "Successfully handled '%s' type event for model: 'cat_nationalities'. "
+            "Record with ID: %s has been DELETED.",
+            schema_data.action,
+            delete_schema.id,
         )
     except Exception as err:
         logger.critical(
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import any_, delete, func, or_, select
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.citizenship_catalog_request_schemas import (
     AddCitizenshipSchema,
@@ -70,6 +70,26 @@ class SQLAlchemyCitizenshipCatalogueRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[CitizenshipCatalogFullResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyCitizenshipCatalogue))
+
+        return [
+            CitizenshipCatalogFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        query = select(SQLAlchemyCitizenshipCatalogue.id).where(
+            SQLAlchemyCitizenshipCatalogue.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return set(result.scalars().all())
+
     async def get_by_country_code(
         self, country_code: str
     ) -> Optional[CitizenshipCatalogFullResponseSchema]:
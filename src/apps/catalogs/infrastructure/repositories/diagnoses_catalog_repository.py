@@ -37,11 +37,18 @@ class SQLAlchemyDiagnosesCatalogRepositoryImpl(
 
         return query
 
-    async def get_total_number_of_diagnoses(self) -> int:
-        query = select(func.count(SQLAlchemyDiagnosesCatalogue.id))
-        result = await self._async_db_session.execute(query)
+    async def get_total_number_of_diagnoses(
+        self, diagnosis_code_filter: Optional[str] = None
+    ) -> int:
+        query = select(SQLAlchemyDiagnosesCatalogue.id)
+        if diagnosis_code_filter:
+            query = self._apply_filters_to_query(
+                diagnosis_code_filter=diagnosis_code_filter, query=query
+            )
 
-        return result.scalar_one()
+        return await self._get_total_count(
+            query, {"diagnosis_code_filter": diagnosis_code_filter}
+        )
 
     async def get_by_id(
         self, diagnosis_id: int
@@ -56,6 +63,11 @@ class SQLAlchemyDiagnosesCatalogRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[DiagnosesCatalogResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyDiagnosesCatalogue))
+
+        return [map_diagnosis_catalog_db_entity_to_response_schema(obj) for obj in result.scalars().all()]
+
     async def get_by_code(
         self, diagnosis_code: str
     ) -> Optional[DiagnosesCatalogResponseSchema]:
@@ -99,6 +111,8 @@ class SQLAlchemyDiagnosesCatalogRepositoryImpl(
     async def add_diagnosis(
         self, request_dto: AddDiagnosisRequestSchema
     ) -> DiagnosesCatalogResponseSchema:
+        self._invalidate_total_count()
+
         obj: SQLAlchemyDiagnosesCatalogue = (
             map_diagnosis_catalog_create_schema_to_db_entity(request_dto)
         )
@@ -114,6 +128,8 @@ class SQLAlchemyDiagnosesCatalogRepositoryImpl(
     async def update_diagnosis(
         self, diagnosis_id: int, request_dto: UpdateDiagnosisRequestSchema
     ) -> DiagnosesCatalogResponseSchema:
+        self._invalidate_total_count()
+
         query = select(SQLAlchemyDiagnosesCatalogue).where(
             SQLAlchemyDiagnosesCatalogue.id == diagnosis_id
         )
@@ -133,6 +149,8 @@ class SQLAlchemyDiagnosesCatalogRepositoryImpl(
 
     @transactional
     async def delete_by_id(self, diagnosis_id: int) -> None:
+        self._invalidate_total_count()
+
         query = delete(SQLAlchemyDiagnosesCatalogue).where(
             SQLAlchemyDiagnosesCatalogue.id == diagnosis_id
         )
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import any_, delete, func, or_, select
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.financing_sources_catalog_request_schemas import (
     AddFinancingSourceSchema,
@@ -83,6 +83,26 @@ class SQLAlchemyFinancingSourcesCatalogRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[FinancingSourceFullResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyFinancingSourcesCatalog))
+
+        return [
+            FinancingSourceFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        query = select(SQLAlchemyFinancingSourcesCatalog.id).where(
+            SQLAlchemyFinancingSourcesCatalog.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return set(result.scalars().all())
+
     async def get_financing_sources(
         self,
         name_filter: Optional[str],
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy import and_, any_, delete, func, or_, select
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.medical_organizations_catalog_schemas import (
     AddMedicalOrganizationSchema,
@@ -102,6 +102,43 @@ class SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[MedicalOrganizationCatalogFullResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyMedicalOrganizationsCatalogue))
+
+        return [
+            MedicalOrganizationCatalogFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        query = select(SQLAlchemyMedicalOrganizationsCatalogue.id).where(
+            SQLAlchemyMedicalOrganizationsCatalogue.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return set(result.scalars().all())
+
+    async def get_by_ids(
+        self, medical_organization_ids: Iterable[int]
+    ) -> List[MedicalOrganizationCatalogFullResponseSchema]:
+        ids = list(set(medical_organization_ids))
+        if not ids:
+            return []
+
+        query = select(SQLAlchemyMedicalOrganizationsCatalogue).where(
+            SQLAlchemyMedicalOrganizationsCatalogue.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return [
+            MedicalOrganizationCatalogFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
     async def get_medical_organizations(
         self,
         name_filter: Optional[str],
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import any_, delete, func, or_, select
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.nationalities_catalog_request_schemas import (
     AddNationalitySchema,
@@ -64,6 +64,26 @@ class SQLAlchemyNationalitiesCatalogRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[NationalityCatalogFullResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyNationalitiesCatalogue))
+
+        return [
+            NationalityCatalogFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        query = select(SQLAlchemyNationalitiesCatalogue.id).where(
+            SQLAlchemyNationalitiesCatalogue.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return set(result.scalars().all())
+
     async def get_total_number_of_nationalities(self) -> int:
         query = select(func.count(SQLAlchemyNationalitiesCatalogue.id))
         result = await self._async_db_session.execute(query)
@@ -1,6 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
-from sqlalchemy import delete, func, or_, select
+from sqlalchemy import any_, delete, func, or_, select
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.patient_context_attributes_catalog_request_schemas import (
     AddPatientContextAttributeSchema,
@@ -74,6 +74,26 @@ class SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl(
 
         return None
 
+    async def get_all(self) -> List[PatientContextAttributeCatalogFullResponseSchema]:
+        result = await self._async_db_session.execute(select(SQLAlchemyPatientContextAttributesCatalogue))
+
+        return [
+            PatientContextAttributeCatalogFullResponseSchema.model_validate(obj)
+            for obj in result.scalars().all()
+        ]
+
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        ids = list(ids)
+        if not ids:
+            return set()
+
+        query = select(SQLAlchemyPatientContextAttributesCatalogue.id).where(
+            SQLAlchemyPatientContextAttributesCatalogue.id == any_(ids)
+        )
+        result = await self._async_db_session.execute(query)
+
+        return set(result.scalars().all())
+
     async def get_patient_context_attributes(
         self,
         name_filter: Optional[str],
@@ -12,11 +12,14 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.diagnoses_catalog_re
 
 class DiagnosesCatalogRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_diagnoses(self) -> int:
+    async def get_total_number_of_diagnoses(
+        self, diagnosis_code_filter: Optional[str] = None
+    ) -> int:
         """
-        Retrieve a number of ALL diagnoses from the Registry Service DB.
+        Retrieve a number of diagnoses matching the filter from the Registry Service DB.
 
-        :return: Number of ALL diagnoses from the Registry Service DB as INT
+        :param diagnosis_code_filter: The same filter that is passed to 'get_diagnoses'.
+        :return: Number of matching diagnoses from the Registry Service DB as INT
         """
         pass
 
@@ -35,6 +38,16 @@ class DiagnosesCatalogRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_all(self) -> List[DiagnosesCatalogResponseSchema]:
+        """
+        Retrieve all records of the catalog (used to preload the catalogs cache).
+
+        :return: All catalog records.
+        :rtype: List[DiagnosesCatalogResponseSchema]
+        """
+        pass
+
     @abstractmethod
     async def get_by_code(
         self, diagnosis_code: str
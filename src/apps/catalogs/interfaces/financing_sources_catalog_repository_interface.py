@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.financing_sources_catalog_request_schemas import (
     AddFinancingSourceSchema,
@@ -53,6 +53,28 @@ class FinancingSourcesCatalogRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_all(self) -> List[FinancingSourceFullResponseSchema]:
+        """
+        Retrieve all records of the catalog (used to preload the catalogs cache).
+
+        :return: All catalog records.
+        :rtype: List[FinancingSourceFullResponseSchema]
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """
+        Check which of the IDs exist, with one 'WHERE id = ANY(...)' query.
+
+        :param ids: Record IDs to check.
+        :type ids: Iterable[int]
+        :return: IDs of the existing records.
+        :rtype: Set[int]
+        """
+        pass
+
     @abstractmethod
     async def get_financing_sources(
         self,
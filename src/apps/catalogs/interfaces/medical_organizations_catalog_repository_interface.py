@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.medical_organizations_catalog_schemas import (
     AddMedicalOrganizationSchema,
@@ -60,6 +60,42 @@ class MedicalOrganizationsCatalogRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_all(self) -> List[MedicalOrganizationCatalogFullResponseSchema]:
+        """
+        Retrieve all records of the catalog (used to preload the catalogs cache).
+
+        :return: All catalog records.
+        :rtype: List[MedicalOrganizationCatalogFullResponseSchema]
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """
+        Check which of the IDs exist, with one 'WHERE id = ANY(...)' query.
+
+        :param ids: Record IDs to check.
+        :type ids: Iterable[int]
+        :return: IDs of the existing records.
+        :rtype: Set[int]
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids(
+        self, medical_organization_ids: Iterable[int]
+    ) -> List[MedicalOrganizationCatalogFullResponseSchema]:
+        """
+        Retrieve medical organization records by their identifiers in one query.
+
+        :param medical_organization_ids: Identifiers of the medical organization records.
+        :type medical_organization_ids: Iterable[int]
+        :return: Found records; missing identifiers are skipped.
+        :rtype: List[MedicalOrganizationCatalogFullResponseSchema]
+        """
+        pass
+
     @abstractmethod
     async def get_medical_organizations(
         self,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.nationalities_catalog_request_schemas import (
     AddNationalitySchema,
@@ -47,6 +47,28 @@ class NationalitiesCatalogRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_all(self) -> List[NationalityCatalogFullResponseSchema]:
+        """
+        Retrieve all records of the catalog (used to preload the catalogs cache).
+
+        :return: All catalog records.
+        :rtype: List[NationalityCatalogFullResponseSchema]
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Iterable[int]) -> Set[int]:
+        """
+        Check which of the IDs exist, with one 'WHERE id = ANY(...)' query.
+
+        :param ids: Record IDs to check.
+        :type ids: Iterable[int]
+        :return: IDs of the existing records.
+        :rtype: Set[int]
+        """
+        pass
+
     @abstractmethod
     async def get_nationalities(
         self,
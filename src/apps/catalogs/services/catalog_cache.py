@@ -0,0 +1,212 @@
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+# Catalog names, as in the admin service events ('payload.model')
+CITIZENSHIP_CATALOG = "cat_citizenship"
+NATIONALITIES_CATALOG = "cat_nationalities"
+FINANCING_SOURCES_CATALOG = "cat_financing_sources"
+PATIENT_CONTEXT_ATTRIBUTES_CATALOG = "cat_patient_context_attributes"
+MEDICAL_ORGANIZATIONS_CATALOG = "cat_medical_organizations"
+DIAGNOSES_CATALOG = "cat_diagnoses"
+
+CatalogLoader = Callable[[], Awaitable[Iterable[Any]]]
+
+
+class CatalogCache:
+    """
+    Process-wide read-through cache of the near-static reference catalogs
+    (citizenship, nationalities, medical organizations, ...) by record ID and code.
+
+    Catalogs are preloaded on startup and missing records are read through from the
+    repository, so lookups don't go to the database. The catalog services drop a
+    record when it's added, updated or deleted, i.e. when the catalog Kafka handlers
+    apply an admin service event. Each event is consumed by one replica of the
+    consumer group, so the TTL bounds how long other replicas serve the old version.
+
+    Records are the repositories' full response schemas; missing records aren't cached.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        code_fields: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._code_fields = dict(code_fields or {})
+        # Catalog -> record ID -> (expires at, record)
+        self._records: Dict[str, Dict[Hashable, Tuple[float, Any]]] = {}
+        # Catalog -> code -> record ID
+        self._ids_by_code: Dict[str, Dict[str, Hashable]] = {}
+
+    def get(self, catalog: str, record_id: Hashable) -> Optional[Any]:
+        records = self._records.get(catalog)
+        entry = records.get(record_id) if records else None
+        if entry is None:
+            return None
+
+        expires_at, record = entry
+        if expires_at < time.monotonic():
+            records.pop(record_id, None)
+            return None
+
+        return record
+
+    def set(self, catalog: str, record: Any) -> None:
+        if self._ttl_seconds <= 0:
+            return
+
+        self._records.setdefault(catalog, {})[record.id] = (
+            time.monotonic() + self._ttl_seconds,
+            record,
+        )
+        code_field = self._code_fields.get(catalog)
+        if code_field is not None:
+            self._ids_by_code.setdefault(catalog, {})[getattr(record, code_field)] = record.id
+
+    def invalidate(
+        self,
+        catalog: Optional[str] = None,
+        record_id: Optional[Hashable] = None,
+    ) -> None:
+        if catalog is None:
+            self._records.clear()
+            self._ids_by_code.clear()
+            return
+
+        if record_id is None:
+            self._records.pop(catalog, None)
+            self._ids_by_code.pop(catalog, None)
+            return
+
+        # Codes of the dropped record resolve to a miss (see 'get_by_code')
+        self._records.get(catalog, {}).pop(record_id, None)
+
+    async def get_by_id(
+        self,
+        catalog: str,
+        record_id: Hashable,
+        load: Callable[[Any], Awaitable[Optional[Any]]],
+    ) -> Optional[Any]:
+        """
+        :param load: Repository lookup by ID, called on a miss (e.g. 'repository.get_by_id').
+        """
+        record = self.get(catalog, record_id)
+        if record is None:
+            record = await load(record_id)
+            if record is not None:
+                self.set(catalog, record)
+
+        return record
+
+    async def get_by_code(
+        self,
+        catalog: str,
+        code: str,
+        load: Callable[[str], Awaitable[Optional[Any]]],
+    ) -> Optional[Any]:
+        """
+        :param load: Repository lookup by code, called on a miss (e.g. 'repository.get_by_code').
+        """
+        code_field = self._code_fields[catalog]
+        record_id = self._ids_by_code.get(catalog, {}).get(code)
+        record = self.get(catalog, record_id) if record_id is not None else None
+        # The code may have been moved to another record since it was indexed
+        if record is None or getattr(record, code_field) != code:
+            record = await load(code)
+            if record is not None:
+                self.set(catalog, record)
+
+        return record
+
+    async def get_many(
+        self,
+        catalog: str,
+        record_ids: Iterable[Hashable],
+        load_many: Callable[[List[Any]], Awaitable[Iterable[Any]]],
+    ) -> Dict[Hashable, Any]:
+        """
+        Records by ID; the missing ones are loaded with one 'load_many' call
+        (e.g. 'repository.get_by_ids'). IDs that don't exist are absent from the result.
+        """
+        records = {}
+        missing = []
+        for record_id in set(record_ids):
+            record = self.get(catalog, record_id)
+            if record is None:
+                missing.append(record_id)
+            else:
+                records[record_id] = record
+
+        if missing:
+            for record in await load_many(missing):
+                self.set(catalog, record)
+                records[record.id] = record
+
+        return records
+
+    async def get_existing_ids(
+        self,
+        catalog: str,
+        record_ids: Iterable[Hashable],
+        load_existing_ids: Callable[[List[Any]], Awaitable[Set[Any]]],
+    ) -> Set[Hashable]:
+        """
+        Which of the IDs exist: cached records exist, the rest are checked with one
+        'load_existing_ids' call (e.g. 'repository.get_existing_ids').
+        """
+        existing = set()
+        missing = []
+        for record_id in set(record_ids):
+            if self.get(catalog, record_id) is None:
+                missing.append(record_id)
+            else:
+                existing.add(record_id)
+
+        if missing:
+            existing.update(await load_existing_ids(missing))
+
+        return existing
+
+    async def preload(
+        self,
+        loaders: Mapping[str, CatalogLoader],
+        logger: LoggerService,
+    ) -> None:
+        """
+        Load whole catalogs (e.g. 'repository.get_all'). A catalog that fails to load
+        is logged and read through on demand.
+        """
+        if self._ttl_seconds <= 0:
+            return
+
+        for catalog, load_all in loaders.items():
+            try:
+                records = list(await load_all())
+            except Exception as err:
+                logger.warning("Failed to preload the '%s' catalog cache: %s", catalog, err)
+                continue
+
+            for record in records:
+                self.set(catalog, record)
+            logger.info("Preloaded %s '%s' catalog records.", len(records), catalog)
+
+
+catalog_cache = CatalogCache(
+    ttl_seconds=project_settings.CATALOG_CACHE_TTL_SECONDS,
+    code_fields={DIAGNOSES_CATALOG: "diagnosis_code"},
+)
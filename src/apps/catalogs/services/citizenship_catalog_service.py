@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.citizenship_catalog_request_schemas import (
     AddCitizenshipSchema,
@@ -13,7 +13,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.citizenship_catalog_
 from src.apps.catalogs.interfaces.citizenship_catalog_repository_interface import (
     CitizenshipCatalogRepositoryInterface,
 )
-from src.core.i18n import _, get_locale
+from src.apps.catalogs.services.catalog_cache import (
+    CITIZENSHIP_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message, get_locale
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
@@ -62,14 +66,18 @@ class CitizenshipCatalogService:
         CitizenshipCatalogFullResponseSchema,
         CitizenshipCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._citizenship_catalog_repository.get_by_id(
-            citizenship_id
+        full_schema = await catalog_cache.get_by_id(
+            CITIZENSHIP_CATALOG,
+            citizenship_id,
+            self._citizenship_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Citizenship with ID: %(ATTR_ID)s was not found.")
-                % {"ATTR_ID": citizenship_id},
+                detail=format_message(
+                    "Citizenship with ID: %(ATTR_ID)s was not found.",
+                    ATTR_ID=citizenship_id,
+                ),
             )
 
         if include_all_locales:
@@ -87,6 +95,14 @@ class CitizenshipCatalogService:
             changed_at=full_schema.changed_at,
         )
 
+    async def get_existing_ids(self, citizenship_ids: Iterable[int]) -> Set[int]:
+        """Which of the IDs exist; cached records don't go to the database."""
+        return await catalog_cache.get_existing_ids(
+            CITIZENSHIP_CATALOG,
+            citizenship_ids,
+            self._citizenship_catalog_repository.get_existing_ids,
+        )
+
     async def get_citizenship_records(
         self,
         pagination_params: PaginationParams,
@@ -160,8 +176,10 @@ class CitizenshipCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Citizenship with name: '%(NAME)s' already exists.")
-                % {"NAME": request_dto.name},
+                detail=format_message(
+                    "Citizenship with name: '%(NAME)s' already exists.",
+                    NAME=request_dto.name,
+                ),
             )
 
         # Check that 'country_code' field is not taken already
@@ -170,8 +188,10 @@ class CitizenshipCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Citizenship with country code: '%(CODE)s' already exists.")
-                % {"CODE": request_dto.country_code},
+                detail=format_message(
+                    "Citizenship with country code: '%(CODE)s' already exists.",
+                    CODE=request_dto.country_code,
+                ),
             )
 
         # Check that value in the 'name_locales' entry is not taken already
@@ -179,11 +199,12 @@ class CitizenshipCatalogService:
             if await self._citizenship_catalog_repository.get_by_locale(code, value):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
+                    detail=format_message(
                         "Citizenship's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                        "record's locale. It's already taken."
-                    )
-                    % {"VALUE": value, "CODE": code},
+                        "record's locale. It's already taken.",
+                        VALUE=value,
+                        CODE=code,
+                    ),
                 )
 
         return await self._citizenship_catalog_repository.add_citizenship(request_dto)
@@ -198,8 +219,10 @@ class CitizenshipCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Citizenship with id: %(ID)s not found.")
-                % {"ID": citizenship_id},
+                detail=format_message(
+                    "Citizenship with id: %(ID)s not found.",
+                    ID=citizenship_id,
+                ),
             )
 
         default_language = project_settings.DEFAULT_LANGUAGE
@@ -207,8 +230,10 @@ class CitizenshipCatalogService:
         if request_dto.lang is not None and request_dto.lang != existing.lang:
             if request_dto.lang != default_language:
                 raise ValueError(
-                    _("Field 'lang' must be '%(DEFAULT_LANG)s.'")
-                    % {"DEFAULT_LANG": default_language}
+                    format_message(
+                        "Field 'lang' must be '%(DEFAULT_LANG)s.'",
+                        DEFAULT_LANG=default_language,
+                    )
                 )
 
         # Check that 'name' field is not taken already
@@ -218,8 +243,10 @@ class CitizenshipCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_("Citizenship with name: '%(NAME)s' already exists.")
-                    % {"NAME": request_dto.name},
+                    detail=format_message(
+                        "Citizenship with name: '%(NAME)s' already exists.",
+                        NAME=request_dto.name,
+                    ),
                 )
 
         # Check that 'country_code' field is not taken already
@@ -232,10 +259,10 @@ class CitizenshipCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
-                        "Citizenship with country code: '%(CODE)s' already exists."
-                    )
-                    % {"CODE": request_dto.country_code},
+                    detail=format_message(
+                        "Citizenship with country code: '%(CODE)s' already exists.",
+                        CODE=request_dto.country_code,
+                    ),
                 )
 
         if request_dto.name_locales is not None:
@@ -249,16 +276,18 @@ class CitizenshipCatalogService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
+                        detail=format_message(
                             "Citizenship's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                            "record's locale. It's already taken."
-                        )
-                        % {"VALUE": value, "CODE": language_code},
+                            "record's locale. It's already taken.",
+                            VALUE=value,
+                            CODE=language_code,
+                        ),
                     )
 
         updated = await self._citizenship_catalog_repository.update_citizenship(
             citizenship_id, request_dto
         )
+        catalog_cache.invalidate(CITIZENSHIP_CATALOG, citizenship_id)
 
         return updated
 
@@ -268,8 +297,11 @@ class CitizenshipCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Citizenship with id: %(ID)s not found.")
-                % {"ID": citizenship_id},
+                detail=format_message(
+                    "Citizenship with id: %(ID)s not found.",
+                    ID=citizenship_id,
+                ),
             )
 
         await self._citizenship_catalog_repository.delete_by_id(citizenship_id)
+        catalog_cache.invalidate(CITIZENSHIP_CATALOG, citizenship_id)
@@ -12,7 +12,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.diagnoses_catalog_re
 from src.apps.catalogs.interfaces.diagnoses_catalogue_repository_interface import (
     DiagnosesCatalogRepositoryInterface,
 )
-from src.core.i18n import _
+from src.apps.catalogs.services.catalog_cache import (
+    DIAGNOSES_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import (
@@ -53,7 +57,10 @@ class DiagnosesCatalogService:
 
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Diagnosis with ID: %(ID)s was not found.") % {"ID": original_id},
+            detail=format_message(
+                "Diagnosis with ID: %(ID)s was not found.",
+                ID=original_id,
+            ),
         )
 
     @staticmethod
@@ -79,8 +86,10 @@ class DiagnosesCatalogService:
 
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Diagnosis with CODE: '%(CODE)s' was not found.")
-            % {"CODE": original_code},
+            detail=format_message(
+                "Diagnosis with CODE: '%(CODE)s' was not found.",
+                CODE=original_code,
+            ),
         )
 
     @staticmethod
@@ -106,8 +115,10 @@ class DiagnosesCatalogService:
 
         raise InstanceAlreadyExistsError(
             status_code=409,
-            detail=_("Diagnosis with code: '%(CODE)s' already exists.")
-            % {"CODE": original_code},
+            detail=format_message(
+                "Diagnosis with code: '%(CODE)s' already exists.",
+                CODE=original_code,
+            ),
         )
 
     async def get_by_id(
@@ -115,7 +126,11 @@ class DiagnosesCatalogService:
         diagnosis_id: int,
     ) -> DiagnosesCatalogResponseSchema:
         diagnosis: Optional[DiagnosesCatalogResponseSchema] = (
-            await self._diagnoses_catalog_repository.get_by_id(diagnosis_id)
+            await catalog_cache.get_by_id(
+                DIAGNOSES_CATALOG,
+                diagnosis_id,
+                self._diagnoses_catalog_repository.get_by_id,
+            )
         )
 
         return self._check_diagnosis_exists_by_id(diagnosis, diagnosis_id)
@@ -125,7 +140,11 @@ class DiagnosesCatalogService:
         diagnosis_code: str,
     ) -> DiagnosesCatalogResponseSchema:
         diagnosis: Optional[DiagnosesCatalogResponseSchema] = (
-            await self._diagnoses_catalog_repository.get_by_code(diagnosis_code)
+            await catalog_cache.get_by_code(
+                DIAGNOSES_CATALOG,
+                diagnosis_code,
+                self._diagnoses_catalog_repository.get_by_code,
+            )
         )
 
         return self._check_diagnosis_exists_by_code(diagnosis, diagnosis_code)
@@ -147,7 +166,9 @@ class DiagnosesCatalogService:
         )
 
         total_items = (
-            await self._diagnoses_catalog_repository.get_total_number_of_diagnoses()
+            await self._diagnoses_catalog_repository.get_total_number_of_diagnoses(
+                diagnosis_code_filter
+            )
         )
 
         # Calculate pagination metadata
@@ -208,6 +229,7 @@ class DiagnosesCatalogService:
         updated = await self._diagnoses_catalog_repository.update_diagnosis(
             diagnosis_id, request_dto
         )
+        catalog_cache.invalidate(DIAGNOSES_CATALOG, diagnosis_id)
 
         return updated
 
@@ -217,3 +239,4 @@ class DiagnosesCatalogService:
         self._check_diagnosis_exists_by_id(existing, diagnosis_id)
 
         await self._diagnoses_catalog_repository.delete_by_id(diagnosis_id)
+        catalog_cache.invalidate(DIAGNOSES_CATALOG, diagnosis_id)
@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.financing_sources_catalog_request_schemas import (
     AddFinancingSourceSchema,
@@ -13,7 +13,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.financing_sources_ca
 from src.apps.catalogs.interfaces.financing_sources_catalog_repository_interface import (
     FinancingSourcesCatalogRepositoryInterface,
 )
-from src.core.i18n import _, get_locale
+from src.apps.catalogs.services.catalog_cache import (
+    FINANCING_SOURCES_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message, get_locale
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
@@ -64,14 +68,18 @@ class FinancingSourceCatalogService:
         FinancingSourceFullResponseSchema,
         FinancingSourcePartialResponseSchema,
     ]:
-        full_schema = await self._financing_sources_catalog_repository.get_by_id(
-            financing_source_id
+        full_schema = await catalog_cache.get_by_id(
+            FINANCING_SOURCES_CATALOG,
+            financing_source_id,
+            self._financing_sources_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Financing source with ID: %(SRC_ID)s was not found.")
-                % {"SRC_ID": financing_source_id},
+                detail=format_message(
+                    "Financing source with ID: %(SRC_ID)s was not found.",
+                    SRC_ID=financing_source_id,
+                ),
             )
 
         if include_all_locales:
@@ -89,6 +97,14 @@ class FinancingSourceCatalogService:
             changed_at=full_schema.changed_at,
         )
 
+    async def get_existing_ids(self, financing_source_ids: Iterable[int]) -> Set[int]:
+        """Which of the IDs exist; cached records don't go to the database."""
+        return await catalog_cache.get_existing_ids(
+            FINANCING_SOURCES_CATALOG,
+            financing_source_ids,
+            self._financing_sources_catalog_repository.get_existing_ids,
+        )
+
     async def get_financing_sources(
         self,
         pagination_params: PaginationParams,
@@ -164,8 +180,10 @@ class FinancingSourceCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Financing source with name: '%(NAME)s' already exists.")
-                % {"NAME": request_dto.name},
+                detail=format_message(
+                    "Financing source with name: '%(NAME)s' already exists.",
+                    NAME=request_dto.name,
+                ),
             )
 
         # Check that 'financing_source_code' is not taken already
@@ -174,8 +192,10 @@ class FinancingSourceCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Financing source with code: '%(SRC_CODE)s' already exists.")
-                % {"SRC_CODE": request_dto.financing_source_code},
+                detail=format_message(
+                    "Financing source with code: '%(SRC_CODE)s' already exists.",
+                    SRC_CODE=request_dto.financing_source_code,
+                ),
             )
 
         # Check that value in the 'name_locales' entry is not taken already
@@ -185,11 +205,12 @@ class FinancingSourceCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
+                    detail=format_message(
                         "Financing source's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                        "record's locale. It's already taken."
-                    )
-                    % {"VALUE": value, "CODE": code},
+                        "record's locale. It's already taken.",
+                        VALUE=value,
+                        CODE=code,
+                    ),
                 )
 
         return await self._financing_sources_catalog_repository.add_financing_source(
@@ -208,8 +229,10 @@ class FinancingSourceCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Financing source with id: %(ID)s not found.")
-                % {"ID": financing_source_id},
+                detail=format_message(
+                    "Financing source with id: %(ID)s not found.",
+                    ID=financing_source_id,
+                ),
             )
 
         default_language = project_settings.DEFAULT_LANGUAGE
@@ -217,8 +240,10 @@ class FinancingSourceCatalogService:
         if request_dto.lang is not None and request_dto.lang != existing.lang:
             if request_dto.lang != default_language:
                 raise ValueError(
-                    _("Field 'lang' must be '%(DEFAULT_LANG)s.'")
-                    % {"DEFAULT_LANG": default_language}
+                    format_message(
+                        "Field 'lang' must be '%(DEFAULT_LANG)s.'",
+                        DEFAULT_LANG=default_language,
+                    )
                 )
 
         # Check that 'name' is not taken already
@@ -228,8 +253,10 @@ class FinancingSourceCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_("Financing source with name: '%(NAME)s' already exists.")
-                    % {"NAME": request_dto.name},
+                    detail=format_message(
+                        "Financing source with name: '%(NAME)s' already exists.",
+                        NAME=request_dto.name,
+                    ),
                 )
 
         # Check that 'financing_source_code' is not taken already
@@ -242,10 +269,10 @@ class FinancingSourceCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
-                        "Financing source with code: '%(SRC_CODE)s' already exists."
-                    )
-                    % {"SRC_CODE": request_dto.financing_source_code},
+                    detail=format_message(
+                        "Financing source with code: '%(SRC_CODE)s' already exists.",
+                        SRC_CODE=request_dto.financing_source_code,
+                    ),
                 )
 
         if request_dto.name_locales is not None:
@@ -259,11 +286,12 @@ class FinancingSourceCatalogService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
+                        detail=format_message(
                             "Financing source's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                            "record's locale. It's already taken."
-                        )
-                        % {"VALUE": value, "CODE": language_code},
+                            "record's locale. It's already taken.",
+                            VALUE=value,
+                            CODE=language_code,
+                        ),
                     )
 
         updated = (
@@ -271,6 +299,7 @@ class FinancingSourceCatalogService:
                 financing_source_id, request_dto
             )
         )
+        catalog_cache.invalidate(FINANCING_SOURCES_CATALOG, financing_source_id)
 
         return updated
 
@@ -282,10 +311,13 @@ class FinancingSourceCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Financing source with id: %(ID)s not found.")
-                % {"ID": financing_source_id},
+                detail=format_message(
+                    "Financing source with id: %(ID)s not found.",
+                    ID=financing_source_id,
+                ),
             )
 
         await self._financing_sources_catalog_repository.delete_by_id(
             financing_source_id
         )
+        catalog_cache.invalidate(FINANCING_SOURCES_CATALOG, financing_source_id)
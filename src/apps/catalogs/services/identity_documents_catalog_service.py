@@ -16,7 +16,7 @@ from src.apps.catalogs.interfaces.identity_documents_repository_interface import
     IdentityDocumentsCatalogRepositoryInterface,
 )
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import (
@@ -59,8 +59,10 @@ class IdentityDocumentsCatalogService:
 
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Identity document with ID: %(ID)s was not found.")
-            % {"ID": original_id},
+            detail=format_message(
+                "Identity document with ID: %(ID)s was not found.",
+                ID=original_id,
+            ),
         )
 
     async def get_by_id(
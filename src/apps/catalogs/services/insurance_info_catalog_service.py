@@ -20,7 +20,7 @@ from src.apps.catalogs.services.financing_sources_catalog_service import (
     FinancingSourceCatalogService,
 )
 from src.apps.patients.services.patients_service import PatientService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import (
@@ -63,9 +63,9 @@ class InsuranceInfoCatalogService:
         if not insurance_info_record:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_(
-                    "Insurance info record with ID: %(ID)s was not found."
-                    % {"ID": original_id if original_id is not None else "unknown"}
+                detail=format_message(
+                    "Insurance info record with ID: %(ID)s was not found.",
+                    ID=original_id if original_id is not None else "unknown",
                 ),
             )
 
@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Set, Union
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.filters.medical_organizations_catalog_filters import (
     MedicalOrganizationsCatalogFilterParams,
@@ -16,7 +16,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.medical_organization
 from src.apps.catalogs.interfaces.medical_organizations_catalog_repository_interface import (
     MedicalOrganizationsCatalogRepositoryInterface,
 )
-from src.core.i18n import _, get_locale
+from src.apps.catalogs.services.catalog_cache import (
+    MEDICAL_ORGANIZATIONS_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message, get_locale
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
@@ -97,14 +101,18 @@ class MedicalOrganizationsCatalogService:
         medical_organization_id: int,
         include_all_locales: bool = False,
     ) -> MedicalOrganizationCatalogFullResponseSchema |  MedicalOrganizationCatalogPartialResponseSchema:
-        full_schema = await self._medical_organizations_catalog_repository.get_by_id(
-            medical_organization_id
+        full_schema = await catalog_cache.get_by_id(
+            MEDICAL_ORGANIZATIONS_CATALOG,
+            medical_organization_id,
+            self._medical_organizations_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Medical organization with ID: %(ORG_ID)s was not found.")
-                % {"ORG_ID": medical_organization_id},
+                detail=format_message(
+                    "Medical organization with ID: %(ORG_ID)s was not found.",
+                    ORG_ID=medical_organization_id,
+                ),
             )
 
         if include_all_locales:
@@ -128,6 +136,51 @@ class MedicalOrganizationsCatalogService:
             changed_at=full_schema.changed_at,
         )
 
+    async def get_by_ids(
+        self,
+        medical_organization_ids: Iterable[int],
+        include_all_locales: bool = False,
+    ) -> Dict[
+        int,
+        MedicalOrganizationCatalogFullResponseSchema | MedicalOrganizationCatalogPartialResponseSchema,
+    ]:
+        """
+        Bulk counterpart of 'get_by_id' for enriching lists: one query for all uncached IDs.
+        Missing organizations are absent from the result instead of raising.
+        """
+        full_schemas = await catalog_cache.get_many(
+            MEDICAL_ORGANIZATIONS_CATALOG,
+            medical_organization_ids,
+            self._medical_organizations_catalog_repository.get_by_ids,
+        )
+        if include_all_locales:
+            return full_schemas
+
+        chosen_language = get_locale()
+
+        return {
+            full_schema.id: MedicalOrganizationCatalogPartialResponseSchema(
+                id=full_schema.id,
+                name=MedicalOrganizationsCatalogService.__get_localized_name(full_schema),
+                organization_code=full_schema.organization_code,
+                address=MedicalOrganizationsCatalogService.__get_localized_address(
+                    full_schema
+                ),
+                lang=chosen_language,
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            )
+            for full_schema in full_schemas.values()
+        }
+
+    async def get_existing_ids(self, medical_organization_ids: Iterable[int]) -> Set[int]:
+        """Which of the IDs exist; cached records don't go to the database."""
+        return await catalog_cache.get_existing_ids(
+            MEDICAL_ORGANIZATIONS_CATALOG,
+            medical_organization_ids,
+            self._medical_organizations_catalog_repository.get_existing_ids,
+        )
+
     async def get_medical_organizations(
         self,
         pagination_params: PaginationParams,
@@ -204,8 +257,10 @@ class MedicalOrganizationsCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Medical organization with name: '%(NAME)s' already exists.")
-                % {"NAME": request_dto.name},
+                detail=format_message(
+                    "Medical organization with name: '%(NAME)s' already exists.",
+                    NAME=request_dto.name,
+                ),
             )
 
         # Check that 'code' (organization internal code) is not taken already
@@ -214,10 +269,10 @@ class MedicalOrganizationsCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_(
-                    "Medical organization with internal code: '%(ORG_CODE)s' already exists."
-                )
-                % {"ORG_CODE": request_dto.organization_code},
+                detail=format_message(
+                    "Medical organization with internal code: '%(ORG_CODE)s' already exists.",
+                    ORG_CODE=request_dto.organization_code,
+                ),
             )
 
         # Check that value in the 'name_locales' entry is not taken already
@@ -227,11 +282,12 @@ class MedicalOrganizationsCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
+                    detail=format_message(
                         "Medical organization's '%(CODE)s' name locale: '%(VALUE)s' already exists in some "
-                        "record's name locale. It's already taken."
-                    )
-                    % {"VALUE": value, "CODE": code},
+                        "record's name locale. It's already taken.",
+                        VALUE=value,
+                        CODE=code,
+                    ),
                 )
 
         return await self._medical_organizations_catalog_repository.add_medical_organization(
@@ -250,8 +306,10 @@ class MedicalOrganizationsCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Medical organization with id: %(ID)s not found.")
-                % {"ID": context_attribute_id},
+                detail=format_message(
+                    "Medical organization with id: %(ID)s not found.",
+                    ID=context_attribute_id,
+                ),
             )
 
         default_language = project_settings.DEFAULT_LANGUAGE
@@ -259,8 +317,10 @@ class MedicalOrganizationsCatalogService:
         if request_dto.lang is not None and request_dto.lang != existing.lang:
             if request_dto.lang != default_language:
                 raise ValueError(
-                    _("Field 'lang' must be '%(DEFAULT_LANG)s.'")
-                    % {"DEFAULT_LANG": default_language}
+                    format_message(
+                        "Field 'lang' must be '%(DEFAULT_LANG)s.'",
+                        DEFAULT_LANG=default_language,
+                    )
                 )
 
         # Check that 'name' field is not taken already
@@ -270,10 +330,10 @@ class MedicalOrganizationsCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
-                        "Medical organization with name: '%(NAME)s' already exists."
-                    )
-                    % {"NAME": request_dto.name},
+                    detail=format_message(
+                        "Medical organization with name: '%(NAME)s' already exists.",
+                        NAME=request_dto.name,
+                    ),
                 )
 
         # Check that 'code' (organization internal code) is not taken already
@@ -290,10 +350,10 @@ class MedicalOrganizationsCatalogService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
-                            "Medical organization with internal code: '%(ORG_CODE)s' already exists."
-                        )
-                        % {"ORG_CODE": request_dto.organization_code},
+                        detail=format_message(
+                            "Medical organization with internal code: '%(ORG_CODE)s' already exists.",
+                            ORG_CODE=request_dto.organization_code,
+                        ),
                     )
 
         if request_dto.name_locales is not None:
@@ -307,16 +367,18 @@ class MedicalOrganizationsCatalogService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
+                        detail=format_message(
                             "Medical organization's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                            "record's locale. It's already taken."
-                        )
-                        % {"VALUE": value, "CODE": language_code},
+                            "record's locale. It's already taken.",
+                            VALUE=value,
+                            CODE=language_code,
+                        ),
                     )
 
         updated = await self._medical_organizations_catalog_repository.update_medical_organization(
             context_attribute_id, request_dto
         )
+        catalog_cache.invalidate(MEDICAL_ORGANIZATIONS_CATALOG, context_attribute_id)
 
         return updated
 
@@ -328,10 +390,13 @@ class MedicalOrganizationsCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Medical organization with id: %(ID)s not found.")
-                % {"ID": context_attribute_id},
+                detail=format_message(
+                    "Medical organization with id: %(ID)s not found.",
+                    ID=context_attribute_id,
+                ),
             )
 
         await self._medical_organizations_catalog_repository.delete_by_id(
             context_attribute_id
         )
+        catalog_cache.invalidate(MEDICAL_ORGANIZATIONS_CATALOG, context_attribute_id)
@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.nationalities_catalog_request_schemas import (
     AddNationalitySchema,
@@ -13,7 +13,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.nationalities_catalo
 from src.apps.catalogs.interfaces.nationalities_catalog_repository_interface import (
     NationalitiesCatalogRepositoryInterface,
 )
-from src.core.i18n import _, get_locale
+from src.apps.catalogs.services.catalog_cache import (
+    NATIONALITIES_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message, get_locale
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
@@ -62,14 +66,18 @@ class NationalitiesCatalogService:
         NationalityCatalogFullResponseSchema,
         NationalityCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._nationalities_catalog_repository.get_by_id(
-            nationality_id
+        full_schema = await catalog_cache.get_by_id(
+            NATIONALITIES_CATALOG,
+            nationality_id,
+            self._nationalities_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Nationality with ID: %(NATIONALITY_ID)s was not found.")
-                % {"NATIONALITY_ID": nationality_id},
+                detail=format_message(
+                    "Nationality with ID: %(NATIONALITY_ID)s was not found.",
+                    NATIONALITY_ID=nationality_id,
+                ),
             )
 
         if include_all_locales:
@@ -86,6 +94,14 @@ class NationalitiesCatalogService:
             changed_at=full_schema.changed_at,
         )
 
+    async def get_existing_ids(self, nationality_ids: Iterable[int]) -> Set[int]:
+        """Which of the IDs exist; cached records don't go to the database."""
+        return await catalog_cache.get_existing_ids(
+            NATIONALITIES_CATALOG,
+            nationality_ids,
+            self._nationalities_catalog_repository.get_existing_ids,
+        )
+
     async def get_nationalities(
         self,
         pagination_params: PaginationParams,
@@ -158,8 +174,10 @@ class NationalitiesCatalogService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Nationality with name: '%(NAME)s' already exists.")
-                % {"NAME": request_dto.name},
+                detail=format_message(
+                    "Nationality with name: '%(NAME)s' already exists.",
+                    NAME=request_dto.name,
+                ),
             )
 
         # Check that value in the 'name_locales' entry is not taken already
@@ -167,11 +185,12 @@ class NationalitiesCatalogService:
             if await self._nationalities_catalog_repository.get_by_locale(code, value):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
+                    detail=format_message(
                         "Nationality's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                        "record's locale. It's already taken."
-                    )
-                    % {"VALUE": value, "CODE": code},
+                        "record's locale. It's already taken.",
+                        VALUE=value,
+                        CODE=code,
+                    ),
                 )
 
         return await self._nationalities_catalog_repository.add_nationality(request_dto)
@@ -188,8 +207,10 @@ class NationalitiesCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Nationality with ID: %(ID)s not found.")
-                % {"ID": nationality_id},
+                detail=format_message(
+                    "Nationality with ID: %(ID)s not found.",
+                    ID=nationality_id,
+                ),
             )
 
         default_language = project_settings.DEFAULT_LANGUAGE
@@ -197,8 +218,10 @@ class NationalitiesCatalogService:
         if request_dto.lang is not None and request_dto.lang != existing.lang:
             if request_dto.lang != default_language:
                 raise ValueError(
-                    _("Field 'lang' must be '%(DEFAULT_LANG)s.'")
-                    % {"DEFAULT_LANG": default_language}
+                    format_message(
+                        "Field 'lang' must be '%(DEFAULT_LANG)s.'",
+                        DEFAULT_LANG=default_language,
+                    )
                 )
 
         if request_dto.name is not None and request_dto.name != existing.name:
@@ -207,8 +230,10 @@ class NationalitiesCatalogService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_("Nationality with name: '%(NAME)s' already exists.")
-                    % {"NAME": request_dto.name},
+                    detail=format_message(
+                        "Nationality with name: '%(NAME)s' already exists.",
+                        NAME=request_dto.name,
+                    ),
                 )
 
         if request_dto.name_locales is not None:
@@ -222,16 +247,18 @@ class NationalitiesCatalogService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
+                        detail=format_message(
                             "Nationality's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                            "record's locale. It's already taken."
-                        )
-                        % {"VALUE": value, "CODE": language_code},
+                            "record's locale. It's already taken.",
+                            VALUE=value,
+                            CODE=language_code,
+                        ),
                     )
 
         updated = await self._nationalities_catalog_repository.update_nationality(
             nationality_id, request_dto
         )
+        catalog_cache.invalidate(NATIONALITIES_CATALOG, nationality_id)
 
         return updated
 
@@ -243,8 +270,11 @@ class NationalitiesCatalogService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Nationality with ID: %(ID)s not found.")
-                % {"ID": nationality_id},
+                detail=format_message(
+                    "Nationality with ID: %(ID)s not found.",
+                    ID=nationality_id,
+                ),
             )
 
         await self._nationalities_catalog_repository.delete_by_id(nationality_id)
+        catalog_cache.invalidate(NATIONALITIES_CATALOG, nationality_id)
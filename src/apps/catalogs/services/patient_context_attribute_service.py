@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.patient_context_attributes_catalog_request_schemas import (
     AddPatientContextAttributeSchema,
@@ -13,7 +13,11 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.patient_context_attr
 from src.apps.catalogs.interfaces.patient_context_attributes_repository_interface import (
     PatientContextAttributesCatalogRepositoryInterface,
 )
-from src.core.i18n import _, get_locale
+from src.apps.catalogs.services.catalog_cache import (
+    PATIENT_CONTEXT_ATTRIBUTES_CATALOG,
+    catalog_cache,
+)
+from src.core.i18n import format_message, get_locale
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import InstanceAlreadyExistsError, NoInstanceFoundError
@@ -62,16 +66,18 @@ class PatientContextAttributeService:
         PatientContextAttributeCatalogFullResponseSchema,
         PatientContextAttributeCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._context_attributes_repository.get_by_id(
-            context_attribute_id
+        full_schema = await catalog_cache.get_by_id(
+            PATIENT_CONTEXT_ATTRIBUTES_CATALOG,
+            context_attribute_id,
+            self._context_attributes_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_(
-                    "Patient context attribute with ID: %(ATTR_ID)s was not found."
-                )
-                % {"ATTR_ID": context_attribute_id},
+                detail=format_message(
+                    "Patient context attribute with ID: %(ATTR_ID)s was not found.",
+                    ATTR_ID=context_attribute_id,
+                ),
             )
 
         if include_all_locales:
@@ -90,6 +96,14 @@ class PatientContextAttributeService:
             changed_at=full_schema.changed_at,
         )
 
+    async def get_existing_ids(self, context_attribute_ids: Iterable[int]) -> Set[int]:
+        """Which of the IDs exist; cached records don't go to the database."""
+        return await catalog_cache.get_existing_ids(
+            PATIENT_CONTEXT_ATTRIBUTES_CATALOG,
+            context_attribute_ids,
+            self._context_attributes_repository.get_existing_ids,
+        )
+
     async def get_patient_context_attributes(
         self,
         pagination_params: PaginationParams,
@@ -162,8 +176,10 @@ class PatientContextAttributeService:
         ):
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Attribute with name: '%(NAME)s' already exists.")
-                % {"NAME": request_dto.name},
+                detail=format_message(
+                    "Attribute with name: '%(NAME)s' already exists.",
+                    NAME=request_dto.name,
+                ),
             )
 
         # Check that value in the 'name_locales' entry is not taken already
@@ -171,11 +187,12 @@ class PatientContextAttributeService:
             if await self._context_attributes_repository.get_by_locale(code, value):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_(
+                    detail=format_message(
                         "Attribute's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                        "record's locale. It's already taken."
-                    )
-                    % {"VALUE": value, "CODE": code},
+                        "record's locale. It's already taken.",
+                        VALUE=value,
+                        CODE=code,
+                    ),
                 )
 
         return await self._context_attributes_repository.add_patient_context_attribute(
@@ -194,8 +211,10 @@ class PatientContextAttributeService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Attribute with id: %(ID)s not found.")
-                % {"ID": context_attribute_id},
+                detail=format_message(
+                    "Attribute with id: %(ID)s not found.",
+                    ID=context_attribute_id,
+                ),
             )
 
         default_language = project_settings.DEFAULT_LANGUAGE
@@ -203,8 +222,10 @@ class PatientContextAttributeService:
         if request_dto.lang is not None and request_dto.lang != existing.lang:
             if request_dto.lang != default_language:
                 raise ValueError(
-                    _("Field 'lang' must be '%(DEFAULT_LANG)s.'")
-                    % {"DEFAULT_LANG": default_language}
+                    format_message(
+                        "Field 'lang' must be '%(DEFAULT_LANG)s.'",
+                        DEFAULT_LANG=default_language,
+                    )
                 )
 
         if request_dto.name is not None and request_dto.name != existing.name:
@@ -213,8 +234,10 @@ class PatientContextAttributeService:
             ):
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_("Attribute with name: '%(NAME)s' already exists.")
-                    % {"NAME": request_dto.name},
+                    detail=format_message(
+                        "Attribute with name: '%(NAME)s' already exists.",
+                        NAME=request_dto.name,
+                    ),
                 )
 
         if request_dto.name_locales is not None:
@@ -228,11 +251,12 @@ class PatientContextAttributeService:
                 ):
                     raise InstanceAlreadyExistsError(
                         status_code=409,
-                        detail=_(
+                        detail=format_message(
                             "Attribute's '%(CODE)s' locale: '%(VALUE)s' already exists in some "
-                            "record's locale. It's already taken."
-                        )
-                        % {"VALUE": value, "CODE": language_code},
+                            "record's locale. It's already taken.",
+                            VALUE=value,
+                            CODE=language_code,
+                        ),
                     )
 
         updated = (
@@ -240,6 +264,7 @@ class PatientContextAttributeService:
                 context_attribute_id, request_dto
             )
         )
+        catalog_cache.invalidate(PATIENT_CONTEXT_ATTRIBUTES_CATALOG, context_attribute_id)
 
         return updated
 
@@ -251,8 +276,11 @@ class PatientContextAttributeService:
         if not existing:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Attribute with id: %(ID)s not found.")
-                % {"ID": context_attribute_id},
+                detail=format_message(
+                    "Attribute with id: %(ID)s not found.",
+                    ID=context_attribute_id,
+                ),
             )
 
         await self._context_attributes_repository.delete_by_id(context_attribute_id)
+        catalog_cache.invalidate(PATIENT_CONTEXT_ATTRIBUTES_CATALOG, context_attribute_id)
@@ -23,7 +23,7 @@ from src.apps.catalogs.services.diagnoses_catalogue_service import (
 )
 from src.apps.patients.services.patients_service import PatientService
 from src.apps.users.services.user_service import UserService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
 from src.shared.schemas.pagination_schemas import (
@@ -72,8 +72,10 @@ class DiagnosedPatientDiagnosisService:
 
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Patient diagnosis record with ID: %(ID)s was not found.")
-            % {"ID": str(original_id)},
+            detail=format_message(
+                "Patient diagnosis record with ID: %(ID)s was not found.",
+                ID=str(original_id),
+            ),
         )
 
     async def _check_record_is_unique(
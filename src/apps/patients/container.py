@@ -23,7 +23,8 @@ from src.apps.patients.infrastructure.repositories.patient_repository import (
 )
 from src.apps.patients.services.patients_service import PatientService
 from src.apps.patients.uow import UnitOfWorkImpl
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -38,6 +39,7 @@ class PatientsContainer(containers.DeclarativeContainer):
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
     citizenship_service = providers.Dependency(instance_of=CitizenshipCatalogService)
     nationalities_service = providers.Dependency(
         instance_of=NationalitiesCatalogService
@@ -54,11 +56,16 @@ class PatientsContainer(containers.DeclarativeContainer):
 
     # Session factory
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Async session
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # UOW
     unit_of_work = providers.Factory(
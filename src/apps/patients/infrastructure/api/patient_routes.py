@@ -1,4 +1,3 @@
-import math
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
@@ -23,8 +22,8 @@ from src.apps.patients.mappers import (
 )
 from src.apps.patients.services.patients_service import PatientService
 from src.shared.schemas.pagination_schemas import (
-    PaginationMetaDataSchema,
     PaginationParams,
+    build_pagination_metadata,
 )
 
 patients_router = APIRouter(prefix="/patients")
@@ -52,19 +51,8 @@ async def get_patients(
     )
 
     # Calculate pagination metadata
-    page: int = pagination_params.page or 1  # for mypy
-    limit: int = pagination_params.limit or 30  # for mypy
-    total_pages = math.ceil(total_number_of_items / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
-
-    pagination_metadata = PaginationMetaDataSchema(
-        current_page=page,
-        per_page=limit,
-        total_items=total_number_of_items,
-        total_pages=total_pages,
-        has_next=has_next,
-        has_prev=has_prev,
+    pagination_metadata = build_pagination_metadata(
+        pagination_params, total_number_of_items, patients
     )
 
     response_schema = MultiplePatientsResponseSchema(
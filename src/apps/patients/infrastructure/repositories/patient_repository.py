@@ -1,8 +1,8 @@
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import any_, select
 from sqlalchemy.orm import selectinload
 
 from src.apps.catalogs.infrastructure.db_models.financing_sources_catalogue import (
@@ -20,6 +20,7 @@ from src.apps.patients.mappers import (
     map_patient_db_entity_to_domain,
     map_patient_domain_to_db_entity,
 )
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
 
 
@@ -56,11 +57,17 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
 
         return query
 
-    async def get_total_number_of_patients(self) -> int:
-        query = select(func.count(SQLAlchemyPatient.id))
-        result = await self._async_db_session.execute(query)
+    async def get_total_number_of_patients(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        query = select(SQLAlchemyPatient.id)
+        if filters:
+            # '_apply_filters_to_query' pops keys, so it must get its own copy
+            query = self._apply_filters_to_query(query, dict(filters))
 
-        return result.scalar_one()
+        return await self._get_total_count(
+            query, filters, approximate_table=SQLAlchemyPatient.__tablename__
+        )
 
     async def get_by_id(self, patient_id: UUID) -> Optional[PatientDomain]:
         query = (
@@ -79,6 +86,26 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
 
         return map_patient_db_entity_to_domain(db_patient)
 
+    async def get_by_ids(self, patient_ids: Iterable[UUID]) -> List[PatientDomain]:
+        patient_ids = list(patient_ids)
+        if not patient_ids:
+            return []
+
+        query = (
+            select(SQLAlchemyPatient)
+            .options(
+                selectinload(SQLAlchemyPatient.financing_sources),
+                selectinload(SQLAlchemyPatient.additional_attributes),
+            )
+            .where(SQLAlchemyPatient.id == any_(patient_ids))
+        )
+        result = await self._async_db_session.execute(query)
+        db_patients = result.scalars().all()
+
+        return [
+            map_patient_db_entity_to_domain(db_patient) for db_patient in db_patients
+        ]
+
     async def get_by_iin(self, patient_iin: str) -> Optional[PatientDomain]:
         query = (
             select(SQLAlchemyPatient)
@@ -101,6 +128,7 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         filters: Optional[Dict[str, Any]] = None,
         page: int = 1,
         limit: int = 30,
+        cursor: Optional[str] = None,
     ) -> List[PatientDomain]:
         query = select(SQLAlchemyPatient).options(
             selectinload(SQLAlchemyPatient.financing_sources),
@@ -110,6 +138,15 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         if filters:
             query = self._apply_filters_to_query(query, filters)
 
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                query, sort_key=(SQLAlchemyPatient.id,), limit=limit, cursor=cursor
+            )
+            return KeysetPage(
+                [map_patient_db_entity_to_domain(row) for row in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
         query = query.offset((page - 1) * limit).limit(limit)
         result = await self._async_db_session.execute(query)
         db_patients = result.scalars().all()
@@ -119,6 +156,8 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         ]
 
     async def create_patient(self, patient_domain: PatientDomain) -> PatientDomain:
+        self._invalidate_total_count()
+
         # Convert domain model to database entity
         db_patient = map_patient_domain_to_db_entity(patient_domain)
 
@@ -166,6 +205,8 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         return map_patient_db_entity_to_domain(reloaded_db_patient)
 
     async def update_patient(self, patient_domain: PatientDomain) -> PatientDomain:
+        self._invalidate_total_count()
+
         # Fetch existing patient entity
         result = await self._async_db_session.execute(
             select(SQLAlchemyPatient)
@@ -240,6 +281,8 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         return map_patient_db_entity_to_domain(db_patient)
 
     async def delete_by_id(self, patient_id: UUID) -> None:
+        self._invalidate_total_count()
+
         query = select(SQLAlchemyPatient).where(SQLAlchemyPatient.id == patient_id)
         result = await self._async_db_session.execute(query)
         db_patient = result.scalars().first()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
 from src.apps.patients.domain.patient import PatientDomain
@@ -7,11 +7,15 @@ from src.apps.patients.domain.patient import PatientDomain
 
 class PatientRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_patients(self) -> int:
+    async def get_total_number_of_patients(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
-        Retrieve a number of ALL patients from the Registry Service DB.
+        Retrieve a number of patients matching the filters from the Registry Service DB.
 
-        :return: Amount of ALL patients from the Registry Service DB as INT
+        :param filters: The same filters that are passed to 'get_patients'
+        (if not provided - ALL patients are counted).
+        :return: Amount of matching patients from the Registry Service DB as INT
         """
         pass
 
@@ -25,6 +29,17 @@ class PatientRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, patient_ids: Iterable[UUID]) -> List[PatientDomain]:
+        """
+        Retrieves all patients with the given ids in a single query.
+        IDs that don't match any patient are skipped.
+
+        :param patient_ids: Patients' unique identifiers
+        :return: List of patient domain objects
+        """
+        pass
+
     @abstractmethod
     async def get_by_iin(self, patient_iin: str) -> Optional[PatientDomain]:
         """
@@ -41,6 +56,7 @@ class PatientRepositoryInterface(ABC):
         filters: Optional[Dict[str, Any]] = None,
         page: int = 1,
         limit: int = 30,
+        cursor: Optional[str] = None,
     ) -> List[PatientDomain]:
         """
         Retrieves a patients from the DB based on the given filters (if provided).
@@ -48,6 +64,8 @@ class PatientRepositoryInterface(ABC):
         :param filters: Parameters to filter patients by
         :param page: Pagination parameter (page number)
         :param limit: Pagination parameter (items per page)
+        :param cursor: Keyset pagination cursor. If not None, 'page' is ignored and
+        patients are fetched after the cursor ordered by ID ('KeysetPage' is returned).
 
         :return: Patient domain object or None if nothing was found.
         """
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
@@ -30,13 +30,14 @@ from src.apps.patients.infrastructure.repositories.patient_repository import (
 )
 from src.apps.patients.interfaces.uow_interface import UnitOfWorkInterface
 from src.apps.patients.mappers import map_update_schema_to_domain
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.shared.exceptions import (
     ApplicationError,
     DeleteRestrictedError,
     InstanceAlreadyExistsError,
     NoInstanceFoundError,
 )
+from src.shared.helpers.reference_validation import References, validate_references
 from src.shared.schemas.pagination_schemas import PaginationParams
 
 
@@ -60,24 +61,41 @@ class PatientService:
         self._patient_context_attributes_service = patient_context_attributes_service
 
     async def _validate_related_entities(self, patient: PatientDomain) -> None:
-        """Checks that all FK and M2M connections for a patient exist by calling catalog services."""
-        # ONE-to-ONE relations
-        await self._citizenship_service.get_by_id(patient.citizenship_id)
-        await self._nationalities_service.get_by_id(patient.nationality_id)
-
-        attachment_data = patient.attachment_data
-        if attachment_data:
-            attached_clinic_id = attachment_data.get("attached_clinic_id")
-            if attached_clinic_id:
-                await self._medical_org_service.get_by_id(attached_clinic_id)
-
-        # MANY-to-MANY relations
-        for source_id in patient.financing_sources_ids:
-            await self._financing_source_service.get_by_id(source_id)
-
-        if patient.context_attributes_ids:
-            for attribute_id in patient.context_attributes_ids:
-                await self._patient_context_attributes_service.get_by_id(attribute_id)
+        """
+        Checks that all FK and M2M connections for a patient exist: one query per catalog,
+        all missing IDs are reported at once.
+        """
+        attachment_data = patient.attachment_data or {}
+
+        await validate_references(
+            # ONE-to-ONE relations
+            References(
+                [patient.citizenship_id],
+                self._citizenship_service.get_existing_ids,
+                "Citizenship with ID: %(IDS)s was not found.",
+            ),
+            References(
+                [patient.nationality_id],
+                self._nationalities_service.get_existing_ids,
+                "Nationality with ID: %(IDS)s was not found.",
+            ),
+            References(
+                [attachment_data.get("attached_clinic_id") or None],
+                self._medical_org_service.get_existing_ids,
+                "Medical organization with ID: %(IDS)s was not found.",
+            ),
+            # MANY-to-MANY relations
+            References(
+                patient.financing_sources_ids or [],
+                self._financing_source_service.get_existing_ids,
+                "Financing sources with IDs: %(IDS)s were not found.",
+            ),
+            References(
+                patient.context_attributes_ids or [],
+                self._patient_context_attributes_service.get_existing_ids,
+                "Patient context attributes with IDs: %(IDS)s were not found.",
+            ),
+        )
 
     @staticmethod
     async def _has_valid_filters(filters: Dict[str, Any]) -> bool:
@@ -114,18 +132,27 @@ class PatientService:
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Patient with ID: '%(ID)s' not found.") % {"ID": patient_id},
+                detail=format_message(
+                    "Patient with ID: '%(ID)s' not found.",
+                    ID=patient_id,
+                ),
             )
 
         return patient
 
+    async def get_by_ids(self, patient_ids: Iterable[UUID]) -> List[PatientDomain]:
+        """Bulk variant of 'get_by_id'. Doesn't raise for missing IDs, they're just skipped."""
+        return await self._patients_repository.get_by_ids(patient_ids)
+
     async def get_by_iin(self, patient_iin: str) -> PatientDomain:
         patient = await self._patients_repository.get_by_iin(patient_iin)
         if not patient:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Patient with IIN: '%(IIN)s' not found.")
-                % {"IIN": patient_iin},
+                detail=format_message(
+                    "Patient with IIN: '%(IIN)s' not found.",
+                    IIN=patient_iin,
+                ),
             )
 
         return patient
@@ -135,19 +162,26 @@ class PatientService:
         filter_params: PatientsFilterParams,
         pagination_params: PaginationParams,
     ) -> Tuple[List[PatientDomain], int]:
-        total_amount_of_patients: int = (
-            await self._patients_repository.get_total_number_of_patients()
-        )
-
         filters_dict = filter_params.to_dict(exclude_none=True)
         if not await self._has_valid_filters(filters_dict):
-            # If filters are too short or empty - return an empty list
-            return [], total_amount_of_patients
+            # If filters are too short or empty - return an empty list with the number of ALL patients
+            total_amount_of_all_patients: int = (
+                await self._patients_repository.get_total_number_of_patients()
+            )
+            return [], total_amount_of_all_patients
+
+        # Counted with the same filters as the page itself
+        total_amount_of_patients: int = (
+            await self._patients_repository.get_total_number_of_patients(
+                dict(filters_dict)
+            )
+        )
 
         patients = await self._patients_repository.get_patients(
             filters=filters_dict,
             page=pagination_params.page,
             limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
         return patients, total_amount_of_patients
@@ -160,8 +194,10 @@ class PatientService:
         if existing_patient_by_iin:
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_("Patient with IIN: '%(IIN)s' already exists.")
-                % {"IIN": patient.iin},
+                detail=format_message(
+                    "Patient with IIN: '%(IIN)s' already exists.",
+                    IIN=patient.iin,
+                ),
             )
 
         # Check that all ONE-to-ONE and MANY-to-MANY relations for patient exist
@@ -189,8 +225,10 @@ class PatientService:
             if existing_patient_by_iin and existing_patient_by_iin.id != patient_id:
                 raise InstanceAlreadyExistsError(
                     status_code=409,
-                    detail=_("Patient with IIN: '%(IIN)s' already exists.")
-                    % {"IIN": dto.iin},
+                    detail=format_message(
+                        "Patient with IIN: '%(IIN)s' already exists.",
+                        IIN=dto.iin,
+                    ),
                 )
 
         # Check that all ONE-to-ONE and MANY-to-MANY relations for patient exist
@@ -6,7 +6,8 @@ from sqlalchemy.orm.session import sessionmaker
 from src.apps.platform_rules.infrastructure.repositories.platform_rules_repository import (
     SQLAlchemyPlatformRulesRepositoryImpl,
 )
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -21,14 +22,20 @@ class PlatformRulesContainer(containers.DeclarativeContainer):
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
 
     # Session factory
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Async session
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # Repositories
     platform_rules_repository = providers.Factory(
@@ -19,7 +19,7 @@ from src.apps.platform_rules.interfaces.platform_rules_repository_interface impo
     PlatformRulesRepositoryInterface,
 )
 from src.apps.registry.exceptions import NoInstanceFoundError
-from src.core.i18n import _
+from src.core.i18n import format_message
 from src.shared.exceptions import InstanceAlreadyExistsError
 from src.shared.schemas.pagination_schemas import (
     PaginationMetaDataSchema,
@@ -45,8 +45,10 @@ async def get_by_id(
     if not platform_rule:
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Platform rule with ID: '%(ID)s' not found.")
-            % {"ID": platform_rule_id},
+            detail=format_message(
+                "Platform rule with ID: '%(ID)s' not found.",
+                ID=platform_rule_id,
+            ),
         )
 
     return platform_rule
@@ -114,8 +116,10 @@ async def create_platform_rule(
     if existing_rule:
         raise InstanceAlreadyExistsError(
             status_code=409,
-            detail=_("Platform rule with key: '%(KEY)s' already exists.")
-            % {"KEY": request_dto.key},
+            detail=format_message(
+                "Platform rule with key: '%(KEY)s' already exists.",
+                KEY=request_dto.key,
+            ),
         )
 
     created_rule = await repository.create_platform_rule(request_dto)
@@ -140,8 +144,10 @@ async def update_platform_rule(
     if not platform_rule:
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Platform rule with ID: '%(ID)s' not found.")
-            % {"ID": platform_rule_id},
+            detail=format_message(
+                "Platform rule with ID: '%(ID)s' not found.",
+                ID=platform_rule_id,
+            ),
         )
 
     updated_platform_rule = await repository.update_platform_rule(
@@ -168,8 +174,10 @@ async def delete_platform_rule_endpoint(
     if not platform_rule:
         raise NoInstanceFoundError(
             status_code=404,
-            detail=_("Platform rule with ID: '%(ID)s' not found.")
-            % {"ID": platform_rule_id},
+            detail=format_message(
+                "Platform rule with ID: '%(ID)s' not found.",
+                ID=platform_rule_id,
+            ),
         )
 
     await repository.delete_by_id(platform_rule_id)
@@ -25,7 +25,8 @@ from src.apps.registry.services.schedule_service import ScheduleService
 from src.apps.registry.uow import UnitOfWorkImpl
 from src.apps.users.infrastructure.repositories.user_repository import SQLAlchemyUserRepository
 from src.apps.users.services.user_service import UserService
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -44,17 +45,23 @@ class RegistryContainer(containers.DeclarativeContainer):
     user_repository: providers.Dependency[SQLAlchemyUserRepository] = providers.Dependency()
     platform_rules_repository: providers.Dependency[SQLAlchemyPlatformRulesRepositoryImpl] = providers.Dependency()
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
     financing_sources_catalog_service = providers.Dependency(
         instance_of=FinancingSourceCatalogService
     )
 
     # Session factory
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Async session
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # UOW
     unit_of_work = providers.Factory(
@@ -0,0 +1,114 @@
+from bisect import bisect_left, insort
+from datetime import time
+from typing import Iterable, List, Optional, Tuple
+
+SECONDS_PER_MINUTE = 60
+
+
+def _to_seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _to_time(seconds: int) -> time:
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+class DaySlotIndex:
+    """
+    Slot availability index of one schedule day.
+
+    Keeps start times of occupied (not cancelled) appointments as a sorted list of
+    seconds since midnight. Every appointment of a day lasts 'appointment_interval'
+    minutes, so a slot overlaps an appointment only if it overlaps its nearest
+    neighbour, and "is this slot free" is answered with a single binary search.
+    """
+
+    def __init__(
+        self,
+        *,
+        work_start_time: time,
+        work_end_time: time,
+        break_start_time: Optional[time] = None,
+        break_end_time: Optional[time] = None,
+        appointment_interval: int,
+        occupied_times: Iterable[time] = (),
+    ):
+        self.appointment_interval = appointment_interval
+        self._duration = appointment_interval * SECONDS_PER_MINUTE
+        self._work_start = _to_seconds(work_start_time)
+        self._work_end = _to_seconds(work_end_time)
+        self._break: Optional[Tuple[int, int]] = None
+        if break_start_time and break_end_time:
+            self._break = (_to_seconds(break_start_time), _to_seconds(break_end_time))
+
+        self._occupied: List[int] = sorted(_to_seconds(t) for t in occupied_times)
+
+    @classmethod
+    def from_schedule_day(
+        cls,
+        schedule_day,
+        appointment_interval: int,
+        occupied_times: Iterable[time] = (),
+    ) -> "DaySlotIndex":
+        return cls(
+            work_start_time=schedule_day.work_start_time,
+            work_end_time=schedule_day.work_end_time,
+            break_start_time=schedule_day.break_start_time,
+            break_end_time=schedule_day.break_end_time,
+            appointment_interval=appointment_interval,
+            occupied_times=occupied_times,
+        )
+
+    def _fits_working_hours(self, start: int) -> bool:
+        if start < self._work_start or start + self._duration > self._work_end:
+            return False
+        if self._break is not None:
+            break_start, break_end = self._break
+            if start < break_end and start + self._duration > break_start:
+                return False
+
+        return True
+
+    def _is_booked(self, start: int) -> bool:
+        position = bisect_left(self._occupied, start)
+        # The next appointment starts before the slot ends
+        if (
+            position < len(self._occupied)
+            and self._occupied[position] < start + self._duration
+        ):
+            return True
+        # The previous appointment ends after the slot starts
+        return position > 0 and self._occupied[position - 1] + self._duration > start
+
+    def is_booked(self, start_time: time) -> bool:
+        """Checks whether a slot starting at 'start_time' overlaps an occupied one."""
+        return self._is_booked(_to_seconds(start_time))
+
+    def is_free(self, start_time: time) -> bool:
+        """Checks whether a slot starting at 'start_time' fits working hours and isn't booked."""
+        start = _to_seconds(start_time)
+        return self._fits_working_hours(start) and not self._is_booked(start)
+
+    def free_slots(self) -> List[Tuple[time, time]]:
+        """
+        Lists free slots of the day as (start, end) pairs. Slots follow the
+        'appointment_interval' grid from the start of the working day.
+        """
+        if self._duration <= 0:
+            return []
+
+        slots = []
+        for start in range(self._work_start, self._work_end, self._duration):
+            if self._fits_working_hours(start) and not self._is_booked(start):
+                slots.append((_to_time(start), _to_time(start + self._duration)))
+
+        return slots
+
+    def occupy(self, start_time: time) -> None:
+        insort(self._occupied, _to_seconds(start_time))
+
+    def release(self, start_time: time) -> None:
+        start = _to_seconds(start_time)
+        position = bisect_left(self._occupied, start)
+        if position < len(self._occupied) and self._occupied[position] == start:
+            del self._occupied[position]
@@ -70,3 +70,7 @@ class InvalidAppointmentInsuranceTypeError(ApplicationRegistryAppError):
 
 class BreakTimeConflictError(ApplicationRegistryAppError):
     pass
+
+
+class InvalidSearchPeriodError(ApplicationRegistryAppError):
+    pass
@@ -1,4 +1,3 @@
-import math
 from typing import Annotated, List
 from uuid import UUID
 
@@ -32,8 +31,8 @@ from src.shared.dependencies.resources_map import (
     AvailableScopesEnum,
 )
 from src.shared.schemas.pagination_schemas import (
-    PaginationMetaDataSchema,
     PaginationParams,
+    build_pagination_metadata,
 )
 
 appointments_router = APIRouter()
@@ -108,19 +107,8 @@ async def get_appointments(
     )
 
     # Calculate pagination metadata
-    page: int = pagination_params.page or 1  # for mypy
-    limit: int = pagination_params.limit or 30  # for mypy
-    total_pages = math.ceil(total_appointments_amount / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
-
-    pagination_metadata = PaginationMetaDataSchema(
-        current_page=page,
-        per_page=limit,
-        total_items=total_appointments_amount,
-        total_pages=total_pages,
-        has_next=has_next,
-        has_prev=has_prev,
+    pagination_metadata = build_pagination_metadata(
+        pagination_params, total_appointments_amount, results
     )
 
     response_schemas: List[ResponseAppointmentSchema] = []
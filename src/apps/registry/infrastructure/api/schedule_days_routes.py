@@ -5,12 +5,18 @@ from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 
 from src.apps.registry.container import RegistryContainer
+from src.apps.registry.infrastructure.api.schemas.requests.filters.free_slots_filter_params import (
+    FreeSlotsFilterParams,
+)
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     UpdateScheduleDaySchema,
 )
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    FreeSlotSchema,
+    MultipleDoctorFreeSlotsResponseSchema,
     MultipleScheduleDaysResponseSchema,
     ResponseScheduleDaySchema,
+    ScheduleDayFreeSlotsResponseSchema,
 )
 from src.apps.registry.services.schedule_day_service import ScheduleDayService
 from src.shared.dependencies.check_user_permissions import check_user_permissions
@@ -26,6 +32,40 @@ from src.shared.schemas.pagination_schemas import (
 schedule_days_router = APIRouter()
 
 
+# Must be declared before "/schedules/days/{day_id}"
+@schedule_days_router.get(
+    "/schedules/days/free-slots", response_model=MultipleDoctorFreeSlotsResponseSchema
+)
+@inject
+async def search_free_slots(
+    filter_params: FreeSlotsFilterParams = Depends(),
+    pagination_params: PaginationParams = Depends(),
+    schedule_day_service: ScheduleDayService = Depends(
+        Provide[RegistryContainer.schedule_day_service]
+    ),
+    _: None = Depends(
+        check_user_permissions(
+            resources=[
+                {
+                    "resource_name": AvailableResourcesEnum.SCHEDULES,
+                    "scopes": [AvailableScopesEnum.READ],
+                },
+            ],
+        )
+    ),
+) -> MultipleDoctorFreeSlotsResponseSchema:
+    free_slots = await schedule_day_service.search_free_slots(
+        filters=filter_params.to_dict(exclude_none=True),
+        limit=pagination_params.limit or 30,
+        cursor=pagination_params.cursor,
+    )
+
+    return MultipleDoctorFreeSlotsResponseSchema(
+        items=free_slots,
+        next_cursor=free_slots.next_cursor,
+    )
+
+
 @schedule_days_router.get(
     "/schedules/days/{day_id}", response_model=ResponseScheduleDaySchema
 )
@@ -61,6 +101,39 @@ async def get_by_id(
     )
 
 
+@schedule_days_router.get(
+    "/schedules/days/{day_id}/free-slots",
+    response_model=ScheduleDayFreeSlotsResponseSchema,
+)
+@inject
+async def get_free_slots(
+    day_id: UUID,
+    schedule_day_service: ScheduleDayService = Depends(
+        Provide[RegistryContainer.schedule_day_service]
+    ),
+    _: None = Depends(
+        check_user_permissions(
+            resources=[
+                {
+                    "resource_name": AvailableResourcesEnum.SCHEDULES,
+                    "scopes": [AvailableScopesEnum.READ],
+                },
+            ],
+        )
+    ),
+) -> ScheduleDayFreeSlotsResponseSchema:
+    schedule_day, free_slots = await schedule_day_service.get_free_slots(day_id)
+
+    return ScheduleDayFreeSlotsResponseSchema(
+        schedule_day_id=schedule_day.id,
+        date=schedule_day.date,
+        items=[
+            FreeSlotSchema(start_time=start_time, end_time=end_time)
+            for start_time, end_time in free_slots
+        ],
+    )
+
+
 @schedule_days_router.get(
     "/schedules/{schedule_id}/days", response_model=MultipleScheduleDaysResponseSchema
 )
@@ -0,0 +1,33 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Query
+
+
+class FreeSlotsFilterParams:
+    def __init__(
+        self,
+        date_from: date = Query(..., description="Search free slots from this date"),
+        date_to: date = Query(
+            ..., description="Search free slots up to this date (inclusive)"
+        ),
+        doctor_id_filter: Optional[UUID] = Query(
+            None, description="Doctor's ID to search free slots by"
+        ),
+        doctor_specialization_filter: Optional[str] = Query(
+            None, description="Doctor's specialization to search free slots by"
+        ),
+    ):
+        self.date_from = date_from
+        self.date_to = date_to
+        self.doctor_id_filter = doctor_id_filter
+        self.doctor_specialization_filter = doctor_specialization_filter
+
+    def to_dict(self, exclude_none: bool = True) -> dict:
+        data = vars(self)
+        return {
+            key: value
+            for key, value in data.items()
+            if not exclude_none or value is not None
+        }
@@ -22,3 +22,28 @@ class ResponseScheduleDaySchema(BaseModel):
 class MultipleScheduleDaysResponseSchema(BaseModel):
     items: List[ResponseScheduleDaySchema]
     pagination: PaginationMetaDataSchema
+
+
+class FreeSlotSchema(BaseModel):
+    start_time: time
+    end_time: time
+
+
+class ScheduleDayFreeSlotsResponseSchema(BaseModel):
+    schedule_day_id: UUID
+    date: date
+    items: List[FreeSlotSchema]
+
+
+class DoctorFreeSlotSchema(BaseModel):
+    doctor_id: UUID
+    schedule_id: UUID
+    schedule_day_id: UUID
+    date: date
+    start_time: time
+    end_time: time
+
+
+class MultipleDoctorFreeSlotsResponseSchema(BaseModel):
+    items: List[DoctorFreeSlotSchema]
+    next_cursor: Optional[str] = None
@@ -36,6 +36,7 @@ class Schedule(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
         sqlalchemy_UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )  # User's id from the Auth Service (Keycloak)
     schedule_name: Mapped[str] = mapped_column(String(20), nullable=False)
 
@@ -74,7 +75,7 @@ class ScheduleDay(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
     __tablename__ = "schedule_days"
 
     schedule_id: Mapped[UUID] = mapped_column(
-        ForeignKey("schedules.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("schedules.id", ondelete="CASCADE"), nullable=False, index=True
     )
     day_of_week: Mapped[int] = mapped_column(
         Integer,
@@ -108,6 +109,7 @@ class Appointment(Base, CreatedAtMixin, ChangedAtMixin):
         sqlalchemy_UUID(as_uuid=True),
         ForeignKey("patients.id", ondelete="CASCADE"),
         nullable=True,
+        index=True,
     )
     phone_number: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     address: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
@@ -133,7 +135,7 @@ class Appointment(Base, CreatedAtMixin, ChangedAtMixin):
     )
     office_number: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     schedule_day_id: Mapped[UUID] = mapped_column(
-        ForeignKey("schedule_days.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("schedule_days.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Optional field to track when the appointment was cancelled (updatable only by the server)
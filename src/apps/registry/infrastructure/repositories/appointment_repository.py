@@ -1,11 +1,20 @@
-from typing import Any, Callable, Dict, List, Optional
+from datetime import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Integer, String, and_, any_, cast, func, select, update
+from sqlalchemy.dialects.postgresql.json import JSONB
 from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.expression import column
 
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.apps.registry.domain.enums import AppointmentStatusEnum
 from src.apps.registry.domain.models.appointment import AppointmentDomain
-from src.apps.registry.infrastructure.db_models.models import Appointment, ScheduleDay
+from src.apps.registry.infrastructure.db_models.models import (
+    Appointment,
+    Schedule,
+    ScheduleDay,
+)
 from src.apps.registry.interfaces.repository_interfaces import (
     AppointmentRepositoryInterface,
 )
@@ -13,9 +22,15 @@ from src.apps.registry.mappers import (
     map_appointment_db_entity_to_domain,
     map_appointment_domain_to_db_entity,
 )
+from src.apps.users.infrastructure.db_models.models import User
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.infrastructure.base import BaseRepository
 
 
+# First key of the two-key advisory lock, so booking locks don't clash with other advisory locks
+BOOKING_ADVISORY_LOCK_NAMESPACE = 1001
+
+
 class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
     _filters_map: Dict[str, Callable[[Any], Any]] = {
         "schedule_id": lambda value: AppointmentRepositoryImpl._filter_by_schedule_id(
@@ -30,8 +45,34 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         "appointment_status_filter": lambda value: AppointmentRepositoryImpl._filter_by_status(
             value
         ),
+        "patient_iin_filter": lambda value: AppointmentRepositoryImpl._filter_by_patient_iin(
+            value
+        ),
+        "patient_full_name_filter": lambda value: AppointmentRepositoryImpl._filter_by_patient_full_name(
+            value
+        ),
+        "attached_area_number_filter": lambda value: AppointmentRepositoryImpl._filter_by_attached_area_number(
+            value
+        ),
+        "doctor_id_filter": lambda value: AppointmentRepositoryImpl._filter_by_doctor_id(
+            value
+        ),
+        "doctor_specialization_filter": lambda value: AppointmentRepositoryImpl._filter_by_doctor_specialization(
+            value
+        ),
     }
 
+    # Filters that can't be evaluated without joining the 'patients' / 'schedules' tables
+    _patient_filters = (
+        "patient_iin_filter",
+        "patient_full_name_filter",
+        "attached_area_number_filter",
+    )
+    _schedule_filters = (
+        "doctor_id_filter",
+        "doctor_specialization_filter",
+    )
+
     @staticmethod
     def _filter_by_schedule_id(value):
         return ScheduleDay.schedule_id == value
@@ -48,6 +89,63 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
     def _filter_by_status(value):
         return Appointment.status == value
 
+    @staticmethod
+    def _filter_by_patient_iin(value):
+        return SQLAlchemyPatient.iin == value
+
+    @staticmethod
+    def _filter_by_patient_full_name(value):
+        full_name = func.concat_ws(
+            " ",
+            SQLAlchemyPatient.last_name,
+            SQLAlchemyPatient.first_name,
+            SQLAlchemyPatient.middle_name,
+            SQLAlchemyPatient.maiden_name,
+        )
+        return full_name.ilike(f"%{value.strip()}%")
+
+    @staticmethod
+    def _filter_by_attached_area_number(value):
+        return and_(
+            SQLAlchemyPatient.attachment_data["area_number"].isnot(None),
+            cast(SQLAlchemyPatient.attachment_data["area_number"].astext, Integer)
+            == value,
+        )
+
+    @staticmethod
+    def _filter_by_doctor_id(value):
+        return Schedule.doctor_id == value
+
+    @staticmethod
+    def _filter_by_doctor_specialization(value):
+        elements_source = func.jsonb_array_elements(User.specializations).table_valued(
+            column("value", JSONB), name="unnested_specs_alias"
+        )
+        element_name_as_text = elements_source.c.value.op("->>")("name")
+
+        return (
+            select(elements_source.c.value)
+            .select_from(elements_source)
+            .where(func.lower(func.trim(element_name_as_text)) == value.strip().lower())
+            .exists()
+        )
+
+    def _apply_filter_joins(self, stmt, filters: dict):
+        """Joins only the tables that the given (non-empty) filters actually reference."""
+        active_filters = {key for key, value in filters.items() if value is not None}
+
+        if active_filters.intersection(self._patient_filters):
+            stmt = stmt.join(
+                SQLAlchemyPatient, Appointment.patient_id == SQLAlchemyPatient.id
+            )
+
+        if active_filters.intersection(self._schedule_filters):
+            stmt = stmt.join(Schedule, ScheduleDay.schedule_id == Schedule.id)
+            if "doctor_specialization_filter" in active_filters:
+                stmt = stmt.join(User, Schedule.doctor_id == User.id)
+
+        return stmt
+
     def _build_filters(self, filters: dict) -> list:
         conditions = []
         for key, value in filters.items():
@@ -60,11 +158,26 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
 
         return conditions
 
-    async def get_total_number_of_appointments(self) -> int:
-        query = select(func.count(Appointment.id))
-        result = await self._async_db_session.execute(query)
+    def _apply_filters(self, stmt, filters: dict):
+        stmt = self._apply_filter_joins(stmt, filters)
+
+        conditions = self._build_filters(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        return stmt
+
+    async def get_total_number_of_appointments(
+        self, filters: Optional[dict] = None
+    ) -> int:
+        filters = filters or {}
+        stmt = self._apply_filters(
+            select(Appointment.id).join(Appointment.schedule_day), filters
+        )
 
-        return result.scalar_one()
+        return await self._get_total_count(
+            stmt, filters, approximate_table=Appointment.__tablename__
+        )
 
     async def get_by_id(self, id: int) -> Optional[AppointmentDomain]:
         result = await self._async_db_session.execute(
@@ -88,6 +201,34 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
 
         return [map_appointment_db_entity_to_domain(row) for row in db_rows]
 
+    async def get_occupied_times_by_day_id(
+        self, schedule_day_id: UUID, exclude_appointment_id: Optional[int] = None
+    ) -> List[time]:
+        query = (
+            select(Appointment.time)
+            .where(
+                Appointment.schedule_day_id == schedule_day_id,
+                Appointment.status != AppointmentStatusEnum.CANCELLED,
+            )
+            .order_by(Appointment.time)
+        )
+        if exclude_appointment_id is not None:
+            query = query.where(Appointment.id != exclude_appointment_id)
+
+        result = await self._async_db_session.execute(query)
+
+        return list(result.scalars().all())
+
+    async def lock_schedule_day(self, schedule_day_id: UUID) -> None:
+        await self._async_db_session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    BOOKING_ADVISORY_LOCK_NAMESPACE,
+                    func.hashtext(cast(schedule_day_id, String)),
+                )
+            )
+        )
+
     async def get_by_schedule_id(
         self, schedule_id: UUID, page: int = 1, limit: int = 30
     ) -> List[AppointmentDomain]:
@@ -113,18 +254,28 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         filters: dict,
         limit: int = 30,
         page: int = 1,
+        cursor: Optional[str] = None,
     ):
         stmt = (
             select(Appointment)
             .join(Appointment.schedule_day)
             .options(joinedload(Appointment.schedule_day))
-            .order_by(ScheduleDay.date, Appointment.time)
         )
-
-        conditions = self._build_filters(filters)
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-
+        stmt = self._apply_filters(stmt, filters)
+
+        if cursor is not None:
+            keyset_page = await self._get_keyset_page(
+                stmt,
+                sort_key=(ScheduleDay.date, Appointment.time, Appointment.id),
+                limit=limit,
+                cursor=cursor,
+            )
+            return KeysetPage(
+                [map_appointment_db_entity_to_domain(row) for row in keyset_page],
+                next_cursor=keyset_page.next_cursor,
+            )
+
+        stmt = stmt.order_by(ScheduleDay.date, Appointment.time, Appointment.id)
         stmt = stmt.limit(limit).offset((page - 1) * limit)
 
         result = await self._async_db_session.execute(stmt)
@@ -133,6 +284,8 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         return [map_appointment_db_entity_to_domain(row) for row in rows]
 
     async def add(self, appointment: AppointmentDomain) -> AppointmentDomain:
+        self._invalidate_total_count()
+
         db_entity = map_appointment_domain_to_db_entity(appointment)
 
         self._async_db_session.add(db_entity)
@@ -142,6 +295,8 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         return map_appointment_db_entity_to_domain(db_entity)
 
     async def update(self, appointment: AppointmentDomain) -> AppointmentDomain:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(Appointment).where(Appointment.id == appointment.id)
         )
@@ -174,7 +329,32 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
 
         return map_appointment_db_entity_to_domain(existing)
 
+    async def cancel_booked_by_day_ids(
+        self, schedule_day_ids: Iterable[UUID]
+    ) -> List[int]:
+        self._invalidate_total_count()
+
+        schedule_day_ids = list(schedule_day_ids)
+        if not schedule_day_ids:
+            return []
+
+        # One set-based UPDATE instead of SELECT + UPDATE per appointment
+        result = await self._async_db_session.execute(
+            update(Appointment)
+            .where(
+                Appointment.schedule_day_id == any_(schedule_day_ids),
+                Appointment.status == AppointmentStatusEnum.BOOKED,
+            )
+            .values(status=AppointmentStatusEnum.CANCELLED, cancelled_at=func.now())
+            .returning(Appointment.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        return list(result.scalars().all())
+
     async def delete_by_id(self, id: int) -> None:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(Appointment).where(Appointment.id == id)
         )
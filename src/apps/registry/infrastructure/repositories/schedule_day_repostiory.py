@@ -1,30 +1,47 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, any_, func, insert, not_, or_, select, tuple_
+from sqlalchemy.dialects.postgresql.json import JSONB
+from sqlalchemy.sql.expression import column
 
+from src.apps.registry.domain.enums import AppointmentStatusEnum
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     CreateScheduleDaySchema,
     UpdateScheduleDaySchema,
 )
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    DoctorFreeSlotSchema,
     ResponseScheduleDaySchema,
 )
-from src.apps.registry.infrastructure.db_models.models import ScheduleDay
+from src.apps.registry.infrastructure.db_models.models import (
+    Appointment,
+    Schedule,
+    ScheduleDay,
+)
 from src.apps.registry.interfaces.repository_interfaces import (
     ScheduleDayRepositoryInterface,
 )
 from src.apps.registry.mappers import map_schedule_day_db_entity_to_schema
+from src.apps.users.infrastructure.db_models.models import User
+from src.shared.helpers.cursor_pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+)
 from src.shared.infrastructure.base import BaseRepository
 
 
 class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
-    async def get_total_number_of_schedule_days(self) -> int:
-        query = select(func.count(ScheduleDay.id))
-        result = await self._async_db_session.execute(query)
+    async def get_total_number_of_schedule_days(
+        self, schedule_id: Optional[UUID] = None
+    ) -> int:
+        query = select(ScheduleDay.id)
+        if schedule_id is not None:
+            query = query.where(ScheduleDay.schedule_id == schedule_id)
 
-        return result.scalar_one()
+        return await self._get_total_count(query, {"schedule_id": schedule_id})
 
     async def get_by_id(self, id: UUID) -> Optional[ResponseScheduleDaySchema]:
         result = await self._async_db_session.execute(
@@ -36,6 +53,18 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
 
         return None
 
+    async def get_by_ids(self, ids: Iterable[UUID]) -> List[ResponseScheduleDaySchema]:
+        ids = list(ids)
+        if not ids:
+            return []
+
+        result = await self._async_db_session.execute(
+            select(ScheduleDay).where(ScheduleDay.id == any_(ids))
+        )
+        schedule_days = result.scalars().all()
+
+        return [map_schedule_day_db_entity_to_schema(sd) for sd in schedule_days]
+
     async def get_by_schedule_and_day_of_week(
         self, schedule_id: UUID, day_of_week: int
     ) -> Optional[ResponseScheduleDaySchema]:
@@ -80,9 +109,124 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
 
         return [map_schedule_day_db_entity_to_schema(sd) for sd in schedule_days]
 
+    @staticmethod
+    def _filter_by_doctor_specialization(value: str):
+        elements_source = func.jsonb_array_elements(User.specializations).table_valued(
+            column("value", JSONB), name="unnested_specs_alias"
+        )
+        element_name_as_text = elements_source.c.value.op("->>")("name")
+
+        return (
+            select(elements_source.c.value)
+            .select_from(elements_source)
+            .where(func.lower(func.trim(element_name_as_text)) == value.strip().lower())
+            .exists()
+        )
+
+    async def find_free_slots(
+        self,
+        date_from: date,
+        date_to: date,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+        doctor_id: Optional[UUID] = None,
+        doctor_specialization: Optional[str] = None,
+    ) -> KeysetPage:
+        # Slots of every active day are generated by 'generate_series' over the
+        # '[work start, work end)' window with the schedule's appointment interval,
+        # slots overlapping the break or any not cancelled appointment are dropped.
+        # So the whole search is one set-returning query ordered by slot start.
+        interval = func.make_interval(0, 0, 0, 0, 0, Schedule.appointment_interval)
+        slot_start = func.generate_series(
+            ScheduleDay.date.op("+")(ScheduleDay.work_start_time),
+            ScheduleDay.date.op("+")(ScheduleDay.work_end_time) - interval,
+            interval,
+        ).column_valued("slot_start")
+        slot_end = slot_start + interval
+
+        overlaps_break = and_(
+            slot_start < ScheduleDay.date.op("+")(ScheduleDay.break_end_time),
+            slot_end > ScheduleDay.date.op("+")(ScheduleDay.break_start_time),
+        )
+        appointment_start = ScheduleDay.date.op("+")(Appointment.time)
+        is_booked = (
+            select(Appointment.id)
+            .where(
+                Appointment.schedule_day_id == ScheduleDay.id,
+                Appointment.status != AppointmentStatusEnum.CANCELLED,
+                appointment_start < slot_end,
+                appointment_start + interval > slot_start,
+            )
+            .exists()
+        )
+
+        query = (
+            select(
+                Schedule.doctor_id,
+                Schedule.id,
+                ScheduleDay.id,
+                ScheduleDay.date,
+                slot_start,
+                slot_end,
+            )
+            .join(Schedule, ScheduleDay.schedule_id == Schedule.id)
+            .where(
+                ScheduleDay.is_active.is_(True),
+                Schedule.is_active.is_(True),
+                ScheduleDay.date >= date_from,
+                ScheduleDay.date <= date_to,
+                Schedule.appointment_interval > 0,
+                or_(
+                    ScheduleDay.break_start_time.is_(None),
+                    ScheduleDay.break_end_time.is_(None),
+                    not_(overlaps_break),
+                ),
+                not_(is_booked),
+            )
+        )
+        if doctor_id is not None:
+            query = query.where(Schedule.doctor_id == doctor_id)
+        if doctor_specialization:
+            query = query.join(User, Schedule.doctor_id == User.id).where(
+                self._filter_by_doctor_specialization(doctor_specialization)
+            )
+
+        sort_key = (slot_start, ScheduleDay.id)
+        if cursor:
+            query = query.where(
+                tuple_(*sort_key) > tuple_(*decode_cursor(cursor, len(sort_key)))
+            )
+        query = query.order_by(*sort_key).limit(limit + 1)
+
+        result = await self._async_db_session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_row = rows[-1]
+            next_cursor = encode_cursor((last_row[4], last_row[2]))
+
+        return KeysetPage(
+            (
+                DoctorFreeSlotSchema(
+                    doctor_id=row[0],
+                    schedule_id=row[1],
+                    schedule_day_id=row[2],
+                    date=row[3],
+                    start_time=row[4].time(),
+                    end_time=row[5].time(),
+                )
+                for row in rows
+            ),
+            next_cursor=next_cursor,
+        )
+
     async def add(
         self, create_day_schema: CreateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
+        self._invalidate_total_count()
+
         new_day = ScheduleDay(
             schedule_id=create_day_schema.schedule_id,
             day_of_week=create_day_schema.day_of_week,
@@ -98,9 +242,28 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
 
         return map_schedule_day_db_entity_to_schema(new_day)
 
+    async def bulk_add(
+        self, days: Iterable[CreateScheduleDaySchema | Dict[str, Any]]
+    ) -> List[ResponseScheduleDaySchema]:
+        self._invalidate_total_count()
+
+        rows = [day if isinstance(day, dict) else day.model_dump() for day in days]
+        if not rows:
+            return []
+
+        # One multi-row 'INSERT ... RETURNING' instead of INSERT + flush per day
+        result = await self._async_db_session.scalars(
+            insert(ScheduleDay).returning(ScheduleDay), rows
+        )
+        schedule_days = result.all()
+
+        return [map_schedule_day_db_entity_to_schema(sd) for sd in schedule_days]
+
     async def update(
         self, day_id: UUID, schema: UpdateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(ScheduleDay).where(ScheduleDay.id == day_id)
         )
@@ -120,6 +283,8 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
         return map_schedule_day_db_entity_to_schema(schedule_day)
 
     async def delete_by_id(self, id: UUID) -> None:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(ScheduleDay).where(ScheduleDay.id == id)
         )
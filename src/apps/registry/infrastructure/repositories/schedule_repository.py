@@ -1,7 +1,7 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Integer, and_, cast, func, or_, select
+from sqlalchemy import Integer, and_, any_, cast, func, or_, select
 from sqlalchemy.dialects.postgresql.json import JSONB
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import column
@@ -76,11 +76,13 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
 
         return query
 
-    async def get_total_number_of_schedules(self) -> int:
-        query = select(func.count(Schedule.id))
-        result = await self._async_db_session.execute(query)
+    async def get_total_number_of_schedules(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        filters = filters or {}
+        query = self._apply_filters_to_query(select(Schedule.id), filters)
 
-        return result.scalar_one()
+        return await self._get_total_count(query, filters)
 
     async def get_by_id(self, id: UUID) -> Optional[ScheduleDomain]:
         result = await self._async_db_session.execute(
@@ -92,6 +94,18 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
 
         return None
 
+    async def get_by_ids(self, ids: Iterable[UUID]) -> List[ScheduleDomain]:
+        ids = list(ids)
+        if not ids:
+            return []
+
+        result = await self._async_db_session.execute(
+            select(Schedule).where(Schedule.id == any_(ids))
+        )
+        schedules = result.scalars().all()
+
+        return [map_schedule_db_entity_to_domain(s) for s in schedules]
+
     async def get_schedule_by_day_id(self, day_id: UUID) -> Optional[ScheduleDomain]:
         query = select(Schedule).join(ScheduleDay).where(ScheduleDay.id == day_id)
 
@@ -124,6 +138,8 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
         return [map_schedule_db_entity_to_domain(s) for s in schedules]
 
     async def add(self, schedule_domain: ScheduleDomain) -> ScheduleDomain:
+        self._invalidate_total_count()
+
         new_schedule = map_schedule_domain_to_db_entity(schedule_domain)
 
         self._async_db_session.add(new_schedule)
@@ -133,6 +149,8 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
         return map_schedule_db_entity_to_domain(new_schedule)
 
     async def update(self, schedule_domain: ScheduleDomain) -> ScheduleDomain:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(Schedule).where(Schedule.id == schedule_domain.id)
         )
@@ -153,6 +171,8 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
         return map_schedule_db_entity_to_domain(existing)
 
     async def delete(self, id: UUID) -> None:
+        self._invalidate_total_count()
+
         result = await self._async_db_session.execute(
             select(Schedule).where(Schedule.id == id)
         )
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Any, Dict, List, Optional
+from datetime import date, time
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
 from src.apps.registry.domain.models.appointment import AppointmentDomain
@@ -10,17 +10,21 @@ from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas
     UpdateScheduleDaySchema,
 )
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    DoctorFreeSlotSchema,
     ResponseScheduleDaySchema,
 )
 
 
 class AppointmentRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_appointments(self) -> int:
+    async def get_total_number_of_appointments(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
-        Retrieve a number of ALL appointments from the Registry Service DB.
+        Retrieve a number of appointments matching the filters from the Registry Service DB.
 
-        :return: Number of ALL appointments from the Registry Service DB as INT
+        :param filters: The same filters that are passed to 'get_appointments'.
+        :return: Number of matching appointments from the Registry Service DB as INT
         """
         pass
 
@@ -34,6 +38,29 @@ class AppointmentRepositoryInterface(ABC):
     ) -> List[AppointmentDomain]:
         pass
 
+    @abstractmethod
+    async def get_occupied_times_by_day_id(
+        self, schedule_day_id: UUID, exclude_appointment_id: Optional[int] = None
+    ) -> List[time]:
+        """
+        Gets sorted start times of all not cancelled appointments of the schedule day.
+
+        :param schedule_day_id: Schedule day ID
+        :param exclude_appointment_id: Appointment to skip (e.g. the one being updated)
+        :return: List of appointment start times
+        """
+        pass
+
+    @abstractmethod
+    async def lock_schedule_day(self, schedule_day_id: UUID) -> None:
+        """
+        Takes a transaction-level advisory lock for booking appointments of the schedule day.
+        Waits if the lock is held by another transaction; released on commit/rollback.
+
+        :param schedule_day_id: Schedule day ID
+        """
+        pass
+
     @abstractmethod
     async def get_by_schedule_id(
         self, schedule_id: UUID, page: int = 1, limit: int = 30
@@ -47,15 +74,20 @@ class AppointmentRepositoryInterface(ABC):
         filters: Dict[str, Any],
         limit: int = 30,
         page: int = 1,
+        cursor: Optional[str] = None,
     ) -> List[AppointmentDomain]:
         """
         Returns a list of scheduled appointment records filtered by the provided params.
+        All filters (including patient- and doctor-related ones) are applied in SQL,
+        so the returned page always contains up to 'limit' matching records.
 
         :param filters: Dictionary of filter parameters.
         :param limit: Pagination limit per page.
         :param page: Pagination page.
+        :param cursor: Keyset pagination cursor. If not None, 'page' is ignored and
+        records are fetched after the cursor ordered by (date, time, id).
 
-        :return: List of 'AppointmentDomain' objects.
+        :return: List of 'AppointmentDomain' objects ('KeysetPage' in cursor mode).
         """
         pass
 
@@ -67,6 +99,19 @@ class AppointmentRepositoryInterface(ABC):
     async def update(self, appointment: AppointmentDomain) -> AppointmentDomain:
         pass
 
+    @abstractmethod
+    async def cancel_booked_by_day_ids(
+        self, schedule_day_ids: Iterable[UUID]
+    ) -> List[int]:
+        """
+        Cancels all BOOKED appointments of the given schedule days with a single
+        'UPDATE ... RETURNING' (status -> CANCELLED, 'cancelled_at' -> now()).
+
+        :param schedule_day_ids: IDs of schedule days whose appointments should be cancelled
+        :return: IDs of the cancelled appointments
+        """
+        pass
+
     @abstractmethod
     async def delete_by_id(self, id: int) -> None:
         pass
@@ -74,11 +119,14 @@ class AppointmentRepositoryInterface(ABC):
 
 class ScheduleDayRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_schedule_days(self) -> int:
+    async def get_total_number_of_schedule_days(
+        self, schedule_id: Optional[UUID] = None
+    ) -> int:
         """
-        Retrieve a number of ALL schedule days from the Registry Service DB.
+        Retrieve a number of schedule days (of the given schedule) from the Registry Service DB.
 
-        :return: Number of ALL schedule days from the Registry Service DB as INT
+        :param schedule_id: Schedule to count days of. If not provided - ALL days are counted.
+        :return: Number of schedule days from the Registry Service DB as INT
         """
         pass
 
@@ -86,6 +134,11 @@ class ScheduleDayRepositoryInterface(ABC):
     async def get_by_id(self, id: UUID) -> Optional[ResponseScheduleDaySchema]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ids: Iterable[UUID]) -> List[ResponseScheduleDaySchema]:
+        """Retrieves all schedule days with the given IDs in a single query. Missing IDs are skipped."""
+        pass
+
     @abstractmethod
     async def get_by_schedule_and_day_of_week(
         self, schedule_id: UUID, day_of_week: int
@@ -104,12 +157,48 @@ class ScheduleDayRepositoryInterface(ABC):
     ) -> List[ResponseScheduleDaySchema]:
         pass
 
+    @abstractmethod
+    async def find_free_slots(
+        self,
+        date_from: date,
+        date_to: date,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+        doctor_id: Optional[UUID] = None,
+        doctor_specialization: Optional[str] = None,
+    ) -> List[DoctorFreeSlotSchema]:
+        """
+        Finds free appointment slots of all active schedules with a single set-returning query.
+
+        :param date_from: Search free slots from this date
+        :param date_to: Search free slots up to this date (inclusive)
+        :param limit: Maximum number of slots to return
+        :param cursor: Cursor from the previous page; None for the first page
+        :param doctor_id: Search free slots of this doctor only
+        :param doctor_specialization: Search free slots of doctors with this specialization only
+        :return: 'KeysetPage' of free slots ordered by slot start time
+        """
+        pass
+
     @abstractmethod
     async def add(
         self, day_schema: CreateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
         pass
 
+    @abstractmethod
+    async def bulk_add(
+        self, days: Iterable[CreateScheduleDaySchema | Dict[str, Any]]
+    ) -> List[ResponseScheduleDaySchema]:
+        """
+        Inserts all the given schedule days with a single multi-row 'INSERT ... RETURNING'.
+
+        :param days: Schedule days to create: schemas or rows with the same fields
+        (e.g. produced by 'ScheduleDaysGenerator')
+        :return: Created schedule days (empty list if nothing was given)
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, day_id: UUID, schema: UpdateScheduleDaySchema
@@ -123,11 +212,14 @@ class ScheduleDayRepositoryInterface(ABC):
 
 class ScheduleRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_schedules(self) -> int:
+    async def get_total_number_of_schedules(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
-        Retrieve a number of ALL schedules from the Registry Service DB.
+        Retrieve a number of schedules matching the filters from the Registry Service DB.
 
-        :return: Amount of ALL schedules from the Registry Service DB as INT
+        :param filters: The same filters that are passed to 'get_schedules'.
+        :return: Amount of matching schedules from the Registry Service DB as INT
         """
         pass
 
@@ -135,6 +227,11 @@ class ScheduleRepositoryInterface(ABC):
     async def get_by_id(self, id: UUID) -> Optional[ScheduleDomain]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ids: Iterable[UUID]) -> List[ScheduleDomain]:
+        """Retrieves all schedules with the given IDs in a single query. Missing IDs are skipped."""
+        pass
+
     @abstractmethod
     async def get_schedule_by_day_id(self, day_id: UUID) -> Optional[ScheduleDomain]:
         pass
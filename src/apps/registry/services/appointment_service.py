@@ -16,6 +16,7 @@ from src.apps.registry.domain.exceptions import (
     ScheduleDayIsNotActiveError as ScheduleDayIsNotActiveErrorDomain,
 )
 from src.apps.registry.domain.models.appointment import AppointmentDomain
+from src.apps.registry.domain.models.day_slot_index import DaySlotIndex
 from src.apps.registry.domain.models.schedule import ScheduleDomain
 from src.apps.registry.exceptions import (
     AppointmentOverlappingError,
@@ -48,12 +49,15 @@ from src.apps.registry.mappers import (
     map_appointment_create_schema_to_domain,
     map_appointment_update_schema_to_domain,
 )
+from src.apps.registry.services.day_slot_index_cache import day_slot_index_cache
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
 from src.apps.users.services.user_service import UserService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import ApplicationError
+from src.shared.helpers.cursor_pagination import KeysetPage
+from src.shared.helpers.reference_validation import References, validate_references
 from src.shared.schemas.pagination_schemas import PaginationParams
 
 
@@ -110,16 +114,14 @@ class AppointmentService:
         ):
             raise InvalidAppointmentTimeError(
                 status_code=409,
-                detail=_(
+                detail=format_message(
                     "Selected time from %(start_time)s for %(appointment_interval)d-minute appointment "
-                    "is outside working hours (%(work_start_time)s–%(work_end_time)s)."
-                )
-                % {
-                    "start_time": requested_start_time,
-                    "appointment_interval": appointment_interval_minutes,
-                    "work_start_time": schedule_day.work_start_time,
-                    "work_end_time": schedule_day.work_end_time,
-                },
+                    "is outside working hours (%(work_start_time)s–%(work_end_time)s).",
+                    start_time=requested_start_time,
+                    appointment_interval=appointment_interval_minutes,
+                    work_start_time=schedule_day.work_start_time,
+                    work_end_time=schedule_day.work_end_time,
+                ),
             )
 
     @staticmethod
@@ -140,38 +142,14 @@ class AppointmentService:
 
     @staticmethod
     def _check_appointment_overlapping(
-        appointment_start_datetime: datetime,
-        appointment_end_datetime: datetime,
-        existing_appointments: List[AppointmentDomain],
-        schedule_day_date: date,
-        appointment_interval_minutes: int,
-        current_appointment_id: Optional[int] = None,
+        slot_index: DaySlotIndex, appointment_start_time: time
     ) -> None:
-        for existing_appointment in existing_appointments:
-            if (
-                current_appointment_id is not None
-                and existing_appointment.id == current_appointment_id
-            ):
-                continue
-
-            if existing_appointment.status == AppointmentStatusEnum.CANCELLED:
-                continue
-
-            existing_start = datetime.combine(
-                schedule_day_date, existing_appointment.time
-            )
-            existing_end = existing_start + timedelta(
-                minutes=appointment_interval_minutes
+        if slot_index.is_booked(appointment_start_time):
+            raise AppointmentOverlappingError(
+                status_code=409,
+                detail=_("The selected appointment slot is already booked."),
             )
 
-            if (appointment_start_datetime < existing_end) and (
-                appointment_end_datetime > existing_start
-            ):
-                raise AppointmentOverlappingError(
-                    status_code=409,
-                    detail=_("The selected appointment slot is already booked."),
-                )
-
     @staticmethod
     def _check_appointment_exists(
         appointment: Optional[AppointmentDomain], appointment_id: int
@@ -179,8 +157,10 @@ class AppointmentService:
         if not appointment:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Appointment with ID: %(ID)s not found.")
-                % {"ID": appointment_id},
+                detail=format_message(
+                    "Appointment with ID: %(ID)s not found.",
+                    ID=appointment_id,
+                ),
             )
         return appointment
 
@@ -191,7 +171,10 @@ class AppointmentService:
         if not schedule:
             raise ScheduleDayNotFoundError(
                 status_code=404,
-                detail=_("Schedule for day ID %(ID)s not found.") % {"ID": schedule_id},
+                detail=format_message(
+                    "Schedule for day ID %(ID)s not found.",
+                    ID=schedule_id,
+                ),
             )
         return schedule
 
@@ -202,8 +185,10 @@ class AppointmentService:
         if not schedule_day:
             raise ScheduleDayNotFoundError(
                 status_code=404,
-                detail=_("Schedule day with ID %(ID)s not found.")
-                % {"ID": schedule_day_id},
+                detail=format_message(
+                    "Schedule day with ID %(ID)s not found.",
+                    ID=schedule_day_id,
+                ),
             )
         return schedule_day
 
@@ -231,83 +216,50 @@ class AppointmentService:
             ) from err
 
     @staticmethod
-    async def _load_entities_by_ids(ids: set, load_function):
-        results = []
-        for entity_id in ids:
-            entity = await load_function(entity_id)
-            if entity is not None:
-                results.append(entity)
-        return {entity.id: entity for entity in results}
-
-    @staticmethod
-    def _appointment_passes_filters(
-        patient: Optional[PatientDomain],
-        schedule_day,
-        schedule,
-        doctors_map: dict[int, UserDomain],
-        filter_params: AppointmentFilterParams,
-    ) -> bool:
-        if filter_params.patient_iin_filter:
-            if not patient or patient.iin != filter_params.patient_iin_filter:
-                return False
-
-        if schedule_day is None or schedule is None:
-            return False
-
-        if (
-            filter_params.doctor_id_filter
-            and schedule.doctor_id != filter_params.doctor_id_filter
-        ):
-            return False
-
-        if filter_params.patient_full_name_filter:
-            if not patient:
-                return False
-
-            full_name = (
-                f"{patient.last_name} {patient.first_name} {patient.middle_name or ''}"
-                f" {patient.maiden_name or ''}"
-            ).lower()
-            if filter_params.patient_full_name_filter.lower() not in full_name:
-                return False
-
-        if filter_params.doctor_specialization_filter:
-            doctor = doctors_map.get(schedule.doctor_id)
-            if not doctor:
-                return False
-
-            specialization_filter = (
-                filter_params.doctor_specialization_filter.strip().lower()
+    def _update_slot_index_cache(
+        previous_slot: Tuple[UUID, time, AppointmentStatusEnum],
+        updated_appointment: AppointmentDomain,
+    ) -> None:
+        """Moves the appointment within cached slot indexes after its day, time or status changed."""
+        previous_day_id, previous_time, previous_status = previous_slot
+        if previous_status != AppointmentStatusEnum.CANCELLED:
+            day_slot_index_cache.release(previous_day_id, previous_time)
+        if updated_appointment.status != AppointmentStatusEnum.CANCELLED:
+            day_slot_index_cache.occupy(
+                updated_appointment.schedule_day_id, updated_appointment.time
             )
-            if not any(
-                (specialization.get("name") or "").strip().lower() == specialization_filter
-                for specialization in (doctor.specializations or [])
-            ):
-                return False
-
-        if filter_params.attached_area_number_filter:
-            if not patient or not patient.attachment_data:
-                return False
 
-            area_number = patient.attachment_data.get("area_number")
-            if area_number != filter_params.attached_area_number_filter:
-                return False
+    @staticmethod
+    async def _load_entities_by_ids(ids: set, bulk_load_function) -> dict:
+        """
+        Resolves a set of IDs to a '{id: entity}' map with a single call to
+        'bulk_load_function' (one 'WHERE id = ANY(...)' query per entity type).
+        """
+        if not ids:
+            return {}
 
-        return True
+        entities = await bulk_load_function(ids)
+        return {entity.id: entity for entity in entities}
 
     async def _validate_financing_sources(
-        self, financing_sources_ids: List[int]
-    ) -> None:
-        for fs_id in financing_sources_ids:
-            await self._financing_sources_catalog_service.get_by_id(fs_id)
-
-    async def _validate_additional_services(
-        self, additional_services: List[AdditionalServiceSchema]
+        self,
+        financing_sources_ids: Optional[List[int]],
+        additional_services: Optional[List[AdditionalServiceSchema]],
     ) -> None:
-        for service in additional_services:
-            await self._financing_sources_catalog_service.get_by_id(
-                service.financing_source_id
+        """
+        Checks the financing sources of the appointment and of its additional services
+        with one query; all missing IDs are reported at once.
+        """
+        ids = list(financing_sources_ids or [])
+        ids.extend(service.financing_source_id for service in additional_services or [])
+
+        await validate_references(
+            References(
+                ids,
+                self._financing_sources_catalog_service.get_existing_ids,
+                "Financing sources with IDs: %(IDS)s were not found.",
             )
+        )
 
     @staticmethod
     def _check_doctor_support(
@@ -321,34 +273,29 @@ class AppointmentService:
                 detail=_(error_message),
             )
 
-    async def _validate_time_change(
+    def _validate_time_change(
         self,
-        schedule_day_id: UUID,
         schedule_day: ResponseScheduleDaySchema,
         schedule: ScheduleDomain,
         new_time: time,
-        current_appointment_id: Optional[int] = None,
     ) -> None:
         """
         Validate the proposed change in appointment time and schedule day.
 
         This method ensures that the schedule is active, the new appointment time
-        fits within the working hours of the schedule day, does not overlap with
-        the scheduled break, and does not conflict with existing appointments.
+        fits within the working hours of the schedule day and does not overlap with
+        the scheduled break. Conflicts with existing appointments are checked later,
+        under the booking lock, by '_lock_and_check_slot_is_free'.
 
         Args:
-            schedule_day_id (UUID): The identifier of the schedule day.
             schedule_day (ResponseScheduleDaySchema): The schedule day details.
             schedule (ScheduleDomain): The schedule information including interval and status.
             new_time (time): The new appointment start time proposed.
-            current_appointment_id (Optional[int], optional): The ID of the appointment
-                being updated, to exclude it from overlap checks. Defaults to None.
 
         Raises:
             ScheduleIsNotActiveError: If the associated schedule is inactive.
             InvalidAppointmentTimeError: If the new time is outside working hours or
                 overlaps with the break time.
-            AppointmentOverlappingError: If the new time overlaps with other existing appointments.
         """
         if not schedule.is_active:
             raise ScheduleIsNotActiveError(
@@ -385,19 +332,36 @@ class AppointmentService:
                     detail=_("The appointment cannot overlap with the break time."),
                 )
 
-        existing_appointments = (
-            await self._appointment_repository.get_appointments_by_day_id(
-                schedule_day_id
+    async def _lock_and_check_slot_is_free(
+        self,
+        schedule_day_id: UUID,
+        schedule_day: ResponseScheduleDaySchema,
+        schedule: ScheduleDomain,
+        new_time: time,
+        current_appointment_id: Optional[int] = None,
+    ) -> None:
+        """
+        Takes the booking lock of the schedule day and checks that the slot is still free.
+
+        Must be called inside 'self._uow' right before the appointment is written. The lock
+        is held until the UoW commits or rolls back, so concurrent bookings of the same day
+        are serialized between this check and the write and can't book the same slot twice.
+
+        Raises:
+            AppointmentOverlappingError: If the new time overlaps with other existing appointments.
+        """
+        await self._uow.appointment_repository.lock_schedule_day(schedule_day_id)
+
+        # Validation always uses the actual DB state rather than the cached index
+        occupied_times = (
+            await self._uow.appointment_repository.get_occupied_times_by_day_id(
+                schedule_day_id, exclude_appointment_id=current_appointment_id
             )
         )
-        self._check_appointment_overlapping(
-            appointment_start_datetime,
-            appointment_end_datetime,
-            existing_appointments,
-            schedule_day.date,
-            appointment_interval_minutes,
-            current_appointment_id=current_appointment_id,
+        slot_index = DaySlotIndex.from_schedule_day(
+            schedule_day, schedule.appointment_interval, occupied_times
         )
+        self._check_appointment_overlapping(slot_index, new_time)
 
     async def _validate_patient_and_support(
         self,
@@ -535,14 +499,17 @@ class AppointmentService:
             filters=filters_dict,
             limit=pagination_params.limit,
             page=pagination_params.page,
+            cursor=pagination_params.cursor,
         )
 
         total_amount_of_records = (
-            await self._appointment_repository.get_total_number_of_appointments()
+            await self._appointment_repository.get_total_number_of_appointments(
+                filters_dict
+            )
         )
 
         if not appointments:
-            return [], total_amount_of_records
+            return appointments, total_amount_of_records
 
         patient_ids = {
             appointment.patient_id
@@ -552,17 +519,17 @@ class AppointmentService:
         schedule_day_ids = {appointment.schedule_day_id for appointment in appointments}
 
         patients_map = await self._load_entities_by_ids(
-            patient_ids, self._patients_service.get_by_id
+            patient_ids, self._patients_service.get_by_ids
         )
         schedule_days_map = await self._load_entities_by_ids(
-            schedule_day_ids, self._schedule_day_repository.get_by_id
+            schedule_day_ids, self._schedule_day_repository.get_by_ids
         )
 
         schedule_ids = {
             schedule_day.schedule_id for schedule_day in schedule_days_map.values()
         }
         schedules_map = await self._load_entities_by_ids(
-            schedule_ids, self._schedule_repository.get_by_id
+            schedule_ids, self._schedule_repository.get_by_ids
         )
 
         doctor_ids = {
@@ -571,18 +538,16 @@ class AppointmentService:
             if schedule.doctor_id
         }
         doctors_map = await self._load_entities_by_ids(
-            doctor_ids, self._user_repository.get_by_id
+            doctor_ids, self._user_repository.get_by_ids
         )
 
-        filtered_results = []
+        results = []
         for appointment in appointments:
             patient = patients_map.get(appointment.patient_id)
             schedule_day = schedule_days_map.get(appointment.schedule_day_id)
             schedule = schedule_day and schedules_map.get(schedule_day.schedule_id)
 
-            if not self._appointment_passes_filters(
-                patient, schedule_day, schedule, doctors_map, filter_params
-            ):
+            if schedule_day is None or schedule is None:
                 continue
 
             end_datetime = self.__add_interval(
@@ -592,11 +557,12 @@ class AppointmentService:
 
             doctor = schedule and doctors_map.get(schedule.doctor_id)
 
-            filtered_results.append(
-                (appointment, patient, doctor, end_time, schedule_day.date)
-            )
+            results.append((appointment, patient, doctor, end_time, schedule_day.date))
+
+        if isinstance(appointments, KeysetPage):
+            results = KeysetPage(results, next_cursor=appointments.next_cursor)
 
-        return filtered_results, total_amount_of_records
+        return results, total_amount_of_records
 
     async def create_appointment(
         self, schedule_day_id: UUID, schema: CreateAppointmentSchema
@@ -638,22 +604,21 @@ class AppointmentService:
                 "The specialist does not support the referral origin type.",
             )
 
-        # Check that all provided financing sources IDs exist
-        if schema.financing_sources_ids:
-            await self._validate_financing_sources(schema.financing_sources_ids)
-
-        # Check that all provided financing sources IDs INSIDE additional_services exist
-        if schema.additional_services:
-            await self._validate_additional_services(schema.additional_services)
+        # Check that all provided financing sources IDs (also INSIDE additional_services) exist
+        await self._validate_financing_sources(
+            schema.financing_sources_ids, schema.additional_services
+        )
 
         if not schedule_day.is_active:
             raise ScheduleIsNotActiveError(
                 status_code=409,
-                detail=_("Schedule day %(id)s is inactive.") % {"id": schedule_day_id},
+                detail=format_message(
+                    "Schedule day %(id)s is inactive.",
+                    id=schedule_day_id,
+                ),
             )
 
-        await self._validate_time_change(
-            schedule_day_id=schedule_day_id,
+        self._validate_time_change(
             schedule_day=schedule_day,
             schedule=schedule,
             new_time=schema.time,
@@ -665,10 +630,19 @@ class AppointmentService:
         self.__validate_appointment_status(appointment)
 
         async with self._uow:
+            await self._lock_and_check_slot_is_free(
+                schedule_day_id=schedule_day_id,
+                schedule_day=schedule_day,
+                schedule=schedule,
+                new_time=appointment.time,
+            )
             created_appointment = await self._uow.appointment_repository.add(
                 appointment
             )
 
+        if created_appointment.status != AppointmentStatusEnum.CANCELLED:
+            day_slot_index_cache.occupy(schedule_day_id, created_appointment.time)
+
         patient = (
             await self._patients_service.get_by_id(schema.patient_id)
             if schema.patient_id
@@ -730,13 +704,16 @@ class AppointmentService:
                 "The specialist does not support the referral origin type.",
             )
 
-        # Check that all provided financing sources IDs exist
-        if schema.financing_sources_ids is not None:
-            await self._validate_financing_sources(schema.financing_sources_ids)
+        # Check that all provided financing sources IDs (also INSIDE additional_services) exist
+        await self._validate_financing_sources(
+            schema.financing_sources_ids, schema.additional_services
+        )
 
-        # Check that all provided financing sources IDs INSIDE additional_services exist
-        if schema.additional_services is not None:
-            await self._validate_additional_services(schema.additional_services)
+        previous_slot = (
+            appointment.schedule_day_id,
+            appointment.time,
+            appointment.status,
+        )
 
         day_changed = bool(
             schema.schedule_day_id
@@ -746,12 +723,10 @@ class AppointmentService:
 
         if day_changed or time_changed:
             new_appointment_time = schema.time or appointment.time
-            await self._validate_time_change(
-                schedule_day_id=schedule_day_id,
+            self._validate_time_change(
                 schedule_day=schedule_day,
                 schedule=schedule,
                 new_time=new_appointment_time,
-                current_appointment_id=appointment.id,
             )
 
             appointment.schedule_day_id = schedule_day_id
@@ -774,11 +749,28 @@ class AppointmentService:
                 appointment, new_status, old_status, schedule, schedule_day
             )
 
+        # Moving the appointment or restoring a cancelled one takes a slot
+        takes_slot = appointment.status != AppointmentStatusEnum.CANCELLED and (
+            day_changed
+            or time_changed
+            or old_status == AppointmentStatusEnum.CANCELLED
+        )
+
         async with self._uow:
+            if takes_slot:
+                await self._lock_and_check_slot_is_free(
+                    schedule_day_id=schedule_day_id,
+                    schedule_day=schedule_day,
+                    schedule=schedule,
+                    new_time=appointment.time,
+                    current_appointment_id=appointment.id,
+                )
             updated_appointment = await self._uow.appointment_repository.update(
                 appointment
             )
 
+        self._update_slot_index_cache(previous_slot, updated_appointment)
+
         patient = (
             await self._patients_service.get_by_id(updated_appointment.patient_id)
             if updated_appointment.patient_id
@@ -801,3 +793,6 @@ class AppointmentService:
             appointment = self._check_appointment_exists(appointment, appointment_id)
 
             await self._uow.appointment_repository.delete_by_id(appointment.id)
+
+        if appointment.status != AppointmentStatusEnum.CANCELLED:
+            day_slot_index_cache.release(appointment.schedule_day_id, appointment.time)
@@ -0,0 +1,108 @@
+import time as time_module
+from collections import OrderedDict
+from datetime import time
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+from src.apps.registry.domain.models.day_slot_index import DaySlotIndex
+from src.core.settings import project_settings
+
+
+class DaySlotIndexCache:
+    """
+    Process-wide bounded TTL cache of 'DaySlotIndex' objects by schedule day ID.
+
+    Cached indexes are kept current by the services on appointment create, update,
+    cancel and delete, and are dropped whenever the day or its schedule changes.
+    The TTL bounds staleness caused by writes made by other processes.
+
+    An index built from appointments read before a concurrent 'occupy', 'release' or
+    'invalidate' of its day would miss that change, so 'set' only stores it if the day
+    hasn't changed since 'current_version()' was taken (before the read).
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: "OrderedDict[UUID, Tuple[float, DaySlotIndex]]" = OrderedDict()
+        # Version of the latest change, per recently changed day
+        self._version = 0
+        self._changed_at: "OrderedDict[UUID, int]" = OrderedDict()
+        # Days forgotten by '_changed_at' are treated as changed at this version
+        self._forgotten_version = 0
+
+    def current_version(self) -> int:
+        return self._version
+
+    def _changed(self, schedule_day_ids: Optional[Iterable[UUID]] = None) -> None:
+        self._version += 1
+        if schedule_day_ids is None:
+            self._changed_at.clear()
+            self._forgotten_version = self._version
+            return
+
+        for schedule_day_id in schedule_day_ids:
+            self._changed_at[schedule_day_id] = self._version
+            self._changed_at.move_to_end(schedule_day_id)
+        while len(self._changed_at) > self._max_size:
+            _, version = self._changed_at.popitem(last=False)
+            self._forgotten_version = max(self._forgotten_version, version)
+
+    def get(self, schedule_day_id: UUID) -> Optional[DaySlotIndex]:
+        entry = self._entries.get(schedule_day_id)
+        if entry is None:
+            return None
+
+        expires_at, slot_index = entry
+        if expires_at < time_module.monotonic():
+            self._entries.pop(schedule_day_id, None)
+            return None
+
+        return slot_index
+
+    def set(self, schedule_day_id: UUID, slot_index: DaySlotIndex, version: int) -> None:
+        """
+        :param version: 'current_version()' taken before reading the day's appointments.
+        """
+        if self._ttl_seconds <= 0:
+            return
+        changed_at = self._changed_at.get(schedule_day_id, self._forgotten_version)
+        if changed_at > version:
+            return
+
+        self._entries[schedule_day_id] = (
+            time_module.monotonic() + self._ttl_seconds,
+            slot_index,
+        )
+        self._entries.move_to_end(schedule_day_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def occupy(self, schedule_day_id: UUID, start_time: time) -> None:
+        self._changed([schedule_day_id])
+        slot_index = self.get(schedule_day_id)
+        if slot_index is not None:
+            slot_index.occupy(start_time)
+
+    def release(self, schedule_day_id: UUID, start_time: time) -> None:
+        self._changed([schedule_day_id])
+        slot_index = self.get(schedule_day_id)
+        if slot_index is not None:
+            slot_index.release(start_time)
+
+    def invalidate(self, schedule_day_ids: Optional[Iterable[UUID]] = None) -> None:
+        if schedule_day_ids is None:
+            self._changed()
+            self._entries.clear()
+            return
+
+        schedule_day_ids = list(schedule_day_ids)
+        self._changed(schedule_day_ids)
+        for schedule_day_id in schedule_day_ids:
+            self._entries.pop(schedule_day_id, None)
+
+
+day_slot_index_cache = DaySlotIndexCache(
+    ttl_seconds=project_settings.SLOT_INDEX_CACHE_TTL_SECONDS,
+    max_size=project_settings.SLOT_INDEX_CACHE_MAX_SIZE,
+)
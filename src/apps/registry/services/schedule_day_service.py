@@ -1,10 +1,11 @@
-from datetime import date, datetime, timedelta
-from typing import List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.apps.registry.domain.enums import AppointmentStatusEnum
+from src.apps.registry.domain.models.day_slot_index import DaySlotIndex
 from src.apps.registry.domain.models.schedule import ScheduleDomain
-from src.apps.registry.exceptions import NoInstanceFoundError
+from src.apps.registry.exceptions import InvalidSearchPeriodError, NoInstanceFoundError
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     UpdateScheduleDaySchema,
 )
@@ -16,8 +17,11 @@ from src.apps.registry.interfaces.repository_interfaces import (
     ScheduleDayRepositoryInterface,
 )
 from src.apps.registry.interfaces.uow_interface import UnitOfWorkInterface
-from src.core.i18n import _
+from src.apps.registry.services.day_slot_index_cache import day_slot_index_cache
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
+from src.core.settings import project_settings
+from src.shared.helpers.cursor_pagination import KeysetPage
 
 
 class ScheduleDayService:
@@ -40,7 +44,7 @@ class ScheduleDayService:
             if schedule_day is None:
                 raise NoInstanceFoundError(
                     status_code=404,
-                    detail=_("Day with ID: %(ID)s not found.") % {"ID": id},
+                    detail=format_message("Day with ID: %(ID)s not found.", ID=id),
                 )
 
             return schedule_day
@@ -54,11 +58,88 @@ class ScheduleDayService:
             )
 
             total_amount_of_records: int = (
-                await self._uow.schedule_day_repository.get_total_number_of_schedule_days()
+                await self._uow.schedule_day_repository.get_total_number_of_schedule_days(
+                    schedule_id
+                )
             )
 
             return days, total_amount_of_records
 
+    async def get_free_slots(
+        self, day_id: UUID
+    ) -> Tuple[ResponseScheduleDaySchema, List[Tuple[time, time]]]:
+        """
+        Lists free appointment slots of one day using its (cached) slot availability index.
+
+        :return: Schedule day and its free slots as (start time, end time) pairs.
+        """
+        day = await self._repository.get_by_id(day_id)
+        if not day:
+            raise NoInstanceFoundError(
+                status_code=404,
+                detail=format_message("Day with ID: %(ID)s not found.", ID=day_id),
+            )
+        if not day.is_active:
+            return day, []
+
+        slot_index = day_slot_index_cache.get(day_id)
+        if slot_index is None:
+            # Taken before the read: a booking committed meanwhile must not be cached as free
+            version = day_slot_index_cache.current_version()
+            schedule: Optional[ScheduleDomain] = (
+                await self._uow.schedule_repository.get_by_id(day.schedule_id)
+            )
+            if not schedule or not schedule.is_active:
+                return day, []
+
+            occupied_times = (
+                await self._appointment_repository.get_occupied_times_by_day_id(day.id)
+            )
+            slot_index = DaySlotIndex.from_schedule_day(
+                day, schedule.appointment_interval, occupied_times
+            )
+            day_slot_index_cache.set(day_id, slot_index, version)
+
+        return day, slot_index.free_slots()
+
+    async def search_free_slots(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> KeysetPage:
+        """
+        Searches free appointment slots across all active schedules in a date range.
+
+        :param filters: 'FreeSlotsFilterParams' as a dict
+        :return: 'KeysetPage' of 'DoctorFreeSlotSchema' ordered by slot start time.
+        """
+        if filters["date_from"] > filters["date_to"]:
+            raise InvalidSearchPeriodError(
+                status_code=400,
+                detail=_("Search start date must not be later than search end date."),
+            )
+
+        max_period_days = project_settings.FREE_SLOTS_SEARCH_MAX_PERIOD_DAYS
+        if (filters["date_to"] - filters["date_from"]).days + 1 > max_period_days:
+            raise InvalidSearchPeriodError(
+                status_code=400,
+                detail=format_message(
+                    "Search period exceeds the maximum allowed period of: %(MAX_VALUE)s days.",
+                    MAX_VALUE=max_period_days,
+                ),
+            )
+
+        async with self._uow:
+            return await self._uow.schedule_day_repository.find_free_slots(
+                date_from=filters["date_from"],
+                date_to=filters["date_to"],
+                limit=limit,
+                cursor=cursor,
+                doctor_id=filters.get("doctor_id_filter"),
+                doctor_specialization=filters.get("doctor_specialization_filter"),
+            )
+
     async def update(
         self,
         day_id: UUID,
@@ -83,8 +164,10 @@ class ScheduleDayService:
         if not schedule:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Schedule with ID: %(ID)s not found.")
-                % {"ID": day.schedule_id},
+                detail=format_message(
+                    "Schedule with ID: %(ID)s not found.",
+                    ID=day.schedule_id,
+                ),
             )
         appointment_interval = schedule.appointment_interval
 
@@ -168,10 +251,10 @@ class ScheduleDayService:
 
         # If deactivation, we cancel all booked appointments
         if is_deactivating and booked_appointments:
-            for booked_appointment in booked_appointments:
-                async with self._uow:
-                    booked_appointment.cancel()
-                    await self._uow.appointment_repository.update(booked_appointment)
+            async with self._uow:
+                await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                    [day.id]
+                )
 
         update_schema = UpdateScheduleDaySchema(
             is_active=(
@@ -191,7 +274,9 @@ class ScheduleDayService:
                 schema=update_schema,
             )
 
-            return updated_day
+        day_slot_index_cache.invalidate([day_id])
+
+        return updated_day
 
     async def delete(self, day_id: UUID) -> None:
         """
@@ -202,25 +287,12 @@ class ScheduleDayService:
         if not day:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Day with ID: %(ID)s not found.") % {"ID": day_id},
+                detail=format_message("Day with ID: %(ID)s not found.", ID=day_id),
             )
 
-        # Get day's appointments
-        appointments = await self._appointment_repository.get_appointments_by_day_id(
-            schedule_day_id=day.id
-        )
-        booked_appointments = [
-            appointment
-            for appointment in appointments
-            if appointment.status == AppointmentStatusEnum.BOOKED
-        ]
-
-        if booked_appointments:
-            for booked_appointment in booked_appointments:
-                # Cancel the appointment (appointment -> 'Cancel list')
-                async with self._uow:
-                    booked_appointment.cancel()
-                    await self._uow.appointment_repository.update(booked_appointment)
-
         async with self._uow:
+            # Cancel booked appointments (appointment -> 'Cancel list')
+            await self._uow.appointment_repository.cancel_booked_by_day_ids([day.id])
             await self._uow.schedule_day_repository.delete_by_id(day_id)
+
+        day_slot_index_cache.invalidate([day_id])
@@ -0,0 +1,178 @@
+from datetime import date, datetime, time, timedelta
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+from uuid import UUID
+
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    CreateScheduleDaySchema,
+)
+
+# (is_active, work_start_time, work_end_time, break_start_time, break_end_time)
+DayTimes = Tuple[bool, Optional[time], Optional[time], Optional[time], Optional[time]]
+
+DEFAULT_DAY_TIMES: DayTimes = (
+    True,
+    time.fromisoformat("08:00:00"),
+    time.fromisoformat("17:00:00"),
+    time.fromisoformat("13:00:00"),
+    time.fromisoformat("14:00:00"),
+)
+
+
+def _to_time(val: Any) -> Optional[time]:
+    if isinstance(val, time) or val is None:
+        return val
+    if isinstance(val, str):
+        return time.fromisoformat(val)
+
+    raise ValueError(f"Unexpected time format: {val!r}")
+
+
+def _normalize_day_times(
+    is_active: bool,
+    work_start: Any,
+    work_end: Any,
+    break_start: Any,
+    break_end: Any,
+) -> DayTimes:
+    work_start, work_end = _to_time(work_start), _to_time(work_end)
+    break_start, break_end = _to_time(break_start), _to_time(break_end)
+
+    # If the break "intersects" with the working day, we remove it
+    if break_start and break_end and work_start and work_end:
+        if break_start < work_start or break_end > work_end:
+            break_start = None
+            break_end = None
+
+    return is_active, work_start, work_end, break_start, break_end
+
+
+class ScheduleDaysGenerator:
+    """
+    Generates schedule days from a week template and 'REDUCED_DAYS' platform rule overrides.
+
+    The template and the overrides are normalized once on init, so generating a day
+    is just a dict lookup. Days are emitted as plain rows ready for
+    'ScheduleDayRepositoryInterface.bulk_add', and every distinct set of day times is
+    validated with 'CreateScheduleDaySchema' only once instead of once per day.
+    """
+
+    def __init__(
+        self,
+        week_days_template: Iterable[Any],
+        reduced_days: Optional[List[dict]] = None,
+    ):
+        """
+        :param week_days_template: Objects with 'day_of_week' and work/break time attributes
+        (e.g. 'ScheduleDayTemplateSchema' or existing schedule days). The last one wins per day of week.
+        :param reduced_days: Rules for 'reduced' days (from platform rules)
+        """
+        raw_by_day_of_week: Dict[int, DayTimes] = {
+            tpl.day_of_week: (
+                tpl.is_active,
+                tpl.work_start_time,
+                tpl.work_end_time,
+                tpl.break_start_time,
+                tpl.break_end_time,
+            )
+            for tpl in week_days_template
+        }
+        self._times_by_day_of_week: Dict[int, DayTimes] = {
+            day_of_week: _normalize_day_times(
+                *raw_by_day_of_week.get(day_of_week, DEFAULT_DAY_TIMES)
+            )
+            for day_of_week in range(1, 8)
+        }
+
+        self._times_by_date: Dict[date, DayTimes] = {}
+        for entry in reduced_days or []:
+            day_date = entry["date"]
+            if isinstance(day_date, str):
+                day_date = datetime.fromisoformat(day_date).date()
+
+            if not entry.get("is_active", True):
+                # The day is completely disabled
+                self._times_by_date[day_date] = _normalize_day_times(
+                    False, *DEFAULT_DAY_TIMES[1:]
+                )
+                continue
+
+            # Substitute redefined times or take from template/default
+            base = raw_by_day_of_week.get(day_date.isoweekday(), DEFAULT_DAY_TIMES)
+            self._times_by_date[day_date] = _normalize_day_times(
+                True,
+                entry.get("work_start_time") or base[1],
+                entry.get("work_end_time") or base[2],
+                entry.get("break_start_time") or base[3],
+                entry.get("break_end_time") or base[4],
+            )
+
+        self._validated_times: Set[DayTimes] = set()
+
+    def _validate(
+        self, schedule_id: UUID, day_date: date, day_of_week: int, day_times: DayTimes
+    ) -> None:
+        is_active, work_start, work_end, break_start, break_end = day_times
+        CreateScheduleDaySchema(
+            schedule_id=schedule_id,
+            date=day_date,
+            day_of_week=day_of_week,
+            is_active=is_active,
+            work_start_time=work_start,
+            work_end_time=work_end,
+            break_start_time=break_start,
+            break_end_time=break_end,
+        )
+        self._validated_times.add(day_times)
+
+    def generate(
+        self,
+        schedule_id: UUID,
+        period_start: date,
+        period_end: date,
+        skip_dates: AbstractSet[date] = frozenset(),
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields schedule day rows for every date in '[period_start, period_end]'.
+
+        :param schedule_id: Schedule UUID (same for all days)
+        :param period_start: Period start date
+        :param period_end: Period end date
+        :param skip_dates: Dates that must not be generated (e.g. already existing days)
+        :return: Iterator of rows with 'CreateScheduleDaySchema' fields
+        :raises pydantic.ValidationError: If the resulting day times are invalid
+        """
+        one_day = timedelta(days=1)
+        current_date = period_start
+
+        while current_date <= period_end:
+            if current_date not in skip_dates:
+                day_of_week = current_date.isoweekday()
+                day_times = self._times_by_date.get(current_date)
+                if day_times is None:
+                    day_times = self._times_by_day_of_week[day_of_week]
+
+                if day_times not in self._validated_times:
+                    self._validate(schedule_id, current_date, day_of_week, day_times)
+
+                yield {
+                    "schedule_id": schedule_id,
+                    "date": current_date,
+                    "day_of_week": day_of_week,
+                    "is_active": day_times[0],
+                    "work_start_time": day_times[1],
+                    "work_end_time": day_times[2],
+                    "break_start_time": day_times[3],
+                    "break_end_time": day_times[4],
+                }
+
+            current_date += one_day
@@ -1,5 +1,4 @@
-from datetime import date, datetime, time, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules_schemas import (
@@ -8,8 +7,6 @@ from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules
 from src.apps.platform_rules.interfaces.platform_rules_repository_interface import (
     PlatformRulesRepositoryInterface,
 )
-from src.apps.registry.domain.enums import AppointmentStatusEnum
-from src.apps.registry.domain.models.appointment import AppointmentDomain
 from src.apps.registry.domain.models.schedule import ScheduleDomain
 from src.apps.registry.exceptions import (
     NoInstanceFoundError,
@@ -21,10 +18,6 @@ from src.apps.registry.exceptions import (
 from src.apps.registry.infrastructure.api.schemas.requests.filters.schedule_filter_params import (
     ScheduleFilterParams,
 )
-from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
-    CreateScheduleDaySchema,
-    ScheduleDayTemplateSchema,
-)
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_schemas import (
     CreateScheduleSchema,
     UpdateScheduleSchema,
@@ -35,10 +28,12 @@ from src.apps.registry.interfaces.repository_interfaces import (
     ScheduleRepositoryInterface,
 )
 from src.apps.registry.interfaces.uow_interface import UnitOfWorkInterface
+from src.apps.registry.services.day_slot_index_cache import day_slot_index_cache
 from src.apps.registry.services.schedule_day_service import ScheduleDayService
+from src.apps.registry.services.schedule_days_generator import ScheduleDaysGenerator
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.services.user_service import UserService
-from src.core.i18n import _
+from src.core.i18n import _, format_message
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
 from src.shared.exceptions import ApplicationError
@@ -66,128 +61,6 @@ class ScheduleService:
         self._user_service = user_service
         self._platform_rules_repository = platform_rules_repository
 
-    @staticmethod
-    def _to_time(val):
-        if isinstance(val, time) or val is None:
-            return val
-        if isinstance(val, str):
-            return time.fromisoformat(val)
-
-        raise ValueError(f"Unexpected time format: {val!r}")
-
-    @staticmethod
-    def _generate_days_for_schedule(
-        schedule_id: UUID,
-        period_start: date,
-        period_end: date,
-        week_days_template: List[ScheduleDayTemplateSchema],
-        reduced_days: Optional[List[dict]] = None,
-    ) -> List[CreateScheduleDaySchema]:
-        """
-        Generates a list of days for the schedule, applying week template and platform rules.
-
-        Args:
-            schedule_id (UUID): Schedule UUID (same for all days)
-            period_start (date): Period start date
-            period_end (date): Period end date
-            week_days_template (List[ScheduleDayTemplateSchema]): List of patterns for each day of the week
-            reduced_days (Optional[List[dict]]): Rules for 'reduced' days (from platform rules)
-
-        Returns:
-            List[CreateScheduleDaySchema]: List of days
-        """
-        default_template = {
-            "is_active": True,
-            "work_start_time": time.fromisoformat("08:00:00"),
-            "work_end_time": time.fromisoformat("17:00:00"),
-            "break_start_time": time.fromisoformat("13:00:00"),
-            "break_end_time": time.fromisoformat("14:00:00"),
-        }
-        # Templates by days of the week
-        template_by_day: Dict[int, dict] = {
-            tpl.day_of_week: tpl.model_dump() for tpl in week_days_template
-        }
-
-        # Convert the reduced_days list to a dictionary by date
-        reduced_by_date: Dict[date, dict] = {}
-        if reduced_days:
-            for entry in reduced_days:
-                dt = entry["date"]
-                if isinstance(dt, str):
-                    dt = datetime.fromisoformat(dt).date()
-                reduced_by_date[dt] = entry
-
-        result: List[CreateScheduleDaySchema] = []
-        current_date = period_start
-
-        while current_date <= period_end:
-            dow = current_date.weekday() + 1
-            override_entry = reduced_by_date.get(current_date)
-
-            if override_entry:
-                # If the day is completely disabled
-                if not override_entry.get("is_active", True):
-                    template_data = default_template.copy()
-                    template_data["is_active"] = False
-                else:
-                    # Substitute redefined times or take from template/default
-                    base = template_by_day.get(dow, default_template)
-                    template_data = {
-                        "is_active": True,
-                        "work_start_time": override_entry.get("work_start_time")
-                        or base["work_start_time"],
-                        "work_end_time": override_entry.get("work_end_time")
-                        or base["work_end_time"],
-                        "break_start_time": override_entry.get("break_start_time")
-                        or base["break_start_time"],
-                        "break_end_time": override_entry.get("break_end_time")
-                        or base["break_end_time"],
-                    }
-            else:
-                # Common template
-                template_data = template_by_day.get(dow, default_template).copy()
-
-            # Convert string fields to time
-            work_start = ScheduleService._to_time(template_data.get("work_start_time"))
-            work_end = ScheduleService._to_time(template_data.get("work_end_time"))
-            br_start = ScheduleService._to_time(template_data.get("break_start_time"))
-            br_end = ScheduleService._to_time(template_data.get("break_end_time"))
-
-            # If it “intersects” with the working day, we remove the pause
-            if br_start and br_end and work_start and work_end:
-                if br_start < work_start or br_end > work_end:
-                    br_start = None
-                    br_end = None
-
-            # Preparing final values
-            template_data["work_start_time"] = work_start
-            template_data["work_end_time"] = work_end
-            template_data["break_start_time"] = br_start
-            template_data["break_end_time"] = br_end
-
-            # Assembling the schema
-            day_schema = CreateScheduleDaySchema(
-                schedule_id=schedule_id,
-                date=current_date,
-                day_of_week=dow,
-                is_active=template_data["is_active"],
-                work_start_time=template_data["work_start_time"],
-                work_end_time=template_data["work_end_time"],
-                break_start_time=template_data["break_start_time"],
-                break_end_time=template_data["break_end_time"],
-            )
-            result.append(day_schema)
-            current_date += timedelta(days=1)
-
-        return result
-
-    async def _move_appointments_to_waiting_list(
-        self, appointments: List[AppointmentDomain]
-    ):
-        for appointment in appointments:
-            appointment.status = AppointmentStatusEnum.CANCELLED
-            await self._appointment_repository.update(appointment)
-
     @staticmethod
     def _is_provided_role_schedulable(role_name: str) -> bool:
         """
@@ -211,7 +84,10 @@ class ScheduleService:
         if not schedule:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Schedule with ID: %(ID)s not found.") % {"ID": schedule_id},
+                detail=format_message(
+                    "Schedule with ID: %(ID)s not found.",
+                    ID=schedule_id,
+                ),
             )
 
         doctor = await self._user_service.get_by_id(schedule.doctor_id)
@@ -242,7 +118,7 @@ class ScheduleService:
         )
 
         total_amount_of_records: int = (
-            await self._schedule_repository.get_total_number_of_schedules()
+            await self._schedule_repository.get_total_number_of_schedules(filters)
         )
 
         result = []
@@ -267,8 +143,10 @@ class ScheduleService:
         if not existing_user:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("User with ID: %(ID)s not found or not a doctor.")
-                % {"ID": doctor_id},
+                detail=format_message(
+                    "User with ID: %(ID)s not found or not a doctor.",
+                    ID=doctor_id,
+                ),
             )
 
         # Check if at least one of the provided client roles is schedulable
@@ -294,10 +172,10 @@ class ScheduleService:
         if schedule_with_same_name:
             raise ScheduleNameIsAlreadyTakenError(
                 status_code=409,
-                detail=_(
-                    "Schedule with name: '%(NAME)s' for this specialist is already taken."
-                )
-                % {"NAME": create_schema.schedule_name},
+                detail=format_message(
+                    "Schedule with name: '%(NAME)s' for this specialist is already taken.",
+                    NAME=create_schema.schedule_name,
+                ),
             )
 
         schedule_domain = ScheduleDomain(
@@ -341,10 +219,10 @@ class ScheduleService:
             if period_duration.days > max_schedule_period_days:
                 raise ScheduleExceedsMaxAllowedPeriod(
                     status_code=409,
-                    detail=_(
-                        "Schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days."
-                    )
-                    % {"MAX_VALUE": max_schedule_period_days},
+                    detail=format_message(
+                        "Schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days.",
+                        MAX_VALUE=max_schedule_period_days,
+                    ),
                 )
 
             just_created_schedule = await self._uow.schedule_repository.add(
@@ -361,16 +239,16 @@ class ScheduleService:
                 else None
             )
 
-            days: List[CreateScheduleDaySchema] = self._generate_days_for_schedule(
+            days_generator = ScheduleDaysGenerator(
+                create_schema.week_days_template, reduced_days=reduced_days
+            )
+            days = days_generator.generate(
                 just_created_schedule.id,
                 just_created_schedule.period_start,
                 just_created_schedule.period_end,
-                create_schema.week_days_template,
-                reduced_days=reduced_days,
             )
 
-            for day_schema in days:
-                await self._uow.schedule_day_repository.add(day_schema)
+            await self._uow.schedule_day_repository.bulk_add(days)
 
         return [just_created_schedule, user_domain]
 
@@ -419,10 +297,10 @@ class ScheduleService:
             if schedule_with_same_name:
                 raise ScheduleNameIsAlreadyTakenError(
                     status_code=409,
-                    detail=_(
-                        "Schedule with name: '%(NAME)s' for this specialist is already taken."
-                    )
-                    % {"NAME": update_schema.schedule_name},
+                    detail=format_message(
+                        "Schedule with name: '%(NAME)s' for this specialist is already taken.",
+                        NAME=update_schema.schedule_name,
+                    ),
                 )
 
         new_start = update_schema.period_start or schedule.period_start
@@ -465,10 +343,10 @@ class ScheduleService:
             if period_duration.days > max_schedule_period_days:
                 raise ScheduleExceedsMaxAllowedPeriod(
                     status_code=409,
-                    detail=_(
-                        "New schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days."
-                    )
-                    % {"MAX_VALUE": max_schedule_period_days},
+                    detail=format_message(
+                        "New schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days.",
+                        MAX_VALUE=max_schedule_period_days,
+                    ),
                 )
 
         # Check if 'is_active' field value changes from True to False
@@ -496,32 +374,18 @@ class ScheduleService:
             reduced_days_rule.rule_data.get("days", []) if reduced_days_rule else None
         )
 
-        days_to_add = []
-        current_date = new_start
-        while current_date <= new_end:
-            if current_date not in existing_dates:
-                day_of_week = current_date.isoweekday()
-                # Looking for a template among the existing days of the schedule
-                existing_template = next(
-                    (day for day in existing_days if day.day_of_week == day_of_week),
-                    None,
-                )
-                if existing_template:
-                    week_days_template = [existing_template]
-                else:
-                    week_days_template = []
-
-                generated_days = self._generate_days_for_schedule(
-                    schedule.id,
-                    current_date,
-                    current_date,
-                    week_days_template,
-                    reduced_days=reduced_days,
-                )
-                day_schema = generated_days[0]
-
-                days_to_add.append(day_schema)
-            current_date += timedelta(days=1)
+        # The first existing day of each day of the week is used as a template
+        week_days_template = {
+            day.day_of_week: day for day in reversed(existing_days)
+        }.values()
+        days_generator = ScheduleDaysGenerator(
+            week_days_template, reduced_days=reduced_days
+        )
+        days_to_add = list(
+            days_generator.generate(
+                schedule.id, new_start, new_end, skip_dates=existing_dates
+            )
+        )
 
         # Delete the existing schedule's days (if the schedule was shortened)
         days_to_delete: List[UUID] = []
@@ -531,45 +395,23 @@ class ScheduleService:
 
         async with self._uow:
             if is_deactivating:
-                for day in existing_days:
-                    appointments = (
-                        await self._appointment_repository.get_appointments_by_day_id(
-                            day.id
-                        )
-                    )
-                    booked_appointments = [
-                        appointment
-                        for appointment in appointments
-                        if appointment.status == AppointmentStatusEnum.BOOKED
-                    ]
-
-                    if booked_appointments:
-                        await self._move_appointments_to_waiting_list(
-                            booked_appointments
-                        )
+                await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                    [day.id for day in existing_days]
+                )
 
             updated_schedule = await self._uow.schedule_repository.update(schedule)
 
-            for day_schema in days_to_add:
-                await self._uow.schedule_day_repository.add(day_schema)
+            await self._uow.schedule_day_repository.bulk_add(days_to_add)
 
+            await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                days_to_delete
+            )
             for day_id in days_to_delete:
-                appointments = (
-                    await self._appointment_repository.get_appointments_by_day_id(
-                        day_id
-                    )
-                )
-                booked_appointments = [
-                    appointment
-                    for appointment in appointments
-                    if appointment.status == AppointmentStatusEnum.BOOKED
-                ]
-
-                if booked_appointments:
-                    await self._move_appointments_to_waiting_list(booked_appointments)
-
                 await self._uow.schedule_day_repository.delete_by_id(day_id)
 
+        # Interval, activity or days of the schedule might have changed
+        day_slot_index_cache.invalidate(day.id for day in existing_days)
+
         return [updated_schedule, doctor_domain]
 
     async def delete(self, schedule_id: UUID) -> None:
@@ -580,27 +422,23 @@ class ScheduleService:
         if not schedule:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("Schedule with ID: %(ID)s not found.") % {"ID": schedule_id},
+                detail=format_message(
+                    "Schedule with ID: %(ID)s not found.",
+                    ID=schedule_id,
+                ),
             )
 
         days = await self._schedule_day_repository.get_all_by_schedule_id(
             schedule_id, limit=1000, page=1
         )
-        for day in days:
-            appointments = (
-                await self._appointment_repository.get_appointments_by_day_id(day.id)
-            )
-            booked_appointments = [
-                appointment
-                for appointment in appointments
-                if appointment.status == AppointmentStatusEnum.BOOKED
-            ]
-            if booked_appointments:
-                await self._move_appointments_to_waiting_list(booked_appointments)
-
         async with self._uow:
+            await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                [day.id for day in days]
+            )
             await self._schedule_repository.delete(schedule_id)
 
+        day_slot_index_cache.invalidate(day.id for day in days)
+
         async with self._uow:
             # Delete the schedule itself
             await self._schedule_repository.delete(schedule_id)
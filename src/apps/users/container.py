@@ -7,7 +7,8 @@ from src.apps.users.infrastructure.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
 from src.apps.users.services.user_service import UserService
-from src.core.database.config import provide_async_session
+from src.core.database.config import ScopedAsyncSession
+from src.core.database.routing import RoutingSession
 from src.core.logger import LoggerService
 
 
@@ -27,14 +28,20 @@ class UsersContainer(containers.DeclarativeContainer):
         instance_of=str, default="registry-service-users-group"
     )
     engine = providers.Dependency(instance_of=AsyncEngine)
+    read_replica = providers.Dependency()  # 'ReadReplica' or None
 
     # Session factory
     session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+        sessionmaker,
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        read_replica=read_replica,
     )
 
     # Async session
-    async_db_session = providers.Resource(provide_async_session, session_factory)
+    async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
 
     # Repositories
     user_repository = providers.Factory(
@@ -50,7 +50,7 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
             self._logger.info("Kafka consumer stopped.")
 
     async def consume(self):
-        self._logger.info(f"Consuming topic '{self.topic}'")
+        self._logger.info("Consuming topic '%s'", self.topic)
         async for msg in self.consumer:
             if not self._running:
                 break
@@ -101,4 +101,4 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
 
         await self.user_service.handle_event(action=action_enum, user_data=user_data)
 
-        self._logger.debug(f"Handled user action '{action_type}'. ID: '{user_id}'.")
+        self._logger.debug("Handled user action '%s'. ID: '%s'.", action_type, user_id)
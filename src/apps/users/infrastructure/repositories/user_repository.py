@@ -1,6 +1,7 @@
+from typing import Iterable, List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import any_, select
 
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.db_models.models import User
@@ -28,6 +29,17 @@ class SQLAlchemyUserRepository(BaseRepository, UserRepositoryInterface):
 
         return map_user_db_entity_to_domain(user)
 
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> List[UserDomain]:
+        user_ids = list(user_ids)
+        if not user_ids:
+            return []
+
+        query = select(User).where(User.id == any_(user_ids))
+        result = await self._async_db_session.execute(query)
+        users = result.scalars().all()
+
+        return [map_user_db_entity_to_domain(user) for user in users]
+
     async def get_by_iin(self, iin: str) -> UserDomain | None:
         query = select(User).where(User.iin == iin)
         result = await self._async_db_session.execute(query)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 from uuid import UUID
 
 from src.apps.users.domain.models.user import UserDomain
@@ -13,6 +14,11 @@ class UserRepositoryInterface(ABC):
     async def get_by_id(self, user_id: UUID) -> UserDomain | None:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> List[UserDomain]:
+        """Retrieves all users with the given IDs in a single query. Missing IDs are skipped."""
+        pass
+
     @abstractmethod
     async def get_by_iin(self, iin: str) -> UserDomain | None:
         pass
@@ -4,7 +4,7 @@ from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.schemas.user_schemas import UserSchema
 from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
 from src.apps.users.mappers import map_user_schema_to_domain
-from src.core.i18n import _
+from src.core.i18n import format_message
 from src.core.logger import LoggerService
 from src.shared.exceptions import (
     InstanceAlreadyExistsError,
@@ -31,7 +31,7 @@ class UserService:
         if user is None:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("User with ID: %(ID)s not found." % {"ID": user_id}),
+                detail=format_message("User with ID: %(ID)s not found.", ID=user_id),
             )
 
         return user
@@ -50,9 +50,9 @@ class UserService:
         if existing_user_by_id:
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_(
-                    "User with ID: %(ID)s already exists."
-                    % {"ID": existing_user_by_id.id}
+                detail=format_message(
+                    "User with ID: %(ID)s already exists.",
+                    ID=existing_user_by_id.id,
                 ),
             )
 
@@ -60,9 +60,9 @@ class UserService:
         if existing_user_by_iin:
             raise InstanceAlreadyExistsError(
                 status_code=409,
-                detail=_(
-                    "User with IIN: %(IIN)s already exists."
-                    % {"IIN": existing_user_by_iin.iin}
+                detail=format_message(
+                    "User with IIN: %(IIN)s already exists.",
+                    IIN=existing_user_by_iin.iin,
                 ),
             )
 
@@ -84,7 +84,7 @@ class UserService:
         if not existing_user:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("User with ID: %(ID)s not found." % {"ID": dto.id}),
+                detail=format_message("User with ID: %(ID)s not found.", ID=dto.id),
             )
 
         # Prepare a domain object manually
@@ -106,7 +106,7 @@ class UserService:
         if not existing_user:
             raise NoInstanceFoundError(
                 status_code=404,
-                detail=_("User with ID: %(ID)s not found." % {"ID": user_id}),
+                detail=format_message("User with ID: %(ID)s not found.", ID=user_id),
             )
 
         await self._user_repository.delete(user_id)
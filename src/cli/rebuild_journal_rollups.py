@@ -0,0 +1,65 @@
+"""
+CLI for rebuilding the journal statistics rollups from the journals.
+Run after the rollups migration, once every instance runs with
+'JOURNAL_STATISTICS_ROLLUPS_MAINTAINED' (or to repair drift), then enable
+'JOURNAL_STATISTICS_ROLLUPS_READ_ENABLED'. Runs as poetry-script module.
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# Register all models (relationships between apps), as in the migrations environment
+import src.apps.registry.infrastructure.db_models.models  # noqa: F401
+import src.apps.users.infrastructure.db_models.models  # noqa: F401
+import src.apps.platform_rules.infrastructure.db_models.models  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.citizenship_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.financing_sources_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.insurance_info_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.medical_organizations_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.nationalities_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.diagnoses_catalogue  # noqa: F401
+import src.apps.catalogs.infrastructure.db_models.patient_context_attributes_catalogue  # noqa: F401
+import src.apps.patients.infrastructure.db_models.association_tables  # noqa: F401
+import src.apps.patients.infrastructure.db_models.patients  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.stationary_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.emergency_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.newborn_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.polyclinic_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.maternity_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.sick_leave_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.home_call_models  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.staff_assignment  # noqa: F401
+import src.apps.assets_journal.infrastructure.db_models.statistics_rollup_models  # noqa: F401
+
+# Journal rollups are registered by the repository modules
+from src.apps.assets_journal.infrastructure.repositories import (  # noqa: F401
+    emergency_asset_repository,
+    home_call_repository,
+    newborn_asset_repository,
+    polyclinic_asset_repository,
+    sick_leave_repository,
+    stationary_asset_repository,
+)
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import rebuild_rollups
+from src.core.settings import project_settings
+
+
+async def rebuild() -> None:
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    try:
+        async with AsyncSession(engine) as session, session.begin():
+            rows = await rebuild_rollups(session)
+    finally:
+        await engine.dispose()
+
+    for journal, count in rows.items():
+        print(f"{journal}: {count} rollup rows")
+
+
+def main():
+    asyncio.run(rebuild())
+
+
+if __name__ == "__main__":
+    main()
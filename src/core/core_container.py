@@ -34,7 +34,10 @@ from src.core.logger import LoggerService
 from src.core.resources.fastapi_resource import FastAPIResource
 from src.core.resources.httpx_resource import HttpxClientResource
 from src.core.resources.kafka_consumer_resource import EventerConsumerResource
-from src.core.resources.sqlalchemy_resource import sqlalchemy_resource
+from src.core.resources.sqlalchemy_resource import (
+    read_replica_resource,
+    sqlalchemy_resource,
+)
 from src.core.resources.uvicorn_resource import uvicorn_server_resource
 from src.core.settings import project_settings
 from src.core.utils import get_exception_handlers, get_routers
@@ -57,9 +60,28 @@ class CoreContainer(containers.DeclarativeContainer):
     engine = providers.Resource(
         sqlalchemy_resource,
         project_settings.DATABASE_URI,
-        pool_pre_ping=True,
+        pool_pre_ping=project_settings.POOL_PRE_PING,
+        pool_size=project_settings.POOL_SIZE,
+        max_overflow=project_settings.MAX_OVERFLOW,
+        pool_timeout=project_settings.POOL_TIMEOUT_SECONDS,
+        pool_recycle=project_settings.POOL_RECYCLE_SECONDS,
+        statement_cache_size=project_settings.DB_STATEMENT_CACHE_SIZE,
+        statement_timeout_ms=project_settings.DB_STATEMENT_TIMEOUT_MS,
+    )
+
+    # Optional read replica engine (None if 'DB_READ_HOST' isn't set)
+    read_replica = providers.Resource(
+        read_replica_resource,
+        project_settings.DATABASE_READ_URI,
+        max_lag_seconds=project_settings.DB_READ_MAX_LAG_SECONDS,
+        check_interval_seconds=project_settings.DB_READ_LAG_CHECK_INTERVAL_SECONDS,
+        pool_pre_ping=project_settings.POOL_PRE_PING,
         pool_size=project_settings.POOL_SIZE,
         max_overflow=project_settings.MAX_OVERFLOW,
+        pool_timeout=project_settings.POOL_TIMEOUT_SECONDS,
+        pool_recycle=project_settings.POOL_RECYCLE_SECONDS,
+        statement_cache_size=project_settings.DB_STATEMENT_CACHE_SIZE,
+        statement_timeout_ms=project_settings.DB_STATEMENT_TIMEOUT_MS,
     )
 
     routers = providers.Callable(get_routers)
@@ -76,6 +98,10 @@ class CoreContainer(containers.DeclarativeContainer):
         debug=config.API_ENABLE_DOCS,
         enable_docs=config.API_ENABLE_DOCS,
         backend_cors_origins=config.BACKEND_CORS_ORIGINS,
+        enable_metrics=config.METRICS_ENABLED,
+        enable_query_detector=config.QUERY_DETECTOR_ENABLED,
+        query_detector_repeat_threshold=config.QUERY_DETECTOR_REPEAT_THRESHOLD,
+        query_detector_time_budget_ms=config.QUERY_DETECTOR_TIME_BUDGET_MS,
     )
 
     # ASGI server
@@ -100,6 +126,7 @@ class CoreContainer(containers.DeclarativeContainer):
         UsersContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
         kafka_bootstrap_servers=config.kafka.KAFKA_BOOTSTRAP_SERVERS,
         kafka_users_topic=config.kafka.ACTIONS_ON_USERS_KAFKA_TOPIC,
         kafka_group_id=config.kafka.KAFKA_GROUP_ID,
@@ -109,6 +136,7 @@ class CoreContainer(containers.DeclarativeContainer):
         PlatformRulesContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
     )
 
     medical_staff_journal_container = providers.Container(
@@ -122,6 +150,7 @@ class CoreContainer(containers.DeclarativeContainer):
         CatalogsContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
         # patients_container is below
     )
 
@@ -129,6 +158,7 @@ class CoreContainer(containers.DeclarativeContainer):
         PatientsContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
         # catalogs are below
     )
 
@@ -136,6 +166,7 @@ class CoreContainer(containers.DeclarativeContainer):
         RegistryContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
         user_service=users_container.user_service,
         patients_service=patients_container.patients_service,
         user_repository=users_container.user_repository,
@@ -152,6 +183,7 @@ class CoreContainer(containers.DeclarativeContainer):
             CatalogsContainer,
             logger=logger,
             engine=engine,
+            read_replica=read_replica,
             patients_service=patients_container.patients_service,
             user_service=users_container.user_service,
         )
@@ -162,6 +194,7 @@ class CoreContainer(containers.DeclarativeContainer):
             PatientsContainer,
             logger=logger,
             engine=engine,
+            read_replica=read_replica,
             citizenship_service=catalogs_container.citizenship_catalog_service,
             nationalities_service=catalogs_container.nationalities_catalog_service,
             medical_org_service=catalogs_container.medical_organizations_catalog_service,
@@ -184,6 +217,7 @@ class CoreContainer(containers.DeclarativeContainer):
         AssetsJournalContainer,
         logger=logger,
         engine=engine,
+        read_replica=read_replica,
         patients_service=patients_container.patients_service,
         medical_organizations_catalog_service=catalogs_container.medical_organizations_catalog_service,
     )
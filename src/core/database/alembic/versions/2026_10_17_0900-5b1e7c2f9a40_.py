@@ -0,0 +1,33 @@
+"""Add indexes for appointment list filters
+
+Revision ID: 5b1e7c2f9a40
+Revises: d7b4ee75c124
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c2f9a40'
+down_revision: Union[str, None] = 'd7b4ee75c124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_schedules_doctor_id'), 'schedules', ['doctor_id'], unique=False)
+    op.create_index(op.f('ix_schedule_days_schedule_id'), 'schedule_days', ['schedule_id'], unique=False)
+    op.create_index(op.f('ix_appointments_patient_id'), 'appointments', ['patient_id'], unique=False)
+    op.create_index(op.f('ix_appointments_schedule_day_id'), 'appointments', ['schedule_day_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_appointments_schedule_day_id'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_patient_id'), table_name='appointments')
+    op.drop_index(op.f('ix_schedule_days_schedule_id'), table_name='schedule_days')
+    op.drop_index(op.f('ix_schedules_doctor_id'), table_name='schedules')
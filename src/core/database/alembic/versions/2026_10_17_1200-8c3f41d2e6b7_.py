@@ -0,0 +1,39 @@
+"""Add journal statistics rollups
+
+Revision ID: 8c3f41d2e6b7
+Revises: 5b1e7c2f9a40
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f41d2e6b7'
+down_revision: Union[str, None] = '5b1e7c2f9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by 'rebuild-journal-rollups' (poetry script) once the upgraded app maintains it
+    op.create_table(
+        'journal_statistics_rollups',
+        sa.Column('journal', sa.String(length=50), nullable=False),
+        sa.Column('organization_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('metric', sa.String(length=100), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            'journal', 'organization_id', 'day', 'metric', name=op.f('pk_journal_statistics_rollups')
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('journal_statistics_rollups')
@@ -1,31 +1,65 @@
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.session import sessionmaker
 
+# Sessions of the current scope (e.g. HTTP request), one per 'ScopedAsyncSession' proxy
+_session_scope: ContextVar[Optional[Dict["ScopedAsyncSession", AsyncSession]]] = (
+    ContextVar("db_session_scope", default=None)
+)
 
-async def provide_async_session(
-    session_factory: sessionmaker,
-) -> AsyncGenerator[AsyncSession, None]:
-    """
-    Asynchronous session provider for SQLAlchemy.
 
-    This helper yields a new AsyncSession using a session factory,
-    and ensures the session is correctly closed after use.
+class ScopedAsyncSession:
+    """
+    Proxy to the AsyncSession of the current session scope.
 
-    Args:
-        session_factory (sessionmaker): SQLAlchemy async session factory.
+    Repositories and UoWs receive this proxy instead of a concrete session. Every
+    attribute access is forwarded to the session that belongs to the current scope
+    (see 'session_scope'), which is created from the session factory on first use.
+    So concurrent requests never share a session, and each of them takes its own
+    connection from the engine pool.
 
-    Yields:
-        AsyncSession: An instance of SQLAlchemy AsyncSession.
+    Outside of any scope (e.g. Kafka consumers, startup code) one shared session
+    of this proxy is used, as before.
 
     Example:
-        async_db_session = providers.Resource(provide_async_session, session_factory)
-        # In your DI container, pass session_factory as argument.
+        async_db_session = providers.Singleton(ScopedAsyncSession, session_factory)
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self._session_factory = session_factory
+        self._shared_session: Optional[AsyncSession] = None
+
+    def _get_session(self) -> AsyncSession:
+        sessions = _session_scope.get()
+        if sessions is None:
+            if self._shared_session is None:
+                self._shared_session = self._session_factory()
+            return self._shared_session
 
-    Note:
-        Use this helper with Dependency Injector's `providers.Resource` to ensure
-        per-request session lifecycle management.
+        session = sessions.get(self)
+        if session is None:
+            session = sessions[self] = self._session_factory()
+        return session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_session(), name)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[None]:
+    """
+    Opens a session scope: every 'ScopedAsyncSession' used inside it gets its own
+    AsyncSession, and all of them are closed (connections are returned to the pool)
+    on exit.
     """
-    async with session_factory() as session:
-        yield session
+    sessions: Dict[ScopedAsyncSession, AsyncSession] = {}
+    token = _session_scope.set(sessions)
+    try:
+        yield
+    finally:
+        _session_scope.reset(token)
+        for session in sessions.values():
+            await session.close()
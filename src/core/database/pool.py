@@ -0,0 +1,147 @@
+import time
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+)
+
+from src.core.logger import logger
+from src.core.metrics import format_sample, metrics
+
+
+class PoolStats:
+    """
+    Counters of a connection pool. Updated only from the event loop thread
+    (pool checkouts of async engines run there), so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+        self.checkout_timeouts = 0
+        self.connections_created = 0
+        self.overflow_connections_created = 0
+
+    def observe_checkout(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.checkout_seconds_total += seconds
+        self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    'AsyncAdaptedQueuePool' that records checkout time (waiting for a free
+    connection, connecting and the pre-ping), checkout timeouts and connections
+    opened beyond 'pool_size' (overflow). See 'snapshot'.
+
+    Example:
+        create_async_engine(uri, poolclass=InstrumentedAsyncAdaptedQueuePool)
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        connection_record = super()._create_connection()
+        self.stats.connections_created += 1
+        if self.overflow() > 0:
+            self.stats.overflow_connections_created += 1
+        return connection_record
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.checkout_timeouts += 1
+            logger.warning(
+                "Connection pool exhausted: %s connections checked out, "
+                "checkout timed out after %ss",
+                self.checkedout(),
+                self.timeout(),
+            )
+            raise
+
+        self.stats.observe_checkout(time.perf_counter() - started)
+        return connection
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current pool state and counters since the pool was created."""
+        stats = self.stats
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts_total": stats.checkouts,
+            "checkout_seconds_total": stats.checkout_seconds_total,
+            "checkout_seconds_max": stats.checkout_seconds_max,
+            "checkout_timeouts_total": stats.checkout_timeouts,
+            "connections_created_total": stats.connections_created,
+            "overflow_connections_created_total": stats.overflow_connections_created,
+        }
+
+
+# Instrumented engines by pool name ('primary', 'replica'), see 'register_pool_metrics'
+_engines: Dict[str, Engine] = {}
+
+# Metric name, type, help, 'snapshot' key
+_POOL_METRICS = (
+    ("db_pool_size", "gauge", "Connections kept open by the pool.", "size"),
+    ("db_pool_max_overflow", "gauge", "Connections allowed beyond the pool size.", "max_overflow"),
+    ("db_pool_checked_out", "gauge", "Connections in use.", "checked_out"),
+    ("db_pool_overflow", "gauge", "Open connections beyond the pool size.", "overflow"),
+    ("db_pool_checkouts_total", "counter", "Connection checkouts.", "checkouts_total"),
+    (
+        "db_pool_checkout_seconds_total",
+        "counter",
+        "Time spent checking out connections (waiting, connecting, pre-ping).",
+        "checkout_seconds_total",
+    ),
+    (
+        "db_pool_checkout_seconds_max",
+        "gauge",
+        "Longest connection checkout.",
+        "checkout_seconds_max",
+    ),
+    (
+        "db_pool_checkout_timeouts_total",
+        "counter",
+        "Checkouts that failed because the pool was exhausted.",
+        "checkout_timeouts_total",
+    ),
+    (
+        "db_pool_overflow_connections_created_total",
+        "counter",
+        "Connections opened beyond the pool size.",
+        "overflow_connections_created_total",
+    ),
+)
+
+
+def register_pool_metrics(name: str, engine: Engine) -> None:
+    """Exposes the engine's pool state on '/metrics' with the label pool='name'."""
+    _engines[name] = engine
+
+
+def _collect_pool_metrics() -> Iterator[str]:
+    snapshots = {
+        name: engine.pool.snapshot()
+        for name, engine in _engines.items()
+        if isinstance(engine.pool, InstrumentedAsyncAdaptedQueuePool)
+    }
+    for metric_name, metric_type, documentation, key in _POOL_METRICS:
+        yield f"# HELP {metric_name} {documentation}"
+        yield f"# TYPE {metric_name} {metric_type}"
+        for name, snapshot in sorted(snapshots.items()):
+            yield format_sample(metric_name, {"pool": name}, snapshot[key])
+
+
+metrics.register_collector(_collect_pool_metrics)
@@ -0,0 +1,119 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.logger import logger
+
+_QUERY_STARTED_AT = "_detector_query_started_at"
+
+# Replaced with '?' to group statements by shape: string literals, bind
+# parameters ('$1', '%(name)s', '?') and numbers; then 'IN (?, ?, ...)' -> 'IN (?)'
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\?|\b\d+(?:\.\d+)?\b")
+_VALUE_LISTS = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """
+    Statement shape without literal values, e.g.
+    "SELECT * FROM users WHERE id = $1 LIMIT 10" -> "SELECT * FROM users WHERE id = ? LIMIT ?".
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _LITERALS.sub("?", statement)
+    return _VALUE_LISTS.sub("(?)", statement)
+
+
+class QueryTracker:
+    """Statements executed within one 'track_queries' block, grouped by shape."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.statements[normalize_sql(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than 'threshold' times (N+1 candidates)."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_tracker: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryTracker]:
+    """
+    Records every SQL statement executed in the block (by any engine), including
+    the ones of tasks started in it.
+
+    Example:
+        with track_queries() as queries:
+            await service.delete(schedule_id)
+        assert queries.count <= 4
+    """
+    tracker = QueryTracker()
+    token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _tracker.reset(token)
+
+
+def report_queries(
+    tracker: QueryTracker,
+    source: str,
+    repeat_threshold: int,
+    time_budget_seconds: float,
+) -> None:
+    """
+    Logs a warning for every statement shape repeated more than 'repeat_threshold'
+    times and if the statements took longer than 'time_budget_seconds' in total.
+
+    :param source: What ran the statements, e.g. "GET /api/v1/patients".
+    """
+    for statement, count in tracker.repeated(repeat_threshold):
+        logger.warning(
+            "Possible N+1 queries: %s ran the same statement %s times: %s",
+            source,
+            count,
+            statement,
+        )
+
+    if tracker.total_seconds > time_budget_seconds:
+        logger.warning(
+            "%s spent %.0f ms in %s SQL statements (budget %.0f ms)",
+            source,
+            tracker.total_seconds * 1000,
+            tracker.count,
+            time_budget_seconds * 1000,
+        )
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _tracker.get() is not None:
+        setattr(context, _QUERY_STARTED_AT, time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracker = _tracker.get()
+    started_at = getattr(context, _QUERY_STARTED_AT, None)
+    if tracker is not None and started_at is not None:
+        tracker.record(statement, time.perf_counter() - started_at)
@@ -0,0 +1,61 @@
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.metrics import db_query_duration
+
+# Operation label of queries issued outside of repository methods (UoW commits, ...)
+UNKNOWN_OPERATION = "other"
+
+# Repository method that is running now, e.g. 'ScheduleRepositoryImpl.get_by_id'
+_db_operation: ContextVar[str] = ContextVar("db_operation", default=UNKNOWN_OPERATION)
+
+_QUERY_STARTED_AT = "_query_started_at"
+
+T = TypeVar("T")
+
+
+def track_db_operation(
+    name: str,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Labels SQL statements executed by the decorated coroutine function with 'name'
+    in 'db_query_duration_seconds'. Nested operations keep the outermost name.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            if _db_operation.get() != UNKNOWN_OPERATION:
+                return await func(*args, **kwargs)
+
+            token = _db_operation.set(name)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _db_operation.reset(token)
+
+        return wrapper
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        setattr(context, _QUERY_STARTED_AT, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started_at = getattr(context, _QUERY_STARTED_AT, None)
+    if started_at is not None:
+        db_query_duration.observe(time.perf_counter() - started_at, _db_operation.get())
+
+
+def instrument_query_metrics(engine: Engine) -> None:
+    """Times every statement executed by the (sync) engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
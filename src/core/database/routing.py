@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any, Optional
+
+from sqlalchemy import Select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from src.core.logger import logger
+
+# 'Session.info' flag: route all statements of the session to the primary
+USE_PRIMARY_INFO_KEY = "use_primary"
+
+# Replication lag in seconds (0 if everything received is replayed or if it's not a replica)
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+class ReadReplica:
+    """
+    Read replica engine with its replication lag monitor.
+
+    The replica is used only while it is reachable and lags behind the primary
+    by no more than 'max_lag_seconds'. The state is refreshed in the background
+    (see 'run') because 'Session.get_bind' is synchronous and can't query it.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ):
+        self.engine = engine
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self.is_available = False
+
+    async def check(self) -> None:
+        try:
+            async with self.engine.connect() as connection:
+                lag_seconds = float(await connection.scalar(REPLICA_LAG_QUERY) or 0)
+        except Exception as err:
+            if self.is_available:
+                logger.warning(f"Read replica is unreachable, using primary: {err}")
+            self.is_available = False
+            return
+
+        is_available = lag_seconds <= self._max_lag_seconds
+        if self.is_available and not is_available:
+            logger.warning(
+                f"Read replica lags by {lag_seconds:.1f}s, using primary until it catches up"
+            )
+        self.is_available = is_available
+
+    async def run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self._check_interval_seconds)
+
+
+class RoutingSession(Session):
+    """
+    Sync session class for 'AsyncSession' that sends plain reads to the read replica.
+
+    A statement goes to the replica only if it's a 'SELECT' without 'FOR UPDATE',
+    the session isn't flushing, the replica is available and the session isn't
+    switched to the primary with 'info[USE_PRIMARY_INFO_KEY]' (UoW blocks do that).
+    Everything else goes to the primary ('bind').
+
+    Example:
+        sessionmaker(bind=engine, class_=AsyncSession, sync_session_class=RoutingSession,
+                     read_replica=read_replica)
+    """
+
+    def __init__(self, *args: Any, read_replica: Optional[ReadReplica] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._read_replica = read_replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any) -> Engine:
+        read_replica = self._read_replica
+        if (
+            read_replica is not None
+            and read_replica.is_available
+            and not self._flushing
+            and not self.info.get(USE_PRIMARY_INFO_KEY)
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            return read_replica.engine.sync_engine
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
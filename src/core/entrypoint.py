@@ -8,6 +8,7 @@ from typing import Any
 
 from mis_eventer_lib.eventer_consumer import EventerConsumerService
 
+from src.apps.catalogs.services.catalog_cache import catalog_cache
 from src.core.core_container import CoreContainer
 from src.core.logger import logger
 from src.core.settings import Settings
@@ -53,6 +54,11 @@ class Entrypoint:
         await asyncify(self._container.init_resources())
         wire_subcontainers(self._container)
 
+        # Warm up the reference catalogs cache before serving requests
+        await catalog_cache.preload(
+            self._container.catalogs_container.catalog_cache_loaders(), logger
+        )
+
         # Get resource-objects
         self._eventer_consumer_service = self._container.eventer_consumer_service()
         self._uvicorn_server = self._container.api_server()
@@ -65,7 +71,8 @@ class Entrypoint:
             self._eventer_consumer_service.start()
         )
         logger.info(
-            f"Started Eventer Consumer task on topics: {', '.join(self._eventer_consumer_service.topics)}"
+            "Started Eventer Consumer task on topics: %s",
+            ', '.join(self._eventer_consumer_service.topics),
         )
 
         self._asgi_server_task = asyncio.create_task(self._uvicorn_server.serve())
@@ -1,15 +1,49 @@
 import contextvars
 import gettext
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from src.core.settings import project_settings
+
+LOCALE_DIR = Path(__file__).resolve().parent.parent.parent / "locale"
 
 _locale_ctx = contextvars.ContextVar("current_locale", default="en")
-_translators = {}
 
+# Immutable msgid -> msgstr catalogs of all 'LANGUAGES', see 'load_catalogs'
+_catalogs: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+_EMPTY_CATALOG: Mapping[str, str] = MappingProxyType({})
+
+
+def load_catalogs() -> None:
+    """
+    Loads compiled (.mo) catalogs of all 'LANGUAGES' into immutable dicts.
+    Called on import; call again after recompiling translations.
+    Languages without a compiled catalog keep original (English) messages.
+    """
+    global _catalogs
+
+    catalogs: Dict[str, Mapping[str, str]] = {}
+    for lang in project_settings.LANGUAGES:
+        translation = gettext.translation(
+            "messages", localedir=LOCALE_DIR, languages=[lang], fallback=True
+        )
+        catalog = getattr(translation, "_catalog", {})
+        catalogs[lang] = MappingProxyType(
+            {
+                msgid: msgstr
+                for msgid, msgstr in catalog.items()
+                # Skip the .mo header and plural forms (keyed by tuples)
+                if isinstance(msgid, str) and msgid and msgstr
+            }
+        )
+
+    _catalogs = MappingProxyType(catalogs)
+    _format_message.cache_clear()
 
-def set_locale(lang: str):
-    from src.core.settings import project_settings
 
+def set_locale(lang: str):
     if lang not in project_settings.LANGUAGES:
         lang = project_settings.DEFAULT_LANGUAGE
 
@@ -20,17 +54,33 @@ def get_locale():
     return _locale_ctx.get()
 
 
-def get_translator(lang: Optional[str] = None):
-    lang = lang or get_locale()
-    if lang not in _translators:
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        localedir = base_dir / "locale"
-        _translators[lang] = gettext.translation(
-            "messages", localedir=localedir, languages=[lang], fallback=True
-        )
+def get_translator(lang: Optional[str] = None) -> Callable[[str], str]:
+    catalog = _catalogs.get(lang or get_locale(), _EMPTY_CATALOG)
+    return lambda message: catalog.get(message, message)
+
+
+def _(message: str) -> str:
+    return _catalogs.get(_locale_ctx.get(), _EMPTY_CATALOG).get(message, message)
+
+
+@lru_cache(maxsize=4096)
+def _format_message(lang: str, message: str, params: tuple) -> str:
+    catalog = _catalogs.get(lang, _EMPTY_CATALOG)
+    return catalog.get(message, message) % dict(params)
+
+
+def format_message(message: str, **params: Any) -> str:
+    """
+    Translates the message into the current locale and fills in its
+    '%(NAME)s' placeholders, e.g. format_message("ID: %(ID)s", ID=1).
 
-    return _translators[lang].gettext
+    Results are memoized per locale and parameters, so the details of
+    frequently raised errors (404, 409, ...) aren't rebuilt on every request.
+    """
+    try:
+        return _format_message(_locale_ctx.get(), message, tuple(params.items()))
+    except TypeError:  # Unhashable parameters
+        return _(message) % params
 
 
-def _(message, *args, **kwargs):
-    return get_translator()(message, *args, **kwargs)
+load_catalogs()
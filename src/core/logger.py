@@ -1,6 +1,91 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+from datetime import datetime, timezone
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Tuple
+
+from src.core.settings import project_settings
+
+# Background writers of the configured loggers and their queue handlers, by logger name
+_listeners: Dict[str, Tuple[QueueListener, QueueHandler]] = {}
+
+# 'LogRecord' attributes that aren't 'extra' fields
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects:
+    '{"timestamp": ..., "level": ..., "logger": ..., "message": ..., ...}'.
+    Fields passed with 'extra' and the formatted exception are added as is.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        # Queued records carry the exception already formatted (see '_QueueHandler')
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatException(record.exc_info)
+        if exc_text:
+            data["exc_info"] = exc_text
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(QueueHandler):
+    """
+    Renders the message and the exception in the calling thread before queueing:
+    by the time the listener thread gets to the record, the arguments (ORM entities,
+    domain models, mutable dicts) may have changed or would lazy load outside of the
+    event loop. Unlike 'QueueHandler.prepare', the record isn't formatted with the
+    handler's formatter, so the listener's formatters (e.g. 'JsonFormatter') still
+    get its fields.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            # Tracebacks hold the frames (and their locals) alive
+            record.exc_info = None
+        return record
+
+
+def _stop_listener(name: str) -> None:
+    """
+    Writes out queued records of the logger and stops its background writer.
+    Further records are written synchronously by the same handlers.
+    """
+    entry = _listeners.pop(name, None)
+    if entry is None:
+        return
+
+    listener, queue_handler = entry
+    listener.stop()
+
+    logger = logging.getLogger(name)
+    logger.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
 
 
 class LoggerService:
@@ -13,10 +98,14 @@ class LoggerService:
         date_format: str = "%Y-%m-%d %H:%M:%S",
         file_level: int = logging.ERROR,
         base_level: int = logging.DEBUG,
+        json_format: bool = project_settings.LOG_JSON,
     ) -> None:
         """
         Creates a customized logger that outputs logs to both the console and a file.
 
+        Logging calls only render the message and put the record into a queue; it is
+        written by a background thread, so callers (e.g. the event loop) never block on I/O.
+
         - name - Logger name.
         - log_file_name - File name, where logs will be written.
         - log_dir - Log files directory.
@@ -24,6 +113,7 @@ class LoggerService:
         - date_format - Date format.
         - file_level - File logging level.
         - base_level - Base logging level.
+        - json_format - Write JSON lines instead of 'log_format'.
         """
         self.logger: Logger = logging.getLogger(name)
         self.logger.setLevel(base_level)
@@ -32,35 +122,62 @@ class LoggerService:
             if not os.path.exists(log_dir):
                 os.makedirs(log_dir)
 
-            formatter = logging.Formatter(log_format, datefmt=date_format)
+            if json_format:
+                formatter = JsonFormatter()
+            else:
+                formatter = logging.Formatter(log_format, datefmt=date_format)
 
             # Console handler setting up
             console_handler = logging.StreamHandler()
             console_handler.setLevel(base_level)
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
 
             # File handler setting up
             file_path = os.path.join(log_dir, f"{log_file_name}.log")
             file_handler = logging.FileHandler(file_path)
             file_handler.setLevel(file_level)
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
 
-    def debug(self, message: str, *, exc_info: bool | Exception = False) -> None:
-        self.logger.debug(message, exc_info=exc_info)
+            # Handlers are run by the listener thread
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(
+                log_queue,
+                console_handler,
+                file_handler,
+                respect_handler_level=True,
+            )
+            queue_handler = _QueueHandler(log_queue)
+            listener.start()
+            _listeners[name] = (listener, queue_handler)
+            atexit.register(_stop_listener, name)
+
+            self.logger.addHandler(queue_handler)
+
+    def stop(self) -> None:
+        """
+        Writes out queued records and stops the background writer
+        (further records are written synchronously).
+        """
+        _stop_listener(self.logger.name)
+
+    # Messages may use %-style placeholders filled with 'args', e.g.
+    # logger.debug("Handled event %s", event_id). They are formatted only if
+    # the level is enabled; writing is left to the background thread.
+
+    def debug(self, message: str, *args: Any, exc_info: bool | Exception = False) -> None:
+        self.logger.debug(message, *args, exc_info=exc_info)
 
-    def info(self, message: str, *, exc_info: bool | Exception = False) -> None:
-        self.logger.info(message, exc_info=exc_info)
+    def info(self, message: str, *args: Any, exc_info: bool | Exception = False) -> None:
+        self.logger.info(message, *args, exc_info=exc_info)
 
-    def warning(self, message: str, *, exc_info: bool | Exception = False) -> None:
-        self.logger.warning(message, exc_info=exc_info)
+    def warning(self, message: str, *args: Any, exc_info: bool | Exception = False) -> None:
+        self.logger.warning(message, *args, exc_info=exc_info)
 
-    def error(self, message: str, *, exc_info: bool | Exception = False) -> None:
-        self.logger.error(message, exc_info=exc_info)
+    def error(self, message: str, *args: Any, exc_info: bool | Exception = False) -> None:
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message: str, *, exc_info: bool | Exception = False) -> None:
-        self.logger.critical(message, exc_info=exc_info)
+    def critical(self, message: str, *args: Any, exc_info: bool | Exception = False) -> None:
+        self.logger.critical(message, *args, exc_info=exc_info)
 
 
 logger = LoggerService()
@@ -0,0 +1,138 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Latency buckets, seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    """One sample line of the Prometheus text exposition format."""
+    if labels:
+        label_pairs = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+        return f"{name}{{{label_pairs}}} {value!r}"
+
+    return f"{name} {value!r}"
+
+
+class Histogram:
+    """
+    Prometheus histogram with a fixed label set.
+
+    Observing costs a bisect and a few increments under an uncontended lock.
+    Label values must have a bounded number of combinations (route templates,
+    not raw paths).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Label values -> (per bucket counts + '+Inf' count, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+
+        with self._lock:
+            series = [
+                (label_values, list(counts), total[0])
+                for label_values, (counts, total) in self._series.items()
+            ]
+
+        for label_values, counts, total in sorted(series):
+            labels = dict(zip(self.label_names, label_values))
+            cumulative = 0
+            for upper_bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                yield format_sample(
+                    f"{self.name}_bucket", {**labels, "le": str(upper_bound)}, cumulative
+                )
+            yield format_sample(f"{self.name}_sum", labels, total)
+            yield format_sample(f"{self.name}_count", labels, cumulative)
+
+
+class MetricsRegistry:
+    """
+    Process-wide set of metrics rendered by the '/metrics' endpoint.
+
+    Histograms are updated by the instrumented code; collectors are called on
+    every scrape and yield ready exposition lines (e.g. connection pool gauges).
+    """
+
+    def __init__(self) -> None:
+        self._histograms: List[Histogram] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, label_names, buckets)
+        self._histograms.append(histogram)
+        return histogram
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in self._histograms:
+            lines.extend(histogram.collect())
+        for collector in self._collectors:
+            lines.extend(collector())
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP requests handled by the service, by route template and status.",
+    ("method", "route", "status"),
+)
+db_query_duration = metrics.histogram(
+    "db_query_duration_seconds",
+    "SQL statements, by the repository method that issued them.",
+    ("operation",),
+)
+http_client_request_duration = metrics.histogram(
+    "http_client_request_duration_seconds",
+    "Outbound HTTP calls (Auth Service, RPN integration, ...), by host and status.",
+    ("host", "method", "status"),
+)
+kafka_handler_duration = metrics.histogram(
+    "kafka_handler_duration_seconds",
+    "Kafka event handlers, by event model, action and outcome.",
+    ("model", "action", "outcome"),
+)
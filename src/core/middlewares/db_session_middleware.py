@@ -0,0 +1,22 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.database.config import session_scope
+
+
+class DBSessionScopeMiddleware:
+    """
+    Opens a DB session scope for every HTTP request, so each request works with
+    its own sessions (see 'ScopedAsyncSession'). The sessions are closed after the
+    response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with session_scope():
+            await self.app(scope, receive, send)
@@ -1,17 +1,71 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from functools import lru_cache
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.i18n import set_locale
 from src.core.settings import project_settings
 
 
-class LocalesTranslationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        lang = request.headers.get("accept-language", project_settings.DEFAULT_LANGUAGE)
+@lru_cache(maxsize=256)
+def _best_supported_language(accept_language: str) -> Optional[str]:
+    best_lang, best_quality = None, 0.0
+    for item in accept_language.split(","):
+        lang, _, params = item.strip().partition(";")
+        lang = lang.strip().split("-")[0].lower()
         if lang not in project_settings.LANGUAGES:
-            lang = project_settings.DEFAULT_LANGUAGE
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+
+        # On equal q-values the first language in the header wins
+        if quality > best_quality:
+            best_lang, best_quality = lang, quality
+
+    return best_lang
+
+
+def negotiate_locale(accept_language: Optional[str]) -> str:
+    """
+    Picks the supported language with the highest q-value from an 'Accept-Language'
+    header value, e.g. "kk-KZ,ru;q=0.9,en;q=0.8" -> "kk". Region subtags are ignored.
+    Falls back to 'DEFAULT_LANGUAGE'.
+    """
+    if accept_language:
+        lang = _best_supported_language(accept_language)
+        if lang is not None:
+            return lang
+
+    return project_settings.DEFAULT_LANGUAGE
+
+
+class LocalesTranslationMiddleware:
+    """
+    Sets the request locale from the 'Accept-Language' header.
+
+    A pure ASGI middleware: messages pass through untouched, without the extra
+    task and response stream wrapping of 'BaseHTTPMiddleware'.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket"):
+            accept_language = None
+            for name, value in scope["headers"]:
+                if name == b"accept-language":
+                    accept_language = value.decode("latin-1")
+                    break
 
-        set_locale(lang)
+            # Not reset after the request: error handlers outside of this middleware
+            # (e.g. the catch-all one) must still see the request locale
+            set_locale(negotiate_locale(accept_language))
 
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
@@ -0,0 +1,33 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.database.query_detector import report_queries, track_queries
+
+
+class QueryDetectorMiddleware:
+    """
+    Tracks SQL statements of every HTTP request and logs a warning if the request
+    repeats the same statement shape more than 'repeat_threshold' times (N+1
+    queries) or spends more than 'time_budget_ms' in SQL (see 'report_queries').
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int, time_budget_ms: int):
+        self.app = app
+        self._repeat_threshold = repeat_threshold
+        self._time_budget_seconds = time_budget_ms / 1000
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                route = scope.get("route")
+                report_queries(
+                    queries,
+                    f"{scope['method']} {getattr(route, 'path', scope['path'])}",
+                    repeat_threshold=self._repeat_threshold,
+                    time_budget_seconds=self._time_budget_seconds,
+                )
@@ -1,9 +1,13 @@
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.core.metrics import CONTENT_TYPE, metrics
+from src.core.middlewares.db_session_middleware import DBSessionScopeMiddleware
 from src.core.middlewares.i18n_middleware import LocalesTranslationMiddleware
+from src.core.middlewares.metrics_middleware import MetricsMiddleware
+from src.core.middlewares.query_detector_middleware import QueryDetectorMiddleware
 from src.shared.exception_handlers import generic_exception_handler
 
 
@@ -16,6 +20,10 @@ def FastAPIResource(
     debug: bool,
     enable_docs: bool,
     backend_cors_origins: List[str],
+    enable_metrics: bool = True,
+    enable_query_detector: bool = False,
+    query_detector_repeat_threshold: int = 10,
+    query_detector_time_budget_ms: int = 500,
 ) -> FastAPI:
     app = FastAPI(
         title=project_name,
@@ -39,6 +47,25 @@ def FastAPIResource(
     # i18n middleware
     app.add_middleware(LocalesTranslationMiddleware)
 
+    # Request-scoped DB sessions
+    app.add_middleware(DBSessionScopeMiddleware)
+
+    # N+1 queries and slow requests warnings
+    if enable_query_detector:
+        app.add_middleware(
+            QueryDetectorMiddleware,
+            repeat_threshold=query_detector_repeat_threshold,
+            time_budget_ms=query_detector_time_budget_ms,
+        )
+
+    # Metrics (the outermost middleware, so the others are timed too)
+    if enable_metrics:
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics", include_in_schema=False)
+        async def get_metrics() -> Response:
+            return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
     # Exception handlers
     for handler_dict in exception_handlers:
         handler = handler_dict["handler"]
@@ -1,4 +1,44 @@
-from httpx import AsyncClient, Limits, Timeout
+import time
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
+    Limits,
+    Request,
+    Response,
+    Timeout,
+)
+
+from src.core.metrics import http_client_request_duration
+
+
+class InstrumentedAsyncTransport(AsyncBaseTransport):
+    """
+    Records the duration of every outbound request (until the response headers
+    are received) by host, method and status ('error' if there was no response).
+    """
+
+    def __init__(self, transport: AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        status = "error"
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            http_client_request_duration.observe(
+                time.perf_counter() - started,
+                request.url.host,
+                request.method,
+                status,
+            )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
 
 
 def HttpxClientResource(
@@ -20,6 +60,9 @@ def HttpxClientResource(
         max_connections=max_connections,
     )
     timeout_config = Timeout(timeout, read=timeout, write=timeout)
-    client = AsyncClient(timeout=timeout_config, limits=limits)
+    client = AsyncClient(
+        timeout=timeout_config,
+        transport=InstrumentedAsyncTransport(AsyncHTTPTransport(limits=limits)),
+    )
 
     return client
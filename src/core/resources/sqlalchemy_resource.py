@@ -1,16 +1,59 @@
+import asyncio
+import contextlib
 import typing
 
 from sqlalchemy.ext import asyncio as asa
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.core.database.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    register_pool_metrics,
+)
+from src.core.database.query_metrics import instrument_query_metrics
+from src.core.database.routing import ReadReplica
 from src.core.logger import logger
 
 
+def _create_async_engine(
+    sqlalchemy_database_uri: str,
+    statement_cache_size: int = 100,
+    statement_timeout_ms: int = 0,
+    pool_name: str = "primary",
+    **kwargs: typing.Any,
+) -> AsyncEngine:
+    """
+    Creates an engine with an instrumented connection pool (see
+    'InstrumentedAsyncAdaptedQueuePool') and timed queries, both exposed on '/metrics'.
+
+    - statement_cache_size - Prepared statements cached per connection, both by
+      SQLAlchemy and asyncpg (0 disables them).
+    - statement_timeout_ms - Server-side 'statement_timeout' (0 - server default).
+    - pool_name - 'pool' label of the pool metrics.
+    """
+    connect_args = {
+        "prepared_statement_cache_size": statement_cache_size,
+        "statement_cache_size": statement_cache_size,
+    }
+    if statement_timeout_ms:
+        connect_args["server_settings"] = {"statement_timeout": str(statement_timeout_ms)}
+
+    engine = asa.create_async_engine(
+        sqlalchemy_database_uri,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args=connect_args,
+        **kwargs,
+    )
+    instrument_query_metrics(engine.sync_engine)
+    register_pool_metrics(pool_name, engine.sync_engine)
+
+    return engine
+
+
 async def sqlalchemy_resource(
     sqlalchemy_database_uri: str, **kwargs: typing.Any
 ) -> AsyncEngine:
     try:
-        engine = asa.create_async_engine(sqlalchemy_database_uri, **kwargs)
+        engine = _create_async_engine(sqlalchemy_database_uri, **kwargs)
         async with engine.connect():
             pass
 
@@ -19,3 +62,33 @@ async def sqlalchemy_resource(
     except Exception as err:
         logger.critical(f"Error creating database engine: {err}", exc_info=True)
         raise
+
+
+async def read_replica_resource(
+    sqlalchemy_database_uri: typing.Optional[str],
+    max_lag_seconds: float,
+    check_interval_seconds: float,
+    **kwargs: typing.Any,
+) -> typing.AsyncIterator[typing.Optional[ReadReplica]]:
+    """
+    Read replica engine with a background lag monitor. Yields None if no replica is configured.
+    Unlike the primary, an unreachable replica doesn't stop the app: reads go to the primary.
+    """
+    if not sqlalchemy_database_uri:
+        yield None
+        return
+
+    engine = _create_async_engine(sqlalchemy_database_uri, pool_name="replica", **kwargs)
+    read_replica = ReadReplica(engine, max_lag_seconds, check_interval_seconds)
+    await read_replica.check()
+    if not read_replica.is_available:
+        logger.warning("Read replica is unavailable on startup, reads go to primary.")
+
+    monitor_task = asyncio.create_task(read_replica.run())
+    try:
+        yield read_replica
+    finally:
+        monitor_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await monitor_task
+        await engine.dispose()
@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List, Optional, Set
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +24,17 @@ class Settings(BaseSettings):
     BACKEND_CORS_ORIGINS: List[str] = []
     DEBUG: bool = True
 
+    # Logging. JSON lines instead of plain text (for log collectors)
+    LOG_JSON: bool = False
+
+    # Prometheus metrics on '/metrics' (request, SQL, outbound HTTP, Kafka handler timings)
+    METRICS_ENABLED: bool = True
+
+    # Warn about requests that repeat a statement (N+1 queries) or spend too long in SQL
+    QUERY_DETECTOR_ENABLED: bool = False
+    QUERY_DETECTOR_REPEAT_THRESHOLD: int = 10
+    QUERY_DETECTOR_TIME_BUDGET_MS: int = 500
+
     # Database params
     DB_NAME: str = ""
     DB_USER: str = ""
@@ -32,6 +43,47 @@ class Settings(BaseSettings):
     DB_PORT: int = 5432
     POOL_SIZE: int = 10
     MAX_OVERFLOW: int = 20
+    # Seconds to wait for a free connection before failing the request
+    POOL_TIMEOUT_SECONDS: float = 30.0
+    # Connections older than this are replaced on checkout (-1 - never)
+    POOL_RECYCLE_SECONDS: int = 1800
+    # Test every connection with a round trip on checkout. Recycling usually suffices
+    POOL_PRE_PING: bool = True
+    # Prepared statements cached per connection (0 - disabled, e.g. behind PgBouncer
+    # in transaction pooling mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Server-side 'statement_timeout' for every connection (0 - server default)
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+
+    # Read replica (optional). Reads outside of UoW blocks go there while its lag is acceptable
+    DB_READ_HOST: str = ""
+    DB_READ_PORT: int = 5432
+    DB_READ_MAX_LAG_SECONDS: float = 5.0
+    DB_READ_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # Pagination 'total items' counts. Writes through a repository drop its cached totals in
+    # this process; other processes may show a stale total for up to the TTL
+    PAGINATION_COUNT_CACHE_TTL_SECONDS: int = 10
+    PAGINATION_COUNT_CACHE_MAX_SIZE: int = 1024
+    # Unfiltered counts of tables estimated above this size are taken from 'pg_class.reltuples'
+    APPROXIMATE_COUNT_THRESHOLD: int = 1_000_000
+
+    # Per schedule day slot availability indexes (free slots listing)
+    SLOT_INDEX_CACHE_TTL_SECONDS: int = 30
+    SLOT_INDEX_CACHE_MAX_SIZE: int = 4096
+    # Longest date range (days, inclusive) of one free slots search
+    FREE_SLOTS_SEARCH_MAX_PERIOD_DAYS: int = 31
+
+    # Per day journal statistics rollups. Keep them maintained (on every write of the journals)
+    # wherever their table exists. Rollout: migrate, deploy with maintenance on, run
+    # 'rebuild-journal-rollups', then enable reads
+    JOURNAL_STATISTICS_ROLLUPS_MAINTAINED: bool = True
+    # Journal statistics filtered only by organization and whole days are read from the rollups
+    JOURNAL_STATISTICS_ROLLUPS_READ_ENABLED: bool = False
+
+    # Reference catalogs cache (preloaded on startup, kept current by the catalog Kafka
+    # handlers). The TTL bounds staleness on replicas that didn't consume an event. 0 disables
+    CATALOG_CACHE_TTL_SECONDS: int = 300
 
     # i18 params
     LANGUAGES: Set[str] = {"ru", "kk", "en"}
@@ -44,6 +96,17 @@ class Settings(BaseSettings):
 
     # Auth Service params
     AUTH_SERVICE_BASE_URL: str = "https://auth-service-app-dev:8001/api/v1"
+    # Cached permissions never outlive the access token itself ('exp' claim). 0 disables caching
+    AUTH_PERMISSIONS_CACHE_TTL_SECONDS: int = 60
+    AUTH_PERMISSIONS_CACHE_MAX_SIZE: int = 10_000
+    # Local JWT verification: permissions are read from the token's 'authorization' claim
+    # (verified against the JWKS), the Auth Service is called only as a fallback
+    AUTH_JWT_LOCAL_VERIFICATION: bool = False
+    AUTH_JWKS_URL: str = ""
+    AUTH_JWKS_CACHE_TTL_SECONDS: int = 600
+    AUTH_JWT_ALGORITHMS: List[str] = ["RS256"]
+    AUTH_JWT_ISSUER: str = ""
+    AUTH_JWT_AUDIENCE: str = ""
 
     # RPN Integration Service params
     RPN_INTEGRATION_SERVICE_BASE_URL: str = "https://rpn-integration-service:8010"
@@ -76,6 +139,18 @@ class Settings(BaseSettings):
             f"{self.DB_NAME}"
         )
 
+    @property
+    def DATABASE_READ_URI(self) -> Optional[str]:
+        if not self.DB_READ_HOST:
+            return None
+
+        return (
+            f"postgresql+asyncpg://"
+            f"{self.DB_USER}:{self.DB_PASSWORD}@"
+            f"{self.DB_READ_HOST}:{self.DB_READ_PORT}/"
+            f"{self.DB_NAME}"
+        )
+
     model_config = SettingsConfigDict(
         env_file_encoding="utf-8",
     )
@@ -3,6 +3,7 @@ from typing import Optional, Type
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.database.routing import USE_PRIMARY_INFO_KEY
 from src.core.logger import LoggerService
 
 
@@ -14,6 +15,9 @@ class BaseUnitOfWork:
 
     async def __aenter__(self) -> "BaseUnitOfWork":
         self._is_active = True
+        # UoW blocks work with the primary. The flag isn't reset on exit, so the rest of
+        # the request reads its own writes instead of possibly lagging replica data.
+        self._session.info[USE_PRIMARY_INFO_KEY] = True
         return self
 
     async def __aexit__(
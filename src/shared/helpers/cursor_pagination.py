@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.core.i18n import _
+from src.shared.exceptions import InvalidPaginationParamsError
+
+
+class KeysetPage(list):
+    """
+    A page of items fetched in cursor (keyset) pagination mode.
+
+    Behaves like a plain list of items, additionally carrying an opaque
+    'next_cursor' (None if there are no more items).
+    """
+
+    def __init__(self, items: Iterable[Any] = (), next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+def _encode_value(value: Any) -> Any:
+    # 'datetime' is a subclass of 'date', so it must be checked first
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, time):
+        return {"t": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    (tag, raw), = value.items()
+    decoders = {
+        "dt": datetime.fromisoformat,
+        "d": date.fromisoformat,
+        "t": time.fromisoformat,
+        "u": UUID,
+    }
+    return decoders[tag](raw)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes sort key values of the last returned row into an opaque URL-safe cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_length: int) -> Tuple[Any, ...]:
+    """
+    Decodes a cursor produced by 'encode_cursor'.
+
+    Raises:
+        InvalidPaginationParamsError: If the cursor is malformed or doesn't match the sort key.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw_values: List[Any] = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw_values, list) or len(raw_values) != key_length:
+            raise ValueError("Cursor doesn't match the sort key.")
+
+        return tuple(_decode_value(value) for value in raw_values)
+    except (ValueError, KeyError, TypeError, binascii.Error) as err:
+        raise InvalidPaginationParamsError(
+            status_code=422,
+            detail=_("Invalid pagination cursor."),
+        ) from err
@@ -1,9 +1,11 @@
+import time
 from functools import wraps
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from src.core.logger import LoggerService
+from src.core.metrics import kafka_handler_duration
 from src.shared.exceptions import UniqueViolationError
 
 
@@ -115,6 +117,7 @@ def handle_kafka_event(
     """
     Decorator for handling exceptions and logging in asynchronous Kafka event handlers.
     Wraps an async function, catches exceptions, and logs critical errors using the provided logger.
+    Handler durations are recorded in the 'kafka_handler_duration_seconds' metric.
 
     Args:
         action_type (str): The type of action (e.g., "CREATE", "UPDATE", "DELETE").
@@ -152,8 +155,12 @@ def handle_kafka_event(
                         logger = arg
                         break
 
+            started = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
+                kafka_handler_duration.observe(
+                    time.perf_counter() - started, model_name, action_type, "success"
+                )
 
                 if logger is None:
                     raise RuntimeError(
@@ -169,18 +176,27 @@ def handle_kafka_event(
 
                 if schema_data:
                     logger.info(
-                        f"Successfully handled '{schema_data.action}' type event for model: '{model_name}'. "
-                        f"Record with ID: {getattr(schema_data, 'id', 'N/A')} processed."
+                        "Successfully handled '%s' type event for model: '%s'. "
+                        "Record with ID: %s processed.",
+                        schema_data.action,
+                        model_name,
+                        getattr(schema_data, 'id', 'N/A'),
                     )
                 else:
                     # If schema_data is not found
                     logger.info(
-                        f"Successfully handled '{action_type}' type event for model: '{model_name}'."
+                        "Successfully handled '%s' type event for model: '%s'.",
+                        action_type,
+                        model_name,
                     )
 
                 return result
 
             except Exception as err:
+                kafka_handler_duration.observe(
+                    time.perf_counter() - started, model_name, action_type, "error"
+                )
+
                 schema_data = None
                 for arg in args:
                     if hasattr(arg, 'action'):
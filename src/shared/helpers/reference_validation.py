@@ -0,0 +1,73 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Set
+
+from src.core.database.config import session_scope
+from src.core.i18n import format_message
+from src.shared.exceptions import NoInstanceFoundError
+
+
+@dataclass
+class References:
+    """
+    IDs referenced from one catalog (table) and how to check them.
+
+    - get_existing_ids: which of the IDs exist, with one query
+      (e.g. 'catalog_service.get_existing_ids')
+    - missing_message: msgid of the error, with the missing IDs as '%(IDS)s'
+    """
+
+    ids: Iterable[Any]
+    get_existing_ids: Callable[[List[Any]], Awaitable[Set[Any]]]
+    missing_message: str
+
+    def __post_init__(self) -> None:
+        # Without duplicates and empty values (e.g. an optional FK that isn't set)
+        self.ids = list(dict.fromkeys(ref_id for ref_id in self.ids if ref_id is not None))
+
+
+async def _find_missing(references: References, own_session: bool) -> Optional[str]:
+    if own_session:
+        # One AsyncSession can't run concurrent statements
+        async with session_scope():
+            existing_ids = await references.get_existing_ids(references.ids)
+    else:
+        existing_ids = await references.get_existing_ids(references.ids)
+
+    missing_ids = [ref_id for ref_id in references.ids if ref_id not in existing_ids]
+    if not missing_ids:
+        return None
+
+    return format_message(
+        references.missing_message,
+        IDS=", ".join(str(ref_id) for ref_id in missing_ids),
+    )
+
+
+async def validate_references(*references: References) -> None:
+    """
+    Check that all referenced IDs exist: one set-based query per catalog instead of
+    one lookup per ID, the catalogs are checked concurrently (each in its own session).
+    Raises NoInstanceFoundError (404) listing every missing ID of every catalog.
+
+    Example:
+        await validate_references(
+            References(
+                patient.financing_sources_ids,
+                self._financing_source_service.get_existing_ids,
+                "Financing sources with IDs: %(IDS)s were not found.",
+            ),
+            ...
+        )
+    """
+    references = [reference for reference in references if reference.ids]
+    if not references:
+        return
+
+    concurrent = len(references) > 1
+    errors = await asyncio.gather(
+        *(_find_missing(reference, own_session=concurrent) for reference in references)
+    )
+    errors = [error for error in errors if error]
+    if errors:
+        raise NoInstanceFoundError(status_code=404, detail=" ".join(errors))
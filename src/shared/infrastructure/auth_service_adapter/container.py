@@ -2,9 +2,18 @@ from dependency_injector import containers, providers
 from httpx import AsyncClient
 
 from src.core.logger import LoggerService
+from src.core.settings import project_settings
 from src.shared.infrastructure.auth_service_adapter.repositories.auth_service_repository import (
     AuthServiceRepositoryImpl,
 )
+from src.shared.infrastructure.auth_service_adapter.repositories.cached_auth_service_repository import (
+    CachedAuthServiceRepository,
+    InMemoryPermissionsCacheBackend,
+)
+from src.shared.infrastructure.auth_service_adapter.repositories.jwt_auth_service_repository import (
+    JwksCache,
+    JwtAuthServiceRepository,
+)
 
 
 class AuthServiceContainer(containers.DeclarativeContainer):
@@ -17,9 +26,44 @@ class AuthServiceContainer(containers.DeclarativeContainer):
     logger = providers.Dependency(instance_of=LoggerService)
     base_url = providers.Dependency(instance_of=str)
 
-    auth_service_repository = providers.Factory(
-        AuthServiceRepositoryImpl,
+    # Override to share the cache between replicas
+    permissions_cache_backend = providers.Singleton(
+        InMemoryPermissionsCacheBackend,
+        max_size=project_settings.AUTH_PERMISSIONS_CACHE_MAX_SIZE,
+    )
+
+    # Singleton, so concurrent requests share in-flight Auth Service requests
+    remote_auth_service_repository = providers.Singleton(
+        CachedAuthServiceRepository,
+        repository=providers.Factory(
+            AuthServiceRepositoryImpl,
+            http_client=httpx_client,
+            base_url=base_url,
+            logger=logger,
+        ),
+        backend=permissions_cache_backend,
+        ttl_seconds=project_settings.AUTH_PERMISSIONS_CACHE_TTL_SECONDS,
+    )
+
+    jwks_cache = providers.Singleton(
+        JwksCache,
         http_client=httpx_client,
-        base_url=base_url,
-        logger=logger,
+        jwks_url=project_settings.AUTH_JWKS_URL,
+        ttl_seconds=project_settings.AUTH_JWKS_CACHE_TTL_SECONDS,
+    )
+
+    auth_service_repository = providers.Selector(
+        providers.Object(
+            "local" if project_settings.AUTH_JWT_LOCAL_VERIFICATION else "remote"
+        ),
+        local=providers.Singleton(
+            JwtAuthServiceRepository,
+            fallback_repository=remote_auth_service_repository,
+            jwks_cache=jwks_cache,
+            logger=logger,
+            algorithms=project_settings.AUTH_JWT_ALGORITHMS,
+            issuer=project_settings.AUTH_JWT_ISSUER,
+            audience=project_settings.AUTH_JWT_AUDIENCE,
+        ),
+        remote=remote_auth_service_repository,
     )
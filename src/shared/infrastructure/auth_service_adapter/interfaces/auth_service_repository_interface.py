@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 class AuthServiceRepositoryInterface(ABC):
@@ -22,3 +22,33 @@ class AuthServiceRepositoryInterface(ABC):
             ]
         """
         pass
+
+
+class PermissionsCacheBackendInterface(ABC):
+    """
+    Storage for cached user permissions. The in-memory backend is per process;
+    a shared backend (e.g. Redis) lets several replicas share one cache.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        :param key: Access token hash
+        :return: Cached permissions or None if missing/expired
+        """
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, permissions: List[Dict[str, Any]], ttl_seconds: float
+    ) -> None:
+        """
+        :param key: Access token hash
+        :param permissions: Permissions to cache
+        :param ttl_seconds: Entry lifetime
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
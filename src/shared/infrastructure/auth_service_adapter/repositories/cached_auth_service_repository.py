@@ -0,0 +1,133 @@
+import asyncio
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.shared.infrastructure.auth_service_adapter.interfaces.auth_service_repository_interface import (
+    AuthServiceRepositoryInterface,
+    PermissionsCacheBackendInterface,
+)
+
+Permissions = List[Dict[str, Any]]
+
+
+def _token_expires_at(access_token: str) -> Optional[float]:
+    """
+    Reads the 'exp' claim (UNIX time) of a JWT without verifying it.
+    The token is verified by the Auth Service; the claim only limits caching.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class InMemoryPermissionsCacheBackend(PermissionsCacheBackendInterface):
+    """
+    Process-wide bounded LRU cache with per-entry expiry.
+    The least recently used entries are evicted once 'max_size' is reached.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Permissions]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Permissions]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, permissions = entry
+        if expires_at < time.time():
+            self._entries.pop(key, None)
+            return None
+
+        self._entries.move_to_end(key)
+        return permissions
+
+    async def set(self, key: str, permissions: Permissions, ttl_seconds: float) -> None:
+        self._entries[key] = (time.time() + ttl_seconds, permissions)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class CachedAuthServiceRepository(AuthServiceRepositoryInterface):
+    """
+    Caches user permissions received from the Auth Service.
+
+    - Entries are keyed by the SHA-256 of the access token (tokens aren't stored) and
+      live for 'ttl_seconds', but never longer than the token itself ('exp' claim).
+    - Concurrent misses for the same token share one Auth Service request (single-flight).
+    - Errors are never cached.
+    - 'stats' exposes hit/miss counters.
+    """
+
+    def __init__(
+        self,
+        repository: AuthServiceRepositoryInterface,
+        backend: PermissionsCacheBackendInterface,
+        ttl_seconds: float,
+    ):
+        self._repository = repository
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    def _entry_ttl_seconds(self, access_token: str) -> float:
+        expires_at = _token_expires_at(access_token)
+        if expires_at is None:
+            return self._ttl_seconds
+
+        return min(self._ttl_seconds, expires_at - time.time())
+
+    async def get_permissions(self, access_token: str) -> List[Dict[str, Any]]:
+        if self._ttl_seconds <= 0:
+            return await self._repository.get_permissions(access_token)
+
+        key = hashlib.sha256(access_token.encode()).hexdigest()
+        permissions = await self._backend.get(key)
+        if permissions is not None:
+            self._stats["hits"] += 1
+            return permissions
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(in_flight)
+
+        self._stats["misses"] += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            permissions = await self._repository.get_permissions(access_token)
+
+            ttl_seconds = self._entry_ttl_seconds(access_token)
+            if ttl_seconds > 0:
+                await self._backend.set(key, permissions, ttl_seconds)
+
+            future.set_result(permissions)
+            return permissions
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved if no one else waits for it
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import jwt
+from httpx import AsyncClient, HTTPError
+
+from src.core.i18n import _
+from src.core.logger import LoggerService
+from src.shared.exceptions import AuthServiceError
+from src.shared.infrastructure.auth_service_adapter.interfaces.auth_service_repository_interface import (
+    AuthServiceRepositoryInterface,
+)
+
+
+class JwksCache:
+    """
+    Signing keys of the identity provider (Keycloak) fetched from its JWKS endpoint.
+
+    Keys are refreshed after 'ttl_seconds' or when a token is signed with an unknown
+    key ID (key rotation), but not more often than 'min_refresh_interval_seconds',
+    so tokens with made-up key IDs can't flood the endpoint.
+    """
+
+    def __init__(
+        self,
+        http_client: AsyncClient,
+        jwks_url: str,
+        ttl_seconds: float,
+        min_refresh_interval_seconds: float = 30,
+    ):
+        self._http_client = http_client
+        self._jwks_url = jwks_url
+        self._ttl_seconds = ttl_seconds
+        self._min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def _refresh(self) -> None:
+        response = await self._http_client.get(self._jwks_url)
+        response.raise_for_status()
+
+        keys = {}
+        for jwk in response.json().get("keys", []):
+            if jwk.get("use", "sig") != "sig" or "kid" not in jwk:
+                continue
+            try:
+                keys[jwk["kid"]] = jwt.PyJWK(jwk)
+            except jwt.PyJWKError:
+                continue  # Unsupported key type/algorithm
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+    async def get_key(self, kid: str) -> Optional[jwt.PyJWK]:
+        """
+        :raises httpx.HTTPError: If the keys must be refreshed and the JWKS endpoint is unavailable
+        """
+        key = self._keys.get(kid)
+        if key is not None and time.monotonic() - self._fetched_at < self._ttl_seconds:
+            return key
+
+        async with self._lock:
+            fetched_at = self._fetched_at
+            if fetched_at is None or (
+                time.monotonic() - fetched_at >= self._min_refresh_interval_seconds
+            ):
+                try:
+                    await self._refresh()
+                except HTTPError:
+                    if key is None:
+                        raise
+                    # Keep using the known key while the endpoint is unavailable
+                    return key
+
+        return self._keys.get(kid)
+
+
+class JwtAuthServiceRepository(AuthServiceRepositoryInterface):
+    """
+    Reads user permissions from the access token itself.
+
+    The token is verified locally against the identity provider's signing keys
+    (signature, expiry, issuer and audience), and permissions are taken from its
+    'authorization.permissions' claim (Keycloak Authorization Services format:
+    '[{"rsname": ..., "scopes": [...]}]'). The Auth Service is called only if the
+    token has no such claim or the signing keys can't be fetched.
+    """
+
+    def __init__(
+        self,
+        fallback_repository: AuthServiceRepositoryInterface,
+        jwks_cache: JwksCache,
+        logger: LoggerService,
+        algorithms: Sequence[str] = ("RS256",),
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+    ):
+        self._fallback_repository = fallback_repository
+        self._jwks_cache = jwks_cache
+        self._logger = logger
+        self._algorithms = list(algorithms)
+        self._issuer = issuer or None
+        self._audience = audience or None
+
+    @staticmethod
+    def _invalid_token_error() -> AuthServiceError:
+        return AuthServiceError(
+            status_code=401,
+            detail=_("Invalid or expired access token."),
+        )
+
+    @staticmethod
+    def _permissions_from_claims(
+        claims: Dict[str, Any],
+    ) -> Optional[List[Dict[str, Any]]]:
+        permissions = (claims.get("authorization") or {}).get("permissions")
+        if not isinstance(permissions, list):
+            return None
+
+        return [
+            {
+                "resource_name": permission.get("rsname"),
+                "scopes": permission.get("scopes") or [],
+            }
+            for permission in permissions
+            if isinstance(permission, dict) and permission.get("rsname")
+        ]
+
+    async def get_permissions(self, access_token: str) -> List[Dict[str, Any]]:
+        try:
+            kid = jwt.get_unverified_header(access_token).get("kid")
+        except jwt.InvalidTokenError as exc:
+            raise self._invalid_token_error() from exc
+
+        try:
+            key = await self._jwks_cache.get_key(kid) if kid else None
+        except HTTPError as exc:
+            self._logger.warning(
+                f"JWKS is unavailable, getting permissions from the Auth Service: {exc}"
+            )
+            return await self._fallback_repository.get_permissions(access_token)
+
+        if key is None:
+            raise self._invalid_token_error()
+
+        try:
+            claims = jwt.decode(
+                access_token,
+                key=key,
+                algorithms=self._algorithms,
+                issuer=self._issuer,
+                audience=self._audience,
+                options={"verify_aud": self._audience is not None},
+            )
+        except jwt.InvalidTokenError as exc:
+            raise self._invalid_token_error() from exc
+
+        permissions = self._permissions_from_claims(claims)
+        if permissions is None:
+            return await self._fallback_repository.get_permissions(access_token)
+
+        return permissions
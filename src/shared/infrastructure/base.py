@@ -1,14 +1,24 @@
 import datetime
+import inspect
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
 
 from sqlalchemy import UUID as sqlalchemy_UUID
-from sqlalchemy import DateTime, MetaData, func, orm
+from sqlalchemy import DateTime, MetaData, func, orm, tuple_
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql import Select
 
+from src.core.database.query_metrics import track_db_operation
 from src.core.logger import LoggerService
+from src.shared.helpers.cursor_pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+)
+from src.shared.infrastructure.pagination_count import count_query_rows, invalidate_counts
+from src.shared.infrastructure.statistics import JournalStatistics, StatisticsResult
 
 
 class Base(DeclarativeBase):
@@ -53,6 +63,94 @@ class ChangedAtMixin:
 
 
 class BaseRepository:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Label SQL metrics with the public repository method, e.g. 'UserRepositoryImpl.get_by_id'
+        for name, attribute in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(attribute):
+                setattr(cls, name, track_db_operation(f"{cls.__name__}.{name}")(attribute))
+
     def __init__(self, async_db_session: AsyncSession, logger: LoggerService):
         self._async_db_session = async_db_session
         self._logger = logger
+
+    async def _get_total_count(
+        self,
+        query: Select,
+        filters: Optional[Dict[str, Any]] = None,
+        *,
+        approximate_table: Optional[str] = None,
+    ) -> int:
+        """
+        Returns the number of rows matching the given (page) query, ignoring its pagination.
+        Counts are cached for a short TTL per repository and normalized filter set.
+
+        :param query: The same filtered query that is used to fetch a page.
+        :param filters: Filters applied to the query (used as the cache key).
+        :param approximate_table: Table name to estimate the count from 'pg_class.reltuples'
+        when no filters are applied (for very large tables).
+        """
+        return await count_query_rows(
+            self._async_db_session,
+            query,
+            namespace=type(self).__name__,
+            filters=filters,
+            approximate_table=approximate_table,
+        )
+
+    def _invalidate_total_count(self) -> None:
+        """Drops the cached totals of this repository; call from methods that write its rows."""
+        invalidate_counts(self._async_db_session, type(self).__name__)
+
+    async def _get_statistics(
+        self, statistics: JournalStatistics, query: Select
+    ) -> StatisticsResult:
+        """
+        Computes journal statistics with one query.
+
+        :param statistics: Statistics description of the journal.
+        :param query: 'statistics.select()' with the journal filters applied.
+        """
+        result = await self._async_db_session.execute(query)
+        return statistics.read(result.one()._mapping)
+
+    async def _get_keyset_page(
+        self,
+        query: Select,
+        sort_key: Sequence[Any],
+        limit: int,
+        cursor: Optional[str],
+        *,
+        descending: bool = False,
+    ) -> KeysetPage:
+        """
+        Fetches one page in cursor (keyset) pagination mode.
+
+        Instead of 'OFFSET', rows are filtered by '(sort key) > (last seen sort key)'
+        (or '<' for descending order), so deep pages cost the same as the first one.
+        The last column of 'sort_key' must be unique (e.g. primary key) to make the order total.
+
+        :param query: Filtered query selecting ONE ORM entity (without ORDER BY/LIMIT/OFFSET).
+        :param sort_key: Columns to order by and build cursors from.
+        :param limit: Page size.
+        :param cursor: Cursor from the previous page; None or empty string for the first page.
+        :param descending: Order direction for all sort key columns.
+        :return: List of ORM entities with 'next_cursor' (None if there are no more rows).
+        """
+        if cursor:
+            last_seen = tuple_(*sort_key)
+            values = tuple_(*decode_cursor(cursor, len(sort_key)))
+            query = query.where(last_seen < values if descending else last_seen > values)
+
+        order_by = [column.desc() if descending else column.asc() for column in sort_key]
+        query = query.add_columns(*sort_key).order_by(*order_by).limit(limit + 1)
+
+        result = await self._async_db_session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(tuple(rows[-1][1:]))
+
+        return KeysetPage((row[0] for row in rows), next_cursor=next_cursor)
@@ -0,0 +1,171 @@
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.core.settings import project_settings
+
+CacheKey = Tuple[str, Tuple[Tuple[str, Hashable], ...]]
+
+# 'Session.info' key: namespaces to invalidate once more after the commit
+_PENDING_INVALIDATIONS = "pagination_count_invalidations"
+
+
+def _normalize_value(value: Any) -> Hashable:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (UUID, date, datetime)):
+        return str(value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_normalize_value(v) for v in value]
+        return tuple(sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items)
+    return value
+
+
+def normalize_filters(
+    filters: Optional[Dict[str, Any]],
+) -> Tuple[Tuple[str, Hashable], ...]:
+    """
+    Turns a filters dict into a hashable, order-independent representation.
+    Empty values (None, blank strings, empty collections) are dropped, so
+    '{"a": None}' and '{}' produce the same key. Strings are kept as is: some
+    filters compare them exactly, so "Foo" and "foo" may have different totals.
+    """
+    if not filters:
+        return ()
+
+    normalized = []
+    for key, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, str) and not value.strip():
+            continue
+        if isinstance(value, (list, tuple, set, frozenset, dict)) and not value:
+            continue
+        normalized.append((key, _normalize_value(value)))
+
+    return tuple(sorted(normalized))
+
+
+class PaginationCountCache:
+    """
+    Process-wide bounded TTL cache for 'total items' counts of paginated lists.
+
+    Keys are '(namespace, normalized filters)', values expire after 'ttl_seconds'.
+    The oldest entries are evicted once 'max_size' is reached.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int]]" = OrderedDict()
+
+    def get(self, key: CacheKey) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        return value
+
+    def set(self, key: CacheKey, value: int) -> None:
+        if self._ttl_seconds <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        if namespace is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == namespace]:
+            del self._entries[key]
+
+
+pagination_count_cache = PaginationCountCache(
+    ttl_seconds=project_settings.PAGINATION_COUNT_CACHE_TTL_SECONDS,
+    max_size=project_settings.PAGINATION_COUNT_CACHE_MAX_SIZE,
+)
+
+
+def invalidate_counts(session: AsyncSession, namespace: str) -> None:
+    """
+    Drops the cached totals of 'namespace' after its rows are written: right away and
+    once more after the session commits, since a concurrent request may count (and
+    cache) the rows as they were before the commit.
+    """
+    pagination_count_cache.invalidate(namespace)
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(namespace)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_counts(session: Session) -> None:
+    for namespace in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        pagination_count_cache.invalidate(namespace)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+async def count_query_rows(
+    session: AsyncSession,
+    query: Select,
+    *,
+    namespace: str,
+    filters: Optional[Dict[str, Any]] = None,
+    approximate_table: Optional[str] = None,
+) -> int:
+    """
+    Counts rows that the given (page) query would return without pagination.
+
+    - ORDER BY / LIMIT / OFFSET are stripped, so the count uses exactly the same
+      joins and WHERE predicates as the page query.
+    - Results are cached for a short TTL under '(namespace, normalized filters)'.
+    - If 'approximate_table' is given and no filters are applied, the planner's
+      estimate from 'pg_class.reltuples' is used for tables whose estimate exceeds
+      'APPROXIMATE_COUNT_THRESHOLD'; smaller (or never analyzed) tables are counted exactly.
+    """
+    cache_key: CacheKey = (namespace, normalize_filters(filters))
+    cached = pagination_count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    total: Optional[int] = None
+    if approximate_table and not cache_key[1]:
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": approximate_table},
+        )
+        estimate = result.scalar_one_or_none()
+        if estimate is not None and estimate >= project_settings.APPROXIMATE_COUNT_THRESHOLD:
+            total = int(estimate)
+
+    if total is None:
+        count_query = select(func.count()).select_from(
+            query.order_by(None).limit(None).offset(None).subquery()
+        )
+        result = await session.execute(count_query)
+        total = result.scalar_one()
+
+    pagination_count_cache.set(cache_key, total)
+
+    return total
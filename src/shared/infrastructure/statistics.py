@@ -0,0 +1,121 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.sql import Select
+
+TOTAL_LABEL = "total"
+
+
+@dataclass
+class Breakdown:
+    """
+    Row counts per value of 'expression', e.g. per member of a status enum.
+    Values missing from the data are reported as 0.
+    """
+
+    expression: ColumnElement
+    values: Iterable[Any]
+
+    def __post_init__(self) -> None:
+        self.values = tuple(self.values)
+
+
+@dataclass
+class StatisticsResult:
+    total: int
+    counts: Dict[str, int] = field(default_factory=dict)
+    breakdowns: Dict[str, Dict[Any, int]] = field(default_factory=dict)
+    aggregates: Dict[str, Any] = field(default_factory=dict)
+
+
+def _bucket_label(name: str, value: Any) -> str:
+    return f"{name}:{value.value if isinstance(value, Enum) else value}"
+
+
+class JournalStatistics:
+    """
+    Declarative description of the statistics of one journal (table).
+
+    Every flag, breakdown bucket and aggregate becomes one column of a single
+    'SELECT count(*), count(*) FILTER (WHERE ...), ...' statement, so the whole
+    statistics is one scan of the filtered rows however many buckets there are.
+
+    - flags: name -> condition, counted as 'count(*) FILTER (WHERE condition)'
+    - breakdowns: name -> Breakdown, one filtered count per value
+    - aggregates: name -> any other aggregate (e.g. 'count(DISTINCT area)'), returned as is
+
+    Example:
+        HOME_CALL_STATISTICS = JournalStatistics(
+            HomeCall,
+            breakdowns={"status": Breakdown(HomeCall.status, HomeCallStatusEnum)},
+        )
+
+        query = self._apply_filters(HOME_CALL_STATISTICS.select(), filters)
+        statistics = await self._get_statistics(HOME_CALL_STATISTICS, query)
+        statistics.breakdowns["status"][HomeCallStatusEnum.COMPLETED]
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        flags: Optional[Mapping[str, ColumnElement]] = None,
+        breakdowns: Optional[Mapping[str, Breakdown]] = None,
+        aggregates: Optional[Mapping[str, ColumnElement]] = None,
+    ):
+        self._model = model
+        self._flags = dict(flags or {})
+        self._breakdowns = dict(breakdowns or {})
+        self._aggregates = dict(aggregates or {})
+
+        # Bucket columns are labeled 'breakdown:value'; labels are stable, so they
+        # can be stored (see statistics rollups)
+        self._bucket_labels: Dict[str, Tuple[str, ...]] = {
+            name: tuple(_bucket_label(name, value) for value in breakdown.values)
+            for name, breakdown in self._breakdowns.items()
+        }
+
+    @property
+    def model(self) -> Any:
+        return self._model
+
+    def select(self) -> Select:
+        """Statistics query without filters; apply the journal filters to it."""
+        columns = [func.count().label(TOTAL_LABEL)]
+        columns.extend(
+            func.count().filter(condition).label(name)
+            for name, condition in self._flags.items()
+        )
+        for name, breakdown in self._breakdowns.items():
+            columns.extend(
+                func.count().filter(breakdown.expression == value).label(label)
+                for value, label in zip(breakdown.values, self._bucket_labels[name])
+            )
+        columns.extend(
+            aggregate.label(name) for name, aggregate in self._aggregates.items()
+        )
+
+        return select(*columns).select_from(self._model)
+
+    def read(self, values: Mapping[str, Any]) -> StatisticsResult:
+        """
+        :param values: Column label -> value, e.g. the mapping of the 'select()' result row.
+        Missing labels are read as 0 (None for aggregates).
+        """
+        counts = {name: values.get(name) or 0 for name in self._flags}
+        breakdowns = {
+            name: {
+                value: values.get(label) or 0
+                for value, label in zip(breakdown.values, self._bucket_labels[name])
+            }
+            for name, breakdown in self._breakdowns.items()
+        }
+
+        return StatisticsResult(
+            total=values.get(TOTAL_LABEL) or 0,
+            counts=counts,
+            breakdowns=breakdowns,
+            aggregates={name: values.get(name) for name in self._aggregates},
+        )
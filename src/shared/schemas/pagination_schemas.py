@@ -1,9 +1,11 @@
-from typing import Optional
+import math
+from typing import Optional, Sequence
 
 from fastapi import Query
 from pydantic import BaseModel
 
 from src.shared.exceptions import InvalidPaginationParamsError
+from src.shared.helpers.cursor_pagination import KeysetPage
 from src.shared.helpers.validation_helpers import (
     validate_pagination_limit,
     validate_pagination_page,
@@ -24,9 +26,18 @@ class PaginationParams:
             ge=1,
             description="Page number",
         ),
+        cursor: Optional[str] = Query(
+            default=None,
+            description=(
+                "Opaque cursor for keyset pagination ('next_cursor' of the previous page). "
+                "Pass an empty value to get the first page in cursor mode. "
+                "If set, 'page' is ignored."
+            ),
+        ),
     ):
         self.limit = limit
         self.page = page
+        self.cursor = cursor
 
         if self.limit:
             try:
@@ -48,3 +59,38 @@ class PaginationMetaDataSchema(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+
+
+def build_pagination_metadata(
+    pagination_params: PaginationParams,
+    total_items: int,
+    items: Sequence,
+) -> PaginationMetaDataSchema:
+    """
+    Builds pagination metadata for both 'page'/'limit' and cursor (keyset) modes.
+    In cursor mode 'has_next'/'has_prev' are derived from the cursors instead of the page number.
+    """
+    page: int = pagination_params.page or 1  # for mypy
+    limit: int = pagination_params.limit or 30  # for mypy
+    total_pages = math.ceil(total_items / limit) if limit else 1
+
+    if isinstance(items, KeysetPage):
+        return PaginationMetaDataSchema(
+            current_page=page,
+            per_page=limit,
+            total_items=total_items,
+            total_pages=total_pages,
+            has_next=items.next_cursor is not None,
+            has_prev=bool(pagination_params.cursor),
+            next_cursor=items.next_cursor,
+        )
+
+    return PaginationMetaDataSchema(
+        current_page=page,
+        per_page=limit,
+        total_items=total_items,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_prev=page > 1,
+    )
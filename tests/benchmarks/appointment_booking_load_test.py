@@ -0,0 +1,166 @@
+"""
+Load test: concurrent registrars booking the same schedule day.
+
+Every booker runs the booking critical section of 'AppointmentService.create_appointment'
+(booking lock -> overlap check -> INSERT -> commit) in its own session. Bookers compete
+for a few slots, so most of them must get 'AppointmentOverlappingError'. The test checks
+that no slot ends up booked twice and prints the latency percentiles.
+
+Needs a migrated database (DB_* settings) and an existing schedule day. Created
+appointments are deleted afterwards. Run with:
+    python -m tests.benchmarks.appointment_booking_load_test --schedule-day-id <UUID>
+
+Pass '--no-lock' to skip the advisory lock and see double bookings happen.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time as perf_time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from unittest.mock import MagicMock
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm.session import sessionmaker
+
+from src.apps.registry.domain.models.appointment import AppointmentDomain
+from src.apps.registry.domain.models.day_slot_index import DaySlotIndex
+from src.apps.registry.exceptions import AppointmentOverlappingError
+from src.apps.registry.infrastructure.db_models.models import Appointment
+from src.apps.registry.infrastructure.repositories.appointment_repository import (
+    AppointmentRepositoryImpl,
+)
+from src.apps.registry.services.appointment_service import AppointmentService
+from src.apps.registry.uow import UnitOfWorkImpl
+from src.core.settings import project_settings
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+async def _book(
+    session_factory: sessionmaker,
+    schedule_day,
+    schedule,
+    slot_time,
+    logger,
+) -> Tuple[float, bool, int | None]:
+    async with session_factory() as session:
+        uow = UnitOfWorkImpl(session=session, logger=logger)
+        service = AppointmentService(
+            uow=uow,
+            logger=logger,
+            appointment_repository=uow.appointment_repository,
+            schedule_repository=uow.schedule_repository,
+            schedule_day_repository=uow.schedule_day_repository,
+            user_service=None,
+            patients_service=None,
+            financing_sources_catalog_service=None,
+            user_repository=None,
+        )
+        appointment = AppointmentDomain(
+            schedule_day_id=schedule_day.id, time=slot_time, patient_id=None
+        )
+
+        started = perf_time.perf_counter()
+        try:
+            async with uow:
+                await service._lock_and_check_slot_is_free(
+                    schedule_day_id=schedule_day.id,
+                    schedule_day=schedule_day,
+                    schedule=schedule,
+                    new_time=slot_time,
+                )
+                created = await uow.appointment_repository.add(appointment)
+            return perf_time.perf_counter() - started, True, created.id
+        except AppointmentOverlappingError:
+            return perf_time.perf_counter() - started, False, None
+
+
+async def main(schedule_day_id: UUID, bookers: int, slots: int, use_lock: bool) -> None:
+    engine = create_async_engine(project_settings.DATABASE_URI, pool_size=bookers)
+    session_factory = sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+    logger = MagicMock()
+
+    if not use_lock:
+        async def _no_lock(self, schedule_day_id):
+            return None
+
+        AppointmentRepositoryImpl.lock_schedule_day = _no_lock
+
+    async with session_factory() as session:
+        uow = UnitOfWorkImpl(session=session, logger=logger)
+        schedule_day = await uow.schedule_day_repository.get_by_id(schedule_day_id)
+        schedule = await uow.schedule_repository.get_schedule_by_day_id(schedule_day_id)
+        if schedule_day is None or schedule is None:
+            raise SystemExit(f"Schedule day {schedule_day_id} not found.")
+
+    free_slots = DaySlotIndex.from_schedule_day(
+        schedule_day, schedule.appointment_interval
+    ).free_slots()[:slots]
+    if not free_slots:
+        raise SystemExit(f"Schedule day {schedule_day_id} has no free slots.")
+
+    # Every second booker asks for the middle of a slot, so overlapping
+    # (not only identical) times are tested too
+    half_interval = timedelta(minutes=schedule.appointment_interval // 2)
+    requested_times = []
+    for index in range(bookers):
+        start, _ = free_slots[index % len(free_slots)]
+        start_datetime = datetime.combine(schedule_day.date, start)
+        requested_times.append((start_datetime + half_interval * (index % 2)).time())
+
+    results = await asyncio.gather(
+        *(
+            _book(session_factory, schedule_day, schedule, slot_time, logger)
+            for slot_time in requested_times
+        )
+    )
+    created_ids = [appointment_id for _, booked, appointment_id in results if booked]
+
+    async with session_factory() as session:
+        occupied_times = await AppointmentRepositoryImpl(
+            session, logger
+        ).get_occupied_times_by_day_id(schedule_day_id)
+        double_bookings = sum(
+            DaySlotIndex.from_schedule_day(
+                schedule_day,
+                schedule.appointment_interval,
+                occupied_times[:index] + occupied_times[index + 1:],
+            ).is_booked(occupied_time)
+            for index, occupied_time in enumerate(occupied_times)
+        )
+
+        if created_ids:
+            await session.execute(delete(Appointment).where(Appointment.id.in_(created_ids)))
+            await session.commit()
+
+    await engine.dispose()
+
+    latencies_ms = [latency * 1000 for latency, _, _ in results]
+    print(f"bookers: {bookers}, slots: {len(free_slots)}, lock: {use_lock}")
+    print(f"booked: {len(created_ids)}, conflicts: {bookers - len(created_ids)}")
+    print(f"overlapping appointments: {double_bookings}")
+    print(
+        f"latency, ms: p50 {_percentile(latencies_ms, 50):.1f} "
+        f"p95 {_percentile(latencies_ms, 95):.1f} "
+        f"p99 {_percentile(latencies_ms, 99):.1f} "
+        f"max {max(latencies_ms):.1f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--schedule-day-id", type=UUID, required=True)
+    parser.add_argument("--bookers", type=int, default=50)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--no-lock", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.schedule_day_id, args.bookers, args.slots, not args.no_lock))
@@ -0,0 +1,100 @@
+"""
+Micro-benchmark: per-request overhead of 'LocalesTranslationMiddleware' before
+(a 'BaseHTTPMiddleware') and after (a pure ASGI middleware).
+
+Every request goes straight through the ASGI stack (no server or network) to a
+Starlette endpoint returning a JSON list; the bare app without any middleware is
+the baseline.
+
+Run with:
+    python -m tests.benchmarks.i18n_middleware_benchmark
+"""
+
+import asyncio
+import time
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.core.i18n import set_locale
+from src.core.middlewares.i18n_middleware import LocalesTranslationMiddleware
+
+REQUESTS = 5_000
+REPEATS = 5
+ITEMS = (10, 1_000)
+
+
+class LegacyLocalesTranslationMiddleware(BaseHTTPMiddleware):
+    """The previous implementation."""
+
+    async def dispatch(self, request, call_next):
+        lang = request.headers.get("accept-language", "ru")
+        set_locale(lang)
+        return await call_next(request)
+
+
+def _build_app(items: int, middleware=None) -> Starlette:
+    payload = [{"id": index, "name": f"item-{index}"} for index in range(items)]
+
+    async def endpoint(request):
+        return JSONResponse(payload)
+
+    return Starlette(
+        routes=[Route("/", endpoint)],
+        middleware=[Middleware(middleware)] if middleware else [],
+    )
+
+
+_SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"accept-language", b"kk-KZ,ru;q=0.9,en;q=0.8")],
+    "client": ("127.0.0.1", 12345),
+    "server": ("127.0.0.1", 8000),
+}
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def _measure(app: Starlette) -> float:
+    """Best time of one request, seconds."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await app(dict(_SCOPE), _receive, _send)
+        best = min(best, (time.perf_counter() - started) / REQUESTS)
+    return best
+
+
+async def main() -> None:
+    print(f"{'items':>6} {'bare, us':>10} {'before, us':>12} {'after, us':>11} "
+          f"{'overhead before, us':>21} {'overhead after, us':>20}")
+    for items in ITEMS:
+        bare = await _measure(_build_app(items))
+        before = await _measure(_build_app(items, LegacyLocalesTranslationMiddleware))
+        after = await _measure(_build_app(items, LocalesTranslationMiddleware))
+        print(
+            f"{items:>6} {bare * 1e6:>10.1f} {before * 1e6:>12.1f} {after * 1e6:>11.1f} "
+            f"{(before - bare) * 1e6:>21.1f} {(after - bare) * 1e6:>20.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,177 @@
+"""
+Micro-benchmark: 'ScheduleDaysGenerator' vs. the previous per-day generator
+(which built a validated 'CreateScheduleDaySchema' for every single day).
+
+Run with:
+    python -m tests.benchmarks.schedule_days_generator_benchmark
+"""
+
+import timeit
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    CreateScheduleDaySchema,
+    ScheduleDayTemplateSchema,
+)
+from src.apps.registry.services.schedule_days_generator import ScheduleDaysGenerator
+
+PERIODS_DAYS = (31, 92, 183, 365)
+REPEATS = 5
+NUMBER = 20
+
+
+def _to_time(val):
+    if isinstance(val, time) or val is None:
+        return val
+    if isinstance(val, str):
+        return time.fromisoformat(val)
+
+    raise ValueError(f"Unexpected time format: {val!r}")
+
+
+def legacy_generate_days(
+    schedule_id: uuid.UUID,
+    period_start: date,
+    period_end: date,
+    week_days_template: List[ScheduleDayTemplateSchema],
+    reduced_days: Optional[List[dict]] = None,
+) -> List[CreateScheduleDaySchema]:
+    """The previous 'ScheduleService._generate_days_for_schedule', kept as a baseline."""
+    default_template = {
+        "is_active": True,
+        "work_start_time": time.fromisoformat("08:00:00"),
+        "work_end_time": time.fromisoformat("17:00:00"),
+        "break_start_time": time.fromisoformat("13:00:00"),
+        "break_end_time": time.fromisoformat("14:00:00"),
+    }
+    template_by_day: Dict[int, dict] = {
+        tpl.day_of_week: tpl.model_dump() for tpl in week_days_template
+    }
+
+    reduced_by_date: Dict[date, dict] = {}
+    if reduced_days:
+        for entry in reduced_days:
+            dt = entry["date"]
+            if isinstance(dt, str):
+                dt = datetime.fromisoformat(dt).date()
+            reduced_by_date[dt] = entry
+
+    result: List[CreateScheduleDaySchema] = []
+    current_date = period_start
+
+    while current_date <= period_end:
+        dow = current_date.weekday() + 1
+        override_entry = reduced_by_date.get(current_date)
+
+        if override_entry:
+            if not override_entry.get("is_active", True):
+                template_data = default_template.copy()
+                template_data["is_active"] = False
+            else:
+                base = template_by_day.get(dow, default_template)
+                template_data = {
+                    "is_active": True,
+                    "work_start_time": override_entry.get("work_start_time")
+                    or base["work_start_time"],
+                    "work_end_time": override_entry.get("work_end_time")
+                    or base["work_end_time"],
+                    "break_start_time": override_entry.get("break_start_time")
+                    or base["break_start_time"],
+                    "break_end_time": override_entry.get("break_end_time")
+                    or base["break_end_time"],
+                }
+        else:
+            template_data = template_by_day.get(dow, default_template).copy()
+
+        work_start = _to_time(template_data.get("work_start_time"))
+        work_end = _to_time(template_data.get("work_end_time"))
+        br_start = _to_time(template_data.get("break_start_time"))
+        br_end = _to_time(template_data.get("break_end_time"))
+
+        if br_start and br_end and work_start and work_end:
+            if br_start < work_start or br_end > work_end:
+                br_start = None
+                br_end = None
+
+        result.append(
+            CreateScheduleDaySchema(
+                schedule_id=schedule_id,
+                date=current_date,
+                day_of_week=dow,
+                is_active=template_data["is_active"],
+                work_start_time=work_start,
+                work_end_time=work_end,
+                break_start_time=br_start,
+                break_end_time=br_end,
+            )
+        )
+        current_date += timedelta(days=1)
+
+    return result
+
+
+def _week_template() -> List[ScheduleDayTemplateSchema]:
+    return [
+        ScheduleDayTemplateSchema(
+            day_of_week=day_of_week,
+            is_active=day_of_week <= 5,
+            work_start_time=time(9, 0),
+            work_end_time=time(18, 0),
+            break_start_time=time(13, 0),
+            break_end_time=time(14, 0),
+        )
+        for day_of_week in range(1, 8)
+    ]
+
+
+def _reduced_days(period_start: date, period_days: int) -> List[dict]:
+    # Roughly two holidays and two shortened days per month
+    reduced = []
+    for offset in range(0, period_days, 15):
+        day = period_start + timedelta(days=offset)
+        reduced.append({"date": day.isoformat(), "is_active": False})
+        reduced.append(
+            {"date": (day + timedelta(days=1)).isoformat(), "work_end_time": "16:00:00"}
+        )
+    return reduced
+
+
+def main() -> None:
+    schedule_id = uuid.uuid4()
+    period_start = date(2025, 1, 1)
+    week_template = _week_template()
+
+    print(f"{'days':>6} {'legacy, ms':>12} {'generator, ms':>14} {'speedup':>8}")
+    for period_days in PERIODS_DAYS:
+        period_end = period_start + timedelta(days=period_days - 1)
+        reduced_days = _reduced_days(period_start, period_days)
+
+        # Both generators must produce the same days
+        generator = ScheduleDaysGenerator(week_template, reduced_days=reduced_days)
+        assert [
+            day.model_dump()
+            for day in legacy_generate_days(
+                schedule_id, period_start, period_end, week_template, reduced_days
+            )
+        ] == list(generator.generate(schedule_id, period_start, period_end))
+
+        def run_legacy():
+            legacy_generate_days(
+                schedule_id, period_start, period_end, week_template, reduced_days
+            )
+
+        def run_generator():
+            generator = ScheduleDaysGenerator(week_template, reduced_days=reduced_days)
+            list(generator.generate(schedule_id, period_start, period_end))
+
+        legacy = min(timeit.repeat(run_legacy, repeat=REPEATS, number=NUMBER)) / NUMBER
+        fast = min(timeit.repeat(run_generator, repeat=REPEATS, number=NUMBER)) / NUMBER
+        print(
+            f"{period_days:>6} {legacy * 1000:>12.3f} {fast * 1000:>14.3f} {legacy / fast:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import datetime
 import importlib
 import uuid
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from unittest.mock import AsyncMock, MagicMock
 from httpx import AsyncClient
@@ -35,6 +36,7 @@ from src.apps.catalogs.infrastructure.repositories.insurance_info_catalog_reposi
     SQLAlchemyInsuranceInfoCatalogRepositoryImpl
 from src.apps.catalogs.infrastructure.repositories.nationalities_catalog_repository import \
     SQLAlchemyNationalitiesCatalogRepositoryImpl
+from src.apps.catalogs.services.catalog_cache import catalog_cache
 from src.apps.catalogs.services.identity_documents_catalog_service import IdentityDocumentsCatalogService
 from src.apps.catalogs.services.insurance_info_catalog_service import InsuranceInfoCatalogService
 from src.apps.catalogs.services.nationalities_catalog_service import NationalitiesCatalogService
@@ -99,6 +101,7 @@ from src.apps.users.infrastructure.schemas.user_schemas import UserSchema, Attac
     DoctorTruncatedResponseSchema
 from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
 from src.core import i18n
+from src.core.database.query_detector import track_queries
 from src.core.i18n import get_locale
 from src.core.settings import project_settings
 from src.apps.users.mappers import map_user_schema_to_domain
@@ -124,11 +127,48 @@ def dummy_logger(mocker):
     return mocker.MagicMock()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fails the test if the block runs more SQL statements than 'max_count', or repeats
+    one statement shape more than 'max_repeats' times (N+1 queries):
+
+        with assert_max_queries(2, max_repeats=1):
+            await service.get_patients(...)
+    """
+
+    @contextmanager
+    def _assert_max_queries(max_count: int, max_repeats: Optional[int] = None):
+        with track_queries() as queries:
+            yield queries
+
+        statements = "\n".join(
+            f"{count} x {statement}" for statement, count in queries.statements.items()
+        )
+        assert queries.count <= max_count, (
+            f"Expected at most {max_count} queries, got {queries.count}:\n{statements}"
+        )
+        if max_repeats is not None:
+            assert not queries.repeated(max_repeats), (
+                f"Statements repeated more than {max_repeats} times:\n{statements}"
+            )
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def mock_http_client():
     return AsyncMock(spec=AsyncClient)
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    """The reference catalogs cache is process-wide; tests must not see each other's records."""
+    catalog_cache.invalidate()
+    yield
+    catalog_cache.invalidate()
+
+
 @pytest.fixture(autouse=True)
 def patch_i18n(monkeypatch):
     """
@@ -549,6 +589,7 @@ def medical_organizations_repository():
     repository = MagicMock()
 
     repository.get_by_id = AsyncMock()
+    repository.get_by_ids = AsyncMock()
     repository.get_medical_organizations = AsyncMock()
     repository.get_total_number_of_medical_organizations = AsyncMock()
     repository.get_by_default_name = AsyncMock()
@@ -0,0 +1,63 @@
+"""
+Query count budgets of the hot repository methods.
+
+These tests need a migrated PostgreSQL database ('DB_*' settings) and are skipped
+without one. Each method must stay a constant number of statements regardless of
+the number of ids it is given.
+"""
+import datetime
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.apps.registry.infrastructure.repositories.appointment_repository import (
+    AppointmentRepositoryImpl,
+)
+from src.apps.registry.infrastructure.repositories.schedule_day_repostiory import (
+    ScheduleDayRepositoryImpl,
+)
+from src.core.settings import project_settings
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(not project_settings.DB_HOST, reason="needs a PostgreSQL database"),
+]
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    async with AsyncSession(engine) as session:
+        yield session
+        await session.rollback()
+    await engine.dispose()
+
+
+async def test_cancel_booked_by_day_ids_is_one_query(db_session, dummy_logger, assert_max_queries):
+    repository = AppointmentRepositoryImpl(db_session, dummy_logger)
+
+    with assert_max_queries(1):
+        await repository.cancel_booked_by_day_ids([uuid.uuid4() for _ in range(50)])
+
+
+async def test_find_free_slots_is_one_query(db_session, dummy_logger, assert_max_queries):
+    repository = ScheduleDayRepositoryImpl(db_session, dummy_logger)
+    today = datetime.date.today()
+
+    with assert_max_queries(1):
+        await repository.find_free_slots(today, today + datetime.timedelta(days=14))
+
+
+async def test_get_by_ids_are_one_query(db_session, dummy_logger, assert_max_queries):
+    ids = [uuid.uuid4() for _ in range(50)]
+
+    with assert_max_queries(1):
+        await ScheduleDayRepositoryImpl(db_session, dummy_logger).get_by_ids(ids)
+
+    with assert_max_queries(1):
+        await SQLAlchemyPatientRepository(db_session, dummy_logger).get_by_ids(ids)
@@ -0,0 +1,61 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.database.config import ScopedAsyncSession, session_scope
+from src.core.middlewares.db_session_middleware import DBSessionScopeMiddleware
+
+
+def _session_factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(close=AsyncMock(), flush=AsyncMock()))
+
+
+@pytest.mark.asyncio
+async def test_each_scope_gets_own_session_closed_on_exit():
+    session_factory = _session_factory()
+    scoped_session = ScopedAsyncSession(session_factory)
+
+    async def use_session():
+        async with session_scope():
+            first = scoped_session._get_session()
+            await asyncio.sleep(0)
+            assert scoped_session._get_session() is first
+            return first
+
+    first, second = await asyncio.gather(use_session(), use_session())
+
+    assert first is not second
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_session_is_shared_outside_of_scope():
+    session_factory = _session_factory()
+    scoped_session = ScopedAsyncSession(session_factory)
+
+    await scoped_session.flush()
+    await scoped_session.flush()
+
+    session_factory.assert_called_once()
+    assert scoped_session._get_session().flush.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_middleware_opens_scope_per_http_request():
+    session_factory = _session_factory()
+    scoped_session = ScopedAsyncSession(session_factory)
+    used_sessions = []
+
+    async def app(scope, receive, send):
+        used_sessions.append(scoped_session._get_session())
+
+    middleware = DBSessionScopeMiddleware(app)
+    await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+    await middleware({"type": "http"}, AsyncMock(), AsyncMock())
+
+    assert len(used_sessions) == 2
+    assert used_sessions[0] is not used_sessions[1]
+    for session in used_sessions:
+        session.close.assert_awaited_once()
@@ -0,0 +1,67 @@
+import io
+
+import pytest
+from pythongettext.msgfmt import Msgfmt
+
+from src.core import i18n
+
+PO = """
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\\n"
+
+msgid "Appointment with ID: %(ID)s not found."
+msgstr "Приём с ID: %(ID)s не найден."
+
+msgid "Not translated."
+msgstr ""
+"""
+
+
+@pytest.fixture
+def ru_catalog(tmp_path, monkeypatch):
+    mo_file = tmp_path / "ru" / "LC_MESSAGES" / "messages.mo"
+    mo_file.parent.mkdir(parents=True)
+    mo_file.write_bytes(Msgfmt(io.BytesIO(PO.encode())).get())
+
+    monkeypatch.setattr(i18n, "LOCALE_DIR", tmp_path)
+    i18n.load_catalogs()
+    token = i18n._locale_ctx.set("ru")
+    yield
+    i18n._locale_ctx.reset(token)
+    monkeypatch.undo()
+    i18n.load_catalogs()
+
+
+def test_catalogs_are_loaded_for_all_languages_and_immutable(ru_catalog):
+    assert set(i18n._catalogs) == i18n.project_settings.LANGUAGES
+    assert dict(i18n._catalogs["ru"]) == {
+        "Appointment with ID: %(ID)s not found.": "Приём с ID: %(ID)s не найден."
+    }
+    with pytest.raises(TypeError):
+        i18n._catalogs["ru"]["Not translated."] = "..."
+
+
+def test_translator_falls_back_to_original_message(ru_catalog):
+    translate = i18n.get_translator()
+
+    assert translate("Appointment with ID: %(ID)s not found.") == (
+        "Приём с ID: %(ID)s не найден."
+    )
+    assert translate("Not translated.") == "Not translated."
+    assert i18n.get_translator("kk")("Not translated.") == "Not translated."
+
+
+def test_format_message_is_translated_and_memoized(ru_catalog):
+    message = "Appointment with ID: %(ID)s not found."
+
+    assert i18n.format_message(message, ID=1) == "Приём с ID: 1 не найден."
+    assert i18n.format_message(message, ID=1) == "Приём с ID: 1 не найден."
+    assert i18n._format_message.cache_info().hits == 1
+
+    i18n._locale_ctx.set("kk")
+    assert i18n.format_message(message, ID=1) == "Appointment with ID: 1 not found."
+
+
+def test_format_message_with_unhashable_params(ru_catalog):
+    assert i18n.format_message("Values: %(VALUES)s", VALUES=[1, 2]) == "Values: [1, 2]"
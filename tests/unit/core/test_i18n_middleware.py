@@ -0,0 +1,69 @@
+import pytest
+
+from src.core.i18n import _locale_ctx, get_locale
+from src.core.middlewares.i18n_middleware import (
+    LocalesTranslationMiddleware,
+    negotiate_locale,
+)
+from src.core.settings import project_settings
+
+
+@pytest.mark.parametrize(
+    "accept_language, expected",
+    [
+        (None, None),
+        ("", None),
+        ("kk", "kk"),
+        ("en-US", "en"),
+        ("kk-KZ,ru;q=0.9,en;q=0.8", "kk"),
+        ("en;q=0.5, kk;q=0.8", "kk"),
+        ("de-DE,de;q=0.9,en;q=0.1", "en"),
+        ("de,fr;q=0.5", None),
+        ("en;q=abc,kk;q=0.2", "kk"),
+        ("en, kk", "en"),
+        ("EN", "en"),
+    ],
+)
+def test_negotiate_locale(accept_language, expected):
+    assert negotiate_locale(accept_language) == (
+        expected or project_settings.DEFAULT_LANGUAGE
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_sets_locale_and_passes_messages_through():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append((scope, receive, send, get_locale()))
+
+    async def receive():
+        pass
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "headers": [(b"accept-language", b"en-GB,en;q=0.9")]}
+    token = _locale_ctx.set("ru")
+    try:
+        await LocalesTranslationMiddleware(app)(scope, receive, send)
+    finally:
+        _locale_ctx.reset(token)
+
+    assert calls == [(scope, receive, send, "en")]
+
+
+@pytest.mark.asyncio
+async def test_middleware_ignores_lifespan():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(get_locale())
+
+    token = _locale_ctx.set("kk")
+    try:
+        await LocalesTranslationMiddleware(app)({"type": "lifespan"}, None, None)
+    finally:
+        _locale_ctx.reset(token)
+
+    assert calls == ["kk"]
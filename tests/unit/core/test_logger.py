@@ -0,0 +1,108 @@
+import json
+import logging
+import threading
+import uuid
+
+import pytest
+
+from src.core.logger import LoggerService
+
+
+class _Arg:
+    """Records the thread that formats it."""
+
+    def __init__(self):
+        self.formatted_in = None
+
+    def __str__(self):
+        self.formatted_in = threading.current_thread()
+        return "arg"
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    services = []
+
+    def make(**kwargs) -> LoggerService:
+        service = LoggerService(
+            name=f"test-logger-{uuid.uuid4()}",
+            log_dir=str(tmp_path),
+            file_level=logging.DEBUG,
+            **kwargs,
+        )
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.stop()
+        for handler in service.logger.handlers:
+            handler.close()
+
+
+def _log_lines(tmp_path):
+    return (tmp_path / "registry_service.log").read_text().splitlines()
+
+
+def test_message_is_rendered_by_calling_thread(make_logger, tmp_path):
+    logger = make_logger()
+    arg = _Arg()
+    payload = {"status": "new"}
+
+    logger.info("Handled %s %s", arg, payload)
+    # Changes after the call don't leak into the queued record
+    payload["status"] = "changed"
+    logger.stop()
+
+    assert arg.formatted_in is threading.current_thread()
+    assert _log_lines(tmp_path)[-1].endswith(": Handled arg {'status': 'new'}")
+
+
+def test_exception_is_written_in_text_format(make_logger, tmp_path):
+    logger = make_logger()
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.error("Failed", exc_info=True)
+    logger.stop()
+
+    log = (tmp_path / "registry_service.log").read_text()
+    assert ": Failed" in log
+    assert "ValueError: boom" in log
+
+
+def test_disabled_level_does_not_format_message(make_logger):
+    logger = make_logger(base_level=logging.INFO)
+    arg = _Arg()
+
+    logger.debug("Handled %s", arg)
+    logger.stop()
+
+    assert arg.formatted_in is None
+
+
+def test_logs_after_stop_are_written_synchronously(make_logger, tmp_path):
+    logger = make_logger()
+    logger.stop()
+
+    logger.warning("After stop")
+
+    assert _log_lines(tmp_path)[-1].endswith(": After stop")
+
+
+def test_json_format(make_logger, tmp_path):
+    logger = make_logger(json_format=True)
+
+    try:
+        raise ValueError("boom")
+    except ValueError as err:
+        logger.error("Failed: %s", err, exc_info=True)
+    logger.stop()
+
+    record = json.loads(_log_lines(tmp_path)[0])
+    assert record["level"] == "ERROR"
+    assert record["logger"] == logger.logger.name
+    assert record["message"] == "Failed: boom"
+    assert "ValueError: boom" in record["exc_info"]
+    assert record["timestamp"]
@@ -0,0 +1,124 @@
+import httpx
+import pytest
+from fastapi import APIRouter
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.core.database.query_metrics import instrument_query_metrics, track_db_operation
+from src.core.metrics import (
+    Histogram,
+    db_query_duration,
+    http_client_request_duration,
+    http_request_duration,
+    kafka_handler_duration,
+)
+from src.core.resources.fastapi_resource import FastAPIResource
+from src.core.resources.httpx_resource import InstrumentedAsyncTransport
+from src.shared.helpers.decorators import handle_kafka_event
+
+
+def _count(histogram: Histogram, *label_values: str) -> int:
+    counts, _ = histogram._series.get(label_values, ([0], [0.0]))
+    return sum(counts)
+
+
+def test_histogram_exposition_format():
+    histogram = Histogram("test_seconds", "Test.", ("route",), buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    assert list(histogram.collect()) == [
+        "# HELP test_seconds Test.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{route="/a",le="0.1"} 1',
+        'test_seconds_bucket{route="/a",le="1.0"} 2',
+        'test_seconds_bucket{route="/a",le="+Inf"} 3',
+        'test_seconds_sum{route="/a"} 5.55',
+        'test_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_requests_are_recorded_by_route_template():
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPIResource(
+        routers=[{"router": router, "tags": ["items"]}],
+        exception_handlers=[],
+        project_name="test",
+        project_version="0.0.1",
+        api_prefix="/api/v1",
+        debug=False,
+        enable_docs=False,
+        backend_cors_origins=[],
+    )
+    before = _count(http_request_duration, "GET", "/api/v1/items/{item_id}", "200")
+
+    with TestClient(app) as client:
+        client.get("/api/v1/items/1")
+        client.get("/api/v1/items/2")
+        client.get("/api/v1/unknown")
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'route="/api/v1/items/{item_id}",status="200"' in response.text
+    assert 'route="<unmatched>",status="404"' in response.text
+    assert _count(http_request_duration, "GET", "/api/v1/items/{item_id}", "200") == before + 2
+
+
+@pytest.mark.asyncio
+async def test_queries_are_labeled_with_repository_method():
+    engine = create_engine("sqlite://")
+    instrument_query_metrics(engine)
+
+    @track_db_operation("TestRepository.get")
+    async def get():
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    @track_db_operation("TestRepository.outer")
+    async def outer():
+        await get()
+
+    await get()
+    await outer()
+
+    assert _count(db_query_duration, "TestRepository.get") == 1
+    assert _count(db_query_duration, "TestRepository.outer") == 1
+
+
+@pytest.mark.asyncio
+async def test_outbound_requests_are_recorded():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/fail":
+            raise httpx.ConnectError("unavailable", request=request)
+        return httpx.Response(201)
+
+    transport = InstrumentedAsyncTransport(httpx.MockTransport(handler))
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.post("http://auth.test/permissions")
+        with pytest.raises(httpx.ConnectError):
+            await client.get("http://auth.test/fail")
+
+    assert _count(http_client_request_duration, "auth.test", "POST", "201") == 1
+    assert _count(http_client_request_duration, "auth.test", "GET", "error") == 1
+
+
+@pytest.mark.asyncio
+async def test_kafka_handler_durations_are_recorded(dummy_logger):
+    @handle_kafka_event("create", "test_model")
+    async def handler(_raw, fail, logger):
+        if fail:
+            raise ValueError("boom")
+
+    await handler(None, False, logger=dummy_logger)
+    await handler(None, True, logger=dummy_logger)
+
+    assert _count(kafka_handler_duration, "test_model", "create", "success") == 1
+    assert _count(kafka_handler_duration, "test_model", "create", "error") == 1
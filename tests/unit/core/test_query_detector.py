@@ -0,0 +1,124 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import APIRouter
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.core.database.query_detector import normalize_sql, report_queries, track_queries
+from src.core.resources.fastapi_resource import FastAPIResource
+
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+
+def _select(engine, value) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT :value"), {"value": value})
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT users.id\n  FROM users WHERE users.id = $1::UUID LIMIT 10",
+            "SELECT users.id FROM users WHERE users.id = ?::UUID LIMIT ?",
+        ),
+        (
+            "SELECT * FROM t_1 WHERE name = 'o''k' AND id IN ($1, $2, $3)",
+            "SELECT * FROM t_1 WHERE name = ? AND id IN (?)",
+        ),
+        ("UPDATE t SET x = %(x)s WHERE id = ?", "UPDATE t SET x = ? WHERE id = ?"),
+    ],
+)
+def test_normalize_sql(statement, expected):
+    assert normalize_sql(statement) == expected
+
+
+@pytest.mark.asyncio
+async def test_statements_are_grouped_by_shape(engine):
+    async def select_in_task(value):
+        _select(engine, value)
+
+    _select(engine, 0)
+    with track_queries() as queries:
+        for value in range(3):
+            _select(engine, value)
+        await asyncio.gather(select_in_task(3), select_in_task(4))
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1, 2"))
+
+    assert queries.count == 6
+    assert queries.statements == {"SELECT ?": 5, "SELECT ?, ?": 1}
+    assert queries.repeated(4) == [("SELECT ?", 5)]
+    assert queries.repeated(5) == []
+
+
+def test_report_warns_about_repeats_and_time_budget(engine):
+    with track_queries() as queries:
+        for value in range(3):
+            _select(engine, value)
+
+    with patch("src.core.database.query_detector.logger") as logger:
+        report_queries(queries, "GET /items", repeat_threshold=2, time_budget_seconds=0)
+
+    messages = [call.args[0] % call.args[1:] for call in logger.warning.call_args_list]
+    assert messages == [
+        "Possible N+1 queries: GET /items ran the same statement 3 times: SELECT ?",
+        f"GET /items spent {queries.total_seconds * 1000:.0f} ms in 3 SQL statements (budget 0 ms)",
+    ]
+
+
+def test_middleware_reports_requests_by_route(engine):
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        for value in range(item_id):
+            _select(engine, value)
+        return {}
+
+    app = FastAPIResource(
+        routers=[{"router": router, "tags": ["items"]}],
+        exception_handlers=[],
+        project_name="test",
+        project_version="0.0.1",
+        api_prefix="/api/v1",
+        debug=False,
+        enable_docs=False,
+        backend_cors_origins=[],
+        enable_query_detector=True,
+        query_detector_repeat_threshold=3,
+        query_detector_time_budget_ms=10_000,
+    )
+
+    with patch("src.core.database.query_detector.logger") as logger, TestClient(app) as client:
+        client.get("/api/v1/items/3")
+        logger.warning.assert_not_called()
+
+        client.get("/api/v1/items/4")
+        logger.warning.assert_called_once_with(
+            "Possible N+1 queries: %s ran the same statement %s times: %s",
+            "GET /api/v1/items/{item_id}",
+            4,
+            "SELECT ?",
+        )
+
+
+def test_assert_max_queries(engine, assert_max_queries):
+    with assert_max_queries(2, max_repeats=2):
+        _select(engine, 1)
+        _select(engine, 2)
+
+    with pytest.raises(AssertionError, match="Expected at most 1 queries, got 2"):
+        with assert_max_queries(1):
+            _select(engine, 1)
+            _select(engine, 2)
+
+    with pytest.raises(AssertionError, match="repeated more than 1 times"):
+        with assert_max_queries(10, max_repeats=1):
+            _select(engine, 1)
+            _select(engine, 2)
@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.exceptions import NoInstanceFoundError
+from src.shared.helpers.reference_validation import References, validate_references
+
+
+def _existing(*ids):
+    return AsyncMock(return_value=set(ids))
+
+
+@pytest.mark.asyncio
+async def test_each_catalog_is_checked_once_with_unique_ids():
+    citizenships = _existing(1)
+    financing_sources = _existing(1, 2)
+
+    await validate_references(
+        References([1], citizenships, "Citizenship with ID: %(IDS)s was not found."),
+        References(
+            [2, 1, 2, None],
+            financing_sources,
+            "Financing sources with IDs: %(IDS)s were not found.",
+        ),
+    )
+
+    citizenships.assert_awaited_once_with([1])
+    financing_sources.assert_awaited_once_with([2, 1])
+
+
+@pytest.mark.asyncio
+async def test_catalogs_without_ids_are_not_queried():
+    get_existing_ids = _existing()
+
+    await validate_references(
+        References([None], get_existing_ids, "Citizenship with ID: %(IDS)s was not found."),
+        References([], get_existing_ids, "Financing sources with IDs: %(IDS)s were not found."),
+    )
+
+    get_existing_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_all_missing_ids_are_reported_at_once():
+    with pytest.raises(NoInstanceFoundError) as ei:
+        await validate_references(
+            References([5], _existing(), "Citizenship with ID: %(IDS)s was not found."),
+            References(
+                [1, 2, 3],
+                _existing(2),
+                "Financing sources with IDs: %(IDS)s were not found.",
+            ),
+        )
+
+    assert ei.value.status_code == 404
+    assert ei.value.detail == (
+        "Citizenship with ID: 5 was not found. "
+        "Financing sources with IDs: 1, 3 were not found."
+    )
+
+
+@pytest.mark.asyncio
+async def test_catalogs_are_checked_concurrently():
+    started = []
+    both_started = asyncio.Event()
+
+    async def get_existing_ids(ids):
+        started.append(ids)
+        if len(started) == 2:
+            both_started.set()
+        # Deadlocks if the second check only starts after the first one is done
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return set(ids)
+
+    await validate_references(
+        References([1], get_existing_ids, "Citizenship with ID: %(IDS)s was not found."),
+        References([2], get_existing_ids, "Nationality with ID: %(IDS)s was not found."),
+    )
+
+    assert sorted(started) == [[1], [2]]
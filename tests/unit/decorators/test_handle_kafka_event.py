@@ -25,7 +25,8 @@ async def test_handle_kafka_event_success(dummy_logger):
 
     result = await handler(None, dummy_schema, logger=dummy_logger)
     assert result == 'result'
-    dummy_logger.info.assert_called_with(
+    message, *args = dummy_logger.info.call_args.args
+    assert message % tuple(args) == (
         "Successfully handled 'create' type event for model: 'dummy_model'. Record with ID: 42 processed."
     )
 
@@ -39,7 +40,8 @@ async def test_handle_kafka_event_success_without_schema(dummy_logger):
     result = await handler(None, "no_schema_obj", logger=dummy_logger)
 
     assert result == "ok"
-    dummy_logger.info.assert_called_with(
+    message, *args = dummy_logger.info.call_args.args
+    assert message % tuple(args) == (
         "Successfully handled 'update' type event for model: 'dummy_model'."
     )
     
@@ -237,3 +237,78 @@ async def test_get_appointments_no_filters(mocker):
 
     mock_async_db_session.execute.assert_awaited_once()
     assert results == []
+
+
+def test_build_filters_includes_patient_and_doctor_filters(dummy_logger) -> None:
+    repository = AppointmentRepositoryImpl(MagicMock(), dummy_logger)
+
+    conditions = repository._build_filters(
+        {
+            "patient_iin_filter": "040806501543",
+            "patient_full_name_filter": "Ivanov",
+            "attached_area_number_filter": 3,
+            "doctor_id_filter": uuid.uuid4(),
+            "doctor_specialization_filter": "Cardiology",
+            "period_start": None,
+        }
+    )
+
+    assert len(conditions) == 5
+
+
+def test_apply_filter_joins_only_joins_referenced_tables(dummy_logger) -> None:
+    repository = AppointmentRepositoryImpl(MagicMock(), dummy_logger)
+    base_stmt = MagicMock()
+    base_stmt.join.return_value = base_stmt
+
+    repository._apply_filter_joins(base_stmt, {"appointment_status_filter": "booked"})
+    assert base_stmt.join.call_count == 0
+
+    repository._apply_filter_joins(base_stmt, {"patient_iin_filter": "040806501543"})
+    assert base_stmt.join.call_count == 1
+
+    base_stmt.join.reset_mock()
+    repository._apply_filter_joins(base_stmt, {"doctor_specialization_filter": "Cardiology"})
+    assert base_stmt.join.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_booked_by_day_ids_uses_single_update(mock_async_db_session, dummy_logger) -> None:
+    fake_result = MagicMock()
+    fake_result.scalars.return_value.all.return_value = [1, 2]
+    mock_async_db_session.execute.return_value = fake_result
+    day_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    cancelled_ids = await repository.cancel_booked_by_day_ids(day_ids)
+
+    assert cancelled_ids == [1, 2]
+    mock_async_db_session.execute.assert_awaited_once()
+    compiled = str(mock_async_db_session.execute.await_args.args[0])
+    assert compiled.startswith("UPDATE appointments SET status=")
+    assert "cancelled_at=now()" in compiled
+    assert "RETURNING appointments.id" in compiled
+
+
+@pytest.mark.asyncio
+async def test_cancel_booked_by_day_ids_without_days_skips_query(mock_async_db_session, dummy_logger) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+
+    assert await repository.cancel_booked_by_day_ids([]) == []
+    mock_async_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lock_schedule_day_takes_transaction_advisory_lock(mock_async_db_session, dummy_logger) -> None:
+    schedule_day_id = uuid.uuid4()
+
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    await repository.lock_schedule_day(schedule_day_id)
+
+    mock_async_db_session.execute.assert_awaited_once()
+    statement = mock_async_db_session.execute.await_args.args[0]
+    compiled = statement.compile()
+    assert "pg_advisory_xact_lock(" in str(compiled)
+    assert "hashtext(" in str(compiled)
+    assert str(schedule_day_id) not in str(compiled)
+    assert schedule_day_id in compiled.params.values()
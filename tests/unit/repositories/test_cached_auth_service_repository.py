@@ -0,0 +1,103 @@
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.shared.exceptions import AuthServiceConnectionError
+from src.shared.infrastructure.auth_service_adapter.repositories.cached_auth_service_repository import (
+    CachedAuthServiceRepository,
+    InMemoryPermissionsCacheBackend,
+)
+
+PERMISSIONS = [{"resource_name": "schedules", "scopes": ["read"]}]
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def _repository(auth_repo, ttl_seconds=60, max_size=100):
+    return CachedAuthServiceRepository(
+        repository=auth_repo,
+        backend=InMemoryPermissionsCacheBackend(max_size=max_size),
+        ttl_seconds=ttl_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_second_call_is_served_from_cache():
+    auth_repo = AsyncMock()
+    auth_repo.get_permissions.return_value = PERMISSIONS
+    repo = _repository(auth_repo)
+
+    assert await repo.get_permissions("token") == PERMISSIONS
+    assert await repo.get_permissions("token") == PERMISSIONS
+
+    auth_repo.get_permissions.assert_awaited_once_with("token")
+    assert repo.stats == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request():
+    release = asyncio.Event()
+
+    async def slow_get_permissions(token):
+        await release.wait()
+        return PERMISSIONS
+
+    auth_repo = AsyncMock()
+    auth_repo.get_permissions.side_effect = slow_get_permissions
+    repo = _repository(auth_repo)
+
+    tasks = [asyncio.create_task(repo.get_permissions("token")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [PERMISSIONS] * 5
+    auth_repo.get_permissions.assert_awaited_once()
+    assert repo.stats == {"hits": 0, "misses": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached():
+    auth_repo = AsyncMock()
+    auth_repo.get_permissions.side_effect = [
+        AuthServiceConnectionError(status_code=503, detail="down"),
+        PERMISSIONS,
+    ]
+    repo = _repository(auth_repo)
+
+    with pytest.raises(AuthServiceConnectionError):
+        await repo.get_permissions("token")
+    assert await repo.get_permissions("token") == PERMISSIONS
+    assert auth_repo.get_permissions.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_not_cached():
+    auth_repo = AsyncMock()
+    auth_repo.get_permissions.return_value = PERMISSIONS
+    repo = _repository(auth_repo)
+    expired_token = _jwt(time.time() - 1)
+
+    await repo.get_permissions(expired_token)
+    await repo.get_permissions(expired_token)
+
+    assert auth_repo.get_permissions.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_backend_evicts_least_recently_used_entries():
+    backend = InMemoryPermissionsCacheBackend(max_size=2)
+    await backend.set("a", PERMISSIONS, 60)
+    await backend.set("b", PERMISSIONS, 60)
+    await backend.get("a")
+    await backend.set("c", PERMISSIONS, 60)
+
+    assert await backend.get("a") == PERMISSIONS
+    assert await backend.get("b") is None
+    assert await backend.get("c") == PERMISSIONS
@@ -0,0 +1,98 @@
+import datetime
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.apps.registry.infrastructure.db_models.models import Appointment
+from src.shared.exceptions import InvalidPaginationParamsError
+from src.shared.helpers.cursor_pagination import (
+    KeysetPage,
+    decode_cursor,
+    encode_cursor,
+)
+from src.shared.infrastructure.base import BaseRepository
+from src.shared.schemas.pagination_schemas import build_pagination_metadata
+from tests.fixtures import mock_async_db_session
+
+
+def test_cursor_roundtrip_keeps_value_types():
+    values = (
+        datetime.date(2025, 5, 1),
+        datetime.time(9, 30),
+        datetime.datetime(2025, 5, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        uuid.uuid4(),
+        7,
+    )
+
+    assert decode_cursor(encode_cursor(values), key_length=len(values)) == values
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor((1, 2))])
+def test_decode_cursor_rejects_malformed_cursor(cursor):
+    with pytest.raises(InvalidPaginationParamsError) as exc_info:
+        decode_cursor(cursor, key_length=3)
+
+    assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_keyset_page_fetches_one_extra_row(mock_async_db_session, dummy_logger):
+    first_id, second_id, third_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    day = datetime.date(2025, 5, 1)
+    fake_result = MagicMock()
+    fake_result.all.return_value = [
+        ("first", day, first_id),
+        ("second", day, second_id),
+        ("third", day, third_id),
+    ]
+    mock_async_db_session.execute.return_value = fake_result
+
+    repository = BaseRepository(mock_async_db_session, dummy_logger)
+    page = await repository._get_keyset_page(
+        select(Appointment),
+        sort_key=(Appointment.created_at, Appointment.id),
+        limit=2,
+        cursor=encode_cursor((day, first_id)),
+    )
+
+    assert page == ["first", "second"]
+    assert decode_cursor(page.next_cursor, key_length=2) == (day, second_id)
+
+    statement = mock_async_db_session.execute.await_args.args[0]
+    compiled = str(statement)
+    assert "OFFSET" not in compiled
+    assert "(appointments.created_at, appointments.id) >" in compiled
+
+
+@pytest.mark.asyncio
+async def test_get_keyset_page_last_page_has_no_cursor(mock_async_db_session, dummy_logger):
+    fake_result = MagicMock()
+    fake_result.all.return_value = [("only", datetime.date(2025, 5, 1), uuid.uuid4())]
+    mock_async_db_session.execute.return_value = fake_result
+
+    repository = BaseRepository(mock_async_db_session, dummy_logger)
+    page = await repository._get_keyset_page(
+        select(Appointment),
+        sort_key=(Appointment.created_at, Appointment.id),
+        limit=2,
+        cursor="",
+        descending=True,
+    )
+
+    assert page == ["only"]
+    assert page.next_cursor is None
+
+
+def test_build_pagination_metadata_for_keyset_page():
+    pagination_params = MagicMock(page=1, limit=2, cursor="abc")
+
+    metadata = build_pagination_metadata(
+        pagination_params, 10, KeysetPage(["a", "b"], next_cursor="next")
+    )
+
+    assert metadata.next_cursor == "next"
+    assert metadata.has_next is True
+    assert metadata.has_prev is True
+    assert metadata.total_items == 10
@@ -0,0 +1,105 @@
+import enum
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Boolean, Column, Enum, Integer, MetaData, String, Table, create_engine, distinct, func
+from sqlalchemy.dialects import postgresql
+
+from src.apps.assets_journal.domain.enums import HomeCallStatusEnum
+from src.apps.assets_journal.infrastructure.repositories.home_call_repository import (
+    HOME_CALL_STATISTICS,
+    HomeCallRepositoryImpl,
+)
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
+
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("color", Enum(Color)),
+    Column("is_done", Boolean),
+    Column("area", String),
+)
+
+ITEM_STATISTICS = JournalStatistics(
+    items,
+    flags={"done": items.c.is_done.is_(True)},
+    breakdowns={"color": Breakdown(items.c.color, Color)},
+    aggregates={"areas": func.count(distinct(items.c.area))},
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            items.insert(),
+            [
+                {"color": Color.RED, "is_done": True, "area": "1"},
+                {"color": Color.RED, "is_done": False, "area": "1"},
+                {"color": Color.GREEN, "is_done": True, "area": "2"},
+                {"color": Color.GREEN, "is_done": False, "area": "3"},
+            ],
+        )
+    return engine
+
+
+def test_statistics_are_computed_in_one_statement(engine):
+    with engine.connect() as connection:
+        row = connection.execute(ITEM_STATISTICS.select()).one()
+
+    statistics = ITEM_STATISTICS.read(row._mapping)
+
+    assert statistics.total == 4
+    assert statistics.counts == {"done": 2}
+    assert statistics.breakdowns == {"color": {Color.RED: 2, Color.GREEN: 2, Color.BLUE: 0}}
+    assert statistics.aggregates == {"areas": 3}
+
+
+def test_filters_apply_to_every_bucket(engine):
+    query = ITEM_STATISTICS.select().where(items.c.color == Color.RED)
+    with engine.connect() as connection:
+        statistics = ITEM_STATISTICS.read(connection.execute(query).one()._mapping)
+
+    assert statistics.total == 2
+    assert statistics.counts == {"done": 1}
+    assert statistics.breakdowns["color"] == {Color.RED: 2, Color.GREEN: 0, Color.BLUE: 0}
+
+
+def test_statistics_use_aggregate_filter_clause():
+    sql = str(ITEM_STATISTICS.select().compile(dialect=postgresql.dialect()))
+
+    assert sql.count("count(*) FILTER (WHERE") == 4
+    assert sql.count("FROM items") == 1
+
+
+@pytest.mark.asyncio
+async def test_home_call_statistics_is_one_query(mock_async_db_session, dummy_logger):
+    values = {column.key: 0 for column in HOME_CALL_STATISTICS.select().selected_columns}
+    values.update(
+        {"total": 7, "status:completed": 3, "category:emergency": 1, "source:egov": 2, "call_type:pediatric": 4}
+    )
+    fake_result = MagicMock()
+    fake_result.one.return_value = MagicMock(_mapping=values)
+    mock_async_db_session.execute.return_value = fake_result
+
+    repository = HomeCallRepositoryImpl(mock_async_db_session, dummy_logger)
+    statistics = await repository.get_statistics({"status": HomeCallStatusEnum.COMPLETED})
+
+    mock_async_db_session.execute.assert_awaited_once()
+    assert statistics.total_calls == 7
+    assert statistics.completed_calls == 3
+    assert statistics.registered_calls == 0
+    assert statistics.emergency_calls == 1
+    assert statistics.egov_calls == 2
+    assert statistics.pediatric_calls == 4
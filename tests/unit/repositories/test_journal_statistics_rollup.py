@@ -0,0 +1,282 @@
+import datetime
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import Column, Date, DateTime, Integer, String, Uuid, create_engine, select
+from sqlalchemy import event as sa_event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Session, lazyload
+from sqlalchemy.sql.elements import Cast
+
+# Все модели (связи между приложениями), как в CLI пересчета
+import src.cli.rebuild_journal_rollups  # noqa: F401
+
+from src.apps.assets_journal.domain.enums import SickLeaveStatusEnum
+from src.apps.assets_journal.infrastructure.repositories.sick_leave_repository import (
+    SICK_LEAVE_ROLLUP,
+    SickLeaveRepositoryImpl,
+)
+from src.apps.assets_journal.infrastructure.db_models.statistics_rollup_models import (
+    JournalStatisticsRollup,
+)
+from src.apps.assets_journal.infrastructure.repositories import statistics_rollup
+from src.apps.assets_journal.infrastructure.repositories.statistics_rollup import (
+    DAY_LABEL,
+    ORGANIZATION_LABEL,
+    _PARTIAL_DAY,
+    JournalRollup,
+    _whole_day,
+    rollup_rows,
+)
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.core.settings import project_settings
+from src.shared.infrastructure.statistics import Breakdown, JournalStatistics
+
+MIDNIGHT = datetime.datetime(2026, 10, 1)
+END_OF_DAY = datetime.datetime(2026, 10, 31, 23, 59, 59)
+
+
+@pytest.fixture
+def rollups_enabled(monkeypatch):
+    monkeypatch.setattr(project_settings, "JOURNAL_STATISTICS_ROLLUPS_READ_ENABLED", True)
+
+
+def test_whole_day_boundaries():
+    assert _whole_day(None, end_of_day=False) is None
+    assert _whole_day(MIDNIGHT, end_of_day=False) == datetime.date(2026, 10, 1)
+    assert _whole_day(END_OF_DAY, end_of_day=True) == datetime.date(2026, 10, 31)
+    assert _whole_day(MIDNIGHT.replace(hour=10), end_of_day=False) is _PARTIAL_DAY
+    assert _whole_day(END_OF_DAY.replace(hour=12), end_of_day=True) is _PARTIAL_DAY
+
+    # Полночь UTC+5 - не граница дня UTC
+    local_midnight = MIDNIGHT.replace(tzinfo=datetime.timezone(datetime.timedelta(hours=5)))
+    assert _whole_day(local_midnight, end_of_day=False) is _PARTIAL_DAY
+
+
+def test_rollup_rows_skip_zero_metrics_and_apply_sign():
+    day = datetime.date(2026, 10, 1)
+    contributions = [{ORGANIZATION_LABEL: 7, DAY_LABEL: day, "total": 3, "status:open": 0}]
+
+    assert rollup_rows("sick_leave", contributions, sign=-1) == [
+        {"journal": "sick_leave", "organization_id": 7, "day": day, "metric": "total", "value": -3}
+    ]
+
+
+def test_contributions_are_grouped_by_organization_and_day():
+    sql = str(SICK_LEAVE_ROLLUP.contributions_query().compile(dialect=postgresql.dialect()))
+
+    assert "LEFT OUTER JOIN patients" in sql
+    assert "GROUP BY coalesce" in sql
+    assert sql.count("count(*) FILTER (WHERE") > 0
+
+
+@pytest.mark.asyncio
+async def test_read_is_disabled_by_default(mock_async_db_session):
+    assert await SICK_LEAVE_ROLLUP.read(mock_async_db_session, {}) is None
+    mock_async_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"status": SickLeaveStatusEnum.OPEN},
+        {"receive_date_from": MIDNIGHT.replace(hour=10)},
+        {"receive_date_to": MIDNIGHT},
+    ],
+)
+async def test_read_skips_filters_not_covered_by_rollups(mock_async_db_session, rollups_enabled, filters):
+    assert await SICK_LEAVE_ROLLUP.read(mock_async_db_session, filters) is None
+    mock_async_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_sums_stored_metrics(mock_async_db_session, rollups_enabled):
+    fake_result = MagicMock()
+    fake_result.all.return_value = [("total", 5), ("status:open", 2), ("duration_days_sum", 12)]
+    mock_async_db_session.execute.return_value = fake_result
+
+    statistics = await SICK_LEAVE_ROLLUP.read(
+        mock_async_db_session,
+        {"organization_id": 7, "receive_date_from": MIDNIGHT, "receive_date_to": END_OF_DAY},
+    )
+
+    sql = str(mock_async_db_session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "FROM journal_statistics_rollups" in sql
+    assert statistics.total == 5
+    assert statistics.breakdowns["status"][SickLeaveStatusEnum.OPEN] == 2
+    assert statistics.breakdowns["status"][SickLeaveStatusEnum.CLOSED] == 0
+    assert statistics.aggregates == {"duration_days_sum": 12, "with_end_date": None}
+
+
+@pytest.mark.asyncio
+async def test_repository_falls_back_to_journal_scan(mock_async_db_session, dummy_logger):
+    fake_result = MagicMock()
+    fake_result.one.return_value = MagicMock(_mapping={"total": 4, "with_end_date": 2, "duration_days_sum": 9})
+    mock_async_db_session.execute.return_value = fake_result
+
+    repository = SickLeaveRepositoryImpl(mock_async_db_session, dummy_logger)
+    statistics = await repository.get_statistics({"organization_id": 7})
+
+    mock_async_db_session.execute.assert_awaited_once()
+    assert statistics.total_sick_leaves == 4
+    assert statistics.average_duration_days == 4.5
+
+
+# Поддержка агрегатов при записи: flush в SQLite с тестовым журналом
+
+class _TestBase(DeclarativeBase):
+    pass
+
+
+class _Visit(_TestBase):
+    __tablename__ = "rollup_test_visits"
+
+    id = Column(Integer, primary_key=True)
+    patient_id = Column(Uuid)
+    status = Column(String)
+    visit_date = Column(DateTime)
+
+
+@compiles(Cast, "sqlite")
+def _sqlite_cast(element, compiler, **kw):
+    # CAST(... AS DATE) в SQLite дает число
+    if isinstance(element.type, Date):
+        return f"DATE({compiler.process(element.clause, **kw)})"
+    return compiler.visit_cast(element, **kw)
+
+
+@pytest.fixture
+def visit_rollup(monkeypatch):
+    # Только тестовый журнал: таблиц остальных журналов в SQLite нет
+    monkeypatch.setattr(statistics_rollup, "_rollups", {})
+    return JournalRollup(
+        "test_visits",
+        JournalStatistics(_Visit, breakdowns={"status": Breakdown(_Visit.status, ("open", "closed"))}),
+        day=_Visit.visit_date,
+        date_filters=("date_from", "date_to"),
+    )
+
+
+@pytest.fixture
+def session(visit_rollup):
+    engine = create_engine("sqlite://")
+
+    @sa_event.listens_for(engine, "connect")
+    def _register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function("timezone", 2, lambda zone, value: value)
+
+    _TestBase.metadata.create_all(engine)
+    JournalStatisticsRollup.__table__.create(engine)
+    columns = ", ".join(column.name for column in SQLAlchemyPatient.__table__.columns)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"CREATE TABLE patients ({columns})")
+
+    with Session(engine) as session:
+        yield session
+
+
+def _add_patient(session, clinic_id):
+    patient_id = uuid.uuid4()
+    session.execute(
+        SQLAlchemyPatient.__table__.insert().values(
+            id=patient_id, iin="000000000000", attachment_data={"attached_clinic_id": clinic_id}
+        )
+    )
+    return patient_id
+
+
+def _counts(session):
+    rows = session.execute(
+        select(
+            JournalStatisticsRollup.organization_id,
+            JournalStatisticsRollup.day,
+            JournalStatisticsRollup.metric,
+            JournalStatisticsRollup.value,
+        ).where(JournalStatisticsRollup.value != 0)
+    )
+    return {(org, day.day, metric): value for org, day, metric, value in rows}
+
+
+def test_insert_adds_contributions(session):
+    patient_id = _add_patient(session, 7)
+    session.add_all(
+        [
+            _Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9)),
+            _Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 15)),
+        ]
+    )
+    session.flush()
+
+    assert _counts(session) == {(7, 1, "total"): 2, (7, 1, "status:open"): 2}
+
+
+def test_update_moves_contributions(session):
+    first_patient_id = _add_patient(session, 7)
+    second_patient_id = _add_patient(session, 8)
+    visit = _Visit(patient_id=first_patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9))
+    session.add(visit)
+    session.flush()
+
+    visit.status = "closed"
+    session.flush()
+    assert _counts(session) == {(7, 1, "total"): 1, (7, 1, "status:closed"): 1}
+
+    visit.visit_date = datetime.datetime(2026, 10, 2, 9)
+    session.flush()
+    assert _counts(session) == {(7, 2, "total"): 1, (7, 2, "status:closed"): 1}
+
+    # Другой пациент - другая организация
+    visit.patient_id = second_patient_id
+    session.flush()
+    assert _counts(session) == {(8, 2, "total"): 1, (8, 2, "status:closed"): 1}
+
+
+def test_delete_subtracts_contributions(session):
+    patient_id = _add_patient(session, 7)
+    visits = [
+        _Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9)),
+        _Visit(patient_id=patient_id, status="closed", visit_date=datetime.datetime(2026, 10, 1, 9)),
+    ]
+    session.add_all(visits)
+    session.flush()
+
+    session.delete(visits[0])
+    session.flush()
+
+    assert _counts(session) == {(7, 1, "total"): 1, (7, 1, "status:closed"): 1}
+
+
+def test_patient_attachment_change_rekeys_contributions(session):
+    patient_id = _add_patient(session, 7)
+    session.add(_Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9)))
+    session.flush()
+
+    patient = session.get(SQLAlchemyPatient, patient_id, options=[lazyload("*")])
+    patient.attachment_data = {"attached_clinic_id": 9}
+    session.flush()
+
+    assert _counts(session) == {(9, 1, "total"): 1, (9, 1, "status:open"): 1}
+
+
+def test_rows_are_maintained_while_reads_are_disabled(session):
+    assert not project_settings.JOURNAL_STATISTICS_ROLLUPS_READ_ENABLED
+    patient_id = _add_patient(session, 7)
+    session.add(_Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9)))
+    session.flush()
+
+    assert _counts(session) == {(7, 1, "total"): 1, (7, 1, "status:open"): 1}
+
+
+def test_rows_are_not_maintained_when_disabled(session, monkeypatch):
+    monkeypatch.setattr(project_settings, "JOURNAL_STATISTICS_ROLLUPS_MAINTAINED", False)
+    patient_id = _add_patient(session, 7)
+    session.add(_Visit(patient_id=patient_id, status="open", visit_date=datetime.datetime(2026, 10, 1, 9)))
+
+    with patch.object(JournalRollup, "apply_changes") as apply_changes:
+        session.flush()
+
+    apply_changes.assert_not_called()
+    assert _counts(session) == {}
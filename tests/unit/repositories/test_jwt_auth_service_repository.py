@@ -0,0 +1,123 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from httpx import ConnectError, Request, Response
+
+from src.shared.exceptions import AuthServiceError
+from src.shared.infrastructure.auth_service_adapter.repositories.jwt_auth_service_repository import (
+    JwksCache,
+    JwtAuthServiceRepository,
+)
+
+JWKS_URL = "https://keycloak/realms/orkendeu/protocol/openid-connect/certs"
+ISSUER = "https://keycloak/realms/orkendeu"
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def http_client(signing_key):
+    jwk = jwt.algorithms.RSAAlgorithm.to_jwk(signing_key.public_key(), as_dict=True)
+    jwk.update({"kid": "key-1", "use": "sig", "alg": "RS256"})
+
+    client = MagicMock()
+    client.get = AsyncMock(
+        return_value=Response(200, json={"keys": [jwk]}, request=Request("GET", JWKS_URL))
+    )
+    return client
+
+
+@pytest.fixture
+def fallback_repository():
+    repository = MagicMock()
+    repository.get_permissions = AsyncMock(return_value=[{"resource_name": "remote"}])
+    return repository
+
+
+@pytest.fixture
+def repository(http_client, fallback_repository, dummy_logger):
+    return JwtAuthServiceRepository(
+        fallback_repository=fallback_repository,
+        jwks_cache=JwksCache(http_client, JWKS_URL, ttl_seconds=600),
+        logger=dummy_logger,
+        issuer=ISSUER,
+    )
+
+
+def _token(signing_key, kid="key-1", **claims) -> str:
+    payload = {"iss": ISSUER, "exp": time.time() + 300}
+    payload.update(claims)
+    return jwt.encode(payload, signing_key, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.mark.asyncio
+async def test_permissions_are_read_from_verified_token(
+    repository, signing_key, http_client, fallback_repository
+):
+    token = _token(
+        signing_key,
+        authorization={"permissions": [{"rsname": "schedules", "scopes": ["read"]}]},
+    )
+
+    for _ in range(3):
+        permissions = await repository.get_permissions(token)
+
+    assert permissions == [{"resource_name": "schedules", "scopes": ["read"]}]
+    http_client.get.assert_awaited_once_with(JWKS_URL)
+    fallback_repository.get_permissions.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_token_without_permissions_claim_falls_back_to_auth_service(
+    repository, signing_key, fallback_repository
+):
+    token = _token(signing_key)
+
+    assert await repository.get_permissions(token) == [{"resource_name": "remote"}]
+    fallback_repository.get_permissions.assert_awaited_once_with(token)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": time.time() - 60},
+        {"iss": "https://someone-else"},
+    ],
+)
+async def test_invalid_token_is_rejected(repository, signing_key, fallback_repository, claims):
+    token = _token(signing_key, **claims)
+
+    with pytest.raises(AuthServiceError) as exc:
+        await repository.get_permissions(token)
+
+    assert exc.value.status_code == 401
+    fallback_repository.get_permissions.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_token_signed_by_unknown_key_is_rejected(repository):
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    with pytest.raises(AuthServiceError) as exc:
+        await repository.get_permissions(_token(other_key))
+    assert exc.value.status_code == 401
+
+    with pytest.raises(AuthServiceError):
+        await repository.get_permissions(_token(other_key, kid="unknown-key"))
+
+
+@pytest.mark.asyncio
+async def test_unavailable_jwks_falls_back_to_auth_service(
+    repository, signing_key, http_client, fallback_repository
+):
+    http_client.get.side_effect = ConnectError("down")
+    token = _token(signing_key)
+
+    assert await repository.get_permissions(token) == [{"resource_name": "remote"}]
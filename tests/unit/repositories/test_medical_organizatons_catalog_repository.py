@@ -224,6 +224,77 @@ async def test_get_by_id_not_found(mock_async_db_session, dummy_logger):
     mock_async_db_session.execute.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_is_one_query(mock_async_db_session, dummy_logger):
+    rec1 = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
+    rec2 = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
+    scalars = MagicMock(all=MagicMock(return_value=[rec1, rec2]))
+    mock_async_db_session.execute = AsyncMock(
+        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
+    )
+    repo = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
+        mock_async_db_session, dummy_logger
+    )
+
+    with patch.object(
+        MedicalOrganizationCatalogFullResponseSchema,
+        "model_validate",
+        side_effect=lambda obj: obj
+    ):
+        result = await repo.get_by_ids([1, 2, 2])
+
+    assert result == [rec1, rec2]
+    mock_async_db_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_all(mock_async_db_session, dummy_logger):
+    rec = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
+    scalars = MagicMock(all=MagicMock(return_value=[rec]))
+    mock_async_db_session.execute = AsyncMock(
+        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
+    )
+    repo = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
+        mock_async_db_session, dummy_logger
+    )
+
+    with patch.object(
+        MedicalOrganizationCatalogFullResponseSchema,
+        "model_validate",
+        return_value="FOUND"
+    ):
+        assert await repo.get_all() == ["FOUND"]
+
+    mock_async_db_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_empty_skips_query(mock_async_db_session, dummy_logger):
+    mock_async_db_session.execute = AsyncMock()
+    repo = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
+        mock_async_db_session, dummy_logger
+    )
+
+    assert await repo.get_by_ids([]) == []
+    mock_async_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_existing_ids_is_one_query(mock_async_db_session, dummy_logger):
+    scalars = MagicMock(all=MagicMock(return_value=[1, 3]))
+    mock_async_db_session.execute = AsyncMock(
+        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
+    )
+    repo = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
+        mock_async_db_session, dummy_logger
+    )
+
+    assert await repo.get_existing_ids([1, 2, 3]) == {1, 3}
+    mock_async_db_session.execute.assert_awaited_once()
+    assert await repo.get_existing_ids([]) == set()
+    mock_async_db_session.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_get_medical_organizations_filters(mock_async_db_session, dummy_logger):
     rec1 = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
@@ -0,0 +1,130 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from src.apps.registry.infrastructure.db_models.models import Appointment
+from src.shared.infrastructure import pagination_count
+from src.shared.infrastructure.pagination_count import (
+    PaginationCountCache,
+    count_query_rows,
+    invalidate_counts,
+    normalize_filters,
+)
+
+
+@pytest.fixture
+def fresh_count_cache(monkeypatch):
+    cache = PaginationCountCache(ttl_seconds=60, max_size=2)
+    monkeypatch.setattr(pagination_count, "pagination_count_cache", cache)
+    return cache
+
+
+def test_normalize_filters_ignores_order_and_empty_values():
+    first = normalize_filters({"b": "Ivan", "a": 1, "c": None, "d": [], "e": " "})
+    second = normalize_filters({"a": 1, "b": "Ivan"})
+
+    assert first == second
+    assert normalize_filters(None) == normalize_filters({"x": None}) == ()
+
+
+def test_cache_evicts_oldest_entry():
+    cache = PaginationCountCache(ttl_seconds=60, max_size=2)
+    cache.set(("repo", ()), 1)
+    cache.set(("repo", (("a", 1),)), 2)
+    cache.set(("repo", (("a", 2),)), 3)
+
+    assert cache.get(("repo", ())) is None
+    assert cache.get(("repo", (("a", 2),))) == 3
+
+
+def test_cache_invalidate_namespace():
+    cache = PaginationCountCache(ttl_seconds=60, max_size=10)
+    cache.set(("first", ()), 1)
+    cache.set(("second", ()), 2)
+
+    cache.invalidate("first")
+
+    assert cache.get(("first", ())) is None
+    assert cache.get(("second", ())) == 2
+
+
+def test_invalidate_counts_drops_totals_again_after_commit(fresh_count_cache):
+    session = Session(create_engine("sqlite://"))
+    session.execute(text("SELECT 1"))
+    fresh_count_cache.set(("repo", ()), 1)
+
+    invalidate_counts(session, "repo")
+    assert fresh_count_cache.get(("repo", ())) is None
+
+    # A concurrent request counted the rows before the commit
+    fresh_count_cache.set(("repo", ()), 1)
+    session.commit()
+
+    assert fresh_count_cache.get(("repo", ())) is None
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_count_query_rows_is_cached_per_filters(fresh_count_cache):
+    fake_result = MagicMock()
+    fake_result.scalar_one.return_value = 42
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=fake_result)
+    query = select(Appointment.id)
+
+    first = await count_query_rows(session, query, namespace="repo", filters={"a": 1})
+    second = await count_query_rows(session, query, namespace="repo", filters={"a": 1, "b": None})
+
+    assert first == second == 42
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_count_query_rows_keeps_case_different_filters_apart(fresh_count_cache):
+    session = MagicMock()
+    session.execute = AsyncMock(
+        side_effect=[MagicMock(scalar_one=MagicMock(return_value=total)) for total in (3, 1)]
+    )
+    query = select(Appointment.id)
+
+    upper = await count_query_rows(session, query, namespace="repo", filters={"name_filter": "Foo"})
+    lower = await count_query_rows(session, query, namespace="repo", filters={"name_filter": "foo"})
+
+    assert (upper, lower) == (3, 1)
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_count_query_rows_uses_estimate_for_large_unfiltered_tables(fresh_count_cache, monkeypatch):
+    monkeypatch.setattr(pagination_count.project_settings, "APPROXIMATE_COUNT_THRESHOLD", 1000)
+    estimate_result = MagicMock()
+    estimate_result.scalar_one_or_none.return_value = 5000
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=estimate_result)
+
+    total = await count_query_rows(
+        session, select(Appointment.id), namespace="repo", approximate_table="appointments"
+    )
+
+    assert total == 5000
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_count_query_rows_falls_back_to_exact_count_for_small_tables(fresh_count_cache, monkeypatch):
+    monkeypatch.setattr(pagination_count.project_settings, "APPROXIMATE_COUNT_THRESHOLD", 1000)
+    estimate_result = MagicMock()
+    estimate_result.scalar_one_or_none.return_value = 10
+    count_result = MagicMock()
+    count_result.scalar_one.return_value = 12
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=[estimate_result, count_result])
+
+    total = await count_query_rows(
+        session, select(Appointment.id), namespace="repo", approximate_table="appointments"
+    )
+
+    assert total == 12
+    assert session.execute.await_count == 2
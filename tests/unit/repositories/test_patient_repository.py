@@ -71,6 +71,34 @@ async def test_get_by_iin_not_found(
     mock_async_db_session.execute.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_uses_single_query(
+        mock_async_db_session,
+        dummy_db_patient,
+        dummy_domain_patient,
+        mock_patient_repository_impl
+):
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = [dummy_db_patient, dummy_db_patient]
+    mock_async_db_session.execute.return_value = result_mock
+
+    result = await mock_patient_repository_impl.get_by_ids({uuid4(), uuid4()})
+
+    assert result == [dummy_domain_patient, dummy_domain_patient]
+    mock_async_db_session.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_empty(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    result = await mock_patient_repository_impl.get_by_ids(set())
+
+    assert result == []
+    mock_async_db_session.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_patients_without_filters_and_pagination_params(
         mock_async_db_session,
@@ -0,0 +1,135 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    CreateScheduleDaySchema,
+)
+from src.apps.registry.infrastructure.db_models.models import ScheduleDay
+from src.apps.registry.infrastructure.repositories.schedule_day_repostiory import (
+    ScheduleDayRepositoryImpl,
+)
+from src.shared.helpers.cursor_pagination import encode_cursor
+from tests.fixtures import mock_async_db_session
+
+
+def _create_day_schema(schedule_id: uuid.UUID, day: datetime.date) -> CreateScheduleDaySchema:
+    return CreateScheduleDaySchema(
+        schedule_id=schedule_id,
+        day_of_week=day.isoweekday(),
+        is_active=True,
+        work_start_time=datetime.time(8, 0),
+        work_end_time=datetime.time(17, 0),
+        break_start_time=datetime.time(13, 0),
+        break_end_time=datetime.time(14, 0),
+        date=day,
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_inserts_all_days_with_one_statement(mock_async_db_session, dummy_logger):
+    schedule_id = uuid.uuid4()
+    first_day = datetime.date(2025, 5, 5)
+    schemas = [
+        _create_day_schema(schedule_id, first_day + datetime.timedelta(days=offset))
+        for offset in range(3)
+    ]
+    db_days = [ScheduleDay(id=uuid.uuid4(), **schema.model_dump()) for schema in schemas]
+
+    fake_result = MagicMock()
+    fake_result.all.return_value = db_days
+    mock_async_db_session.scalars = AsyncMock(return_value=fake_result)
+
+    repository = ScheduleDayRepositoryImpl(mock_async_db_session, dummy_logger)
+    created = await repository.bulk_add(schemas)
+
+    assert [day.id for day in created] == [day.id for day in db_days]
+    assert [day.date for day in created] == [schema.date for schema in schemas]
+
+    mock_async_db_session.scalars.assert_awaited_once()
+    statement, rows = mock_async_db_session.scalars.await_args.args
+    compiled = str(statement)
+    assert compiled.startswith("INSERT INTO schedule_days")
+    assert "RETURNING" in compiled
+    assert rows == [schema.model_dump() for schema in schemas]
+    mock_async_db_session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_with_no_days_skips_query(mock_async_db_session, dummy_logger):
+    mock_async_db_session.scalars = AsyncMock()
+
+    repository = ScheduleDayRepositoryImpl(mock_async_db_session, dummy_logger)
+    created = await repository.bulk_add([])
+
+    assert created == []
+    mock_async_db_session.scalars.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_free_slots_uses_one_set_returning_query(mock_async_db_session, dummy_logger):
+    doctor_id, schedule_id, day_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    day = datetime.date(2025, 5, 5)
+    slot_bounds = [datetime.time(9, 0), datetime.time(9, 30), datetime.time(10, 0)]
+    rows = [
+        (
+            doctor_id,
+            schedule_id,
+            day_id,
+            day,
+            datetime.datetime.combine(day, start),
+            datetime.datetime.combine(day, end),
+        )
+        for start, end in zip(slot_bounds, slot_bounds[1:])
+    ]
+    fake_result = MagicMock()
+    fake_result.all.return_value = rows
+    mock_async_db_session.execute = AsyncMock(return_value=fake_result)
+
+    repository = ScheduleDayRepositoryImpl(mock_async_db_session, dummy_logger)
+    free_slots = await repository.find_free_slots(
+        date_from=day,
+        date_to=day + datetime.timedelta(days=30),
+        limit=1,
+        doctor_specialization="Therapist",
+    )
+
+    assert len(free_slots) == 1
+    assert free_slots[0].doctor_id == doctor_id
+    assert free_slots[0].schedule_day_id == day_id
+    assert free_slots[0].start_time == datetime.time(9, 0)
+    assert free_slots[0].end_time == datetime.time(9, 30)
+    assert free_slots.next_cursor == encode_cursor((rows[0][4], day_id))
+
+    mock_async_db_session.execute.assert_awaited_once()
+    statement = mock_async_db_session.execute.await_args.args[0]
+    compiled = str(statement.compile(dialect=postgresql.dialect()))
+    assert "generate_series" in compiled
+    assert "NOT (EXISTS (SELECT appointments.id" in compiled
+    assert "jsonb_array_elements(users.specializations)" in compiled
+    assert compiled.rstrip().endswith("ORDER BY slot_start, schedule_days.id \n LIMIT %(param_1)s")
+
+
+@pytest.mark.asyncio
+async def test_find_free_slots_continues_after_cursor(mock_async_db_session, dummy_logger):
+    fake_result = MagicMock()
+    fake_result.all.return_value = []
+    mock_async_db_session.execute = AsyncMock(return_value=fake_result)
+    cursor = encode_cursor((datetime.datetime(2025, 5, 5, 9, 0), uuid.uuid4()))
+
+    repository = ScheduleDayRepositoryImpl(mock_async_db_session, dummy_logger)
+    free_slots = await repository.find_free_slots(
+        date_from=datetime.date(2025, 5, 5),
+        date_to=datetime.date(2025, 5, 6),
+        cursor=cursor,
+    )
+
+    assert free_slots == []
+    assert free_slots.next_cursor is None
+    statement = mock_async_db_session.execute.await_args.args[0]
+    compiled = str(statement.compile(dialect=postgresql.dialect()))
+    assert "(slot_start, schedule_days.id) > (" in compiled
+    assert "JOIN users" not in compiled
@@ -39,6 +39,32 @@ async def test_get_by_id_found(mock_async_db_session, dummy_db_user, dummy_user_
     assert result.id == dummy_user_domain.id
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_found(mock_async_db_session, dummy_db_user, dummy_user_domain, dummy_logger):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+    fake_result = MagicMock()
+    fake_result.scalars.return_value.all.return_value = [dummy_db_user]
+    mock_async_db_session.execute.return_value = fake_result
+
+    with patch(
+            "src.apps.users.infrastructure.repositories.user_repository.map_user_db_entity_to_domain",
+            return_value=dummy_user_domain
+    ):
+        result = await repo.get_by_ids([dummy_user_domain.id])
+
+    assert result == [dummy_user_domain]
+    mock_async_db_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_empty(mock_async_db_session, dummy_logger):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+
+    result = await repo.get_by_ids([])
+    assert result == []
+    mock_async_db_session.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_get_by_iin_not_found(mock_async_db_session, dummy_logger):
     repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
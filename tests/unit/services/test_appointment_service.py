@@ -0,0 +1,117 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.registry.exceptions import AppointmentOverlappingError
+from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    ResponseScheduleDaySchema,
+)
+from src.apps.registry.services.appointment_service import AppointmentService
+
+
+@pytest.fixture
+def uow_appointment_repository():
+    repository = MagicMock()
+    repository.lock_schedule_day = AsyncMock()
+    repository.get_occupied_times_by_day_id = AsyncMock(return_value=[])
+    return repository
+
+
+@pytest.fixture
+def appointment_service(uow_appointment_repository, dummy_logger):
+    uow = MagicMock()
+    uow.appointment_repository = uow_appointment_repository
+    return AppointmentService(
+        uow=uow,
+        logger=dummy_logger,
+        appointment_repository=MagicMock(),
+        schedule_repository=MagicMock(),
+        schedule_day_repository=MagicMock(),
+        user_service=MagicMock(),
+        patients_service=MagicMock(),
+        financing_sources_catalog_service=MagicMock(),
+        user_repository=MagicMock(),
+    )
+
+
+def _schedule_day() -> ResponseScheduleDaySchema:
+    return ResponseScheduleDaySchema(
+        id=uuid.uuid4(),
+        schedule_id=uuid.uuid4(),
+        day_of_week=1,
+        is_active=True,
+        work_start_time=datetime.time(9, 0),
+        work_end_time=datetime.time(18, 0),
+        date=datetime.date(2025, 5, 5),
+    )
+
+
+@pytest.mark.asyncio
+async def test_lock_and_check_slot_locks_day_before_reading_appointments(
+    appointment_service, uow_appointment_repository
+):
+    schedule_day = _schedule_day()
+    calls = MagicMock()
+    calls.attach_mock(uow_appointment_repository.lock_schedule_day, "lock")
+    calls.attach_mock(uow_appointment_repository.get_occupied_times_by_day_id, "read")
+
+    await appointment_service._lock_and_check_slot_is_free(
+        schedule_day_id=schedule_day.id,
+        schedule_day=schedule_day,
+        schedule=MagicMock(appointment_interval=30),
+        new_time=datetime.time(10, 0),
+        current_appointment_id=7,
+    )
+
+    assert [call[0] for call in calls.mock_calls] == ["lock", "read"]
+    uow_appointment_repository.lock_schedule_day.assert_awaited_once_with(schedule_day.id)
+    uow_appointment_repository.get_occupied_times_by_day_id.assert_awaited_once_with(
+        schedule_day.id, exclude_appointment_id=7
+    )
+
+
+@pytest.mark.asyncio
+async def test_lock_and_check_slot_raises_on_overlapping_appointment(
+    appointment_service, uow_appointment_repository
+):
+    schedule_day = _schedule_day()
+    uow_appointment_repository.get_occupied_times_by_day_id.return_value = [
+        datetime.time(9, 45)
+    ]
+
+    with pytest.raises(AppointmentOverlappingError) as exc_info:
+        await appointment_service._lock_and_check_slot_is_free(
+            schedule_day_id=schedule_day.id,
+            schedule_day=schedule_day,
+            schedule=MagicMock(appointment_interval=30),
+            new_time=datetime.time(10, 0),
+        )
+
+    assert exc_info.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_validate_financing_sources_checks_additional_services_in_one_query(
+    appointment_service,
+):
+    catalog_service = appointment_service._financing_sources_catalog_service
+    catalog_service.get_existing_ids = AsyncMock(return_value={1, 2})
+
+    await appointment_service._validate_financing_sources(
+        [1, 2],
+        [MagicMock(financing_source_id=2), MagicMock(financing_source_id=1)],
+    )
+
+    catalog_service.get_existing_ids.assert_awaited_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_validate_financing_sources_without_ids_makes_no_query(appointment_service):
+    catalog_service = appointment_service._financing_sources_catalog_service
+    catalog_service.get_existing_ids = AsyncMock()
+
+    await appointment_service._validate_financing_sources(None, [])
+
+    catalog_service.get_existing_ids.assert_not_awaited()
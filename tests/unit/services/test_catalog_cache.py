@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.catalogs.services.catalog_cache import (
+    CITIZENSHIP_CATALOG,
+    DIAGNOSES_CATALOG,
+    CatalogCache,
+)
+
+
+def _record(record_id, code=None):
+    return SimpleNamespace(id=record_id, diagnosis_code=code)
+
+
+@pytest.fixture
+def cache():
+    return CatalogCache(ttl_seconds=60, code_fields={DIAGNOSES_CATALOG: "diagnosis_code"})
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_reads_through_once(cache):
+    load = AsyncMock(return_value=_record(1))
+
+    first = await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load)
+    second = await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load)
+
+    assert first is second
+    load.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_missing_records_are_not_cached(cache):
+    load = AsyncMock(return_value=None)
+
+    assert await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load) is None
+    assert await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load) is None
+    assert load.await_count == 2
+
+
+def test_invalidate_drops_only_the_record(cache):
+    cache.set(CITIZENSHIP_CATALOG, _record(1))
+    cache.set(CITIZENSHIP_CATALOG, _record(2))
+
+    cache.invalidate(CITIZENSHIP_CATALOG, 1)
+
+    assert cache.get(CITIZENSHIP_CATALOG, 1) is None
+    assert cache.get(CITIZENSHIP_CATALOG, 2) is not None
+
+
+@pytest.mark.asyncio
+async def test_get_by_code_rechecks_moved_codes(cache):
+    cache.set(DIAGNOSES_CATALOG, _record(1, "A00"))
+    load = AsyncMock(return_value=_record(2, "A00"))
+
+    assert (await cache.get_by_code(DIAGNOSES_CATALOG, "A00", load)).id == 1
+    load.assert_not_awaited()
+
+    # The code moved to another record: the old one was updated (and invalidated)
+    cache.invalidate(DIAGNOSES_CATALOG, 1)
+    cache.set(DIAGNOSES_CATALOG, _record(1, "A01"))
+
+    assert (await cache.get_by_code(DIAGNOSES_CATALOG, "A00", load)).id == 2
+    load.assert_awaited_once_with("A00")
+
+
+@pytest.mark.asyncio
+async def test_get_many_loads_only_missing_records(cache):
+    cache.set(CITIZENSHIP_CATALOG, _record(1))
+    load_many = AsyncMock(return_value=[_record(2)])
+
+    records = await cache.get_many(CITIZENSHIP_CATALOG, [1, 2, 3], load_many)
+
+    assert set(records) == {1, 2}
+    assert sorted(load_many.await_args.args[0]) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_preload_skips_failing_catalogs(cache):
+    logger = MagicMock()
+    await cache.preload(
+        {
+            CITIZENSHIP_CATALOG: AsyncMock(return_value=[_record(1), _record(2)]),
+            DIAGNOSES_CATALOG: AsyncMock(side_effect=ConnectionError("DB is down")),
+        },
+        logger,
+    )
+
+    assert cache.get(CITIZENSHIP_CATALOG, 2) is not None
+    logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_reads_through():
+    cache = CatalogCache(ttl_seconds=0)
+    load = AsyncMock(return_value=_record(1))
+
+    await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load)
+    await cache.get_by_id(CITIZENSHIP_CATALOG, 1, load)
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_existing_ids_checks_only_uncached_ids(cache):
+    cache.set(CITIZENSHIP_CATALOG, _record(1))
+    load_existing_ids = AsyncMock(return_value={2})
+
+    existing = await cache.get_existing_ids(CITIZENSHIP_CATALOG, [1, 2, 3, 2], load_existing_ids)
+
+    assert existing == {1, 2}
+    assert sorted(load_existing_ids.await_args.args[0]) == [2, 3]
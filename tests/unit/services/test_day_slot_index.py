@@ -0,0 +1,105 @@
+import uuid
+from datetime import time
+
+from src.apps.registry.domain.models.day_slot_index import DaySlotIndex
+from src.apps.registry.services.day_slot_index_cache import DaySlotIndexCache
+
+
+def _slot_index(*occupied_times: time) -> DaySlotIndex:
+    return DaySlotIndex(
+        work_start_time=time(9, 0),
+        work_end_time=time(12, 0),
+        break_start_time=time(10, 0),
+        break_end_time=time(10, 30),
+        appointment_interval=30,
+        occupied_times=occupied_times,
+    )
+
+
+def test_is_booked_checks_neighbour_appointments():
+    slot_index = _slot_index(time(9, 0), time(11, 0))
+
+    assert slot_index.is_booked(time(9, 0))
+    assert slot_index.is_booked(time(9, 15))  # overlaps the previous appointment
+    assert slot_index.is_booked(time(10, 45))  # overlaps the next appointment
+    assert not slot_index.is_booked(time(9, 30))
+    assert not slot_index.is_booked(time(11, 30))
+
+
+def test_is_free_respects_working_hours_and_break():
+    slot_index = _slot_index()
+
+    assert slot_index.is_free(time(9, 30))
+    assert not slot_index.is_free(time(8, 30))  # before working hours
+    assert not slot_index.is_free(time(11, 45))  # ends after working hours
+    assert not slot_index.is_free(time(9, 45))  # overlaps the break
+
+
+def test_free_slots_skip_break_and_booked_slots():
+    slot_index = _slot_index(time(9, 30))
+
+    assert slot_index.free_slots() == [
+        (time(9, 0), time(9, 30)),
+        (time(10, 30), time(11, 0)),
+        (time(11, 0), time(11, 30)),
+        (time(11, 30), time(12, 0)),
+    ]
+
+
+def test_occupy_and_release_keep_index_current():
+    slot_index = _slot_index()
+
+    slot_index.occupy(time(11, 0))
+    assert not slot_index.is_free(time(11, 0))
+
+    slot_index.release(time(11, 0))
+    assert slot_index.is_free(time(11, 0))
+
+
+def test_cache_updates_only_cached_days():
+    cache = DaySlotIndexCache(ttl_seconds=60, max_size=10)
+    cached_day_id, other_day_id = uuid.uuid4(), uuid.uuid4()
+    slot_index = _slot_index()
+    cache.set(cached_day_id, slot_index, cache.current_version())
+
+    cache.occupy(cached_day_id, time(9, 0))
+    cache.occupy(other_day_id, time(9, 0))
+
+    assert slot_index.is_booked(time(9, 0))
+    assert cache.get(other_day_id) is None
+
+    cache.invalidate([cached_day_id])
+    assert cache.get(cached_day_id) is None
+
+
+def test_cache_drops_index_built_before_a_concurrent_change():
+    cache = DaySlotIndexCache(ttl_seconds=60, max_size=10)
+    day_id = uuid.uuid4()
+
+    # Free slots request reads the appointments, then a booking of the day commits
+    version = cache.current_version()
+    cache.occupy(day_id, time(9, 0))
+    cache.set(day_id, _slot_index(), version)
+
+    assert cache.get(day_id) is None
+
+    cache.set(day_id, _slot_index(time(9, 0)), cache.current_version())
+    assert cache.get(day_id).is_booked(time(9, 0))
+
+
+def test_cache_keeps_index_when_other_days_change():
+    cache = DaySlotIndexCache(ttl_seconds=60, max_size=1)
+    day_id = uuid.uuid4()
+
+    version = cache.current_version()
+    cache.release(uuid.uuid4(), time(9, 0))
+    cache.set(day_id, _slot_index(), version)
+    assert cache.get(day_id) is not None
+
+    # The changes of more days than 'max_size' aren't tracked separately
+    version = cache.current_version()
+    cache.release(uuid.uuid4(), time(9, 0))
+    cache.release(uuid.uuid4(), time(9, 0))
+    cache.invalidate([day_id])
+    cache.set(day_id, _slot_index(), version)
+    assert cache.get(day_id) is None
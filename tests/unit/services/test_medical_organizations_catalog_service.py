@@ -53,6 +53,42 @@ async def test_get_by_id_partial_translated(monkeypatch, medical_organizations_s
     assert partial.address == full_medorg.address_locales["ru"]
 
 
+@pytest.mark.asyncio
+async def test_get_by_ids_returns_dict_by_id(monkeypatch, medical_organizations_service, medical_organizations_repository, full_medorg):
+    monkeypatch.setattr(
+        "src.apps.catalogs.services.medical_organizations_catalog_service.get_locale",
+        lambda: "ru",
+    )
+    medical_organizations_repository.get_by_ids.return_value = [full_medorg]
+
+    out = await medical_organizations_service.get_by_ids({7, 8})
+
+    medical_organizations_repository.get_by_ids.assert_awaited_once()
+    assert sorted(medical_organizations_repository.get_by_ids.await_args.args[0]) == [7, 8]
+    assert list(out) == [7]
+    assert isinstance(out[7], MedicalOrganizationCatalogPartialResponseSchema)
+    assert out[7].name == full_medorg.name_locales["ru"]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_served_from_cache(medical_organizations_service, medical_organizations_repository, full_medorg):
+    medical_organizations_repository.get_by_id.return_value = full_medorg
+
+    await medical_organizations_service.get_by_id(7)
+    out = await medical_organizations_service.get_by_ids([7], include_all_locales=True)
+
+    medical_organizations_repository.get_by_id.assert_awaited_once_with(7)
+    medical_organizations_repository.get_by_ids.assert_not_awaited()
+    assert out == {7: full_medorg}
+
+
+@pytest.mark.asyncio
+async def test_get_by_ids_full_returned(medical_organizations_service, medical_organizations_repository, full_medorg):
+    medical_organizations_repository.get_by_ids.return_value = [full_medorg]
+    out = await medical_organizations_service.get_by_ids([7], include_all_locales=True)
+    assert out == {7: full_medorg}
+
+
 @pytest.mark.asyncio
 async def test_get_medical_organizations_pagination_partial(medical_organizations_service, medical_organizations_repository, full_medorg):
     medical_organizations_repository.get_medical_organizations.return_value = [full_medorg, full_medorg]
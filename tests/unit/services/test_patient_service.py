@@ -48,7 +48,7 @@ async def test_get_by_iin_not_found(patient_service, mock_patient_repository):
 @pytest.mark.asyncio
 async def test_get_patients_calls_repository(patient_service, mock_patient_repository):
     filters = MagicMock(to_dict=lambda **kw: {"iin": "111"})
-    pagination = MagicMock(page=5, limit=50)
+    pagination = MagicMock(page=5, limit=50, cursor=None)
 
     expected_patients = [dummy := object()]
     expected_total = 123
@@ -61,18 +61,19 @@ async def test_get_patients_calls_repository(patient_service, mock_patient_repos
     assert patients == expected_patients
     assert total == expected_total
 
-    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with()
+    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with({"iin": "111"})
     mock_patient_repository.get_patients.assert_awaited_once_with(
         filters={"iin": "111"},
         page=5,
         limit=50,
+        cursor=None,
     )
 
 
 @pytest.mark.asyncio
 async def test_get_patients_returns_patients_and_total(patient_service, mock_patient_repository):
     filters = MagicMock(to_dict=lambda **kw: {"iin": "123"})
-    pagination = MagicMock(page=2, limit=10)
+    pagination = MagicMock(page=2, limit=10, cursor=None)
     fake_patients = [object(), object()]
     mock_patient_repository.get_patients.return_value = fake_patients
     mock_patient_repository.get_total_number_of_patients.return_value = 22
@@ -82,15 +83,15 @@ async def test_get_patients_returns_patients_and_total(patient_service, mock_pat
     assert result_patients == fake_patients
     assert total == 22
     mock_patient_repository.get_patients.assert_awaited_once_with(
-        filters={"iin": "123"}, page=2, limit=10
+        filters={"iin": "123"}, page=2, limit=10, cursor=None
     )
-    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with()
+    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with({"iin": "123"})
 
 
 @pytest.mark.asyncio
 async def test_get_patients_none_filters(patient_service, mock_patient_repository):
     filters = MagicMock(to_dict=lambda **kw: {})
-    pagination = MagicMock(page=1, limit=10)
+    pagination = MagicMock(page=1, limit=10, cursor=None)
     mock_patient_repository.get_patients.return_value = []
     mock_patient_repository.get_total_number_of_patients.return_value = 0
 
@@ -106,7 +107,7 @@ async def test_get_patients_none_filters(patient_service, mock_patient_repositor
 @pytest.mark.asyncio
 async def test_get_patients_returns_empty_and_total(patient_service, mock_patient_repository):
     filters = MagicMock(to_dict=lambda **kw: {'iin': '123'})
-    pagination = MagicMock(page=1, limit=10)
+    pagination = MagicMock(page=1, limit=10, cursor=None)
     mock_patient_repository.get_patients.return_value = []
     mock_patient_repository.get_total_number_of_patients.return_value = 0
 
@@ -115,18 +116,27 @@ async def test_get_patients_returns_empty_and_total(patient_service, mock_patien
     assert result_patients == []
     assert total == 0
     mock_patient_repository.get_patients.assert_awaited_once_with(
-        filters={'iin': '123'}, page=1, limit=10
+        filters={'iin': '123'}, page=1, limit=10, cursor=None
     )
-    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with()
+    mock_patient_repository.get_total_number_of_patients.assert_awaited_once_with({'iin': '123'})
+
+
+def _all_references_exist(patient_service):
+    for svc in (
+            patient_service._citizenship_service,
+            patient_service._nationalities_service,
+            patient_service._medical_org_service,
+            patient_service._financing_source_service,
+            patient_service._patient_context_attributes_service,
+    ):
+        svc.get_existing_ids.side_effect = lambda ids: set(ids)
 
 
 @pytest.mark.asyncio
 async def test_create_patient_success(patient_service, mock_patient_repository, mock_uow, dummy_domain_patient):
     mock_patient_repository.get_by_iin.return_value = None
-    for svc in patient_service._citizenship_service, patient_service._nationalities_service, patient_service._medical_org_service:
-        svc.get_by_id.return_value = object()
-    for svc in patient_service._financing_source_service, patient_service._patient_context_attributes_service:
-        svc.get_by_id.return_value = object()
+    dummy_domain_patient.financing_sources_ids = [1, 2, 1]
+    _all_references_exist(patient_service)
 
     created = object()
     mock_uow.patients_repository.create_patient.return_value = created
@@ -134,12 +144,35 @@ async def test_create_patient_success(patient_service, mock_patient_repository,
     result = await patient_service.create_patient(dummy_domain_patient)
 
     mock_patient_repository.get_by_iin.assert_awaited_once_with(dummy_domain_patient.iin)
-    patient_service._citizenship_service.get_by_id.assert_awaited_once_with(dummy_domain_patient.citizenship_id)
+    patient_service._citizenship_service.get_existing_ids.assert_awaited_once_with(
+        [dummy_domain_patient.citizenship_id]
+    )
+    patient_service._financing_source_service.get_existing_ids.assert_awaited_once_with([1, 2])
 
     mock_uow.patients_repository.create_patient.assert_awaited_once_with(dummy_domain_patient)
     assert result is created
 
 
+@pytest.mark.asyncio
+async def test_create_patient_reports_all_missing_references(
+    patient_service, mock_patient_repository, mock_uow, dummy_domain_patient
+):
+    mock_patient_repository.get_by_iin.return_value = None
+    dummy_domain_patient.citizenship_id = 5
+    dummy_domain_patient.financing_sources_ids = [1, 2, 3]
+    _all_references_exist(patient_service)
+    patient_service._citizenship_service.get_existing_ids.side_effect = lambda ids: set()
+    patient_service._financing_source_service.get_existing_ids.side_effect = lambda ids: {2}
+
+    with pytest.raises(NoInstanceFoundError) as ei:
+        await patient_service.create_patient(dummy_domain_patient)
+
+    assert ei.value.status_code == 404
+    assert "Citizenship with ID: 5 was not found." in ei.value.detail
+    assert "Financing sources with IDs: 1, 3 were not found." in ei.value.detail
+    mock_uow.patients_repository.create_patient.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_create_patient_duplicate_iin(patient_service, mock_patient_repository, dummy_domain_patient):
     mock_patient_repository.get_by_iin.return_value = dummy_domain_patient
@@ -170,17 +203,7 @@ async def test_update_patient_success(patient_service, mock_uow, dummy_domain_pa
         lambda dto, existing: updated
     )
 
-    for svc in (
-            patient_service._citizenship_service,
-            patient_service._nationalities_service,
-            patient_service._medical_org_service,
-    ):
-        svc.get_by_id.return_value = object()
-    for svc in (
-            patient_service._financing_source_service,
-            patient_service._patient_context_attributes_service,
-    ):
-        svc.get_by_id.return_value = object()
+    _all_references_exist(patient_service)
 
     mock_uow.patients_repository.update_patient.return_value = updated
 
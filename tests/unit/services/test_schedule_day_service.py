@@ -0,0 +1,47 @@
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.registry.exceptions import InvalidSearchPeriodError
+from src.apps.registry.services.schedule_day_service import ScheduleDayService
+from src.core.settings import project_settings
+
+
+@pytest.fixture
+def schedule_day_service(dummy_logger):
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    uow.schedule_day_repository.find_free_slots = AsyncMock(return_value=[])
+    return ScheduleDayService(
+        uow=uow,
+        logger=dummy_logger,
+        schedule_day_repository=MagicMock(),
+        appointment_repository=MagicMock(),
+    )
+
+
+def _filters(days: int) -> dict:
+    date_from = date(2025, 5, 1)
+    return {"date_from": date_from, "date_to": date_from + timedelta(days=days - 1)}
+
+
+@pytest.mark.asyncio
+async def test_search_free_slots_accepts_the_maximum_period(schedule_day_service):
+    filters = _filters(project_settings.FREE_SLOTS_SEARCH_MAX_PERIOD_DAYS)
+
+    await schedule_day_service.search_free_slots(filters)
+
+    schedule_day_service._uow.schedule_day_repository.find_free_slots.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_search_free_slots_rejects_longer_periods(schedule_day_service):
+    filters = _filters(project_settings.FREE_SLOTS_SEARCH_MAX_PERIOD_DAYS + 1)
+
+    with pytest.raises(InvalidSearchPeriodError) as ei:
+        await schedule_day_service.search_free_slots(filters)
+
+    assert ei.value.status_code == 400
+    schedule_day_service._uow.schedule_day_repository.find_free_slots.assert_not_awaited()
@@ -0,0 +1,108 @@
+import datetime
+import uuid
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    ScheduleDayTemplateSchema,
+)
+from src.apps.registry.services import schedule_days_generator
+from src.apps.registry.services.schedule_days_generator import ScheduleDaysGenerator
+
+MONDAY = datetime.date(2025, 5, 5)
+
+
+def _template(day_of_week: int, **overrides) -> ScheduleDayTemplateSchema:
+    data = {
+        "day_of_week": day_of_week,
+        "is_active": True,
+        "work_start_time": datetime.time(9, 0),
+        "work_end_time": datetime.time(18, 0),
+        "break_start_time": datetime.time(12, 0),
+        "break_end_time": datetime.time(13, 0),
+    }
+    data.update(overrides)
+    return ScheduleDayTemplateSchema(**data)
+
+
+def test_generate_uses_template_and_default_for_missing_days():
+    schedule_id = uuid.uuid4()
+    generator = ScheduleDaysGenerator([_template(1)])
+
+    rows = list(generator.generate(schedule_id, MONDAY, MONDAY + datetime.timedelta(days=1)))
+
+    assert [row["date"] for row in rows] == [MONDAY, MONDAY + datetime.timedelta(days=1)]
+    assert rows[0] == {
+        "schedule_id": schedule_id,
+        "date": MONDAY,
+        "day_of_week": 1,
+        "is_active": True,
+        "work_start_time": datetime.time(9, 0),
+        "work_end_time": datetime.time(18, 0),
+        "break_start_time": datetime.time(12, 0),
+        "break_end_time": datetime.time(13, 0),
+    }
+    # Tuesday has no template - defaults are used
+    assert rows[1]["day_of_week"] == 2
+    assert rows[1]["work_start_time"] == datetime.time(8, 0)
+    assert rows[1]["work_end_time"] == datetime.time(17, 0)
+
+
+def test_generate_applies_reduced_days():
+    reduced_days = [
+        {"date": MONDAY.isoformat(), "work_end_time": "12:30:00"},
+        {"date": MONDAY + datetime.timedelta(days=1), "is_active": False},
+    ]
+    generator = ScheduleDaysGenerator([_template(1)], reduced_days=reduced_days)
+
+    monday, tuesday = generator.generate(
+        uuid.uuid4(), MONDAY, MONDAY + datetime.timedelta(days=1)
+    )
+
+    assert monday["work_start_time"] == datetime.time(9, 0)
+    assert monday["work_end_time"] == datetime.time(12, 30)
+    # The break doesn't fit into the shortened working day anymore
+    assert monday["break_start_time"] is None
+    assert monday["break_end_time"] is None
+    assert tuesday["is_active"] is False
+
+
+def test_generate_skips_given_dates():
+    generator = ScheduleDaysGenerator([])
+
+    rows = list(
+        generator.generate(
+            uuid.uuid4(),
+            MONDAY,
+            MONDAY + datetime.timedelta(days=2),
+            skip_dates={MONDAY + datetime.timedelta(days=1)},
+        )
+    )
+
+    assert [row["day_of_week"] for row in rows] == [1, 3]
+
+
+def test_generate_validates_each_distinct_template_once():
+    generator = ScheduleDaysGenerator([_template(day) for day in range(1, 8)])
+
+    with patch.object(
+        schedule_days_generator,
+        "CreateScheduleDaySchema",
+        wraps=schedule_days_generator.CreateScheduleDaySchema,
+    ) as schema_mock:
+        rows = list(
+            generator.generate(uuid.uuid4(), MONDAY, MONDAY + datetime.timedelta(days=89))
+        )
+
+    assert len(rows) == 90
+    schema_mock.assert_called_once()
+
+
+def test_generate_raises_on_invalid_override():
+    reduced_days = [{"date": MONDAY, "work_start_time": "19:00:00"}]
+    generator = ScheduleDaysGenerator([_template(1)], reduced_days=reduced_days)
+
+    with pytest.raises(ValidationError):
+        list(generator.generate(uuid.uuid4(), MONDAY, MONDAY))